@@ -0,0 +1,195 @@
+"""
+Batched Account Reads
+Coalesces account lookups into getMultipleAccounts calls and fans results back out
+"""
+
+import base64
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+
+import requests
+from solana.rpc.api import Client
+from solana.publickey import PublicKey
+
+MAX_ACCOUNTS_PER_REQUEST = 100  # getMultipleAccounts limit
+MAX_REQUESTS_PER_HTTP_BATCH = 20  # JSON-RPC calls per HTTP POST
+DEFAULT_BATCH_WINDOW = 0.005  # Seconds to wait for more lookups before flushing
+
+# SPL mint account: COption<Pubkey> authority, u64 supply, u8 decimals,
+# bool initialized, COption<Pubkey> freeze authority
+MINT_LAYOUT = struct.Struct("<I32sQBBI32s")
+MINT_ACCOUNT_SIZE = MINT_LAYOUT.size
+
+
+def account_data(account: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Raw bytes of a base64-encoded account value"""
+    if account is None:
+        return None
+    data = account["data"]
+    if isinstance(data, (list, tuple)):
+        data = data[0]
+    return base64.b64decode(data)
+
+
+def decode_mint_account(data: bytes) -> Dict[str, Any]:
+    """Decode an SPL Token mint account"""
+    (
+        mint_authority_option,
+        mint_authority,
+        supply,
+        decimals,
+        is_initialized,
+        freeze_authority_option,
+        freeze_authority,
+    ) = MINT_LAYOUT.unpack_from(data)
+
+    return {
+        "mint_authority": str(PublicKey(mint_authority)) if mint_authority_option else None,
+        "supply": supply,
+        "decimals": decimals,
+        "is_initialized": bool(is_initialized),
+        "freeze_authority": str(PublicKey(freeze_authority)) if freeze_authority_option else None,
+    }
+
+
+class AccountReadBatcher:
+    """
+    Gathers account lookups and issues them as getMultipleAccounts calls
+
+    `get()` returns a Future immediately; lookups arriving within the batch
+    window are deduplicated and fetched together, 100 accounts per call.
+    `get_many()` fetches a known list directly. When `rpc_url` is given,
+    the getMultipleAccounts calls are additionally grouped into JSON-RPC
+    batch requests so thousands of accounts cost a handful of round trips.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        window: float = DEFAULT_BATCH_WINDOW,
+        rpc_url: Optional[str] = None,
+        commitment: str = "confirmed"
+    ):
+        self.client = client
+        self.window = window
+        self.rpc_url = rpc_url
+        self.commitment = commitment
+        self.rpc_requests = 0
+        self.accounts_read = 0
+        self._queue: List[Tuple[str, Future]] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._session = requests.Session() if rpc_url else None
+
+    def get(self, pubkey: PublicKey) -> Future:
+        """
+        Queue one account lookup
+
+        Args:
+            pubkey: Account address
+
+        Returns:
+            Future resolving to the account value dict, or None if missing
+        """
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((str(pubkey), future))
+            self._ensure_running()
+        self._wakeup.set()
+        return future
+
+    def get_many(self, pubkeys: Sequence[PublicKey]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch a list of accounts with the fewest RPC round trips
+
+        Args:
+            pubkeys: Account addresses (duplicates are fetched once)
+
+        Returns:
+            Account value per input address, None where the account is missing
+        """
+        keys = [str(pubkey) for pubkey in pubkeys]
+        found = self._fetch(list(dict.fromkeys(keys)))
+        return [found[key] for key in keys]
+
+    def _fetch(self, keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        chunks = [
+            keys[start:start + MAX_ACCOUNTS_PER_REQUEST]
+            for start in range(0, len(keys), MAX_ACCOUNTS_PER_REQUEST)
+        ]
+        if not chunks:
+            return {}
+
+        if self._session is not None and len(chunks) > 1:
+            values = self._fetch_json_rpc_batches(chunks)
+        else:
+            values = []
+            for chunk in chunks:
+                response = self.client.get_multiple_accounts(
+                    [PublicKey(key) for key in chunk],
+                    encoding="base64"
+                )
+                self.rpc_requests += 1
+                values.append(response['result']['value'])
+
+        found = {}
+        for chunk, chunk_values in zip(chunks, values):
+            found.update(zip(chunk, chunk_values))
+        self.accounts_read += len(keys)
+        return found
+
+    def _fetch_json_rpc_batches(self, chunks: List[List[str]]) -> List[List[Optional[Dict[str, Any]]]]:
+        values: List[List[Optional[Dict[str, Any]]]] = []
+        for start in range(0, len(chunks), MAX_REQUESTS_PER_HTTP_BATCH):
+            group = chunks[start:start + MAX_REQUESTS_PER_HTTP_BATCH]
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getMultipleAccounts",
+                    "params": [chunk, {"encoding": "base64", "commitment": self.commitment}],
+                }
+                for i, chunk in enumerate(group)
+            ]
+            response = self._session.post(self.rpc_url, json=payload, timeout=30)
+            response.raise_for_status()
+            self.rpc_requests += 1
+
+            by_id = {item["id"]: item for item in response.json()}
+            for i in range(len(group)):
+                item = by_id.get(i)
+                if item is None or "error" in item:
+                    raise RuntimeError(f"getMultipleAccounts failed: {item and item.get('error')}")
+                values.append(item["result"]["value"])
+        return values
+
+    def _ensure_running(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="account-batcher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.window)  # Let concurrent callers join this batch
+
+            with self._lock:
+                self._wakeup.clear()
+                queued, self._queue = self._queue, []
+
+            if not queued:
+                continue
+
+            try:
+                found = self._fetch(list(dict.fromkeys(key for key, _ in queued)))
+            except Exception as e:
+                for _, future in queued:
+                    future.set_exception(e)
+                continue
+
+            for key, future in queued:
+                future.set_result(found[key])
@@ -0,0 +1,780 @@
+"""
+Async Solana Memecoin Launchpad
+Drives many concurrent launches from one process over a shared async RPC session
+"""
+
+import base64
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Callable, Awaitable
+from dataclasses import dataclass
+
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.rpc.types import TxOpts
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction, TransactionInstruction
+from spl.token.instructions import create_associated_token_account
+
+from account_batcher import account_data, decode_mint_account
+from blockhash_cache import get_blockhash_provider
+from compute_budget import BUDGET_RESERVE, ComputeBudgetPlanner, PriorityFeeModel, fee_model_for
+from confirmation_tracker import (
+    COMMITMENT_RANK,
+    MAX_SIGNATURES_PER_REQUEST,
+    ConfirmationTracker,
+    commitment_rank,
+)
+from derivation_cache import find_program_address, get_associated_token_address
+from launch_pipeline import EXPIRY_POLL_INTERVAL, LaunchJournal
+from rpc_metrics import record_retry
+from rpc_pool import client_endpoints, shared_client
+from solana_memecoin_launchpad_production import (
+    MAINNET_RPC_ENDPOINTS,
+    METAPLEX_METADATA_PROGRAM_ID,
+    LaunchInstructionBuilder,
+    ProductionLaunchConfig,
+    TokenMetadata,
+)
+from transaction_packer import TransactionPacker
+
+DEFAULT_MAX_CONCURRENT_LAUNCHES = 16
+
+
+_worker_keypairs: Dict[str, Keypair] = {}
+
+
+def _load_worker_keypairs(secret_keys: List[bytes]):
+    """Process-pool initializer: keep long-lived signing keys in the worker"""
+    for secret in secret_keys:
+        keypair = Keypair.from_secret_key(secret)
+        _worker_keypairs[str(keypair.public_key)] = keypair
+
+
+def _sign_message(message: bytes, pubkeys: List[str]) -> List[bytes]:
+    """Process-pool worker: ed25519 signatures over a serialized message by loaded keys"""
+    return [bytes(_worker_keypairs[pubkey].sign(message).signature) for pubkey in pubkeys]
+
+
+class ProcessPoolSigner:
+    """
+    Signs transactions in worker processes so ed25519 signing for many
+    concurrent launches does not serialize on the event loop
+
+    The long-lived `keypairs` (e.g. the payer) are sent to each worker once,
+    when it starts; calls only pass the message and public keys. Any other
+    signer, such as a launch's fresh mint keypair, signs in the calling
+    thread so its secret key never crosses a process boundary.
+
+    Args:
+        processes: Worker processes (default: CPU count)
+        keypairs: Keypairs loaded into every worker
+    """
+
+    def __init__(self, processes: Optional[int] = None, keypairs: Iterable[Keypair] = ()):
+        keypairs = list(keypairs)
+        self._loaded = {str(keypair.public_key) for keypair in keypairs}
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_load_worker_keypairs,
+            initargs=([bytes(keypair.secret_key) for keypair in keypairs],)
+        )
+
+    async def sign(
+        self,
+        transaction: Transaction,
+        signers: List[Keypair],
+        recent_blockhash: str
+    ) -> Transaction:
+        """
+        Sign a transaction, in the pool for loaded keypairs
+
+        Args:
+            transaction: Transaction to sign in place
+            signers: Signing keypairs, fee payer first
+            recent_blockhash: Blockhash to sign against
+
+        Returns:
+            The signed transaction
+        """
+        transaction.recent_blockhash = recent_blockhash
+        transaction.fee_payer = signers[0].public_key
+        # Placeholder signatures fix the signer order in the compiled message
+        transaction.sign_partial(*[signer.public_key for signer in signers])
+        message = transaction.serialize_message()
+
+        pooled = [signer for signer in signers if str(signer.public_key) in self._loaded]
+        local = [signer for signer in signers if str(signer.public_key) not in self._loaded]
+        for signer in local:
+            transaction.add_signature(signer.public_key, bytes(signer.sign(message).signature))
+
+        if pooled:
+            signatures = await asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                _sign_message,
+                message,
+                [str(signer.public_key) for signer in pooled]
+            )
+            for signer, signature in zip(pooled, signatures):
+                transaction.add_signature(signer.public_key, signature)
+        return transaction
+
+    def close(self):
+        self._pool.shutdown()
+
+
+@dataclass
+class LaunchRequest:
+    """A single launch to run through the async engine"""
+    payer: Keypair
+    metadata: TokenMetadata
+    config: ProductionLaunchConfig
+    dev_wallet: Optional[PublicKey] = None
+    marketing_wallet: Optional[PublicKey] = None
+    mint_keypair_source: Optional[Callable[[], Keypair]] = None
+    journal: Optional[LaunchJournal] = None  # Makes the launch resumable
+
+
+class JournaledLaunch:
+    """
+    Resume state for one async launch, backed by a LaunchJournal
+
+    Uses the journal's record types the same way LaunchPipeline does: the
+    mint keypair is journaled before it signs anything, every send is
+    journaled with its blockhash expiry, and each phase (create_token,
+    distribute, renounce, verify) is marked done with its result. Rerunning
+    with the same journal reuses the mint instead of creating a second
+    token and skips transactions that already landed.
+    """
+
+    def __init__(self, journal: LaunchJournal):
+        self.journal = journal
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.landed: Dict[Tuple[str, str], str] = {}
+
+    def has_keypair(self, name: str) -> bool:
+        return any(r["type"] == "account" and r["name"] == name for r in self.journal.records)
+
+    async def keypair(self, name: str, source: Optional[Callable[[], Keypair]] = None) -> Keypair:
+        """Keypair created for this launch; `source` (run in the default executor) on first use"""
+        for record in self.journal.records:
+            if record["type"] == "account" and record["name"] == name:
+                return Keypair.from_secret_key(base64.b64decode(record["secret_key"]))
+
+        if source is not None:
+            keypair = await asyncio.get_running_loop().run_in_executor(None, source)
+        else:
+            keypair = Keypair()
+        self.journal.append(
+            "account",
+            name=name,
+            pubkey=str(keypair.public_key),
+            secret_key=base64.b64encode(keypair.secret_key).decode()
+        )
+        return keypair
+
+    def plan(self, step: str) -> Optional[Any]:
+        """Inputs `step` fixed on an earlier run, so its transactions pack the same way"""
+        for record in self.journal.records:
+            if record["type"] == "plan" and record["step"] == step:
+                return record["plan"]
+        return None
+
+    def record_plan(self, step: str, plan: Any):
+        self.journal.append("plan", step=step, plan=plan)
+
+    def on_sent(self, step: str, key: str) -> Callable[[str, str, int], None]:
+        return lambda signature, blockhash, last_valid_block_height: self.journal.append(
+            "sent",
+            step=step,
+            key=key,
+            signature=signature,
+            blockhash=blockhash,
+            last_valid_block_height=last_valid_block_height
+        )
+
+    async def step(self, name: str, run: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run a phase unless the journal already has its result"""
+        if name in self.results:
+            print(f"⏭️  {name}: already complete")
+            return self.results[name]
+        try:
+            result = await run()
+        except Exception as e:
+            self.journal.append("failed", step=name, error=str(e))
+            raise
+        self.journal.append("done", step=name, result=result)
+        self.results[name] = result
+        return result
+
+    async def recover(self, client: AsyncClient, confirmations: ConfirmationTracker):
+        """
+        Load finished phases and find which journaled sends landed
+
+        A signature the node does not know may still land until its
+        blockhash expires, so it is looked up again once the block height
+        has passed its lastValidBlockHeight. Landed but unconfirmed ones
+        are awaited through `confirmations`.
+        """
+        sent = []
+        for record in self.journal.records:
+            if record["type"] == "done":
+                self.results[record["step"]] = record["result"]
+            elif record["type"] == "sent":
+                sent.append(record)
+        sent = [record for record in sent if record["step"] not in self.results]
+        if not sent:
+            return
+
+        statuses = await _get_statuses(client, [record["signature"] for record in sent])
+        unknown = [record for record in sent if statuses.get(record["signature"]) is None]
+        if unknown:
+            last_valid_block_height = max(record["last_valid_block_height"] for record in unknown)
+            while (await client.get_block_height())['result'] <= last_valid_block_height:
+                await asyncio.sleep(EXPIRY_POLL_INTERVAL)
+            statuses.update(await _get_statuses(client, [record["signature"] for record in unknown]))
+
+        for record in sent:
+            status = statuses.get(record["signature"])
+            if status is None or status.get("err") is not None:
+                continue
+            if commitment_rank(status) < COMMITMENT_RANK["confirmed"]:
+                try:
+                    await asyncio.wrap_future(confirmations.track(record["signature"], Confirmed))
+                except Exception:
+                    continue
+            self.landed[(record["step"], record["key"])] = record["signature"]
+
+
+async def _get_statuses(client: AsyncClient, signatures: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """getSignatureStatuses over the full history, in chunks of the request limit"""
+    statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+    for start in range(0, len(signatures), MAX_SIGNATURES_PER_REQUEST):
+        chunk = signatures[start:start + MAX_SIGNATURES_PER_REQUEST]
+        response = await client.get_signature_statuses(chunk, search_transaction_history=True)
+        statuses.update(zip(chunk, response['result']['value']))
+    return statuses
+
+
+class AsyncMemecoinLaunchpad(LaunchInstructionBuilder):
+    """
+    Async counterpart of ProductionMemecoinLaunchpad built on AsyncClient
+
+    Blockhashes, compute budgets and confirmations come from the same
+    process-wide helpers as the sync launchpad, driven by a sync client for
+    the same endpoint: blocking fetches run in the default executor and
+    confirmations are awaited on the ConfirmationTracker's futures. Pass
+    `sync_client` when `client` exposes no endpoint URL (e.g. a test double).
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        retry_delay: float = 2.0,
+        signer: Optional[ProcessPoolSigner] = None,
+        sync_client: Optional[Client] = None,
+        fee_model: Optional[PriorityFeeModel] = None
+    ):
+        self.client = client
+        self.retry_delay = retry_delay
+        self.signer = signer
+        if sync_client is None:
+            endpoints = client_endpoints(client)
+            if not endpoints:
+                raise ValueError("client exposes no endpoint; pass sync_client")
+            sync_client = shared_client(endpoints[0], Confirmed)
+        self.confirmations = ConfirmationTracker(sync_client, commitment=Confirmed)
+        self.blockhash = get_blockhash_provider(sync_client)
+        self.compute_budget = ComputeBudgetPlanner(
+            sync_client,
+            fee_model or fee_model_for(sync_client),
+            self.blockhash
+        )
+
+    async def verify_connection(self):
+        """Verify RPC connection"""
+        try:
+            version = await self.client.get_version()
+            print(f"Connected to Solana {version['result']['solana-core']}")
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to Solana RPC: {e}")
+
+    async def create_token_with_metadata(
+        self,
+        payer: Keypair,
+        metadata: TokenMetadata,
+        config: ProductionLaunchConfig,
+        mint_keypair_source: Optional[Callable[[], Keypair]] = None,
+        launch: Optional[JournaledLaunch] = None
+    ) -> Dict[str, Any]:
+        """
+        Create SPL token with Metaplex metadata
+
+        Args:
+            payer: Funded keypair for transaction fees
+            metadata: Token metadata
+            config: Launch configuration
+            mint_keypair_source: Supplies the mint keypair; blocking sources
+                such as a vanity grinder run in the default executor
+            launch: Journal state; a resumed launch reuses its mint keypair
+
+        Returns:
+            Token creation details
+        """
+        balance = await self._get_sol_balance(payer.public_key)
+        required_balance = 0.1  # Approximate SOL needed for token creation
+
+        if balance < required_balance:
+            raise ValueError(f"Insufficient balance. Need at least {required_balance} SOL, have {balance} SOL")
+
+        resumed = launch is not None and launch.has_keypair("mint")
+        if launch is not None:
+            mint_keypair = await launch.keypair("mint", mint_keypair_source)
+        elif mint_keypair_source is not None:
+            mint_keypair = await asyncio.get_running_loop().run_in_executor(None, mint_keypair_source)
+        else:
+            mint_keypair = Keypair()
+        instructions, metadata_pda = self._create_token_instructions(
+            payer, mint_keypair.public_key, metadata, config
+        )
+
+        tx_sig = launch.landed.get(("create_token", "create")) if launch is not None else None
+        # A resumed mint may exist even if its send was never journaled
+        if tx_sig is None and not (resumed and await self._account_exists(mint_keypair.public_key)):
+            transaction = Transaction()
+            for ix in instructions:
+                transaction.add(ix)
+            tx_sig = await self._send_once(launch, "create_token", "create", transaction, [payer, mint_keypair])
+
+        return {
+            "mint": str(mint_keypair.public_key),
+            "metadata_pda": str(metadata_pda),
+            "transaction": tx_sig,
+            "decimals": config.decimals,
+            "explorer_url": f"https://solscan.io/token/{mint_keypair.public_key}"
+        }
+
+    async def setup_token_distribution(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        config: ProductionLaunchConfig,
+        dev_wallet: Optional[PublicKey] = None,
+        marketing_wallet: Optional[PublicKey] = None,
+        launch: Optional[JournaledLaunch] = None
+    ) -> Dict[str, Any]:
+        """
+        Setup token accounts and mint initial distribution
+
+        Args:
+            payer: Mint authority
+            mint: Token mint address
+            config: Launch configuration
+            dev_wallet: Developer wallet (optional, defaults to payer)
+            marketing_wallet: Marketing wallet (optional, defaults to payer)
+            launch: Journal state; on resume the token accounts to create
+                come from the journal so the packed transactions match
+
+        Returns:
+            Distribution details
+        """
+        allocations = self._calculate_allocations(config)
+        owners = {
+            "liquidity": payer.public_key,
+            "dev": dev_wallet or payer.public_key,
+            "marketing": marketing_wallet or payer.public_key,
+        }
+
+        distribution = {
+            "total_supply": allocations["total_supply"],
+            "allocations": {},
+            "token_accounts": {},
+            "transactions": [],
+            "packed_transactions": []
+        }
+
+        # Look up every distinct ATA concurrently
+        atas = {}
+        for name, owner in owners.items():
+            if name == "liquidity" or allocations[name] > 0:
+                atas.setdefault(str(get_associated_token_address(owner, mint)), owner)
+
+        planned_owners = launch.plan("distribute") if launch is not None else None
+        if planned_owners is None:
+            create_ixs = await asyncio.gather(*[
+                self._create_token_account_instruction_if_missing(payer, mint, owner)
+                for owner in atas.values()
+            ])
+            instructions: List[TransactionInstruction] = [ix for ix in create_ixs if ix is not None]
+            if launch is not None:
+                launch.record_plan("distribute", [
+                    str(owner) for owner, ix in zip(atas.values(), create_ixs) if ix is not None
+                ])
+        else:
+            instructions = [
+                create_associated_token_account(payer=payer.public_key, owner=PublicKey(owner), mint=mint)
+                for owner in planned_owners
+            ]
+
+        for name, owner in owners.items():
+            amount = allocations[name]
+            if name != "liquidity" and amount <= 0:
+                continue
+            ata = get_associated_token_address(owner, mint)
+            instructions.append(self._mint_to_instruction(payer, mint, ata, amount))
+            distribution["token_accounts"][name] = str(ata)
+            distribution["allocations"][name] = amount
+
+        burn_amount = allocations["burned"]
+        if burn_amount > 0:
+            burn_ata = get_associated_token_address(payer.public_key, mint)
+            instructions.append(self._mint_to_instruction(payer, mint, burn_ata, burn_amount))
+            instructions.append(self._burn_instruction(payer, mint, burn_ata, burn_amount, config.decimals))
+            distribution["allocations"]["burned"] = burn_amount
+
+        # Packing is deterministic, so transaction keys are stable across runs
+        for i, planned in enumerate(TransactionPacker(payer.public_key, reserved=BUDGET_RESERVE).pack(instructions)):
+            tx_sig = await self._send_once(launch, "distribute", f"mint_{i}", planned.build(), [payer])
+            distribution["transactions"].append(tx_sig)
+            distribution["packed_transactions"].append({
+                "signature": tx_sig,
+                "instructions": len(planned.instructions),
+                "size_bytes": planned.size_bytes
+            })
+
+        return distribution
+
+    async def renounce_authorities(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        metadata_pda: PublicKey,
+        launch: Optional[JournaledLaunch] = None
+    ) -> Dict[str, str]:
+        """
+        Renounce mint and metadata update authorities
+
+        Args:
+            payer: Current authority
+            mint: Token mint address
+            metadata_pda: Metadata account address
+            launch: Journal state, so a resumed launch skips landed updates
+
+        Returns:
+            Transaction signatures
+        """
+        mint_tx = Transaction()
+        mint_tx.add(self._renounce_mint_instruction(payer, mint))
+
+        metadata_tx = Transaction()
+        metadata_tx.add(self._update_metadata_to_immutable(
+            metadata_pda=metadata_pda,
+            update_authority=payer.public_key
+        ))
+
+        # The two updates touch different accounts, so send them together
+        mint_sig, metadata_sig = await asyncio.gather(
+            self._send_once(launch, "renounce", "renounce", mint_tx, [payer]),
+            self._send_once(launch, "renounce", "immutable", metadata_tx, [payer])
+        )
+
+        return {
+            "mint_authority_renounced": mint_sig,
+            "metadata_immutable": metadata_sig
+        }
+
+    async def verify_launch_readiness(
+        self,
+        mint: PublicKey,
+        config: ProductionLaunchConfig
+    ) -> Dict[str, Any]:
+        """
+        Verify token is ready for launch
+
+        Args:
+            mint: Token mint address
+            config: Launch configuration
+
+        Returns:
+            Verification results
+        """
+        results = {
+            "mint": str(mint),
+            "checks": {},
+            "ready": True
+        }
+
+        metadata_pda, _ = find_program_address(
+            [
+                b"metadata",
+                bytes(METAPLEX_METADATA_PROGRAM_ID),
+                bytes(mint)
+            ],
+            METAPLEX_METADATA_PROGRAM_ID
+        )
+
+        # One getMultipleAccounts call; the supply is decoded from the mint account
+        try:
+            response = await self.client.get_multiple_accounts([mint, metadata_pda], encoding="base64")
+            mint_info, metadata_info = response['result']['value']
+        except Exception:
+            mint_info = metadata_info = None
+
+        results["checks"]["mint_exists"] = mint_info is not None
+
+        try:
+            actual_supply = decode_mint_account(account_data(mint_info))["supply"]
+            expected_supply = config.total_supply * (10 ** config.decimals)
+            results["checks"]["correct_supply"] = actual_supply == expected_supply
+            results["actual_supply"] = actual_supply
+        except Exception:
+            results["checks"]["correct_supply"] = False
+
+        results["checks"]["metadata_exists"] = metadata_info is not None
+
+        results["ready"] = all(results["checks"].values())
+        return results
+
+    async def _get_sol_balance(self, pubkey: PublicKey) -> float:
+        """Get SOL balance for an account"""
+        response = await self.client.get_balance(pubkey)
+        return response['result']['value'] / 1e9
+
+    async def _send_transaction_with_retry(
+        self,
+        transaction: Transaction,
+        signers: List[Keypair],
+        max_retries: int = 3,
+        on_sent: Optional[Callable[[str, str, int], None]] = None
+    ) -> str:
+        """
+        Send transaction with retry logic, yielding to other launches while waiting
+
+        `on_sent` is called with each attempt's signature, blockhash and the
+        blockhash's lastValidBlockHeight before waiting for confirmation.
+        A simulated compute-unit limit and a priority fee are prepended;
+        each retry attempt doubles the fee.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(max_retries):
+            try:
+                blockhash, last_valid_block_height = await self._blockhash_with_expiry()
+                budgeted = await loop.run_in_executor(
+                    None, self.compute_budget.apply, transaction, signers, attempt
+                )
+                if self.signer is not None:
+                    signed = await self.signer.sign(budgeted, signers, blockhash)
+                    response = await self.client.send_raw_transaction(
+                        signed.serialize(),
+                        opts=TxOpts(skip_preflight=False, preflight_commitment=Confirmed)
+                    )
+                else:
+                    response = await self.client.send_transaction(
+                        budgeted,
+                        *signers,
+                        opts=TxOpts(skip_preflight=False, preflight_commitment=Confirmed),
+                        recent_blockhash=blockhash
+                    )
+                if on_sent is not None:
+                    on_sent(response['result'], blockhash, last_valid_block_height)
+
+                await asyncio.wrap_future(self.confirmations.track(response['result'], Confirmed))
+                return response['result']
+
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    raise e
+                print(f"Transaction failed, retrying... ({attempt + 1}/{max_retries})")
+                record_retry(self.client, "send_raw_transaction" if self.signer is not None else "send_transaction")
+                self.blockhash.invalidate()
+                await asyncio.sleep(self.retry_delay)
+
+    async def _send_once(
+        self,
+        launch: Optional[JournaledLaunch],
+        step: str,
+        key: str,
+        transaction: Transaction,
+        signers: List[Keypair]
+    ) -> str:
+        """Send unless a journaled launch already landed this step's `key` transaction"""
+        if launch is None:
+            return await self._send_transaction_with_retry(transaction, signers)
+
+        signature = launch.landed.get((step, key))
+        if signature is not None:
+            print(f"⏭️  {step}/{key} already landed: {signature}")
+            return signature
+        signature = await self._send_transaction_with_retry(
+            transaction, signers, on_sent=launch.on_sent(step, key)
+        )
+        launch.landed[(step, key)] = signature
+        return signature
+
+    async def _blockhash_with_expiry(self) -> Tuple[str, int]:
+        """Shared blockhash and its lastValidBlockHeight, fetched off the event loop when stale"""
+        cached = self.blockhash.cached_blockhash_with_expiry()
+        if cached is not None:
+            return cached
+        return await asyncio.get_running_loop().run_in_executor(None, self.blockhash.get_blockhash_with_expiry)
+
+    async def _account_exists(self, pubkey: PublicKey) -> bool:
+        response = await self.client.get_account_info(pubkey)
+        return response['result']['value'] is not None
+
+    async def _create_token_account_instruction_if_missing(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        owner: PublicKey
+    ) -> Optional[TransactionInstruction]:
+        """Build the ATA create instruction, or None if the account already exists"""
+        ata = get_associated_token_address(owner, mint)
+        account_info = await self.client.get_account_info(ata)
+
+        if account_info['result']['value'] is not None:
+            return None
+
+        return create_associated_token_account(
+            payer=payer.public_key,
+            owner=owner,
+            mint=mint
+        )
+
+
+class AsyncLaunchEngine:
+    """
+    Runs the launch pipeline (create mint + metadata, distribution, renounce,
+    verify) for many tokens at once over one shared AsyncClient session
+    """
+
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        max_concurrent_launches: int = DEFAULT_MAX_CONCURRENT_LAUNCHES,
+        client: Optional[AsyncClient] = None,
+        signer: Optional[ProcessPoolSigner] = None,
+        sync_client: Optional[Client] = None
+    ):
+        if max_concurrent_launches < 1:
+            raise ValueError("max_concurrent_launches must be at least 1")
+
+        self.rpc_url = rpc_url or MAINNET_RPC_ENDPOINTS[0]
+        self.client = client or AsyncClient(self.rpc_url, commitment=Confirmed)
+        self.launchpad = AsyncMemecoinLaunchpad(
+            self.client,
+            signer=signer,
+            sync_client=sync_client or shared_client(self.rpc_url, Confirmed)
+        )
+        self.max_concurrent_launches = max_concurrent_launches
+        self._semaphore = asyncio.Semaphore(max_concurrent_launches)
+
+    async def __aenter__(self) -> "AsyncLaunchEngine":
+        await self.launchpad.verify_connection()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the shared HTTP session and stop confirmation polling"""
+        self.launchpad.confirmations.stop()
+        await self.client.close()
+
+    def slot(self) -> asyncio.Semaphore:
+        """Concurrency slot to hold while a launch is in flight"""
+        return self._semaphore
+
+    async def launch(self, request: LaunchRequest) -> Dict[str, Any]:
+        """
+        Run one launch, waiting for a free slot under the concurrency limit
+
+        Args:
+            request: Launch to run
+
+        Returns:
+            Launch results for every pipeline step
+        """
+        async with self._semaphore:
+            return await self.run_launch(request)
+
+    async def run_launch(self, request: LaunchRequest) -> Dict[str, Any]:
+        """
+        Run one launch immediately; callers must already hold a slot()
+
+        With `request.journal`, each phase is journaled and a rerun resumes
+        from the first unfinished one.
+        """
+        launchpad = self.launchpad
+        launch = None
+        if request.journal is not None:
+            launch = JournaledLaunch(request.journal)
+            await launch.recover(self.client, launchpad.confirmations)
+
+        async def create_token() -> Dict[str, Any]:
+            return await launchpad.create_token_with_metadata(
+                request.payer, request.metadata, request.config, request.mint_keypair_source, launch
+            )
+
+        token_info = await _run_step(launch, "create_token", create_token)
+        mint = PublicKey(token_info["mint"])
+        metadata_pda = PublicKey(token_info["metadata_pda"])
+
+        async def distribute() -> Dict[str, Any]:
+            return await launchpad.setup_token_distribution(
+                payer=request.payer,
+                mint=mint,
+                config=request.config,
+                dev_wallet=request.dev_wallet,
+                marketing_wallet=request.marketing_wallet,
+                launch=launch
+            )
+
+        async def renounce() -> Dict[str, Any]:
+            return await launchpad.renounce_authorities(
+                payer=request.payer,
+                mint=mint,
+                metadata_pda=metadata_pda,
+                launch=launch
+            )
+
+        async def verify() -> Dict[str, Any]:
+            return await launchpad.verify_launch_readiness(mint, request.config)
+
+        distribution = await _run_step(launch, "distribute", distribute)
+        renounce_results = await _run_step(launch, "renounce", renounce)
+        verification = await _run_step(launch, "verify", verify)
+
+        print(f"✅ Launched {request.metadata.symbol}: {mint}")
+
+        return {
+            "token": token_info,
+            "distribution": distribution,
+            "renounce": renounce_results,
+            "verification": verification
+        }
+
+    async def launch_many(self, requests: Iterable[LaunchRequest]) -> List[Any]:
+        """
+        Run many launches concurrently, bounded by max_concurrent_launches
+
+        Args:
+            requests: Launches to run
+
+        Returns:
+            One result per request, in order; failed launches return their exception
+        """
+        return await asyncio.gather(
+            *[self.launch(request) for request in requests],
+            return_exceptions=True
+        )
+
+
+async def _run_step(
+    launch: Optional[JournaledLaunch],
+    name: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    return await (launch.step(name, run) if launch is not None else run())
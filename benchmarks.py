@@ -0,0 +1,569 @@
+"""
+Offline Benchmark Suite
+Throughput and allocation benchmarks for the launchpad hot paths, with baseline regression checks
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import subprocess
+import platform
+import argparse
+import statistics
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Callable
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+
+from derivation_cache import METAPLEX_METADATA_PROGRAM_ID, DerivationCache
+from memecoin_launchpad_with_fees import (
+    CreatorFeeConfig,
+    EnhancedMemecoinLaunchpad,
+    FeeDistributionManager,
+)
+from metadata_codec import encode_create_metadata_v3
+from milestone_tracker import MilestoneTracker
+from raydium_integration import AntiBotMechanism, RaydiumIntegration
+from solana_memecoin_launchpad_production import LaunchInstructionBuilder, TokenMetadata
+
+DEFAULT_BASELINE_PATH = "benchmarks_baseline.json"
+DEFAULT_MIN_TIME = 0.2  # Seconds per timed round
+DEFAULT_ROUNDS = 5
+DEFAULT_TOLERANCE = 0.15  # Allowed fractional slowdown / memory growth
+DEFAULT_STARTUP_RUNS = 5
+STARTUP_FLOOR_MS = 1.0  # Startup changes smaller than this are noise
+ALLOCATION_SAMPLE_CALLS = 1_000
+SETTLEMENT_BATCH_SIZE = 100_000  # Fees per settle_fee_batch call
+
+# Fixed inputs so runs are comparable across machines and commits
+_KEYS = [PublicKey(bytes([i]) * 32) for i in range(1, 9)]
+_METADATA = TokenMetadata(
+    name="Benchmark Token",
+    symbol="BENCH",
+    description="Benchmark fixture",
+    image_url="https://example.com/bench.png",
+    uri="https://example.com/bench.json"
+)
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a factory whose optional dependency is not installed"""
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and allocation figures for one benchmark"""
+    name: str
+    ops_per_sec: float
+    us_per_op: float
+    stdev_pct: float  # Spread of per-round throughput
+    peak_bytes: int  # Peak traced memory during one call
+    retained_bytes_per_op: float  # Memory still held after many calls
+
+
+@dataclass
+class StartupResult:
+    """Cold-start timing for one step, measured in fresh interpreters"""
+    name: str
+    median_ms: float
+    min_ms: float
+
+
+def _metadata_instruction() -> Callable[[], Any]:
+    builder = LaunchInstructionBuilder()
+    metadata_pda, mint, authority = _KEYS[0], _KEYS[1], _KEYS[2]
+
+    def run():
+        return builder._create_metadata_instruction_v3(
+            metadata_pda=metadata_pda,
+            mint=mint,
+            mint_authority=authority,
+            payer=authority,
+            update_authority=authority,
+            metadata=_METADATA
+        )
+    return run
+
+
+def _token_2022_mint() -> Callable[[], Any]:
+    # __new__ skips the RPC client and connection check
+    launchpad = EnhancedMemecoinLaunchpad.__new__(EnhancedMemecoinLaunchpad)
+    fee_config = CreatorFeeConfig()
+    payer, mint = _KEYS[0], _KEYS[1]
+
+    def run():
+        return launchpad._create_token_2022_mint_with_fees(payer, mint, 9, payer, None, fee_config)
+    return run
+
+
+def _fee_distribution() -> Callable[[], Any]:
+    manager = FeeDistributionManager.__new__(FeeDistributionManager)
+    fee_config = CreatorFeeConfig()
+    fees = [997, 1_000_003, 123_456_789, 5]
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        return manager.calculate_fee_distribution(fees[state["i"] & 3], fee_config)
+    return run
+
+
+def _settle_fee_batch() -> Callable[[], Any]:
+    try:
+        import numpy as np
+    except ImportError:
+        raise BenchmarkSkipped("numpy is not installed")
+    from fee_settlement import FeeSettlementEngine
+
+    engine = FeeSettlementEngine(CreatorFeeConfig())
+    rng = np.random.default_rng(0)
+    fees = rng.integers(0, 1_000_000, SETTLEMENT_BATCH_SIZE, dtype=np.uint64)
+    mint_ids = rng.integers(0, 1_024, SETTLEMENT_BATCH_SIZE)
+    return lambda: engine.settle(fees, mint_ids)
+
+
+def _volume_milestone() -> Callable[[], Any]:
+    manager = FeeDistributionManager.__new__(FeeDistributionManager)
+    manager.volume_tracker = MilestoneTracker()
+    fee_config = CreatorFeeConfig()
+    tokens = [f"token-{i}" for i in range(1_024)]
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        return manager.track_volume_milestone(tokens[state["i"] & 1_023], 250_000, fee_config)
+    return run
+
+
+def _volume_milestone_dict() -> Callable[[], Any]:
+    # The dict-of-dicts tracker track_volume_milestone used before MilestoneTracker
+    volume_tracker: Dict[str, Dict[str, Any]] = {}
+    fee_config = CreatorFeeConfig()
+    tokens = [f"token-{i}" for i in range(1_024)]
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        tracker = volume_tracker.setdefault(
+            tokens[state["i"] & 1_023], {'total_volume': 0, 'milestones_reached': []}
+        )
+        tracker['total_volume'] += 250_000
+        for milestone, reward in fee_config.volume_milestone_rewards.items():
+            if tracker['total_volume'] >= milestone and milestone not in tracker['milestones_reached']:
+                tracker['milestones_reached'].append(milestone)
+                return reward
+        return None
+    return run
+
+
+def _ingest_transfer_chunk() -> Callable[[], Any]:
+    from fee_ingestion import DEFAULT_CHUNK_SIZE, FeeIngestionPipeline, TransferEvent
+
+    manager = FeeDistributionManager.__new__(FeeDistributionManager)
+    manager.volume_tracker = MilestoneTracker()
+    manager.distributed_fees = {}
+    pipeline = FeeIngestionPipeline(manager, on_milestone=lambda mint, reward: None)
+    chunk = [
+        TransferEvent(f"mint-{i & 63}", 1_000 + i, 1_700_000_000 + i / 100)
+        for i in range(DEFAULT_CHUNK_SIZE)
+    ]
+    return lambda: pipeline.ingest(chunk)
+
+
+def _price_impact() -> Callable[[], Any]:
+    raydium = RaydiumIntegration.__new__(RaydiumIntegration)
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        return raydium.calculate_price_impact(
+            1_000_000_000_000_000, 10_000_000_000, 1_000_000 + state["i"], bool(state["i"] & 1)
+        )
+    return run
+
+
+def _anti_bot() -> Callable[[], Any]:
+    anti_bot = AntiBotMechanism()
+    buyers = [f"buyer-{i}" for i in range(4_096)]
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        i = state["i"]
+        return anti_bot.check_transaction(buyers[i & 4_095], 1_000 + (i & 7), 1_000_000_000, i)
+    return run
+
+
+def _encode_metadata() -> Callable[[], Any]:
+    def run():
+        return encode_create_metadata_v3(_METADATA.name, _METADATA.symbol, _METADATA.uri)
+    return run
+
+
+def _derive_metadata_pda() -> Callable[[], Any]:
+    # Uncached bump search; the launchpads normally hit the derivation cache
+    mints = [bytes(Keypair().public_key) for _ in range(64)]
+    program = bytes(METAPLEX_METADATA_PROGRAM_ID)
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        return PublicKey.find_program_address(
+            [b"metadata", program, mints[state["i"] & 63]], METAPLEX_METADATA_PROGRAM_ID
+        )
+    return run
+
+
+def _derive_metadata_pda_cached() -> Callable[[], Any]:
+    cache = DerivationCache()
+    mints = [Keypair().public_key for _ in range(64)]
+    for mint in mints:
+        cache.find_metadata_pda(mint)
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        return cache.find_metadata_pda(mints[state["i"] & 63])
+    return run
+
+
+# name -> factory returning a zero-argument callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {
+    "metadata_instruction_v3": _metadata_instruction,
+    "token_2022_mint_with_fees": _token_2022_mint,
+    "calculate_fee_distribution": _fee_distribution,
+    "settle_fee_batch_100k": _settle_fee_batch,
+    "track_volume_milestone": _volume_milestone,
+    "track_volume_milestone_dict": _volume_milestone_dict,
+    "ingest_transfer_chunk_1k": _ingest_transfer_chunk,
+    "calculate_price_impact": _price_impact,
+    "anti_bot_check_transaction": _anti_bot,
+    "encode_create_metadata_v3": _encode_metadata,
+    "derive_metadata_pda": _derive_metadata_pda,
+    "derive_metadata_pda_cached": _derive_metadata_pda_cached,
+}
+
+
+def _calibrate(fn: Callable[[], Any], min_time: float) -> int:
+    """Smallest power-of-two call count that takes at least min_time"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_time:
+            return number
+        number *= 2
+
+
+def run_benchmark(
+    name: str,
+    factory: Callable[[], Callable[[], Any]],
+    min_time: float = DEFAULT_MIN_TIME,
+    rounds: int = DEFAULT_ROUNDS
+) -> BenchmarkResult:
+    """
+    Time one benchmark and measure its allocations
+
+    Args:
+        name: Benchmark name
+        factory: Builds the callable to time
+        min_time: Seconds per timed round
+        rounds: Timed rounds; the best round is reported
+
+    Returns:
+        BenchmarkResult
+
+    Raises:
+        BenchmarkSkipped: The factory's optional dependency is missing
+    """
+    fn = factory()
+    number = _calibrate(fn, min_time)
+
+    throughputs = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            throughputs.append(number / (time.perf_counter() - start))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    best = max(throughputs)
+    spread = statistics.pstdev(throughputs) / statistics.mean(throughputs) * 100
+
+    # Allocation figures come from a fresh instance so timing state does not leak in
+    fn = factory()
+    fn()  # Warm lazy caches and interned objects
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes = peak - before
+
+        before, _ = tracemalloc.get_traced_memory()
+        results = [fn() for _ in range(ALLOCATION_SAMPLE_CALLS)]
+        del results
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=round(best, 1),
+        us_per_op=round(1e6 / best, 3),
+        stdev_pct=round(spread, 2),
+        peak_bytes=peak_bytes,
+        retained_bytes_per_op=round(max(after - before, 0) / ALLOCATION_SAMPLE_CALLS, 1)
+    )
+
+
+# Each probe runs in a fresh interpreter and prints {step: milliseconds} as JSON
+_IMPORT_PROBE = """
+import json, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"import.{label}": (time.perf_counter() - start) * 1000}}))
+"""
+
+_FIRST_CALL_PROBE = """
+import json, time
+from solana.keypair import Keypair
+from fake_rpc_server import FakeRpcServer
+from solana_memecoin_launchpad_production import (
+    ProductionLaunchConfig, ProductionMemecoinLaunchpad, TokenMetadata
+)
+
+timings = {{}}
+with FakeRpcServer() as server:
+    start = time.perf_counter()
+    launchpad = ProductionMemecoinLaunchpad(rpc_url=server.url, verify_connection={verify})
+    timings["first_call.init_{label}"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    ProductionMemecoinLaunchpad(rpc_url=server.url, verify_connection={verify})
+    timings["first_call.second_init_{label}"] = (time.perf_counter() - start) * 1000
+
+    payer, mint = Keypair(), Keypair()
+    metadata = TokenMetadata("a", "A", "d", "i", "u")
+    start = time.perf_counter()
+    launchpad._create_token_instructions(payer, mint.public_key, metadata, ProductionLaunchConfig(total_supply=1))
+    timings["first_call.create_instructions_{label}"] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+STARTUP_PROBES: Dict[str, str] = {
+    "import.production": _IMPORT_PROBE.format(module="solana_memecoin_launchpad_production", label="production"),
+    "import.enhanced": _IMPORT_PROBE.format(module="memecoin_launchpad_with_fees", label="enhanced"),
+    "import.simple": _IMPORT_PROBE.format(module="simple_mainnet_launchpad", label="simple"),
+    "first_call.verified": _FIRST_CALL_PROBE.format(verify=True, label="verified"),
+    "first_call.deferred": _FIRST_CALL_PROBE.format(verify=False, label="deferred"),
+}
+
+
+def run_startup(
+    probes: Dict[str, str],
+    runs: int = DEFAULT_STARTUP_RUNS
+) -> List[StartupResult]:
+    """
+    Cold-start timings from fresh interpreter processes
+
+    Args:
+        probes: Probe scripts keyed by name (see STARTUP_PROBES)
+        runs: Interpreter launches per probe; the median is reported
+
+    Returns:
+        One result per timed step
+    """
+    samples: Dict[str, List[float]] = {}
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    for name, code in probes.items():
+        for _ in range(runs):
+            proc = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise RuntimeError(f"Startup probe {name} failed:\n{proc.stderr}")
+            for step, ms in json.loads(proc.stdout.strip().splitlines()[-1]).items():
+                samples.setdefault(step, []).append(ms)
+
+    return [
+        StartupResult(name, round(statistics.median(values), 3), round(min(values), 3))
+        for name, values in samples.items()
+    ]
+
+
+def _environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_baseline(results: List[Any], path: str, section: str = "results"):
+    """Store results under `section`, keeping the baseline's other sections"""
+    try:
+        with open(path) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {}
+    baseline.update({
+        "environment": _environment(),
+        "created_at": time.time(),
+        section: {r.name: asdict(r) for r in results},
+    })
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """
+    Regressions against a stored baseline
+
+    A benchmark regresses when its throughput drops, or its peak memory
+    grows, by more than `tolerance` (a fraction) of the baseline value.
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get("results", {}).get(result.name)
+        if base is None:
+            continue
+        if result.ops_per_sec < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: {result.ops_per_sec:,.0f} ops/s vs baseline {base['ops_per_sec']:,.0f}"
+            )
+        if result.peak_bytes > base["peak_bytes"] * (1 + tolerance) + 64:
+            regressions.append(
+                f"{result.name}: peak {result.peak_bytes:,} B vs baseline {base['peak_bytes']:,} B"
+            )
+    return regressions
+
+
+def compare_startup_to_baseline(
+    results: List[StartupResult],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """Startup steps whose median grew by more than `tolerance` and STARTUP_FLOOR_MS"""
+    regressions = []
+    for result in results:
+        base = baseline.get("startup", {}).get(result.name)
+        if base is None:
+            continue
+        if result.median_ms > base["median_ms"] * (1 + tolerance) + STARTUP_FLOOR_MS:
+            regressions.append(
+                f"{result.name}: {result.median_ms:,.1f} ms vs baseline {base['median_ms']:,.1f} ms"
+            )
+    return regressions
+
+
+def _print_table(results: List[BenchmarkResult], baseline: Optional[Dict[str, Any]]):
+    print(f"{'benchmark':<30} {'ops/sec':>14} {'us/op':>10} {'±%':>6} {'peak B':>9} {'kept B/op':>10} {'vs base':>9}")
+    for r in results:
+        change = ""
+        base = baseline.get("results", {}).get(r.name) if baseline else None
+        if base:
+            change = f"{(r.ops_per_sec / base['ops_per_sec'] - 1) * 100:+.1f}%"
+        print(f"{r.name:<30} {r.ops_per_sec:>14,.0f} {r.us_per_op:>10.3f} {r.stdev_pct:>6.1f} "
+              f"{r.peak_bytes:>9,} {r.retained_bytes_per_op:>10.1f} {change:>9}")
+
+
+def _print_startup_table(results: List[StartupResult], baseline: Optional[Dict[str, Any]]):
+    print(f"{'startup step':<40} {'median ms':>10} {'min ms':>10} {'vs base':>9}")
+    for r in results:
+        change = ""
+        base = baseline.get("startup", {}).get(r.name) if baseline else None
+        if base and base["median_ms"]:
+            change = f"{(r.median_ms / base['median_ms'] - 1) * 100:+.1f}%"
+        print(f"{r.name:<40} {r.median_ms:>10.2f} {r.min_ms:>10.2f} {change:>9}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run the offline launchpad benchmarks")
+    parser.add_argument("-k", "--filter", help="Only benchmarks whose name contains this")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Record this run in the baseline")
+    parser.add_argument("--no-compare", action="store_true", help="Report results without a baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--startup", action="store_true",
+                        help="Measure import and first-call times in fresh interpreters instead")
+    parser.add_argument("--startup-runs", type=int, default=DEFAULT_STARTUP_RUNS)
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        selected = {n: c for n, c in STARTUP_PROBES.items() if not args.filter or args.filter in n}
+        results = run_startup(selected, args.startup_runs)
+        section, print_table, compare = "startup", _print_startup_table, compare_startup_to_baseline
+    else:
+        selected = {n: f for n, f in BENCHMARKS.items() if not args.filter or args.filter in n}
+        results = []
+        for name, factory in selected.items():
+            try:
+                results.append(run_benchmark(name, factory, args.min_time, args.rounds))
+            except BenchmarkSkipped as e:
+                print(f"⏭️  {name}: skipped, {e}", file=sys.stderr)
+        section, print_table, compare = "results", _print_table, compare_to_baseline
+
+    baseline = None
+    if not args.save_baseline and not args.no_compare:
+        try:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            baseline = None
+        if baseline is None or section not in baseline:
+            # Baselines are machine-specific, so none ships with the repo
+            print(f"❌ No {section} baseline in {args.baseline}; record one on this machine with "
+                  f"--save-baseline{' --startup' if args.startup else ''}, or pass --no-compare",
+                  file=sys.stderr)
+            sys.exit(2)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print_table(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline, section)
+        print(f"💾 Baseline saved to {args.baseline}", file=sys.stderr)
+        return
+
+    if baseline is None:
+        return  # --no-compare
+
+    if baseline.get("environment") != _environment():
+        print(f"⚠️  Baseline was recorded on {baseline.get('environment')}; "
+              f"comparisons across environments are indicative only", file=sys.stderr)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("❌ Regressions:", file=sys.stderr)
+        for regression in regressions:
+            print(f"   {regression}", file=sys.stderr)
+        sys.exit(1)
+    print("✅ No regressions against baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
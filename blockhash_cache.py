@@ -0,0 +1,191 @@
+"""
+Shared Recent-Blockhash Cache
+Serves one cached blockhash to every launchpad while it has block-height headroom
+"""
+
+import time
+import threading
+from typing import Optional, Any, Dict, Hashable, Tuple
+
+from solana.rpc.api import Client
+
+from rpc_pool import client_endpoints
+
+SLOT_TIME_SECONDS = 0.4
+MIN_HEADROOM_BLOCKS = 30  # Never hand out a blockhash closer to expiry than this
+REFRESH_HEADROOM_BLOCKS = 75  # Refresh in the background below this headroom
+IDLE_TIMEOUT = 30.0  # Seconds without get_blockhash() before background refresh stops
+
+
+class BlockhashProvider:
+    """
+    Process-wide recent blockhash with slot-aware refresh
+
+    The provider remembers the block height observed when the blockhash was
+    fetched and extrapolates the current height from wall-clock slot time.
+    `get_blockhash()` serves the cached value while its lastValidBlockHeight
+    leaves at least `min_headroom` blocks, and a background thread refreshes
+    it once headroom falls below `refresh_headroom`. The thread exits after
+    `idle_timeout` seconds without a get_blockhash() call and is restarted by
+    the next one, so an idle process does not keep polling. Fetches are
+    single-flight: callers that find the blockhash stale while another
+    thread is fetching wait for that fetch instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        min_headroom: int = MIN_HEADROOM_BLOCKS,
+        refresh_headroom: int = REFRESH_HEADROOM_BLOCKS,
+        background: bool = True,
+        idle_timeout: float = IDLE_TIMEOUT
+    ):
+        if refresh_headroom <= min_headroom:
+            raise ValueError("refresh_headroom must be larger than min_headroom")
+
+        self.client = client
+        self.min_headroom = min_headroom
+        self.refresh_headroom = refresh_headroom
+        self.background = background
+        self.idle_timeout = idle_timeout
+        self.fetches = 0
+        self.hits = 0
+
+        self._blockhash: Optional[str] = None
+        self._last_valid_block_height = 0
+        self._fetched_block_height = 0
+        self._fetched_at = 0.0
+        self._used_at = 0.0
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # Held for the whole fetch; taken before _lock
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get_blockhash(self) -> str:
+        """Return a blockhash with enough headroom, fetching only when needed"""
+        with self._lock:
+            self._used_at = time.monotonic()
+            blockhash = self._serve_cached()
+            if blockhash is not None:
+                return blockhash
+
+        with self._fetch_lock:
+            # Another caller (or the background thread) may have fetched meanwhile
+            with self._lock:
+                blockhash = self._serve_cached()
+                if blockhash is not None:
+                    return blockhash
+            blockhash, _ = self.refresh()
+        with self._lock:
+            if self._thread is None:
+                self._start_background()
+        return blockhash
+
+    def get_blockhash_with_expiry(self) -> Tuple[str, int]:
+        """Blockhash plus the lastValidBlockHeight it expires at"""
+        blockhash = self.get_blockhash()
+        with self._lock:
+            return blockhash, self._last_valid_block_height
+
+    def cached_blockhash_with_expiry(self) -> Optional[Tuple[str, int]]:
+        """get_blockhash_with_expiry() if the cached blockhash will do; never fetches, so never blocks"""
+        with self._lock:
+            self._used_at = time.monotonic()
+            blockhash = self._serve_cached()
+            return None if blockhash is None else (blockhash, self._last_valid_block_height)
+
+    def refresh(self) -> Tuple[str, int]:
+        """Fetch a new blockhash and the current block height"""
+        latest = self.client.get_latest_blockhash()['result']['value']
+        block_height = self.client.get_block_height()['result']
+
+        with self._lock:
+            self._blockhash = latest['blockhash']
+            self._last_valid_block_height = latest['lastValidBlockHeight']
+            self._fetched_block_height = block_height
+            self._fetched_at = time.monotonic()
+            self.fetches += 1
+            return self._blockhash, self._last_valid_block_height
+
+    def invalidate(self):
+        """Drop the cached blockhash, e.g. after a 'Blockhash not found' error"""
+        with self._lock:
+            self._blockhash = None
+
+    def stop(self):
+        """Stop background refreshing"""
+        self._stopped.set()
+
+    def _serve_cached(self) -> Optional[str]:
+        """The cached blockhash if it has enough headroom (caller holds the lock)"""
+        if self._blockhash is None or self._headroom() < self.min_headroom:
+            return None
+        self.hits += 1
+        if self._thread is None:
+            self._start_background()
+        return self._blockhash
+
+    def _headroom(self) -> float:
+        """Blocks left before the cached blockhash expires (caller holds the lock)"""
+        elapsed_blocks = (time.monotonic() - self._fetched_at) / SLOT_TIME_SECONDS
+        return self._last_valid_block_height - (self._fetched_block_height + elapsed_blocks)
+
+    def _start_background(self):
+        """Start the refresh thread (caller holds the lock and saw no thread)"""
+        if not self.background or self._stopped.is_set():
+            return
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="blockhash-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def _refresh_loop(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                idle_left = self.idle_timeout - (time.monotonic() - self._used_at)
+                if idle_left <= 0:
+                    self._thread = None  # The next get_blockhash() starts a new one
+                    return
+                headroom = self._headroom() if self._blockhash is not None else 0.0
+            wait_blocks = headroom - self.refresh_headroom
+
+            if wait_blocks > 0:
+                self._stopped.wait(min(wait_blocks * SLOT_TIME_SECONDS, idle_left))
+                continue
+
+            try:
+                with self._fetch_lock:
+                    self.refresh()
+            except Exception as e:
+                print(f"Blockhash refresh failed, retrying: {e}")
+                self._stopped.wait(1.0)
+
+
+_providers: Dict[Hashable, BlockhashProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def _endpoint_key(client: Any) -> Hashable:
+    """Endpoint identity of a Client, RpcPool or InstrumentedClient"""
+    endpoints = client_endpoints(client)
+    if endpoints:
+        return tuple(endpoints)
+    # Unknown client type; the registry keeps it alive, so its id stays unique
+    return ("client", id(getattr(client, "wrapped", client)))
+
+
+def get_blockhash_provider(client: Client) -> BlockhashProvider:
+    """
+    Process-wide provider per RPC endpoint
+
+    Every launchpad talking to the same endpoint (or the same pool of
+    endpoints) shares one provider. Clients for different endpoints, which
+    may be different clusters, never share a blockhash.
+    """
+    key = _endpoint_key(client)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = BlockhashProvider(client)
+            _providers[key] = provider
+        return provider
@@ -0,0 +1,341 @@
+"""
+Bulk Memecoin Launcher
+Launches every row of a CSV/JSONL manifest with parallel signing and bounded RPC concurrency
+"""
+
+import os
+import csv
+import json
+import time
+import base64
+import asyncio
+import argparse
+from dataclasses import MISSING, dataclass, fields
+from typing import Optional, Dict, Any, List, Iterator, Set, Callable
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+
+from async_launchpad import (
+    DEFAULT_MAX_CONCURRENT_LAUNCHES,
+    AsyncLaunchEngine,
+    LaunchRequest,
+    ProcessPoolSigner,
+)
+from keypair_pool import KeypairPool
+from launch_pipeline import LaunchJournal
+from launch_store import DEFAULT_STORE_PATH, LaunchRecord, LaunchStore
+from rpc_metrics import DEFAULT_METRICS_PORT, instrument, serve_launch_metrics
+from solana_memecoin_launchpad_production import (
+    MAINNET_RPC_ENDPOINTS,
+    ProductionLaunchConfig,
+    TokenMetadata,
+)
+
+
+@dataclass
+class ManifestRow:
+    """One launch from the manifest"""
+    row: int  # 0-based data row, used as the resume key
+    metadata: TokenMetadata
+    config: ProductionLaunchConfig
+    dev_wallet: Optional[PublicKey] = None
+    marketing_wallet: Optional[PublicKey] = None
+
+
+def _coerce(cls: type, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the dataclass's fields, converting CSV strings to the field types"""
+    coerced = {}
+    for f in fields(cls):
+        value = values.get(f.name)
+        if value is None:
+            continue
+        if value == "" and (f.default is not MISSING or f.default_factory is not MISSING):
+            continue  # Empty cell: use the field's default
+        if f.type is int:
+            value = int(value)
+        elif f.type is float:
+            value = float(value)
+        coerced[f.name] = value
+    return coerced
+
+
+def parse_manifest_entry(row: int, entry: Dict[str, Any]) -> ManifestRow:
+    """
+    Build a ManifestRow from a flat dict (CSV columns) or a nested
+    {"metadata": {...}, "config": {...}} JSONL object
+    """
+    metadata = entry.get("metadata", entry)
+    config = entry.get("config", entry)
+    dev_wallet = entry.get("dev_wallet")
+    marketing_wallet = entry.get("marketing_wallet")
+
+    return ManifestRow(
+        row=row,
+        metadata=TokenMetadata(**_coerce(TokenMetadata, metadata)),
+        config=ProductionLaunchConfig(**_coerce(ProductionLaunchConfig, config)),
+        dev_wallet=PublicKey(dev_wallet) if dev_wallet else None,
+        marketing_wallet=PublicKey(marketing_wallet) if marketing_wallet else None,
+    )
+
+
+def read_manifest(path: str) -> Iterator[ManifestRow]:
+    """Stream manifest rows from a .csv file or a JSONL file"""
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row, entry in enumerate(csv.DictReader(f)):
+                yield parse_manifest_entry(row, entry)
+        else:
+            row = 0
+            for line in f:
+                if line.strip():
+                    yield parse_manifest_entry(row, json.loads(line))
+                    row += 1
+
+
+class LaunchProgress:
+    """
+    Append-only JSONL record of which manifest rows have started and finished
+
+    A rerun skips rows marked done. Each row also has a LaunchJournal
+    (mint keypair, sent signatures, finished phases) under `journal_dir`,
+    so a row that started but never finished resumes with the same mint
+    instead of launching a second token. A row's journal is removed once
+    the row is marked done.
+    """
+
+    def __init__(self, path: str, journal_dir: Optional[str] = None):
+        self.path = path
+        self.journal_dir = journal_dir or f"{path}.journals"
+        self.done: Set[int] = set()
+        self.started: Set[int] = set()
+        self.failed: Set[int] = set()
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn final line
+                    if record["status"] == "started":
+                        self.started.add(record["row"])
+                    elif record["status"] == "done":
+                        self.done.add(record["row"])
+                    elif record["status"] == "failed":
+                        self.failed.add(record["row"])
+
+        os.makedirs(self.journal_dir, exist_ok=True)
+        self._file = open(path, "a")
+
+    def journal_path(self, row: int) -> str:
+        return os.path.join(self.journal_dir, f"row_{row}.journal.jsonl")
+
+    def incomplete(self) -> Set[int]:
+        """Rows that started but neither finished nor failed cleanly"""
+        return self.started - self.done - self.failed
+
+    def record(self, row: int, status: str, **fields):
+        self._file.write(json.dumps({"row": row, "status": status, "ts": time.time(), **fields}) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+class BulkLauncher:
+    """Drives manifest rows through AsyncLaunchEngine and tracks throughput"""
+
+    def __init__(
+        self,
+        engine: AsyncLaunchEngine,
+        payer: Keypair,
+        progress: LaunchProgress,
+        store: Optional[LaunchStore] = None,
+        mint_keypair_source: Optional[Callable[[], Keypair]] = None
+    ):
+        self.engine = engine
+        self.payer = payer
+        self.progress = progress
+        self.store = store
+        self.mint_keypair_source = mint_keypair_source
+        self.latencies: List[float] = []
+        self.failures = 0
+
+    async def run(self, rows: List[ManifestRow]) -> Dict[str, Any]:
+        """
+        Launch every row not yet marked done
+
+        Returns:
+            Aggregate summary with latency percentiles and launches per minute
+        """
+        pending = [row for row in rows if row.row not in self.progress.done]
+        skipped = len(rows) - len(pending)
+        if skipped:
+            print(f"⏭️  Skipping {skipped} row(s) already launched")
+
+        failed = self.progress.failed - self.progress.done
+        if failed:
+            print(f"🔁 Retrying {len(failed)} previously failed row(s)")
+
+        incomplete = sorted(self.progress.incomplete())
+        if incomplete:
+            print(f"🔁 Rows {incomplete} were interrupted mid-launch and will resume from their journals")
+
+        start = time.perf_counter()
+        await asyncio.gather(*[self._launch_row(row) for row in pending])
+        elapsed = time.perf_counter() - start
+
+        return self._summary(len(pending), skipped, elapsed)
+
+    async def _launch_row(self, row: ManifestRow):
+        journal_path = self.progress.journal_path(row.row)
+
+        async with self.engine.slot():
+            self.progress.record(row.row, "started", symbol=row.metadata.symbol)
+            start = time.perf_counter()
+            try:
+                with LaunchJournal(journal_path) as journal:
+                    header = next((r for r in journal.records if r["type"] == "launch"), None)
+                    if header is None:
+                        journal.append("launch", payer=str(self.payer.public_key), symbol=row.metadata.symbol)
+                    elif header["payer"] != str(self.payer.public_key):
+                        raise ValueError(f"Journal {journal_path} belongs to payer {header['payer']}")
+
+                    result = await self.engine.run_launch(LaunchRequest(
+                        payer=self.payer,
+                        metadata=row.metadata,
+                        config=row.config,
+                        dev_wallet=row.dev_wallet,
+                        marketing_wallet=row.marketing_wallet,
+                        mint_keypair_source=self.mint_keypair_source,
+                        journal=journal
+                    ))
+            except Exception as e:
+                self.failures += 1
+                self.progress.record(row.row, "failed", error=str(e))
+                print(f"❌ Row {row.row} ({row.metadata.symbol}) failed: {e}")
+                return
+
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+        mint = result["token"]["mint"]
+
+        if self.store is not None:
+            self.store.append(LaunchRecord(
+                mint=mint,
+                symbol=row.metadata.symbol,
+                creator=str(self.payer.public_key),
+                config=row.config,
+                metadata=row.metadata,
+                token=result["token"],
+                distribution=result["distribution"]
+            ))
+        self.progress.record(row.row, "done", mint=mint, latency=round(latency, 3))
+        os.remove(journal_path)
+        print(f"✅ Row {row.row} ({row.metadata.symbol}): {mint} in {latency:.1f}s")
+
+    def _summary(self, attempted: int, skipped: int, elapsed: float) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+        launched = len(ordered)
+        summary = {
+            "attempted": attempted,
+            "launched": launched,
+            "failed": self.failures,
+            "skipped": skipped,
+            "elapsed_seconds": round(elapsed, 2),
+            "launches_per_minute": round(launched * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+            "latency_p50": round(percentile(50), 2),
+            "latency_p95": round(percentile(95), 2),
+            "latency_max": round(ordered[-1], 2) if ordered else 0.0,
+        }
+
+        print("\n" + "=" * 50)
+        print(f"🚀 Launched {launched}/{attempted} in {elapsed:.1f}s "
+              f"({summary['launches_per_minute']} launches/min)")
+        print(f"⏱️  Latency p50 {summary['latency_p50']}s, p95 {summary['latency_p95']}s, "
+              f"max {summary['latency_max']}s")
+        if self.failures:
+            print(f"❌ {self.failures} failed; rerun to retry them")
+
+        return summary
+
+
+def load_payer() -> Keypair:
+    """Payer from SOLANA_PAYER_SECRET_KEY (base64 secret key)"""
+    secret = os.getenv("SOLANA_PAYER_SECRET_KEY")
+    if not secret:
+        raise SystemExit("Set SOLANA_PAYER_SECRET_KEY to the funded payer's base64 secret key")
+    return Keypair.from_secret_key(base64.b64decode(secret))
+
+
+async def bulk_launch(args: argparse.Namespace) -> Dict[str, Any]:
+    rows = list(read_manifest(args.manifest))
+    payer = load_payer()
+    print(f"📋 {len(rows)} launches in {args.manifest}, payer {payer.public_key}")
+
+    signer = ProcessPoolSigner(args.signing_processes, keypairs=[payer])
+    progress = LaunchProgress(args.progress or f"{args.manifest}.progress.jsonl", args.journal_dir)
+    store = LaunchStore(args.store)
+    metrics_server = serve_launch_metrics(args.metrics_port)
+    pool = None
+    if args.key_pool:
+        pool = KeypairPool(
+            payer.public_key,
+            target_depth=2 * args.concurrency,
+            low_water=args.concurrency,
+            path=args.key_pool
+        )
+        pool.start()
+    try:
+        async with AsyncLaunchEngine(
+            rpc_url=args.rpc_url,
+            client=instrument(AsyncClient(args.rpc_url, commitment=Confirmed)),
+            max_concurrent_launches=args.concurrency,
+            signer=signer
+        ) as engine:
+            launcher = BulkLauncher(
+                engine, payer, progress, store,
+                mint_keypair_source=pool.mint_keypair_source() if pool else None
+            )
+            return await launcher.run(rows)
+    finally:
+        if pool is not None:
+            pool.stop()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        store.close()
+        progress.close()
+        signer.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Launch every token in a CSV or JSONL manifest")
+    parser.add_argument("manifest", help="CSV with TokenMetadata/ProductionLaunchConfig columns, or JSONL")
+    parser.add_argument("--rpc-url", default=MAINNET_RPC_ENDPOINTS[0])
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENT_LAUNCHES,
+                        help="Launches in flight at once")
+    parser.add_argument("--signing-processes", type=int, default=None,
+                        help="Signing worker processes (default: CPU count)")
+    parser.add_argument("--progress", help="Progress file (default: <manifest>.progress.jsonl)")
+    parser.add_argument("--journal-dir", help="Per-row launch journals (default: <progress>.journals)")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH, help="Launch store database")
+    parser.add_argument("--key-pool", help="Persisted warm mint keypair pool file")
+    parser.add_argument("--metrics-port", type=int, default=DEFAULT_METRICS_PORT,
+                        help="Port serving RPC metrics at /metrics (0 disables)")
+    args = parser.parse_args(argv)
+
+    asyncio.run(bulk_launch(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Compute Budget Planner
+Sizes compute-unit limits by simulation and prices them from recent priority fees
+"""
+
+import math
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Iterable, Sequence, Tuple
+
+import requests
+from solana.rpc.api import Client
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction, TransactionInstruction
+
+from blockhash_cache import BlockhashProvider
+from rpc_pool import client_endpoints
+
+COMPUTE_BUDGET_PROGRAM_ID = PublicKey("ComputeBudget111111111111111111111111111111")
+
+MAX_COMPUTE_UNITS = 1_400_000  # Per-transaction runtime cap
+DEFAULT_UNITS_PER_INSTRUCTION = 200_000  # Runtime default when no limit is set
+UNIT_MARGIN = 1.1  # Headroom over simulated consumption
+BUDGET_INSTRUCTION_UNITS = 300  # Consumed by the budget instructions themselves
+
+DEFAULT_FEE_PERCENTILE = 75
+DEFAULT_FEE_WINDOW_SLOTS = 150  # getRecentPrioritizationFees returns this many slots
+DEFAULT_FEE_REFRESH_INTERVAL = 10.0  # Seconds
+DEFAULT_MAX_PRICE = 1_000_000  # Micro-lamports per compute unit
+DEFAULT_SHAPE_CACHE_SIZE = 1_024
+
+_SET_COMPUTE_UNIT_LIMIT = struct.Struct("<BI")
+_SET_COMPUTE_UNIT_PRICE = struct.Struct("<BQ")
+
+InstructionShape = Tuple[Tuple[bytes, Tuple[Tuple[bool, bool], ...], int, bytes], ...]
+
+
+def set_compute_unit_limit(units: int) -> TransactionInstruction:
+    """ComputeBudget SetComputeUnitLimit instruction"""
+    return TransactionInstruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=_SET_COMPUTE_UNIT_LIMIT.pack(2, units)
+    )
+
+
+def set_compute_unit_price(micro_lamports: int) -> TransactionInstruction:
+    """ComputeBudget SetComputeUnitPrice instruction"""
+    return TransactionInstruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=_SET_COMPUTE_UNIT_PRICE.pack(3, micro_lamports)
+    )
+
+
+def budget_instructions(units: int, micro_lamports: int) -> List[TransactionInstruction]:
+    """Limit and price instructions, in the order they are prepended"""
+    return [set_compute_unit_limit(units), set_compute_unit_price(micro_lamports)]
+
+
+# Same wire size as the real budget instructions; pass to TransactionPacker(reserved=...)
+BUDGET_RESERVE = budget_instructions(0, 0)
+
+
+def instruction_shape(instructions: Sequence[TransactionInstruction]) -> InstructionShape:
+    """
+    Cache key for compute usage: program, account roles, data length and
+    leading discriminator byte of each instruction, ignoring the concrete
+    addresses and amounts that do not change the work done
+    """
+    return tuple(
+        (
+            bytes(ix.program_id),
+            tuple((meta.is_signer, meta.is_writable) for meta in ix.keys),
+            len(ix.data),
+            bytes(ix.data[:1]),
+        )
+        for ix in instructions
+    )
+
+
+class PriorityFeeModel:
+    """
+    Rolling percentile of recent prioritization fees
+
+    Samples from getRecentPrioritizationFees are kept per slot for the most
+    recent `window_slots` slots and refreshed at most every
+    `refresh_interval` seconds, so many transactions share one fetch; when
+    several senders find the window stale at once, one refreshes and the
+    rest use the current estimate. Without an rpc_url nothing is fetched
+    and only samples passed to observe() count (min_price until then).
+    """
+
+    def __init__(
+        self,
+        rpc_url: Optional[str],
+        percentile: float = DEFAULT_FEE_PERCENTILE,
+        window_slots: int = DEFAULT_FEE_WINDOW_SLOTS,
+        refresh_interval: float = DEFAULT_FEE_REFRESH_INTERVAL,
+        max_price: int = DEFAULT_MAX_PRICE,
+        min_price: int = 0
+    ):
+        self.rpc_url = rpc_url
+        self.percentile = percentile
+        self.window_slots = window_slots
+        self.refresh_interval = refresh_interval
+        self.max_price = max_price
+        self.min_price = min_price
+        self._fees_by_slot: Dict[int, int] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._session = requests.Session() if rpc_url else None
+
+    def price(self) -> int:
+        """Priority fee to bid, in micro-lamports per compute unit"""
+        if self._stale() and self._refresh_lock.acquire(blocking=False):
+            try:
+                if self._stale():  # Another sender may have refreshed meanwhile
+                    self.refresh()
+            except Exception as e:
+                print(f"Priority fee refresh failed, using last estimate: {e}")
+                with self._lock:
+                    self._fetched_at = time.monotonic()  # Back off until the next interval
+            finally:
+                self._refresh_lock.release()
+
+        with self._lock:
+            fees = sorted(self._fees_by_slot.values())
+
+        if not fees:
+            return self.min_price
+
+        index = min(len(fees) - 1, int(len(fees) * self.percentile / 100))
+        return max(self.min_price, min(self.max_price, fees[index]))
+
+    def _stale(self) -> bool:
+        if self._session is None:
+            return False
+        with self._lock:
+            return time.monotonic() - self._fetched_at > self.refresh_interval
+
+    def refresh(self):
+        """Fetch recent fees and fold them into the window"""
+        if self._session is None:
+            return
+        response = self._session.post(
+            self.rpc_url,
+            json={"jsonrpc": "2.0", "id": 1, "method": "getRecentPrioritizationFees", "params": [[]]},
+            timeout=10
+        )
+        response.raise_for_status()
+        body = response.json()
+        if "error" in body:
+            raise RuntimeError(f"getRecentPrioritizationFees failed: {body['error']}")
+
+        self.observe(body["result"])
+        with self._lock:
+            self._fetched_at = time.monotonic()
+
+    def observe(self, samples: Iterable[Dict[str, Any]]):
+        """Add {slot, prioritizationFee} samples and drop slots outside the window"""
+        with self._lock:
+            for sample in samples:
+                self._fees_by_slot[sample["slot"]] = sample["prioritizationFee"]
+
+            if self._fees_by_slot:
+                oldest = max(self._fees_by_slot) - self.window_slots
+                for slot in [s for s in self._fees_by_slot if s <= oldest]:
+                    del self._fees_by_slot[slot]
+
+
+_fee_models: Dict[str, PriorityFeeModel] = {}
+_fee_models_lock = threading.Lock()
+
+
+def get_fee_model(rpc_url: str) -> PriorityFeeModel:
+    """Process-wide PriorityFeeModel per endpoint, so instances share one fee window"""
+    with _fee_models_lock:
+        model = _fee_models.get(rpc_url)
+        if model is None:
+            model = PriorityFeeModel(rpc_url)
+            _fee_models[rpc_url] = model
+        return model
+
+
+def fee_model_for(client: Client) -> PriorityFeeModel:
+    """
+    Fee model reading from the endpoint behind `client`
+
+    A pool reads from its first endpoint. Clients that expose no endpoint
+    (test doubles, custom transports) get an offline model that never
+    issues its own requests.
+    """
+    endpoints = client_endpoints(client)
+    return get_fee_model(endpoints[0]) if endpoints else PriorityFeeModel(None)
+
+
+class ComputeBudgetPlanner:
+    """
+    Prepends a tight compute-unit limit and a priority fee to transactions
+
+    The first transaction of each instruction shape is simulated with the
+    maximum limit to measure the units it consumes; later transactions of
+    the same shape reuse the cached measurement. Failed simulations fall
+    back to the runtime default of 200k units per instruction and are not
+    cached.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        fee_model: PriorityFeeModel,
+        blockhash: BlockhashProvider,
+        margin: float = UNIT_MARGIN,
+        cache_size: int = DEFAULT_SHAPE_CACHE_SIZE
+    ):
+        self.client = client
+        self.fee_model = fee_model
+        self.blockhash = blockhash
+        self.margin = margin
+        self.cache_size = cache_size
+        self.simulations = 0
+        self.cache_hits = 0
+        self._units: "OrderedDict[InstructionShape, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def apply(self, transaction: Transaction, signers: List[Keypair], attempt: int = 0) -> Transaction:
+        """
+        Build a copy of the transaction with budget instructions prepended
+
+        Args:
+            transaction: Unsigned transaction without budget instructions
+            signers: Signers, fee payer first
+            attempt: Retry number; the priority fee doubles per attempt up to max_price
+
+        Returns:
+            New transaction ready to send
+        """
+        instructions = list(transaction.instructions)
+        price = self.fee_model.price()
+        if attempt:
+            price = min(self.fee_model.max_price, max(price, 1) << attempt)
+
+        budgeted = Transaction(fee_payer=signers[0].public_key)
+        for ix in budget_instructions(self.units_for(instructions, signers), price):
+            budgeted.add(ix)
+        for ix in instructions:
+            budgeted.add(ix)
+        return budgeted
+
+    def units_for(self, instructions: Sequence[TransactionInstruction], signers: List[Keypair]) -> int:
+        """Compute-unit limit for the instructions, simulating on a cache miss"""
+        shape = instruction_shape(instructions)
+        with self._lock:
+            units = self._units.get(shape)
+            if units is not None:
+                self._units.move_to_end(shape)
+                self.cache_hits += 1
+                return units
+
+        consumed = self._simulate(instructions, signers)
+        if consumed is None:
+            return min(MAX_COMPUTE_UNITS, DEFAULT_UNITS_PER_INSTRUCTION * len(instructions))
+
+        units = min(MAX_COMPUTE_UNITS, math.ceil(consumed * self.margin) + BUDGET_INSTRUCTION_UNITS)
+        with self._lock:
+            self._units[shape] = units
+            while len(self._units) > self.cache_size:
+                self._units.popitem(last=False)
+        return units
+
+    def stats(self) -> Dict[str, Any]:
+        price = self.fee_model.price()
+        with self._lock:
+            return {
+                "shapes": len(self._units),
+                "simulations": self.simulations,
+                "cache_hits": self.cache_hits,
+                "priority_fee": price,
+            }
+
+    def _simulate(self, instructions: Sequence[TransactionInstruction], signers: List[Keypair]) -> Optional[int]:
+        transaction = Transaction(fee_payer=signers[0].public_key)
+        transaction.add(set_compute_unit_limit(MAX_COMPUTE_UNITS))
+        for ix in instructions:
+            transaction.add(ix)
+        transaction.recent_blockhash = self.blockhash.get_blockhash()
+        transaction.sign(*signers)
+
+        self.simulations += 1
+        try:
+            result = self.client.simulate_transaction(transaction)['result']['value']
+        except Exception as e:
+            print(f"Simulation failed, using default compute limit: {e}")
+            return None
+
+        if result.get("err") is not None or result.get("unitsConsumed") is None:
+            print(f"Simulation error, using default compute limit: {result.get('err')}")
+            return None
+        return result["unitsConsumed"]
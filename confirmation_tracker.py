@@ -0,0 +1,232 @@
+"""
+Batched Signature Confirmation
+Confirms many in-flight transactions with shared getSignatureStatuses polls
+"""
+
+import time
+import threading
+from concurrent.futures import Future, wait
+from typing import Optional, Dict, Any, List, Iterable
+
+from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
+
+MAX_SIGNATURES_PER_REQUEST = 256  # getSignatureStatuses limit
+DEFAULT_POLL_INTERVAL = 0.4  # Roughly one slot
+DEFAULT_TIMEOUT = 60.0
+
+COMMITMENT_RANK = {
+    "processed": 0,
+    "confirmed": 1,
+    "finalized": 2,
+}
+
+
+def commitment_rank(status: Dict[str, Any]) -> int:
+    """COMMITMENT_RANK reached by a getSignatureStatuses entry"""
+    if status.get("confirmations") is None and status.get("confirmationStatus") is None:
+        return COMMITMENT_RANK["finalized"]  # Rooted
+    return COMMITMENT_RANK.get(status.get("confirmationStatus") or "processed", 0)
+
+
+class TransactionFailedError(Exception):
+    """A tracked transaction landed but failed on chain"""
+
+    def __init__(self, signature: str, err: Any):
+        super().__init__(f"Transaction {signature} failed: {err}")
+        self.signature = signature
+        self.err = err
+
+
+class _PendingSignature:
+    __slots__ = ("signature", "required_rank", "deadline", "future")
+
+    def __init__(self, signature: str, required_rank: int, deadline: float):
+        self.signature = signature
+        self.required_rank = required_rank
+        self.deadline = deadline
+        self.future: Future = Future()
+
+
+class ConfirmationTracker:
+    """
+    Tracks in-flight signatures and resolves a future for each one
+
+    A single background thread polls getSignatureStatuses for every pending
+    signature in batches of up to 256. Each future resolves with the status
+    dict as soon as its signature reaches the requested commitment, or fails
+    with TransactionFailedError / TimeoutError.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        commitment=Confirmed,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT
+    ):
+        self.client = client
+        self.commitment = commitment
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._pending: Dict[str, List[_PendingSignature]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        signature: str,
+        commitment=None,
+        timeout: Optional[float] = None
+    ) -> Future:
+        """
+        Start tracking one signature
+
+        Args:
+            signature: Transaction signature
+            commitment: Required commitment (defaults to the tracker's)
+            timeout: Seconds before the future fails with TimeoutError
+
+        Returns:
+            Future resolving to the signature status
+        """
+        required = COMMITMENT_RANK[str(commitment or self.commitment)]
+        entry = _PendingSignature(
+            signature,
+            required,
+            time.monotonic() + (timeout if timeout is not None else self.timeout)
+        )
+
+        with self._lock:
+            self._pending.setdefault(signature, []).append(entry)
+            self._ensure_running()
+        self._wakeup.set()
+
+        return entry.future
+
+    def track_many(self, signatures: Iterable[str], commitment=None) -> List[Future]:
+        """Start tracking several signatures at once"""
+        return [self.track(sig, commitment) for sig in signatures]
+
+    def confirm_all(
+        self,
+        signatures: Iterable[str],
+        commitment=None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Block until every signature is confirmed
+
+        Returns:
+            Status per signature; raises the first failure encountered
+        """
+        futures = {sig: self.track(sig, commitment, timeout) for sig in signatures}
+        wait(futures.values())
+        return {sig: future.result() for sig, future in futures.items()}
+
+    def get_statuses(
+        self,
+        signatures: Iterable[str],
+        search_history: bool = False
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        One-shot status lookup without tracking
+
+        Args:
+            signatures: Signatures to look up
+            search_history: Also search the ledger beyond the node's recent
+                status cache, for signatures that may be older
+
+        Returns:
+            Status per signature, None for signatures the node does not know
+        """
+        signatures = list(dict.fromkeys(signatures))
+        statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(signatures), MAX_SIGNATURES_PER_REQUEST):
+            chunk = signatures[start:start + MAX_SIGNATURES_PER_REQUEST]
+            response = self.client.get_signature_statuses(chunk, search_transaction_history=search_history)
+            statuses.update(zip(chunk, response['result']['value']))
+        return statuses
+
+    def stop(self):
+        """Stop polling; pending futures are left unresolved"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _ensure_running(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="confirmation-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                signatures = list(self._pending)
+
+            if not signatures:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            for start in range(0, len(signatures), MAX_SIGNATURES_PER_REQUEST):
+                chunk = signatures[start:start + MAX_SIGNATURES_PER_REQUEST]
+                try:
+                    response = self.client.get_signature_statuses(chunk)
+                    statuses = response['result']['value']
+                except Exception as e:
+                    print(f"Signature status poll failed, retrying: {e}")
+                    statuses = [None] * len(chunk)
+                self._resolve(chunk, statuses)
+
+            self._expire()
+            time.sleep(self.poll_interval)
+
+    def _resolve(self, signatures: List[str], statuses: List[Optional[Dict[str, Any]]]):
+        with self._lock:
+            for signature, status in zip(signatures, statuses):
+                if status is None:
+                    continue
+
+                entries = self._pending.get(signature, [])
+                if status.get("err") is not None:
+                    for entry in entries:
+                        entry.future.set_exception(TransactionFailedError(signature, status["err"]))
+                    self._pending.pop(signature, None)
+                    continue
+
+                reached = commitment_rank(status)
+
+                remaining = []
+                for entry in entries:
+                    if reached >= entry.required_rank:
+                        entry.future.set_result(status)
+                    else:
+                        remaining.append(entry)
+
+                if remaining:
+                    self._pending[signature] = remaining
+                else:
+                    self._pending.pop(signature, None)
+
+    def _expire(self):
+        now = time.monotonic()
+        with self._lock:
+            for signature in list(self._pending):
+                remaining = []
+                for entry in self._pending[signature]:
+                    if now >= entry.deadline:
+                        entry.future.set_exception(
+                            TimeoutError(f"Transaction {signature} not confirmed in time")
+                        )
+                    else:
+                        remaining.append(entry)
+
+                if remaining:
+                    self._pending[signature] = remaining
+                else:
+                    del self._pending[signature]
@@ -0,0 +1,205 @@
+"""
+PDA and ATA Derivation Cache
+Memoizes program-address bump searches and derives addresses in bulk
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Sequence, Iterable
+
+from solana.publickey import PublicKey
+from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
+
+METAPLEX_METADATA_PROGRAM_ID = PublicKey("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
+
+DEFAULT_CACHE_SIZE = 65_536
+BULK_CHUNK_SIZE = 512
+
+# (seeds, program_id) as raw bytes
+DerivationKey = Tuple[Tuple[bytes, ...], bytes]
+
+
+class DerivationCache:
+    """
+    Bounded LRU cache of find_program_address results
+
+    Keys are the raw seed bytes plus the program id, so the same PDA derived
+    from different call sites (create, verify, distribution) shares one entry.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[DerivationKey, Tuple[PublicKey, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find_program_address(
+        self,
+        seeds: Sequence[bytes],
+        program_id: PublicKey
+    ) -> Tuple[PublicKey, int]:
+        """Cached PublicKey.find_program_address"""
+        key = _derivation_key(seeds, program_id)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Bump search runs outside the lock; a racing duplicate is harmless
+        result = PublicKey.find_program_address(list(key[0]), program_id)
+        self._store(key, result)
+        return result
+
+    def get_associated_token_address(
+        self,
+        owner: PublicKey,
+        mint: PublicKey,
+        token_program_id: PublicKey = TOKEN_PROGRAM_ID
+    ) -> PublicKey:
+        """Cached associated token account address"""
+        return self.find_program_address(
+            [bytes(owner), bytes(token_program_id), bytes(mint)],
+            ASSOCIATED_TOKEN_PROGRAM_ID
+        )[0]
+
+    def find_metadata_pda(self, mint: PublicKey) -> PublicKey:
+        """Cached Metaplex metadata PDA for a mint"""
+        return self.find_program_address(
+            [b"metadata", bytes(METAPLEX_METADATA_PROGRAM_ID), bytes(mint)],
+            METAPLEX_METADATA_PROGRAM_ID
+        )[0]
+
+    def derive_many(
+        self,
+        requests: Iterable[Tuple[Sequence[bytes], PublicKey]],
+        processes: Optional[int] = None,
+        chunksize: int = BULK_CHUNK_SIZE
+    ) -> List[Tuple[PublicKey, int]]:
+        """
+        Derive many program addresses across a process pool
+
+        Entries already cached are served locally; the rest are split into
+        chunks and bump-searched in worker processes. Results are stored back
+        into the cache so later single lookups hit.
+
+        Args:
+            requests: (seeds, program_id) pairs
+            processes: Worker processes (defaults to the CPU count)
+            chunksize: Derivations per worker task
+
+        Returns:
+            (address, bump) per request, in input order
+        """
+        keys = [_derivation_key(seeds, program_id) for seeds, program_id in requests]
+        results: List[Optional[Tuple[PublicKey, int]]] = [None] * len(keys)
+
+        missing: List[int] = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results[i] = cached
+                else:
+                    self.misses += 1
+                    missing.append(i)
+
+        if missing:
+            chunks = [
+                [keys[i] for i in missing[start:start + chunksize]]
+                for start in range(0, len(missing), chunksize)
+            ]
+            workers = processes or os.cpu_count() or 1
+
+            if workers == 1 or len(chunks) == 1:
+                derived = [item for chunk in map(_derive_chunk, chunks) for item in chunk]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    derived = [item for chunk in pool.map(_derive_chunk, chunks) for item in chunk]
+
+            for i, (address, bump) in zip(missing, derived):
+                result = (PublicKey(address), bump)
+                self._store(keys[i], result)
+                results[i] = result
+
+        return results
+
+    def prime(self, seeds: Sequence[bytes], program_id: PublicKey, result: Tuple[PublicKey, int]):
+        """Insert an already-derived address"""
+        self._store(_derivation_key(seeds, program_id), result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _store(self, key: DerivationKey, result: Tuple[PublicKey, int]):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def _derivation_key(seeds: Sequence[bytes], program_id: PublicKey) -> DerivationKey:
+    return tuple(bytes(seed) for seed in seeds), bytes(program_id)
+
+
+def _derive_chunk(chunk: List[DerivationKey]) -> List[Tuple[bytes, int]]:
+    """Process-pool worker: bump searches for a chunk of raw keys"""
+    results = []
+    for seeds, program_id in chunk:
+        address, bump = PublicKey.find_program_address(list(seeds), PublicKey(program_id))
+        results.append((bytes(address), bump))
+    return results
+
+
+def derive_many(
+    requests: Iterable[Tuple[Sequence[bytes], PublicKey]],
+    processes: Optional[int] = None,
+    chunksize: int = BULK_CHUNK_SIZE,
+    cache: Optional[DerivationCache] = None
+) -> List[Tuple[PublicKey, int]]:
+    """DerivationCache.derive_many on the given cache (defaults to the process-wide cache)"""
+    return (cache or default_cache).derive_many(requests, processes, chunksize)
+
+
+# Process-wide cache used by the launchpads
+default_cache = DerivationCache()
+
+
+def find_program_address(seeds: Sequence[bytes], program_id: PublicKey) -> Tuple[PublicKey, int]:
+    """Cached PublicKey.find_program_address on the process-wide cache"""
+    return default_cache.find_program_address(seeds, program_id)
+
+
+def get_associated_token_address(owner: PublicKey, mint: PublicKey) -> PublicKey:
+    """Drop-in cached replacement for spl.token.instructions.get_associated_token_address"""
+    return default_cache.get_associated_token_address(owner, mint)
+
+
+def find_metadata_pda(mint: PublicKey) -> PublicKey:
+    """Cached Metaplex metadata PDA on the process-wide cache"""
+    return default_cache.find_metadata_pda(mint)
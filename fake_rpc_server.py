@@ -0,0 +1,835 @@
+"""
+Fake Solana JSON-RPC Server
+Local stand-in endpoint for exercising RPC routing and load testing the launchpads offline
+"""
+
+import json
+import base64
+import random
+import struct
+import hashlib
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+
+FAKE_SOLANA_CORE_VERSION = "1.17.0-fake"
+FAKE_FEATURE_SET = 0
+
+DEFAULT_SLOT_TIME = 0.4  # Seconds per slot, as on mainnet
+BLOCKHASH_VALIDITY = 150  # Blocks a blockhash stays valid
+CONFIRMED_AFTER_SLOTS = 1  # Slots from processed to confirmed
+FINALIZED_AFTER_SLOTS = 32  # Slots from processed to finalized
+DEFAULT_UNITS_CONSUMED = 45_000  # Reported by simulateTransaction
+SIGNATURE_FEE = 5_000  # Lamports per signature
+
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+METADATA_PROGRAM_ID = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+
+# SPL Token account layouts (same as account_batcher.MINT_LAYOUT for mints)
+_MINT = struct.Struct("<I32sQBBI32s")
+_TOKEN_ACCOUNT = struct.Struct("<32s32sQI32sBIQQI32s")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {c: i for i, c in enumerate(_BASE58_ALPHABET)}
+
+
+class RpcError(Exception):
+    """JSON-RPC error returned to the caller"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class FakeRpcServer:
+    """
+    Threaded JSON-RPC server with in-memory accounts
+
+    Slots advance with wall-clock time. Sent transactions are recorded by
+    signature and move from processed to confirmed to finalized as slots
+    pass, so confirmation polling behaves as it does against a cluster.
+    Sending charges the fee payer the signature fee when it has a balance.
+
+    Legacy transactions are executed atomically for the instructions a
+    launch uses: system create_account and transfer; SPL Token
+    initialize_mint, mint_to, burn and set_authority (mint tokens); the
+    associated token account create; and Metaplex CreateMetadataAccountV3
+    and UpdateMetadataAccountV2. Those update the accounts, balances and
+    token supplies that the read methods report. A failing instruction
+    rejects the send as a preflight failure, or lands the transaction
+    with its error when preflight is skipped. Other programs (compute
+    budget, Raydium) and versioned messages are accepted without effects,
+    so pool creation is not exercised. Signatures are not verified.
+
+    Args:
+        latency: Seconds to sleep before answering each request
+        error_rate: Fraction of requests answered with HTTP 500
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        latency_jitter: Extra uniformly random delay, up to this many seconds
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        max_requests_per_second: Answer HTTP 429 above this sustained rate
+        tx_error_rate: Fraction of sent transactions that land with an error
+        slot_time: Seconds per slot
+        units_consumed: Compute units reported by simulateTransaction
+        priority_fee: Fee reported by getRecentPrioritizationFees
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_jitter: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        max_requests_per_second: Optional[float] = None,
+        tx_error_rate: float = 0.0,
+        slot_time: float = DEFAULT_SLOT_TIME,
+        units_consumed: int = DEFAULT_UNITS_CONSUMED,
+        priority_fee: int = 0
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.latency_jitter = latency_jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.max_requests_per_second = max_requests_per_second
+        self.tx_error_rate = tx_error_rate
+        self.slot_time = slot_time
+        self.units_consumed = units_consumed
+        self.priority_fee = priority_fee
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.balances: Dict[str, int] = {}
+        self.token_supplies: Dict[str, Dict[str, Any]] = {}
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self._blockhash_slots: Dict[str, int] = {}
+        self.request_count = 0
+        self.method_counts: Dict[str, int] = {}
+        self.rate_limited_count = 0
+        self._started_at = time.monotonic()
+        self._tokens = max_requests_per_second or 0.0
+        self._tokens_at = self._started_at
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeRpcServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeRpcServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def dispatch(self, method: str, params: List[Any]) -> Any:
+        """Answer one JSON-RPC method call"""
+        handler = getattr(self, f"_rpc_{method}", None)
+        if handler is None:
+            raise RpcError(-32601, f"Method not found: {method}")
+        with self._lock:
+            self.method_counts[method] = self.method_counts.get(method, 0) + 1
+        return handler(*params)
+
+    @property
+    def slot(self) -> int:
+        return int((time.monotonic() - self._started_at) / self.slot_time) + 1
+
+    def fund(self, pubkey: str, lamports: int):
+        """Credit an account's balance"""
+        with self._lock:
+            self.balances[pubkey] = self.balances.get(pubkey, 0) + lamports
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "rate_limited": self.rate_limited_count,
+                "transactions": len(self.transactions),
+                "methods": dict(self.method_counts),
+            }
+
+    def _context(self, value: Any) -> Dict[str, Any]:
+        return {"context": {"slot": self.slot}, "value": value}
+
+    def _blockhash(self, slot: int) -> str:
+        return _b58encode(hashlib.sha256(f"fake-blockhash-{slot}".encode()).digest())
+
+    def _rpc_getVersion(self, *_):
+        return {"solana-core": FAKE_SOLANA_CORE_VERSION, "feature-set": FAKE_FEATURE_SET}
+
+    def _rpc_getHealth(self, *_):
+        return "ok"
+
+    def _rpc_getSlot(self, *_):
+        return self.slot
+
+    def _rpc_getBlockHeight(self, *_):
+        return self.slot
+
+    def _rpc_getLatestBlockhash(self, *_):
+        slot = self.slot
+        blockhash = self._blockhash(slot)
+        with self._lock:
+            self._blockhash_slots[blockhash] = slot
+        return self._context({
+            "blockhash": blockhash,
+            "lastValidBlockHeight": slot + BLOCKHASH_VALIDITY,
+        })
+
+    def _rpc_getBalance(self, pubkey: str, *_):
+        return self._context(self.balances.get(pubkey, 0))
+
+    def _rpc_requestAirdrop(self, pubkey: str, lamports: int, *_):
+        self.fund(pubkey, lamports)
+        return _b58encode(hashlib.sha512(f"airdrop-{pubkey}-{time.monotonic()}".encode()).digest())
+
+    def _rpc_getMinimumBalanceForRentExemption(self, size: int, *_):
+        return (size + 128) * 6_960  # Two years of rent at the default rate
+
+    def _rpc_getAccountInfo(self, pubkey: str, *_):
+        return self._context(self.accounts.get(pubkey))
+
+    def _rpc_getMultipleAccounts(self, pubkeys: List[str], *_):
+        return self._context([self.accounts.get(pubkey) for pubkey in pubkeys])
+
+    def _rpc_getProgramAccounts(self, program_id: str, config: Optional[Dict[str, Any]] = None):
+        filters = (config or {}).get("filters") or []
+        matched = []
+        for pubkey, account in list(self.accounts.items()):
+            if account.get("owner") != program_id:
+                continue
+            data = account["data"]
+            data = base64.b64decode(data[0] if isinstance(data, (list, tuple)) else data)
+            if all(_filter_matches(data, f) for f in filters):
+                matched.append({"pubkey": pubkey, "account": account})
+        return matched
+
+    def _rpc_getTokenSupply(self, mint: str, *_):
+        supply = self.token_supplies.get(mint)
+        if supply is None:
+            raise RpcError(-32602, "Invalid param: not a Token mint")
+        return self._context(supply)
+
+    def _rpc_getRecentPrioritizationFees(self, *_):
+        slot = self.slot
+        return [
+            {"slot": s, "prioritizationFee": self.priority_fee}
+            for s in range(max(1, slot - BLOCKHASH_VALIDITY + 1), slot + 1)
+        ]
+
+    def _rpc_sendTransaction(self, transaction: str, opts: Optional[Dict[str, Any]] = None):
+        raw = _decode_transaction(transaction, opts)
+        signature, num_signatures, fee_payer = _parse_wire_transaction(raw)
+        message = _parse_legacy_message(raw)
+
+        failed = self.tx_error_rate and random.random() < self.tx_error_rate
+        with self._lock:
+            if signature in self.transactions:
+                return signature
+
+            issued = self._blockhash_slots.get(message[1]) if message else None
+            if issued is not None and self.slot > issued + BLOCKHASH_VALIDITY:
+                raise RpcError(-32002, "Transaction simulation failed: Blockhash not found")
+
+            err = {"InstructionError": [0, {"Custom": 1}]} if failed else None
+            if err is None and message is not None:
+                ledger = _Ledger(self)
+                err = ledger.execute(*message)
+                if err is not None and not (opts or {}).get("skipPreflight", False):
+                    raise RpcError(-32002, f"Transaction simulation failed: {json.dumps(err)}")
+                if err is None:
+                    ledger.commit()
+
+            self.transactions[signature] = {"slot": self.slot, "err": err}
+            if fee_payer in self.balances:
+                self.balances[fee_payer] -= SIGNATURE_FEE * num_signatures
+        return signature
+
+    def _rpc_getSignatureStatuses(self, signatures: List[str], *_):
+        slot = self.slot
+        statuses = []
+        with self._lock:
+            for signature in signatures:
+                tx = self.transactions.get(signature)
+                if tx is None:
+                    statuses.append(None)
+                    continue
+                age = slot - tx["slot"]
+                if age >= FINALIZED_AFTER_SLOTS:
+                    status, confirmations = "finalized", None
+                elif age >= CONFIRMED_AFTER_SLOTS:
+                    status, confirmations = "confirmed", age
+                else:
+                    status, confirmations = "processed", 0
+                statuses.append({
+                    "slot": tx["slot"],
+                    "confirmations": confirmations,
+                    "err": tx["err"],
+                    "status": {"Err": tx["err"]} if tx["err"] else {"Ok": None},
+                    "confirmationStatus": status,
+                })
+        return self._context(statuses)
+
+    def _rpc_simulateTransaction(self, transaction: str, opts: Optional[Dict[str, Any]] = None):
+        _decode_transaction(transaction, opts)
+        return self._context({
+            "err": None,
+            "logs": [],
+            "accounts": None,
+            "unitsConsumed": self.units_consumed,
+        })
+
+    def _rate_limited(self) -> bool:
+        if self.rate_limit_rate and random.random() < self.rate_limit_rate:
+            return True
+        if self.max_requests_per_second is None:
+            return False
+
+        # Token bucket holding up to one second of requests
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_requests_per_second,
+            self._tokens + (now - self._tokens_at) * self.max_requests_per_second
+        )
+        self._tokens_at = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+
+                with server._lock:
+                    server.request_count += 1
+                    limited = server._rate_limited()
+                    if limited:
+                        server.rate_limited_count += 1
+
+                if limited:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                delay = server.latency
+                if server.latency_jitter:
+                    delay += random.uniform(0, server.latency_jitter)
+                if delay:
+                    time.sleep(delay)
+
+                if server.error_rate and random.random() < server.error_rate:
+                    self._reply(500, b'{"error": "injected failure"}')
+                    return
+
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    self._reply(400, json.dumps(_error(None, -32700, "Parse error")).encode())
+                    return
+
+                if isinstance(request, list):
+                    response = [server._answer(item) for item in request]
+                else:
+                    response = server._answer(request)
+                self._reply(200, json.dumps(response).encode())
+
+            def _reply(self, status: int, payload: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # Keep test output quiet
+
+        return Handler
+
+    def _answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = request.get("id")
+        try:
+            result = self.dispatch(request.get("method", ""), request.get("params") or [])
+        except RpcError as e:
+            return _error(request_id, e.code, e.message)
+        except TypeError as e:
+            return _error(request_id, -32602, f"Invalid params: {e}")
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _b58encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = _BASE58_ALPHABET[remainder] + encoded
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading_zeros + encoded
+
+
+def _b58decode(text: str) -> bytes:
+    number = 0
+    for char in text:
+        if char not in _BASE58_INDEX:
+            raise RpcError(-32602, f"Invalid param: invalid base58 character {char!r}")
+        number = number * 58 + _BASE58_INDEX[char]
+    leading_ones = len(text) - len(text.lstrip("1"))
+    return b"\0" * leading_ones + number.to_bytes((number.bit_length() + 7) // 8, "big")
+
+
+def _filter_matches(data: bytes, account_filter: Dict[str, Any]) -> bool:
+    """Apply one getProgramAccounts dataSize or memcmp filter"""
+    if "dataSize" in account_filter:
+        return len(data) == account_filter["dataSize"]
+    memcmp = account_filter.get("memcmp")
+    if memcmp is None:
+        raise RpcError(-32602, f"Invalid param: unsupported filter {account_filter!r}")
+    if memcmp.get("encoding") == "base64":
+        expected = base64.b64decode(memcmp["bytes"])
+    else:
+        expected = _b58decode(memcmp["bytes"])
+    offset = memcmp.get("offset", 0)
+    return data[offset:offset + len(expected)] == expected
+
+
+def _decode_transaction(transaction: str, opts: Optional[Dict[str, Any]]) -> bytes:
+    """Wire bytes of a transaction sent as base58 (the RPC default) or base64"""
+    if (opts or {}).get("encoding", "base58") != "base64":
+        return _b58decode(transaction)
+    try:
+        return base64.b64decode(transaction, validate=True)
+    except ValueError:
+        raise RpcError(-32602, "Invalid param: invalid base64 transaction")
+
+
+def _read_compact_u16(raw: bytes, offset: int):
+    value = 0
+    for shift in (0, 7, 14):
+        if offset >= len(raw):
+            raise RpcError(-32602, "Invalid param: truncated transaction")
+        byte = raw[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+    return value, offset
+
+
+class _InstructionError(Exception):
+    def __init__(self, error: Any):
+        super().__init__(error)
+        self.error = error
+
+
+class _Ledger:
+    """
+    Pending account changes of one transaction over the server's state
+
+    Reads fall through to the server; writes stay here until commit(), so
+    a failing instruction leaves nothing behind.
+    """
+
+    def __init__(self, server: FakeRpcServer):
+        self.server = server
+        self.accounts: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.data: Dict[str, bytearray] = {}
+        self.balances: Dict[str, int] = {}
+        self.mints = set()
+
+    def execute(self, account_keys: List[str], blockhash: str, signers: int, instructions) -> Optional[Dict[str, Any]]:
+        """Run every instruction; returns the transaction error, or None"""
+        handlers = {
+            SYSTEM_PROGRAM_ID: self._system,
+            TOKEN_PROGRAM_ID: self._token,
+            ASSOCIATED_TOKEN_PROGRAM_ID: self._associated_token,
+            METADATA_PROGRAM_ID: self._metadata,
+        }
+        signed = set(account_keys[:signers])
+        for index, (program_id, accounts, data) in enumerate(instructions):
+            handler = handlers.get(program_id)
+            if handler is None:
+                continue
+            try:
+                handler(accounts, data, signed)
+            except _InstructionError as e:
+                return {"InstructionError": [index, e.error]}
+            except (struct.error, IndexError):
+                return {"InstructionError": [index, "InvalidInstructionData"]}
+        return None
+
+    def commit(self):
+        server = self.server
+        for pubkey, account in self.accounts.items():
+            if account is None:
+                continue
+            if pubkey in self.data:
+                account["data"] = [base64.b64encode(bytes(self.data[pubkey])).decode(), "base64"]
+            server.accounts[pubkey] = account
+        server.balances.update(self.balances)
+        for mint in self.mints:
+            _, _, supply, decimals, _, _, _ = _MINT.unpack(self.data[mint])
+            server.token_supplies[mint] = _token_amount(supply, decimals)
+
+    # State access
+
+    def account(self, pubkey: str) -> Optional[Dict[str, Any]]:
+        if pubkey not in self.accounts:
+            account = self.server.accounts.get(pubkey)
+            self.accounts[pubkey] = dict(account) if account is not None else None
+        return self.accounts[pubkey]
+
+    def account_bytes(self, pubkey: str, owner: str) -> bytearray:
+        if pubkey not in self.data:
+            account = self.account(pubkey)
+            if account is None or account.get("owner") != owner:
+                raise _InstructionError("InvalidAccountData")
+            raw = account["data"]
+            self.data[pubkey] = bytearray(base64.b64decode(raw[0] if isinstance(raw, (list, tuple)) else raw))
+        return self.data[pubkey]
+
+    def balance(self, pubkey: str) -> Optional[int]:
+        if pubkey in self.balances:
+            return self.balances[pubkey]
+        return self.server.balances.get(pubkey)
+
+    def debit(self, pubkey: str, lamports: int):
+        """Take lamports from an account the server tracks a balance for"""
+        balance = self.balance(pubkey)
+        if balance is None:
+            return
+        if balance < lamports:
+            raise _InstructionError({"Custom": 1})  # InsufficientFunds
+        self.balances[pubkey] = balance - lamports
+
+    def create(self, pubkey: str, owner: str, space: int, lamports: int):
+        if self.account(pubkey) is not None:
+            raise _InstructionError({"Custom": 0})  # AccountAlreadyInUse
+        self.accounts[pubkey] = {
+            "lamports": lamports,
+            "owner": owner,
+            "data": None,
+            "executable": False,
+            "rentEpoch": 0,
+            "space": space,
+        }
+        self.data[pubkey] = bytearray(space)
+        self.balances[pubkey] = (self.balance(pubkey) or 0) + lamports
+
+    def rent(self, space: int) -> int:
+        return self.server._rpc_getMinimumBalanceForRentExemption(space)
+
+    # Programs
+
+    def _system(self, accounts: List[str], data: bytes, signed: set):
+        (instruction,) = _U32.unpack_from(data, 0)
+        if instruction == 0:  # CreateAccount
+            lamports, space = struct.unpack_from("<QQ", data, 4)
+            owner = _b58encode(data[20:52])
+            self.debit(accounts[0], lamports)
+            self.create(accounts[1], owner, space, lamports)
+        elif instruction == 2:  # Transfer
+            (lamports,) = _U64.unpack_from(data, 4)
+            self.debit(accounts[0], lamports)
+            self.balances[accounts[1]] = (self.balance(accounts[1]) or 0) + lamports
+
+    def _token(self, accounts: List[str], data: bytes, signed: set):
+        instruction = data[0]
+        if instruction in (0, 20):  # InitializeMint, InitializeMint2
+            mint = self.account_bytes(accounts[0], TOKEN_PROGRAM_ID)
+            if len(mint) != _MINT.size:
+                raise _InstructionError("InvalidAccountData")
+            if mint[45]:
+                raise _InstructionError({"Custom": 6})  # AlreadyInUse
+            decimals, authority, has_freeze = data[1], data[2:34], data[34]
+            freeze = data[35:67] if has_freeze else bytes(32)
+            _MINT.pack_into(mint, 0, 1, authority, 0, decimals, 1, has_freeze, freeze)
+            self.mints.add(accounts[0])
+        elif instruction in (7, 14):  # MintTo, MintToChecked
+            (amount,) = _U64.unpack_from(data, 1)
+            mint = self._mint(accounts[0])
+            has_authority, authority, supply, decimals, _, has_freeze, freeze = _MINT.unpack(mint)
+            if not has_authority:
+                raise _InstructionError({"Custom": 5})  # FixedSupply
+            self._check_authority(authority, accounts[2], signed)
+            destination = self._token_account(accounts[1], accounts[0])
+            if supply + amount > 0xFFFFFFFFFFFFFFFF:
+                raise _InstructionError({"Custom": 14})  # Overflow
+            _MINT.pack_into(mint, 0, has_authority, authority, supply + amount, decimals, 1, has_freeze, freeze)
+            _U64.pack_into(destination, 64, _U64.unpack_from(destination, 64)[0] + amount)
+        elif instruction in (8, 15):  # Burn, BurnChecked
+            (amount,) = _U64.unpack_from(data, 1)
+            source = self._token_account(accounts[0], accounts[1])
+            self._check_authority(source[32:64], accounts[2], signed)
+            (balance,) = _U64.unpack_from(source, 64)
+            if balance < amount:
+                raise _InstructionError({"Custom": 1})  # InsufficientFunds
+            mint = self._mint(accounts[1])
+            has_authority, authority, supply, decimals, _, has_freeze, freeze = _MINT.unpack(mint)
+            _MINT.pack_into(mint, 0, has_authority, authority, supply - amount, decimals, 1, has_freeze, freeze)
+            _U64.pack_into(source, 64, balance - amount)
+        elif instruction == 6:  # SetAuthority
+            authority_type, has_new = data[1], data[2]
+            if authority_type != 0:  # Only MintTokens is modelled
+                return
+            mint = self._mint(accounts[0])
+            has_authority, authority, supply, decimals, _, has_freeze, freeze = _MINT.unpack(mint)
+            if not has_authority:
+                raise _InstructionError({"Custom": 15})  # AuthorityTypeNotSupported
+            self._check_authority(authority, accounts[1], signed)
+            new_authority = data[3:35] if has_new else bytes(32)
+            _MINT.pack_into(mint, 0, has_new, new_authority, supply, decimals, 1, has_freeze, freeze)
+
+    def _associated_token(self, accounts: List[str], data: bytes, signed: set):
+        payer, ata, owner, mint = accounts[:4]
+        if self.account(ata) is not None:
+            if data[:1] == b"\x01":  # CreateIdempotent
+                return
+            raise _InstructionError({"Custom": 0})  # AccountAlreadyInUse
+        self._mint(mint)
+        lamports = self.rent(_TOKEN_ACCOUNT.size)
+        self.debit(payer, lamports)
+        self.create(ata, TOKEN_PROGRAM_ID, _TOKEN_ACCOUNT.size, lamports)
+        _TOKEN_ACCOUNT.pack_into(
+            self.data[ata], 0, _b58decode(mint), _b58decode(owner), 0, 0, bytes(32), 1, 0, 0, 0, 0, bytes(32)
+        )
+
+    def _metadata(self, accounts: List[str], data: bytes, signed: set):
+        instruction = data[0]
+        if instruction == 33:  # CreateMetadataAccountV3
+            metadata, mint, mint_authority, payer, update_authority = accounts[:5]
+            authority = _MINT.unpack(self._mint(mint))[1]
+            self._check_authority(authority, mint_authority, signed)
+            body, is_mutable = _metadata_v3_body(data)
+            # Account: key (MetadataV1), update authority, mint, data,
+            # primary sale happened, is_mutable, no edition nonce or token standard
+            account_data = (
+                bytes([4]) + _b58decode(update_authority) + _b58decode(mint)
+                + body + bytes([0, is_mutable, 0, 0])
+            )
+            lamports = self.rent(len(account_data))
+            self.debit(payer, lamports)
+            self.create(metadata, METADATA_PROGRAM_ID, len(account_data), lamports)
+            self.data[metadata][:] = account_data
+        elif instruction == 15:  # UpdateMetadataAccountV2
+            account = self.account_bytes(accounts[0], METADATA_PROGRAM_ID)
+            self._check_authority(account[1:33], accounts[1], signed)
+            is_mutable_offset = _metadata_is_mutable_offset(account)
+            if not account[is_mutable_offset]:
+                raise _InstructionError({"Custom": 28})  # DataIsImmutable
+            _apply_metadata_update(account, is_mutable_offset, data)
+
+    def _mint(self, pubkey: str) -> bytearray:
+        mint = self.account_bytes(pubkey, TOKEN_PROGRAM_ID)
+        if len(mint) != _MINT.size or not mint[45]:
+            raise _InstructionError({"Custom": 2})  # InvalidMint
+        self.mints.add(pubkey)
+        return mint
+
+    def _token_account(self, pubkey: str, mint: str) -> bytearray:
+        account = self.account_bytes(pubkey, TOKEN_PROGRAM_ID)
+        if len(account) != _TOKEN_ACCOUNT.size:
+            raise _InstructionError("InvalidAccountData")
+        if _b58encode(bytes(account[:32])) != mint:
+            raise _InstructionError({"Custom": 3})  # MintMismatch
+        return account
+
+    def _check_authority(self, expected: bytes, pubkey: str, signed: set):
+        if _b58encode(bytes(expected)) != pubkey:
+            raise _InstructionError({"Custom": 4})  # OwnerMismatch
+        if pubkey not in signed:
+            raise _InstructionError("MissingRequiredSignature")
+
+
+def _token_amount(amount: int, decimals: int) -> Dict[str, Any]:
+    ui_amount = amount / 10 ** decimals
+    return {
+        "amount": str(amount),
+        "decimals": decimals,
+        "uiAmount": ui_amount,
+        "uiAmountString": f"{ui_amount:.{decimals}f}".rstrip("0").rstrip(".") if decimals else str(amount),
+    }
+
+
+def _metadata_v3_body(data: bytes) -> Tuple[bytes, int]:
+    """Metadata data (name through creators) of CreateMetadataAccountV3, and is_mutable"""
+    offset = 1
+    for _ in range(3):  # name, symbol, uri
+        offset += _U32.size + _U32.unpack_from(data, offset)[0]
+    offset += 2  # seller_fee_basis_points
+    has_creators = data[offset]
+    offset += 1
+    if has_creators:
+        offset += _U32.size + 34 * _U32.unpack_from(data, offset)[0]
+    body = data[1:offset]
+    for _ in range(2):  # collection, uses: only None is supported
+        if data[offset]:
+            raise _InstructionError("InvalidInstructionData")
+        offset += 1
+    return body, data[offset]
+
+
+def _metadata_is_mutable_offset(account: bytearray) -> int:
+    offset = 65
+    for _ in range(3):
+        offset += _U32.size + _U32.unpack_from(account, offset)[0]
+    offset += 2
+    if account[offset]:
+        offset += 1 + _U32.size + 34 * _U32.unpack_from(account, offset + 1)[0]
+    else:
+        offset += 1
+    return offset + 1  # After primary_sale_happened
+
+
+def _apply_metadata_update(account: bytearray, is_mutable_offset: int, data: bytes):
+    """
+    Apply UpdateMetadataAccountV2's update authority, primary sale and
+    is_mutable options; replacing the data itself is not supported.
+    Missing options or values fail like Borsh decoding in the program.
+    """
+    if len(data) < 2 or data[1]:
+        raise _InstructionError("InvalidInstructionData")
+    offset = 2
+    values = []
+    for size in (32, 1, 1):  # update_authority, primary_sale_happened, is_mutable
+        if offset >= len(data) or data[offset] > 1:
+            raise _InstructionError("InvalidInstructionData")
+        if data[offset]:
+            if offset + 1 + size > len(data):
+                raise _InstructionError("InvalidInstructionData")
+            values.append(data[offset + 1:offset + 1 + size])
+            offset += 1 + size
+        else:
+            values.append(None)
+            offset += 1
+    if offset != len(data):
+        raise _InstructionError("InvalidInstructionData")
+
+    update_authority, primary_sale_happened, is_mutable = values
+    if update_authority is not None:
+        account[1:33] = update_authority
+    if primary_sale_happened is not None:
+        account[is_mutable_offset - 1] = primary_sale_happened[0]
+    if is_mutable is not None:
+        account[is_mutable_offset] = is_mutable[0]
+
+
+def _parse_legacy_message(raw: bytes):
+    """
+    (account keys, blockhash, required signatures, instructions) of a legacy
+    transaction, or None for a versioned one whose keys may come from
+    lookup tables
+    """
+    num_signatures, offset = _read_compact_u16(raw, 0)
+    offset += 64 * num_signatures
+    if raw[offset] & 0x80:
+        return None
+    required_signatures = raw[offset]
+    offset += 3
+
+    num_keys, offset = _read_compact_u16(raw, offset)
+    account_keys = [_b58encode(raw[offset + 32 * i:offset + 32 * (i + 1)]) for i in range(num_keys)]
+    offset += 32 * num_keys
+    blockhash = _b58encode(raw[offset:offset + 32])
+    offset += 32
+
+    instructions = []
+    num_instructions, offset = _read_compact_u16(raw, offset)
+    try:
+        for _ in range(num_instructions):
+            program_id = account_keys[raw[offset]]
+            num_accounts, offset = _read_compact_u16(raw, offset + 1)
+            accounts = [account_keys[index] for index in raw[offset:offset + num_accounts]]
+            offset += num_accounts
+            data_length, offset = _read_compact_u16(raw, offset)
+            instructions.append((program_id, accounts, raw[offset:offset + data_length]))
+            offset += data_length
+    except IndexError:
+        raise RpcError(-32602, "Invalid param: malformed transaction")
+    return account_keys, blockhash, required_signatures, instructions
+
+
+def _parse_wire_transaction(raw: bytes):
+    """(first signature, signature count, fee payer) of a serialized transaction"""
+    num_signatures, signatures_start = _read_compact_u16(raw, 0)
+    message_start = signatures_start + 64 * num_signatures
+    if num_signatures == 0 or len(raw) < message_start + 3:
+        raise RpcError(-32602, "Invalid param: malformed transaction")
+
+    offset = message_start + 3  # Message header
+    if raw[message_start] & 0x80:
+        offset += 1  # Versioned message prefix
+    num_keys, offset = _read_compact_u16(raw, offset)
+    if num_keys == 0 or len(raw) < offset + 32:
+        raise RpcError(-32602, "Invalid param: malformed transaction")
+
+    signature = _b58encode(raw[signatures_start:signatures_start + 64])
+    fee_payer = _b58encode(raw[offset:offset + 32])
+    return signature, num_signatures, fee_payer
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run a fake Solana JSON-RPC endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds per request")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Extra random seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction answered with HTTP 429")
+    parser.add_argument("--max-rps", type=float, default=None, help="Answer HTTP 429 above this rate")
+    parser.add_argument("--tx-error-rate", type=float, default=0.0, help="Fraction of transactions that fail")
+    args = parser.parse_args(argv)
+
+    server = FakeRpcServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        host=args.host,
+        port=args.port,
+        latency_jitter=args.latency_jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        max_requests_per_second=args.max_rps,
+        tx_error_rate=args.tx_error_rate
+    )
+    with server:
+        print(f"Fake Solana RPC listening on {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+Token-2022 Withheld Fee Harvester
+Finds token accounts holding withheld transfer fees and sweeps them in maximally packed transactions
+"""
+
+import time
+import struct
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Callable
+
+from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
+from solana.rpc.types import MemcmpOpts
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction, TransactionInstruction, AccountMeta
+
+from account_batcher import account_data
+from blockhash_cache import get_blockhash_provider
+from compute_budget import BUDGET_RESERVE, ComputeBudgetPlanner
+from confirmation_tracker import ConfirmationTracker
+from memecoin_launchpad_with_fees import TOKEN_2022_PROGRAM_ID
+from rpc_metrics import record_retry
+from transaction_packer import MAX_TX_ACCOUNTS, TransactionPacker
+
+# Token-2022 account layout: the 165-byte SPL token account, an account-type
+# byte, then type-length-value extensions
+TOKEN_ACCOUNT_SIZE = 165
+ACCOUNT_TYPE_ACCOUNT = 2
+EXTENSION_TRANSFER_FEE_AMOUNT = 2  # Value: withheld_amount u64
+_TLV_HEADER = struct.Struct("<HH")
+_U64 = struct.Struct("<Q")
+
+# TransferFeeExtension instruction and its sub-instructions
+TRANSFER_FEE_EXTENSION = 26
+WITHDRAW_WITHHELD_TOKENS_FROM_MINT = 2
+WITHDRAW_WITHHELD_TOKENS_FROM_ACCOUNTS = 3
+HARVEST_WITHHELD_TOKENS_TO_MINT = 4
+MAX_WITHDRAW_SOURCES = 255  # num_token_accounts is a u8
+
+DEFAULT_MAX_CONCURRENT_SENDS = 8
+DEFAULT_MAX_RETRIES = 3
+RETRY_DELAY = 1.0  # Seconds between attempts of one batch
+
+
+def decode_withheld_amount(data: bytes) -> Optional[int]:
+    """
+    Withheld transfer fees in a Token-2022 token account
+
+    Returns:
+        The TransferFeeAmount extension's withheld amount, or None if the
+        data is not a token account carrying that extension
+    """
+    if len(data) <= TOKEN_ACCOUNT_SIZE or data[TOKEN_ACCOUNT_SIZE] != ACCOUNT_TYPE_ACCOUNT:
+        return None
+
+    offset = TOKEN_ACCOUNT_SIZE + 1
+    while offset + _TLV_HEADER.size <= len(data):
+        extension_type, length = _TLV_HEADER.unpack_from(data, offset)
+        offset += _TLV_HEADER.size
+        if extension_type == 0:
+            break  # Uninitialized: the rest is padding
+        if extension_type == EXTENSION_TRANSFER_FEE_AMOUNT:
+            if length < _U64.size or offset + _U64.size > len(data):
+                return None  # Malformed or truncated extension
+            return _U64.unpack_from(data, offset)[0]
+        offset += length
+    return None
+
+
+def harvest_withheld_tokens_to_mint(
+    mint: PublicKey,
+    sources: List[PublicKey],
+    program_id: PublicKey = TOKEN_2022_PROGRAM_ID
+) -> TransactionInstruction:
+    """Permissionless sweep of the sources' withheld fees into the mint"""
+    return TransactionInstruction(
+        program_id=program_id,
+        data=bytes([TRANSFER_FEE_EXTENSION, HARVEST_WITHHELD_TOKENS_TO_MINT]),
+        keys=[AccountMeta(pubkey=mint, is_signer=False, is_writable=True)] + [
+            AccountMeta(pubkey=source, is_signer=False, is_writable=True) for source in sources
+        ]
+    )
+
+
+def withdraw_withheld_tokens_from_accounts(
+    mint: PublicKey,
+    destination: PublicKey,
+    authority: PublicKey,
+    sources: List[PublicKey],
+    program_id: PublicKey = TOKEN_2022_PROGRAM_ID
+) -> TransactionInstruction:
+    """Move the sources' withheld fees straight to destination (signed by the withdraw authority)"""
+    if len(sources) > MAX_WITHDRAW_SOURCES:
+        raise ValueError(f"At most {MAX_WITHDRAW_SOURCES} source accounts per withdraw instruction")
+    return TransactionInstruction(
+        program_id=program_id,
+        data=bytes([TRANSFER_FEE_EXTENSION, WITHDRAW_WITHHELD_TOKENS_FROM_ACCOUNTS, len(sources)]),
+        keys=[
+            AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
+            AccountMeta(pubkey=destination, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=authority, is_signer=True, is_writable=False),
+        ] + [AccountMeta(pubkey=source, is_signer=False, is_writable=True) for source in sources]
+    )
+
+
+def withdraw_withheld_tokens_from_mint(
+    mint: PublicKey,
+    destination: PublicKey,
+    authority: PublicKey,
+    program_id: PublicKey = TOKEN_2022_PROGRAM_ID
+) -> TransactionInstruction:
+    """Move fees already harvested into the mint to destination"""
+    return TransactionInstruction(
+        program_id=program_id,
+        data=bytes([TRANSFER_FEE_EXTENSION, WITHDRAW_WITHHELD_TOKENS_FROM_MINT]),
+        keys=[
+            AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=destination, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=authority, is_signer=True, is_writable=False),
+        ]
+    )
+
+
+@dataclass
+class WithheldAccount:
+    """A token account with withheld fees waiting to be collected"""
+    address: PublicKey
+    withheld: int
+
+
+@dataclass
+class HarvestReport:
+    """Outcome of one harvest or withdraw run"""
+    accounts_scanned: int = 0
+    accounts_with_fees: int = 0
+    total_withheld: int = 0
+    sources_per_transaction: int = 0
+    signatures: List[str] = field(default_factory=list)
+    swept: int = 0  # Withheld amount in confirmed batches
+    failed: List[Tuple[List[str], str]] = field(default_factory=list)  # (sources, error)
+    seconds: float = 0.0
+
+
+class WithheldFeeHarvester:
+    """
+    Collects Token-2022 withheld transfer fees for a mint
+
+    One getProgramAccounts call with a memcmp filter on the mint field
+    lists the mint's token accounts; each account's TransferFeeAmount
+    extension is decoded locally. Accounts with withheld fees are split into
+    batches of the largest size that still fits one transaction (with room
+    for the compute-budget instructions), measured once per instruction kind
+    with TransactionPacker. Batches are independent, so up to
+    `max_concurrent` are in flight at once; their confirmations are polled
+    together by one ConfirmationTracker, and a failed batch is retried with
+    a fresh blockhash before being reported.
+
+    Args:
+        client: Solana RPC client
+        payer: Fee payer for the sweep transactions
+        max_concurrent: Transactions in flight at once
+        compute_budget: Prepends simulated limits and priority fees when given
+        min_withheld: Accounts holding less than this are skipped
+        max_retries: Attempts per batch
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        payer: Keypair,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_SENDS,
+        compute_budget: Optional[ComputeBudgetPlanner] = None,
+        min_withheld: int = 1,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        program_id: PublicKey = TOKEN_2022_PROGRAM_ID
+    ):
+        self.client = client
+        self.payer = payer
+        self.max_concurrent = max_concurrent
+        self.compute_budget = compute_budget
+        self.min_withheld = min_withheld
+        self.max_retries = max_retries
+        self.program_id = program_id
+        self.blockhash = get_blockhash_provider(client)
+        self.confirmations = ConfirmationTracker(client, commitment=Confirmed)
+        self._packer = TransactionPacker(payer.public_key, reserved=BUDGET_RESERVE)
+        self._capacity: Dict[str, int] = {}
+
+    def scan(self, mint: PublicKey) -> Tuple[int, List[WithheldAccount]]:
+        """
+        Token accounts of a mint holding withheld fees
+
+        Returns:
+            (accounts scanned, accounts with at least min_withheld, largest first)
+        """
+        response = self.client.get_program_accounts(
+            self.program_id,
+            encoding="base64",
+            memcmp_opts=[MemcmpOpts(offset=0, bytes=str(mint))]
+        )
+        accounts = response['result']
+
+        found = []
+        for item in accounts:
+            withheld = decode_withheld_amount(account_data(item['account']))
+            if withheld is not None and withheld >= self.min_withheld:
+                found.append(WithheldAccount(PublicKey(item['pubkey']), withheld))
+        found.sort(key=lambda account: account.withheld, reverse=True)
+        return len(accounts), found
+
+    def max_sources(self, kind: str, build: Callable[[List[PublicKey]], TransactionInstruction]) -> int:
+        """Largest source count for which build(sources) fits one transaction"""
+        capacity = self._capacity.get(kind)
+        if capacity is None:
+            # Every source adds one distinct 32-byte key, so size grows
+            # monotonically; bisect over placeholder keys
+            low, high = 0, MAX_TX_ACCOUNTS
+            while low < high:
+                middle = (low + high + 1) // 2
+                sources = [PublicKey(i.to_bytes(32, "little")) for i in range(1, middle + 1)]
+                if self._packer.fits([build(sources)]):
+                    low = middle
+                else:
+                    high = middle - 1
+            if low == 0:
+                raise ValueError(f"A {kind} instruction with one source does not fit in a transaction")
+            capacity = self._capacity[kind] = low
+        return capacity
+
+    def harvest(
+        self,
+        mint: PublicKey,
+        withdraw_authority: Optional[Keypair] = None,
+        destination: Optional[PublicKey] = None
+    ) -> HarvestReport:
+        """
+        Sweep every account's withheld fees into the mint (permissionless)
+
+        With a withdraw authority and destination, the mint's accumulated
+        withheld balance is then withdrawn to destination; a failed withdraw
+        is recorded in report.failed under the mint address.
+        """
+        def build(sources: List[PublicKey]) -> TransactionInstruction:
+            return harvest_withheld_tokens_to_mint(mint, sources, self.program_id)
+
+        report = self._run(mint, "harvest", build, [self.payer])
+        if withdraw_authority is not None and destination is not None and report.swept:
+            signers = self._signers(withdraw_authority)
+            ix = withdraw_withheld_tokens_from_mint(mint, destination, withdraw_authority.public_key, self.program_id)
+            try:
+                report.signatures.append(self._send_with_retry(ix, signers))
+            except Exception as e:
+                # The harvest batches have landed; keep their report
+                report.failed.append(([str(mint)], f"withdraw from mint: {e}"))
+        return report
+
+    def withdraw(
+        self,
+        mint: PublicKey,
+        withdraw_authority: Keypair,
+        destination: PublicKey
+    ) -> HarvestReport:
+        """Withdraw every account's withheld fees directly to destination"""
+        def build(sources: List[PublicKey]) -> TransactionInstruction:
+            return withdraw_withheld_tokens_from_accounts(
+                mint, destination, withdraw_authority.public_key, sources, self.program_id
+            )
+
+        return self._run(mint, "withdraw", build, self._signers(withdraw_authority))
+
+    def _signers(self, authority: Keypair) -> List[Keypair]:
+        if authority.public_key == self.payer.public_key:
+            return [self.payer]
+        return [self.payer, authority]
+
+    def _run(
+        self,
+        mint: PublicKey,
+        kind: str,
+        build: Callable[[List[PublicKey]], TransactionInstruction],
+        signers: List[Keypair]
+    ) -> HarvestReport:
+        started = time.monotonic()
+        report = HarvestReport()
+        report.accounts_scanned, accounts = self.scan(mint)
+        report.accounts_with_fees = len(accounts)
+        report.total_withheld = sum(account.withheld for account in accounts)
+        if not accounts:
+            report.seconds = time.monotonic() - started
+            return report
+
+        per_transaction = report.sources_per_transaction = self.max_sources(kind, build)
+        batches = [accounts[i:i + per_transaction] for i in range(0, len(accounts), per_transaction)]
+        print(f"🧹 {kind}: {len(accounts):,} accounts, {report.total_withheld:,} withheld, "
+              f"{len(batches)} transactions of up to {per_transaction} sources")
+
+        def send(batch: List[WithheldAccount]) -> str:
+            return self._send_with_retry(build([account.address for account in batch]), signers)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="fee-harvester") as pool:
+            futures = [(batch, pool.submit(send, batch)) for batch in batches]
+            for batch, future in futures:
+                try:
+                    report.signatures.append(future.result())
+                    report.swept += sum(account.withheld for account in batch)
+                except Exception as e:
+                    report.failed.append(([str(account.address) for account in batch], str(e)))
+
+        report.seconds = time.monotonic() - started
+        print(f"✅ Swept {report.swept:,} in {len(report.signatures)} transactions "
+              f"({len(report.failed)} failed) in {report.seconds:.1f}s")
+        return report
+
+    def _send_with_retry(self, ix: TransactionInstruction, signers: List[Keypair]) -> str:
+        for attempt in range(self.max_retries):
+            try:
+                transaction = Transaction(fee_payer=self.payer.public_key)
+                transaction.add(ix)
+                if self.compute_budget is not None:
+                    transaction = self.compute_budget.apply(transaction, signers, attempt)
+                response = self.client.send_transaction(
+                    transaction,
+                    *signers,
+                    opts={"skip_preflight": False, "preflight_commitment": Confirmed},
+                    recent_blockhash=self.blockhash.get_blockhash()
+                )
+                self.confirmations.track(response['result'], Confirmed).result()
+                return response['result']
+            except Exception:
+                if attempt == self.max_retries - 1:
+                    raise
+                record_retry(self.client, "send_transaction")
+                self.blockhash.invalidate()
+                time.sleep(RETRY_DELAY)
+
+    def stop(self):
+        self.confirmations.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    import json
+    from rpc_pool import shared_client
+    from solana_memecoin_launchpad_production import MAINNET_RPC_ENDPOINTS
+
+    parser = argparse.ArgumentParser(description="Collect Token-2022 withheld transfer fees for a mint")
+    parser.add_argument("mint")
+    parser.add_argument("--payer", required=True, help="Fee payer keypair file (solana CLI JSON format)")
+    parser.add_argument("--authority", help="Withdraw-withheld authority keypair file")
+    parser.add_argument("--destination", help="Token account receiving withdrawn fees")
+    parser.add_argument("--direct", action="store_true",
+                        help="Withdraw from accounts directly instead of harvesting to the mint first")
+    parser.add_argument("--rpc-url", default=MAINNET_RPC_ENDPOINTS[0])
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENT_SENDS)
+    args = parser.parse_args(argv)
+
+    def load_keypair(path: str) -> Keypair:
+        with open(path) as f:
+            return Keypair.from_secret_key(bytes(json.load(f)))
+
+    harvester = WithheldFeeHarvester(
+        shared_client(args.rpc_url), load_keypair(args.payer), max_concurrent=args.concurrency
+    )
+    mint = PublicKey(args.mint)
+    authority = load_keypair(args.authority) if args.authority else None
+    destination = PublicKey(args.destination) if args.destination else None
+    try:
+        if args.direct:
+            if authority is None or destination is None:
+                parser.error("--direct needs --authority and --destination")
+            report = harvester.withdraw(mint, authority, destination)
+        else:
+            report = harvester.harvest(mint, authority, destination)
+    finally:
+        harvester.stop()
+
+    for sources, error in report.failed:
+        print(f"❌ {len(sources)} sources failed: {error}")
+
+
+if __name__ == "__main__":
+    main()
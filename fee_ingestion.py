@@ -0,0 +1,443 @@
+"""
+Transfer Fee Ingestion
+Streams transfer events in bounded chunks into rolling per-mint volume/fee windows and milestone checks
+"""
+
+import sys
+import json
+import math
+import time
+import queue
+import socket
+import argparse
+import threading
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterable, Iterator, Callable, NamedTuple
+
+from memecoin_launchpad_with_fees import CreatorFeeConfig, FeeDistributionManager, split_fee
+from milestone_tracker import MAX_TRACKED_VOLUME
+
+if TYPE_CHECKING:
+    from fee_persistence import FeeStateStore
+
+DEFAULT_CHUNK_SIZE = 1_024  # Events per chunk handed from reader to aggregator
+DEFAULT_MAX_PENDING_CHUNKS = 8  # Reader blocks once this many chunks are waiting
+DEFAULT_FLUSH_INTERVAL = 0.5  # Seconds before a partial chunk is handed over anyway
+EVICT_INTERVAL = 60.0  # Event-time seconds between idle-mint sweeps
+
+# label -> (span seconds, bucket seconds); windows are exact to one bucket
+DEFAULT_WINDOWS: Dict[str, Tuple[int, int]] = {
+    "1m": (60, 5),
+    "1h": (3_600, 300),
+    "24h": (86_400, 3_600),
+}
+
+_END = object()
+
+
+class TransferEvent(NamedTuple):
+    """One token transfer; `fee` is the withheld amount when the source already knows it"""
+    mint: str
+    amount: int
+    timestamp: float
+    fee: Optional[int] = None
+
+
+class RollingWindow:
+    """
+    Volume, fee and transfer totals over the last `span` seconds
+
+    A ring of fixed-width buckets, each tagged with the epoch it holds, so
+    stale buckets are recycled lazily on write and skipped on read. Events
+    older than the ring are dropped from the window.
+    """
+    __slots__ = ("bucket_seconds", "_epochs", "_volumes", "_fees", "_transfers")
+
+    def __init__(self, span: int, bucket_seconds: int):
+        buckets = span // bucket_seconds
+        self.bucket_seconds = bucket_seconds
+        self._epochs = [-1] * buckets
+        self._volumes = [0] * buckets
+        self._fees = [0] * buckets
+        self._transfers = [0] * buckets
+
+    def add(self, timestamp: float, volume: int, fee: int):
+        epoch = int(timestamp // self.bucket_seconds)
+        slot = epoch % len(self._epochs)
+        current = self._epochs[slot]
+        if current != epoch:
+            if current > epoch:
+                return  # Older than the window
+            self._epochs[slot] = epoch
+            self._volumes[slot] = self._fees[slot] = self._transfers[slot] = 0
+        self._volumes[slot] += volume
+        self._fees[slot] += fee
+        self._transfers[slot] += 1
+
+    def totals(self, now: float) -> Tuple[int, int, int]:
+        """(volume, fees, transfers) in the buckets covering `now` and the span before it"""
+        newest = int(now // self.bucket_seconds)
+        oldest = newest - len(self._epochs) + 1
+        volume = fees = transfers = 0
+        for slot, epoch in enumerate(self._epochs):
+            if oldest <= epoch <= newest:
+                volume += self._volumes[slot]
+                fees += self._fees[slot]
+                transfers += self._transfers[slot]
+        return volume, fees, transfers
+
+
+class _MintWindows:
+    __slots__ = ("windows", "last_seen")
+
+    def __init__(self, specs: Iterable[Tuple[int, int]]):
+        self.windows = [RollingWindow(span, bucket) for span, bucket in specs]
+        self.last_seen = 0.0
+
+
+@dataclass
+class IngestionStats:
+    """Counters for one pipeline"""
+    events: int = 0
+    malformed: int = 0
+    chunks: int = 0
+    milestones: int = 0
+    backpressure_waits: int = 0  # Times the reader found the queue full
+    backpressure_seconds: float = 0.0  # Time the reader spent blocked
+    recent_events_per_sec: float = 0.0  # Moving average over recent chunks
+    started_at: Optional[float] = None
+    elapsed: float = 0.0
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class FeeIngestionPipeline:
+    """
+    Bounded-memory transfer-event aggregator
+
+    A reader thread pulls raw line chunks from a source generator into a
+    bounded queue; the caller's thread parses and aggregates them. When the
+    aggregator falls behind the queue fills and the reader blocks, which
+    stops it reading the file or socket (so TCP flow control pushes back
+    on the sender) instead of buffering without limit.
+
+    Each event's fee (the Token-2022 transfer fee unless the event carries
+    one) goes into rolling windows for its mint and is split into
+    `manager.distributed_fees` exactly as calculate_fee_distribution would.
+    Volumes are summed per mint per chunk and then checked once against the
+    milestone schedule through `manager.track_volume_milestone`.
+
+    Windows are kept in event time. A mint with no events for longer than
+    the widest window drops its windows; its lifetime volume stays in the
+    manager.
+
+    Args:
+        manager: Receives volume (milestones) and distributed fees
+        fee_config: Fee settings for mints without their own entry
+        mint_configs: Per-mint fee settings keyed by mint address
+        windows: label -> (span seconds, bucket seconds)
+        max_pending_chunks: Chunks buffered between reader and aggregator
+        on_milestone: Called with (mint, reward) when a chunk crosses milestones
+        store: FeeStateStore that journals the mints each chunk touched
+    """
+
+    def __init__(
+        self,
+        manager: FeeDistributionManager,
+        fee_config: Optional[CreatorFeeConfig] = None,
+        mint_configs: Optional[Dict[str, CreatorFeeConfig]] = None,
+        windows: Optional[Dict[str, Tuple[int, int]]] = None,
+        max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS,
+        on_milestone: Optional[Callable[[str, int], None]] = None,
+        store: Optional["FeeStateStore"] = None
+    ):
+        self.manager = manager
+        self.fee_config = fee_config or CreatorFeeConfig()
+        self.mint_configs = mint_configs or {}
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        self.max_pending_chunks = max_pending_chunks
+        self.on_milestone = on_milestone or self._print_milestone
+        self.store = store
+        self.stats = IngestionStats()
+        self.watermark = 0.0  # Newest event time seen
+        self._mints: Dict[str, _MintWindows] = {}
+        self._max_span = max(span for span, _ in self.windows.values())
+        self._evicted_at = 0.0
+
+    def run(self, source: Iterable[List[Any]]) -> IngestionStats:
+        """
+        Ingest every chunk a source yields
+
+        Args:
+            source: Iterable of raw JSON line chunks (see jsonl_source / socket_source)
+
+        Returns:
+            The pipeline's stats
+        """
+        pending: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_pending_chunks)
+        stop = threading.Event()
+        reader_error: List[BaseException] = []
+
+        def read():
+            try:
+                for chunk in source:
+                    if not self._put(pending, chunk, stop):
+                        return
+            except BaseException as e:
+                reader_error.append(e)
+            self._put(pending, _END, stop)
+
+        reader = threading.Thread(target=read, name="fee-ingestion-reader", daemon=True)
+        if self.stats.started_at is None:
+            self.stats.started_at = time.monotonic()
+        reader.start()
+        try:
+            while True:
+                chunk = pending.get()
+                if chunk is _END:
+                    break
+                self.ingest_lines(chunk)
+        finally:
+            stop.set()
+            reader.join(timeout=1.0)
+            self.stats.elapsed = time.monotonic() - self.stats.started_at
+
+        if reader_error:
+            raise reader_error[0]
+        return self.stats
+
+    def _put(self, pending: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+        """Blocking put that records backpressure; False once the consumer has stopped"""
+        try:
+            pending.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        self.stats.backpressure_waits += 1
+        blocked_at = time.monotonic()
+        try:
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.stats.backpressure_seconds += time.monotonic() - blocked_at
+
+    def ingest_lines(self, lines: List[Any]) -> int:
+        """
+        Parse and ingest a chunk of JSON lines
+
+        Lines that are not JSON objects, or whose mint is not a string, whose
+        amount or fee is negative (or the amount beyond u64), or whose
+        timestamp is not finite, are counted as malformed and skipped, so
+        they never reach ingest().
+        """
+        events = []
+        now = time.time()
+        for line in lines:
+            try:
+                data = json.loads(line)
+                mint = data["mint"]
+                amount = int(data["amount"])
+                timestamp = float(data.get("timestamp", now))
+                fee = int(data["fee"]) if data.get("fee") is not None else None
+                if not isinstance(mint, str) or not 0 <= amount <= MAX_TRACKED_VOLUME \
+                        or (fee is not None and fee < 0) \
+                        or not math.isfinite(timestamp):
+                    raise ValueError("invalid transfer event")
+                events.append(TransferEvent(mint, amount, timestamp, fee))
+            except (ValueError, KeyError, TypeError, OverflowError):
+                self.stats.malformed += 1
+        return self.ingest(events)
+
+    def ingest(self, events: List[TransferEvent]) -> int:
+        """
+        Aggregate one chunk of events
+
+        Returns:
+            Number of events ingested
+        """
+        started = time.perf_counter()
+        mints = self._mints
+        distributed = self.manager.distributed_fees
+        chunk_volumes: Dict[str, int] = {}
+        watermark = self.watermark
+
+        for mint, amount, timestamp, fee in events:
+            config = self.mint_configs.get(mint, self.fee_config)
+            if fee is None:
+                fee = config.transfer_fee(amount)
+
+            state = mints.get(mint)
+            if state is None:
+                state = mints[mint] = _MintWindows(self.windows.values())
+            for window in state.windows:
+                window.add(timestamp, amount, fee)
+            if timestamp > state.last_seen:
+                state.last_seen = timestamp
+            if timestamp > watermark:
+                watermark = timestamp
+
+            # Same split as FeeDistributionManager.calculate_fee_distribution
+            creator, liquidity, burn, treasury = split_fee(fee, config.share_basis_points())
+            shares = distributed.get(mint)
+            if shares is None:
+                shares = distributed[mint] = {'creator': 0, 'liquidity': 0, 'burn': 0, 'treasury': 0}
+            shares['creator'] += creator
+            shares['liquidity'] += liquidity
+            shares['burn'] += burn
+            shares['treasury'] += treasury
+
+            chunk_volumes[mint] = chunk_volumes.get(mint, 0) + amount
+
+        self.watermark = watermark
+        for mint, volume in chunk_volumes.items():
+            config = self.mint_configs.get(mint, self.fee_config)
+            reward = self.manager.track_volume_milestone(mint, volume, config)
+            if reward is not None:
+                self.stats.milestones += 1
+                self.on_milestone(mint, reward)
+
+        if self.store is not None:
+            self.store.log_mints(chunk_volumes)
+
+        if watermark - self._evicted_at >= EVICT_INTERVAL:
+            self.evict_idle()
+
+        self._record_chunk(len(events), time.perf_counter() - started)
+        return len(events)
+
+    def _record_chunk(self, events: int, seconds: float):
+        stats = self.stats
+        stats.events += events
+        stats.chunks += 1
+        if stats.started_at is None:
+            stats.started_at = time.monotonic() - seconds
+        stats.elapsed = time.monotonic() - stats.started_at
+        if seconds > 0:
+            rate = events / seconds
+            stats.recent_events_per_sec = rate if stats.chunks == 1 else \
+                0.8 * stats.recent_events_per_sec + 0.2 * rate
+
+    def evict_idle(self) -> int:
+        """Drop windows of mints idle for longer than the widest window"""
+        cutoff = self.watermark - self._max_span
+        idle = [mint for mint, state in self._mints.items() if state.last_seen < cutoff]
+        for mint in idle:
+            del self._mints[mint]
+        self._evicted_at = self.watermark
+        return len(idle)
+
+    def aggregates(self, mint: str, now: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Rolling totals for a mint
+
+        Args:
+            mint: Token mint address
+            now: Window end in event time (defaults to the newest event seen)
+
+        Returns:
+            label -> {"volume", "fees", "transfers"}
+        """
+        now = self.watermark if now is None else now
+        state = self._mints.get(mint)
+        result = {}
+        for i, label in enumerate(self.windows):
+            volume, fees, transfers = state.windows[i].totals(now) if state else (0, 0, 0)
+            result[label] = {"volume": volume, "fees": fees, "transfers": transfers}
+        return result
+
+    def top_mints(self, window: str = "1h", limit: int = 10, by: str = "volume") -> List[Tuple[str, int]]:
+        """Mints with the highest rolling volume (or fees / transfers) in a window"""
+        index = list(self.windows).index(window)
+        field = ("volume", "fees", "transfers").index(by)
+        totals = [(mint, state.windows[index].totals(self.watermark)[field]) for mint, state in self._mints.items()]
+        totals.sort(key=lambda item: item[1], reverse=True)
+        return totals[:limit]
+
+    @staticmethod
+    def _print_milestone(mint: str, reward: int):
+        print(f"🏆 {mint} crossed a volume milestone: {reward:,} reward")
+
+
+def _chunked(lines: Iterable[bytes], chunk_size: int, flush_interval: float) -> Iterator[List[bytes]]:
+    chunk: List[bytes] = []
+    started = time.monotonic()
+    for line in lines:
+        if line.strip():
+            chunk.append(line)
+        if len(chunk) >= chunk_size or (chunk and time.monotonic() - started >= flush_interval):
+            yield chunk
+            chunk = []
+            started = time.monotonic()
+    if chunk:
+        yield chunk
+
+
+def jsonl_source(
+    paths: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[bytes]]:
+    """Chunks of lines from JSONL event files, read lazily ("-" reads stdin)"""
+    for path in paths:
+        if path == "-":
+            yield from _chunked(sys.stdin.buffer, chunk_size, DEFAULT_FLUSH_INTERVAL)
+            continue
+        with open(path, "rb") as f:
+            yield from _chunked(f, chunk_size, DEFAULT_FLUSH_INTERVAL)
+
+
+def socket_source(
+    sock: socket.socket,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL
+) -> Iterator[List[bytes]]:
+    """
+    Chunks of newline-delimited JSON events from a connected stream socket
+
+    A partial chunk is handed over once `flush_interval` has passed since
+    the chunk started, checked as each line arrives.
+    """
+    with sock.makefile("rb") as stream:
+        yield from _chunked(stream, chunk_size, flush_interval)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Aggregate transfer events into rolling fee windows")
+    parser.add_argument("paths", nargs="*", help="JSONL event files (- for stdin)")
+    parser.add_argument("--connect", help="host:port of a newline-delimited JSON event feed")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-pending-chunks", type=int, default=DEFAULT_MAX_PENDING_CHUNKS)
+    parser.add_argument("--top", type=int, default=10, help="Mints to list by 1h volume")
+    args = parser.parse_args(argv)
+
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        source = socket_source(socket.create_connection((host, int(port))), args.chunk_size)
+    elif args.paths:
+        source = jsonl_source(args.paths, args.chunk_size)
+    else:
+        parser.error("Give event files or --connect")
+
+    pipeline = FeeIngestionPipeline(
+        FeeDistributionManager(client=None), max_pending_chunks=args.max_pending_chunks
+    )
+    stats = pipeline.run(source)
+
+    print(f"📥 {stats.events:,} events ({stats.malformed:,} malformed) in {stats.elapsed:.2f}s, "
+          f"{stats.events_per_sec:,.0f} events/s")
+    print(f"⏳ Backpressure: {stats.backpressure_waits:,} waits, {stats.backpressure_seconds:.2f}s blocked")
+    for mint, volume in pipeline.top_mints("1h", args.top):
+        fees = pipeline.aggregates(mint)["1h"]["fees"]
+        print(f"   {mint}  1h volume {volume:,}  fees {fees:,}")
+    print(json.dumps(asdict(stats)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Fee State Persistence
+Write-ahead log plus compact binary snapshots for FeeDistributionManager state
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Optional, List, Iterable, Tuple, BinaryIO
+
+from solana.publickey import PublicKey
+
+from memecoin_launchpad_with_fees import FeeDistributionManager
+from milestone_tracker import MilestoneSchedule, MilestoneTracker
+
+FSYNC_ALWAYS = "always"  # fsync every append; nothing acknowledged is lost
+FSYNC_INTERVAL = "interval"  # fsync on the first append after fsync_interval seconds
+FSYNC_NEVER = "never"  # leave flushing to the OS
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER)
+
+DEFAULT_FSYNC_INTERVAL = 1.0
+DEFAULT_SNAPSHOT_WAL_BYTES = 64 * 1024 * 1024  # Snapshot once the live WAL grows past this
+
+SNAPSHOT_NAME = "fee_state.snapshot"
+SNAPSHOT_MAGIC = b"FEESNAP2"
+WAL_PREFIX = "fee_state.wal."
+
+# Record: payload length, crc32 of type + payload, type
+_RECORD_HEADER = struct.Struct("<IIB")
+_VOLUME = struct.Struct("<QHH")  # total volume, milestones reached, schedule id; mint follows
+_FEES = struct.Struct("<QQQQ")  # creator, liquidity, burn, treasury; mint follows
+_SCHEDULE = struct.Struct("<H")  # schedule id; [[threshold, reward], ...] JSON follows
+# wal sequence, tracker mints, fee mints, fee-account JSON bytes, native byte order flag
+_SNAPSHOT_HEADER = struct.Struct("<QQQQB")
+
+RECORD_VOLUME = 1
+RECORD_FEES = 2
+RECORD_FEE_ACCOUNTS = 3
+RECORD_SCHEDULE = 4
+
+_SHARES = ('creator', 'liquidity', 'burn', 'treasury')
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+@dataclass
+class RecoveryStats:
+    """What FeeStateStore found on open"""
+    snapshot_mints: int = 0
+    wal_records: int = 0
+    wal_segments: int = 0
+    torn_bytes: int = 0  # Incomplete final record dropped from the last segment
+    seconds: float = 0.0
+
+
+class FeeStateStore:
+    """
+    Durable FeeDistributionManager state
+
+    Updates are appended to a write-ahead log as absolute per-mint values
+    (total volume, milestones reached and the id of the milestone schedule
+    they count against, cumulative fee shares), so replaying a record twice
+    is harmless. Each schedule is logged once, before the first record that
+    refers to it. Once the live WAL passes
+    `snapshot_wal_bytes`, a snapshot is taken: the WAL rolls to a new
+    segment, the full state is written to a temporary file and renamed over
+    the previous snapshot, and the segments it covers are deleted.
+
+    Snapshots store the milestone tracker's arrays as raw bytes, so
+    restoring a million mints is a few bulk reads rather than a million
+    record decodes. Recovery loads the snapshot, replays the newer WAL
+    segments and drops a torn record at the very end; a bad record with
+    valid data after it is corruption and fails recovery.
+
+    Opening the store recovers state into `manager` (which should be empty).
+    After that, call log_mints() for every mint whose volume or fees changed;
+    FeeIngestionPipeline does this per chunk when given the store.
+
+    Args:
+        directory: Holds the snapshot and WAL segments
+        manager: Manager to restore into and log from
+        fsync_policy: "always", "interval" or "never"
+        fsync_interval: Seconds between fsyncs under the interval policy
+        snapshot_wal_bytes: WAL size that triggers a snapshot (0 disables)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        manager: FeeDistributionManager,
+        fsync_policy: str = FSYNC_INTERVAL,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        snapshot_wal_bytes: int = DEFAULT_SNAPSHOT_WAL_BYTES
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of {FSYNC_POLICIES}")
+        self.directory = directory
+        self.manager = manager
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.snapshot_wal_bytes = snapshot_wal_bytes
+        self._lock = threading.Lock()
+        self._wal: Optional[BinaryIO] = None
+        self._wal_seq = 0
+        self._wal_bytes = 0
+        self._synced_at = time.monotonic()
+        self._unsynced = False
+        self._logged_schedules = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.recovery = self._recover()
+        self._logged_schedules = len(self.manager.volume_tracker.schedules)
+
+    def __enter__(self) -> "FeeStateStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def log_mints(self, mints: Iterable[str]):
+        """Append the current volume and fee totals of each mint as one WAL write"""
+        tracker = self.manager.volume_tracker
+        distributed = self.manager.distributed_fees
+        records = []
+        while self._logged_schedules < len(tracker.schedules):
+            schedule_id = self._logged_schedules
+            payload = _SCHEDULE.pack(schedule_id) + json.dumps(tracker.schedules[schedule_id].key).encode()
+            records.append(_record(RECORD_SCHEDULE, payload))
+            self._logged_schedules += 1
+        for mint in mints:
+            encoded = mint.encode()
+            records.append(_record(RECORD_VOLUME, _VOLUME.pack(*tracker.state(mint)) + encoded))
+            shares = distributed.get(mint)
+            if shares is not None:
+                records.append(_record(RECORD_FEES, _FEES.pack(*(shares[k] for k in _SHARES)) + encoded))
+        self._append(b"".join(records))
+
+    def log_fee_accounts(self):
+        """Append the manager's fee account addresses"""
+        accounts = {name: str(address) for name, address in self.manager.fee_accounts.items()}
+        self._append(_record(RECORD_FEE_ACCOUNTS, json.dumps(accounts).encode()))
+
+    def _append(self, data: bytes):
+        if not data:
+            return
+        with self._lock:
+            if self._wal is None:
+                raise RuntimeError("Fee state store is closed")
+            self._wal.write(data)  # Unbuffered: in the OS page cache once this returns
+            self._wal_bytes += len(data)
+            self._unsynced = True
+            if self.fsync_policy == FSYNC_ALWAYS or (
+                self.fsync_policy == FSYNC_INTERVAL and time.monotonic() - self._synced_at >= self.fsync_interval
+            ):
+                self._sync()
+            due = self.snapshot_wal_bytes and self._wal_bytes >= self.snapshot_wal_bytes
+        if due:
+            self.snapshot()
+
+    def _sync(self):
+        os.fsync(self._wal.fileno())
+        self._synced_at = time.monotonic()
+        self._unsynced = False
+
+    def flush(self):
+        """fsync any WAL writes not yet on disk"""
+        with self._lock:
+            if self._wal is not None and self._unsynced:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._wal is None:
+                return
+            if self.fsync_policy != FSYNC_NEVER and self._unsynced:
+                self._sync()
+            self._wal.close()
+            self._wal = None
+
+    def snapshot(self):
+        """Write a full snapshot and delete the WAL segments it covers"""
+        with self._lock:
+            covered = self._wal_seq
+            self._open_segment(covered + 1)  # Later updates land after the snapshot's cut
+            blob = self._encode_snapshot(covered + 1)
+
+            path = os.path.join(self.directory, SNAPSHOT_NAME)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            self._sync_directory()
+
+            for seq in self._segments():
+                if seq <= covered:
+                    os.remove(self._segment_path(seq))
+
+    def _encode_snapshot(self, wal_seq: int) -> bytes:
+        tracker_mints, volumes, reached, schedule_ids, schedules = self.manager.volume_tracker.export()
+        fee_mints = list(self.manager.distributed_fees)
+        rows = list(self.manager.distributed_fees.values())
+        shares = [array("Q", [row[k] for row in rows]) for k in _SHARES]
+        accounts = json.dumps({k: str(v) for k, v in self.manager.fee_accounts.items()}).encode()
+
+        parts = [
+            SNAPSHOT_MAGIC,
+            _SNAPSHOT_HEADER.pack(wal_seq, len(tracker_mints), len(fee_mints), len(accounts), _LITTLE_ENDIAN),
+            _blob("\n".join(tracker_mints).encode()),
+            volumes.tobytes(),
+            reached.tobytes(),
+            schedule_ids.tobytes(),
+            _blob(json.dumps([schedule.key for schedule in schedules]).encode()),
+            _blob("\n".join(fee_mints).encode()),
+            *(column.tobytes() for column in shares),
+            accounts,
+        ]
+        body = b"".join(parts)
+        return body + struct.pack("<I", zlib.crc32(body))
+
+    def _load_snapshot(self, stats: RecoveryStats) -> int:
+        """Restore the snapshot into the manager; returns the first WAL segment to replay"""
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            data = f.read()
+        body, (crc,) = data[:-4], struct.unpack("<I", data[-4:])
+        if not data.startswith(SNAPSHOT_MAGIC) or zlib.crc32(body) != crc:
+            raise ValueError(f"Fee state snapshot {path} is corrupt")
+
+        view = memoryview(body)
+        offset = len(SNAPSHOT_MAGIC)
+        wal_seq, tracker_count, fee_count, accounts_len, little = _SNAPSHOT_HEADER.unpack_from(view, offset)
+        offset += _SNAPSHOT_HEADER.size
+
+        tracker_mints, offset = _read_names(view, offset, tracker_count)
+        volumes, offset = _read_array(view, offset, "Q", tracker_count, little)
+        reached, offset = _read_array(view, offset, "H", tracker_count, little)
+        schedule_ids, offset = _read_array(view, offset, "H", tracker_count, little)
+        (length,) = struct.unpack_from("<Q", view, offset)
+        schedules = [_schedule_from_json(pairs) for pairs in json.loads(bytes(view[offset + 8:offset + 8 + length]))]
+        offset += 8 + length
+        fee_mints, offset = _read_names(view, offset, fee_count)
+        columns = []
+        for _ in _SHARES:
+            column, offset = _read_array(view, offset, "Q", fee_count, little)
+            columns.append(column)
+        accounts = json.loads(bytes(view[offset:offset + accounts_len]))
+
+        self.manager.volume_tracker = MilestoneTracker.from_export(
+            tracker_mints, volumes, reached, schedule_ids, schedules
+        )
+        self.manager.distributed_fees.update({
+            mint: {'creator': creator, 'liquidity': liquidity, 'burn': burn, 'treasury': treasury}
+            for mint, creator, liquidity, burn, treasury in zip(fee_mints, *(c.tolist() for c in columns))
+        })
+        self.manager.fee_accounts.update({k: PublicKey(v) for k, v in accounts.items()})
+        stats.snapshot_mints = tracker_count
+        return wal_seq
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{WAL_PREFIX}{seq:010d}")
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(name[len(WAL_PREFIX):]) for name in os.listdir(self.directory)
+            if name.startswith(WAL_PREFIX) and name[len(WAL_PREFIX):].isdigit()
+        )
+
+    def _open_segment(self, seq: int):
+        if self._wal is not None:
+            if self.fsync_policy != FSYNC_NEVER:
+                self._sync()
+            self._wal.close()
+        self._wal = open(self._segment_path(seq), "ab", buffering=0)
+        self._wal_seq = seq
+        self._wal_bytes = self._wal.tell()
+        self._sync_directory()
+
+    def _sync_directory(self):
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _recover(self) -> RecoveryStats:
+        started = time.perf_counter()
+        stats = RecoveryStats()
+        first_seq = self._load_snapshot(stats)
+
+        segments = [seq for seq in self._segments() if seq >= first_seq]
+        for i, seq in enumerate(segments):
+            last = i == len(segments) - 1
+            self._replay_segment(seq, last, stats)
+        stats.wal_segments = len(segments)
+
+        self._open_segment(segments[-1] if segments else max(first_seq, 1))
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def _replay_segment(self, seq: int, last: bool, stats: RecoveryStats):
+        path = self._segment_path(seq)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        tracker = self.manager.volume_tracker
+        distributed = self.manager.distributed_fees
+        view = memoryview(data)
+        offset = 0
+        header_size = _RECORD_HEADER.size
+        while offset + header_size <= len(data):
+            length, crc, kind = _RECORD_HEADER.unpack_from(view, offset)
+            end = offset + header_size + length
+            if end > len(data) or zlib.crc32(view[offset + header_size:end], zlib.crc32(bytes((kind,)))) != crc:
+                break
+            payload = view[offset + header_size:end]
+            if kind == RECORD_VOLUME:
+                total_volume, reached, schedule_id = _VOLUME.unpack_from(payload)
+                tracker.restore(bytes(payload[_VOLUME.size:]).decode(), total_volume, reached, schedule_id)
+            elif kind == RECORD_SCHEDULE:
+                (schedule_id,) = _SCHEDULE.unpack_from(payload)
+                schedule = _schedule_from_json(json.loads(bytes(payload[_SCHEDULE.size:])))
+                if tracker.schedule_id(schedule) != schedule_id:
+                    raise ValueError(f"Fee state WAL segment {path} registers schedule {schedule_id} out of order")
+            elif kind == RECORD_FEES:
+                distributed[bytes(payload[_FEES.size:]).decode()] = dict(zip(_SHARES, _FEES.unpack_from(payload)))
+            elif kind == RECORD_FEE_ACCOUNTS:
+                self.manager.fee_accounts = {k: PublicKey(v) for k, v in json.loads(bytes(payload)).items()}
+            stats.wal_records += 1
+            offset = end
+
+        if offset < len(data):
+            if not (last and _is_torn_tail(view, offset)):
+                raise ValueError(f"Fee state WAL segment {path} is corrupt at byte {offset}")
+            # A crash mid-append leaves a partial record; cut it so new appends follow valid data
+            stats.torn_bytes = len(data) - offset
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def _is_torn_tail(view: memoryview, offset: int) -> bool:
+    """Whether the bad record at offset is an interrupted final append
+
+    Only a record that runs to end-of-file (or a zero-filled tail the
+    filesystem extended but never wrote) can come from a crash mid-append;
+    anything followed by further data is corruption.
+    """
+    remaining = len(view) - offset
+    if remaining < _RECORD_HEADER.size:
+        return True
+    length, _, _ = _RECORD_HEADER.unpack_from(view, offset)
+    if _RECORD_HEADER.size + length >= remaining:
+        return True
+    return not any(view[offset:])
+
+
+def _schedule_from_json(pairs: List[List[int]]) -> MilestoneSchedule:
+    return MilestoneSchedule({threshold: reward for threshold, reward in pairs})
+
+
+def _record(kind: int, payload: bytes) -> bytes:
+    crc = zlib.crc32(payload, zlib.crc32(bytes((kind,))))
+    return _RECORD_HEADER.pack(len(payload), crc, kind) + payload
+
+
+def _blob(data: bytes) -> bytes:
+    return struct.pack("<Q", len(data)) + data
+
+
+def _read_names(view: memoryview, offset: int, count: int) -> Tuple[List[str], int]:
+    (length,) = struct.unpack_from("<Q", view, offset)
+    offset += 8
+    raw = bytes(view[offset:offset + length])
+    names = raw.decode().split("\n") if count else []
+    if len(names) != count:
+        raise ValueError("Fee state snapshot mint list does not match its header")
+    return names, offset + length
+
+
+def _read_array(view: memoryview, offset: int, typecode: str, count: int, little: bool) -> Tuple[array, int]:
+    values = array(typecode)
+    size = values.itemsize * count
+    values.frombytes(view[offset:offset + size])
+    if little != _LITTLE_ENDIAN:
+        values.byteswap()
+    return values, offset + size
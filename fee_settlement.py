@@ -0,0 +1,170 @@
+"""
+Bulk Fee Settlement
+Vectorized, integer-exact creator/liquidity/burn/treasury splits aggregated per mint
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Dict, List
+
+import numpy as np
+
+from memecoin_launchpad_with_fees import BPS_DENOMINATOR, CreatorFeeConfig
+
+SHARES = ("creator", "liquidity", "burn", "treasury")
+
+# numpy 1.x promotes uint64 mixed with Python/int64 scalars to float64, so
+# every operand in the split stays uint64
+_DENOMINATOR = np.uint64(BPS_DENOMINATOR)
+
+
+@dataclass
+class SettlementTotals:
+    """Per-mint aggregates of one settlement batch, rows ordered by mint id"""
+    mint_ids: np.ndarray  # int64, sorted and unique
+    transfers: np.ndarray  # Fees settled per mint
+    fees: np.ndarray  # uint64
+    shares: np.ndarray  # uint64, one column per SHARES entry
+
+    def __len__(self) -> int:
+        return len(self.mint_ids)
+
+    def share(self, name: str) -> np.ndarray:
+        return self.shares[:, SHARES.index(name)]
+
+    def as_dict(self) -> Dict[int, Dict[str, int]]:
+        """Python-int totals keyed by mint id, in calculate_fee_distribution's shape"""
+        return {
+            int(mint_id): {
+                **dict(zip(SHARES, (int(v) for v in row))),
+                "total_fee": int(fee),
+                "transfers": int(count),
+            }
+            for mint_id, count, fee, row in zip(self.mint_ids, self.transfers, self.fees, self.shares)
+        }
+
+
+class FeeSettlementEngine:
+    """
+    Splits arrays of transfer fees exactly as calculate_fee_distribution does
+
+    Each fee is split with integer basis points (creator, liquidity and burn
+    floored, treasury takes the remainder), then the splits are summed per
+    mint with one stable sort and one reduceat, so the totals equal the sum of the
+    scalar results to the lamport.
+
+    Fees are handled as uint64. Each share is computed as
+    (fee // 10_000) * bps + (fee % 10_000) * bps // 10_000, which never
+    exceeds the fee itself, so no intermediate can overflow. Per-mint sums
+    must fit in a u64, as they do on chain.
+
+    Args:
+        fee_config: Split used for mints without their own entry
+        mint_configs: Per-mint fee configs keyed by mint id
+    """
+
+    def __init__(
+        self,
+        fee_config: Optional[CreatorFeeConfig] = None,
+        mint_configs: Optional[Dict[int, CreatorFeeConfig]] = None
+    ):
+        self.fee_config = fee_config or CreatorFeeConfig()
+        self._default_bps = self.fee_config.share_basis_points()
+        self._mint_bps = {
+            mint_id: config.share_basis_points() for mint_id, config in (mint_configs or {}).items()
+        }
+
+    def _bps_table(self, mint_ids: np.ndarray) -> np.ndarray:
+        """(len(mint_ids), 3) uint64 creator/liquidity/burn basis points"""
+        return np.array(
+            [self._mint_bps.get(int(mint_id), self._default_bps) for mint_id in mint_ids],
+            dtype=np.uint64
+        ).reshape(len(mint_ids), 3)
+
+    def split(self, fees: np.ndarray, bps: np.ndarray) -> np.ndarray:
+        """
+        Per-fee splits
+
+        Args:
+            fees: uint64 fees, shape (n,)
+            bps: uint64 creator/liquidity/burn basis points, shape (n, 3) or (3,)
+
+        Returns:
+            uint64 array of shape (n, 4), columns in SHARES order
+        """
+        quotient, remainder = np.divmod(fees, _DENOMINATOR)
+        shares = np.empty((len(fees), 4), dtype=np.uint64)
+        shares[:, :3] = quotient[:, None] * bps + remainder[:, None] * bps // _DENOMINATOR
+        shares[:, 3] = fees - shares[:, :3].sum(axis=1, dtype=np.uint64)
+        return shares
+
+    def settle(self, fees, mint_ids) -> SettlementTotals:
+        """
+        Split a batch of transfer fees and total them per mint
+
+        Args:
+            fees: Non-negative integer fees (array-like)
+            mint_ids: Integer mint id of each fee, same length as fees
+
+        Returns:
+            Per-mint totals
+        """
+        fees = np.asarray(fees)
+        mint_ids = np.asarray(mint_ids, dtype=np.int64)
+        if fees.ndim != 1 or fees.shape != mint_ids.shape:
+            raise ValueError("fees and mint_ids must be 1-D arrays of the same length")
+        if fees.dtype.kind not in "iu" and fees.size:
+            raise TypeError(f"Fees must be integers, got {fees.dtype}")
+        if fees.dtype.kind == "i" and fees.size and fees.min() < 0:
+            raise ValueError("Fees must be non-negative")
+        fees = fees.astype(np.uint64, copy=False)
+
+        # One stable sort groups each mint's fees (skipped when the batch is
+        # already grouped); splitting happens in sorted order
+        if np.all(mint_ids[1:] >= mint_ids[:-1]):
+            sorted_ids = mint_ids
+        else:
+            order = np.argsort(mint_ids, kind="stable")
+            sorted_ids = mint_ids[order]
+            fees = fees[order]
+        first = np.empty(len(sorted_ids), dtype=bool)
+        first[:1] = True
+        first[1:] = sorted_ids[1:] != sorted_ids[:-1]
+        starts = np.flatnonzero(first)
+        mints = sorted_ids[starts]
+        counts = np.diff(np.append(starts, len(fees)))
+
+        if self._mint_bps:
+            bps = np.repeat(self._bps_table(mints), counts, axis=0)
+        else:
+            bps = np.array(self._default_bps, dtype=np.uint64)  # Broadcast over every row
+        shares = self.split(fees, bps)
+
+        if len(mints) == 0:
+            return SettlementTotals(mints, counts, fees, shares)
+        return SettlementTotals(
+            mint_ids=mints,
+            transfers=counts,
+            fees=np.add.reduceat(fees, starts),
+            shares=np.add.reduceat(shares, starts, axis=0),
+        )
+
+    def settle_batches(self, batches) -> SettlementTotals:
+        """
+        Settle (fees, mint_ids) chunks and combine their totals
+
+        Keeps memory bounded when a settlement run is streamed from disk.
+        """
+        parts: List[SettlementTotals] = [self.settle(fees, mint_ids) for fees, mint_ids in batches]
+        if not parts:
+            return self.settle(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64))
+
+        mint_ids = np.concatenate([p.mint_ids for p in parts])
+        mints, inverse = np.unique(mint_ids, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        transfers = np.zeros(len(mints), dtype=np.int64)
+        fees = np.zeros(len(mints), dtype=np.uint64)
+        shares = np.zeros((len(mints), 4), dtype=np.uint64)
+        np.add.at(transfers, inverse, np.concatenate([p.transfers for p in parts]))
+        np.add.at(fees, inverse, np.concatenate([p.fees for p in parts]))
+        np.add.at(shares, inverse, np.concatenate([p.shares for p in parts]))
+        return SettlementTotals(mints, transfers, fees, shares)
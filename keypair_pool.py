@@ -0,0 +1,265 @@
+"""
+Warm Mint Keypair Pool
+Pre-generates mint keypairs with their metadata PDAs and payer ATAs in the background
+"""
+
+import os
+import json
+import base64
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable, Deque
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
+
+from derivation_cache import METAPLEX_METADATA_PROGRAM_ID, DerivationCache, default_cache
+
+DEFAULT_TARGET_DEPTH = 32
+DEFAULT_LOW_WATER = 8  # Refill starts when the pool drops to this depth
+
+
+@dataclass
+class WarmMint:
+    """A mint keypair with its addresses already derived"""
+    keypair: Keypair
+    metadata_pda: PublicKey
+    metadata_bump: int
+    payer_ata: PublicKey
+    payer_ata_bump: int
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "secret_key": base64.b64encode(bytes(self.keypair.secret_key)).decode(),
+            "metadata_pda": str(self.metadata_pda),
+            "metadata_bump": self.metadata_bump,
+            "payer_ata": str(self.payer_ata),
+            "payer_ata_bump": self.payer_ata_bump,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "WarmMint":
+        return cls(
+            keypair=Keypair.from_secret_key(base64.b64decode(data["secret_key"])),
+            metadata_pda=PublicKey(data["metadata_pda"]),
+            metadata_bump=data["metadata_bump"],
+            payer_ata=PublicKey(data["payer_ata"]),
+            payer_ata_bump=data["payer_ata_bump"],
+        )
+
+
+class KeypairPool:
+    """
+    Background-refilled pool of WarmMints for one payer
+
+    take() pops a ready entry in O(1); a background thread tops the pool
+    back up to `target_depth` once it falls to `low_water`. Derived
+    addresses go through the derivation cache, so the later
+    create/distribute calls for a handed-out mint are cache hits.
+
+    With a `path`, entries are saved atomically (0600, write-then-rename)
+    when the refill thread adds to them and reloaded on start. take()
+    appends the handed-out mint address to `<path>.taken` instead of
+    rewriting the pool, so persisting a take costs one small fsynced append;
+    entries listed there are skipped on load, and the log is compacted
+    whenever the pool file is rewritten.
+
+    Payer ATAs are derived for `token_program_id`; pools feeding Token-2022
+    launches (create_token_with_fees) pass TOKEN_2022_PROGRAM_ID.
+    """
+
+    def __init__(
+        self,
+        payer: PublicKey,
+        target_depth: int = DEFAULT_TARGET_DEPTH,
+        low_water: int = DEFAULT_LOW_WATER,
+        path: Optional[str] = None,
+        keypair_source: Optional[Callable[[], Keypair]] = None,
+        cache: Optional[DerivationCache] = None,
+        token_program_id: PublicKey = TOKEN_PROGRAM_ID
+    ):
+        if not 0 <= low_water < target_depth:
+            raise ValueError("low_water must be below target_depth")
+        self.payer = payer
+        self.token_program_id = token_program_id
+        self.target_depth = target_depth
+        self.low_water = low_water
+        self.path = path
+        self.keypair_source = keypair_source or Keypair
+        self.cache = cache or default_cache
+        self.hits = 0
+        self.misses = 0
+        self._entries: Deque[WarmMint] = deque()
+        self._wake = threading.Condition()
+        self._dirty = False
+        self._taken_lock = threading.Lock()
+        self._taken_log = None
+        self._taken_lines: List[bytes] = []  # Appended since the pool file was last written
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if path:
+            if os.path.exists(path):
+                self._load()
+            fd = os.open(self._taken_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            self._taken_log = os.fdopen(fd, "ab", buffering=0)
+
+    def __enter__(self) -> "KeypairPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def start(self):
+        """Start the refill thread"""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._refill_loop, name="keypair-pool", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the refill thread and save unused entries"""
+        self._stopped.set()
+        with self._wake:
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._save()
+
+    @property
+    def _taken_path(self) -> str:
+        return f"{self.path}.taken"
+
+    def take(self) -> WarmMint:
+        """Hand out a warm entry, deriving one inline if the pool is empty"""
+        with self._taken_lock:
+            try:
+                entry = self._entries.popleft()
+                self.hits += 1
+            except IndexError:
+                entry = self._generate()
+                self.misses += 1
+            if self._taken_log is not None:
+                # Durable before the key is used, so a restart never reissues it
+                line = f"{entry.keypair.public_key}\n".encode()
+                self._taken_log.write(line)
+                os.fsync(self._taken_log.fileno())
+                self._taken_lines.append(line)
+
+        if len(self._entries) <= self.low_water:
+            with self._wake:
+                self._wake.notify()
+        return entry
+
+    def mint_keypair_source(self) -> Callable[[], Keypair]:
+        """Mint-keypair source for create_token_with_metadata / create_token_with_fees"""
+        return lambda: self.take().keypair
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._entries),
+            "target_depth": self.target_depth,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _generate(self) -> WarmMint:
+        keypair = self.keypair_source()
+        mint = bytes(keypair.public_key)
+        metadata_pda, metadata_bump = self.cache.find_program_address(
+            [b"metadata", bytes(METAPLEX_METADATA_PROGRAM_ID), mint],
+            METAPLEX_METADATA_PROGRAM_ID
+        )
+        payer_ata, payer_ata_bump = self.cache.find_program_address(
+            [bytes(self.payer), bytes(self.token_program_id), mint],
+            ASSOCIATED_TOKEN_PROGRAM_ID
+        )
+        return WarmMint(keypair, metadata_pda, metadata_bump, payer_ata, payer_ata_bump)
+
+    def _refill_loop(self):
+        while not self._stopped.is_set():
+            while len(self._entries) < self.target_depth and not self._stopped.is_set():
+                entry = self._generate()
+                with self._wake:
+                    self._entries.append(entry)
+                    self._dirty = True
+
+            self._save()
+
+            with self._wake:
+                if not self._dirty and len(self._entries) > self.low_water and not self._stopped.is_set():
+                    self._wake.wait()
+
+    def _load(self):
+        with open(self.path) as f:
+            data = json.load(f)
+        if data["payer"] != str(self.payer):
+            raise ValueError(f"Keypair pool {self.path} belongs to payer {data['payer']}")
+        # Pools saved before the token program was recorded derived for SPL Token
+        token_program = data.get("token_program", str(TOKEN_PROGRAM_ID))
+        if token_program != str(self.token_program_id):
+            raise ValueError(f"Keypair pool {self.path} derives ATAs for token program {token_program}")
+
+        taken = set()
+        if os.path.exists(self._taken_path):
+            with open(self._taken_path) as f:
+                taken = set(f.read().split())
+
+        for item in data["entries"]:
+            entry = WarmMint.from_json(item)
+            if str(entry.keypair.public_key) in taken:
+                continue
+            mint = bytes(entry.keypair.public_key)
+            self.cache.prime(
+                [b"metadata", bytes(METAPLEX_METADATA_PROGRAM_ID), mint],
+                METAPLEX_METADATA_PROGRAM_ID,
+                (entry.metadata_pda, entry.metadata_bump)
+            )
+            self.cache.prime(
+                [bytes(self.payer), bytes(self.token_program_id), mint],
+                ASSOCIATED_TOKEN_PROGRAM_ID,
+                (entry.payer_ata, entry.payer_ata_bump)
+            )
+            self._entries.append(entry)
+
+    def _save(self):
+        with self._wake:
+            dirty, self._dirty = self._dirty, False
+            if not self.path or not dirty:
+                return
+        with self._taken_lock:
+            entries = list(self._entries)
+            covered = len(self._taken_lines)
+
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "payer": str(self.payer),
+                "token_program": str(self.token_program_id),
+                "entries": [entry.to_json() for entry in entries],
+            }, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        # The new pool file already excludes the takes it covers; keep only later ones
+        with self._taken_lock:
+            del self._taken_lines[:covered]
+            tmp_path = f"{self._taken_path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"".join(self._taken_lines))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._taken_path)
+            self._taken_log.close()
+            fd = os.open(self._taken_path, os.O_WRONLY | os.O_APPEND, 0o600)
+            self._taken_log = os.fdopen(fd, "ab", buffering=0)
@@ -0,0 +1,192 @@
+"""
+Bulk Launch-Readiness Auditor
+Re-verifies thousands of launched mints with batched account reads
+"""
+
+import sys
+import json
+import time
+import argparse
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator, TextIO
+
+from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
+from solana.publickey import PublicKey
+
+from account_batcher import AccountReadBatcher, account_data, decode_mint_account
+from derivation_cache import METAPLEX_METADATA_PROGRAM_ID, derive_many
+from metadata_codec import decode_metadata_account
+from solana_memecoin_launchpad_production import MAINNET_RPC_ENDPOINTS, ProductionLaunchConfig
+
+DEFAULT_AUDIT_CHUNK = 1_000  # Mints per batched read (2 accounts each)
+
+
+class LaunchAuditor:
+    """
+    Bulk counterpart of ProductionMemecoinLaunchpad.verify_launch_readiness
+
+    Mints are processed in chunks: metadata PDAs are derived in bulk, the mint
+    and metadata accounts of the whole chunk are fetched with batched
+    getMultipleAccounts reads, and both are decoded locally. Each mint is
+    checked for existence, expected supply, metadata presence, metadata
+    immutability and a renounced mint authority.
+    """
+
+    def __init__(self, accounts: AccountReadBatcher, chunk_size: int = DEFAULT_AUDIT_CHUNK):
+        self.accounts = accounts
+        self.chunk_size = chunk_size
+
+    def audit(
+        self,
+        launches: Iterable[Tuple[PublicKey, ProductionLaunchConfig]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Audit launches, yielding one result per mint in input order
+
+        Args:
+            launches: (mint, config) pairs
+
+        Yields:
+            Verification results shaped like verify_launch_readiness output
+        """
+        chunk: List[Tuple[PublicKey, ProductionLaunchConfig]] = []
+        for launch in launches:
+            chunk.append(launch)
+            if len(chunk) >= self.chunk_size:
+                yield from self._audit_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._audit_chunk(chunk)
+
+    def audit_to_jsonl(
+        self,
+        launches: Iterable[Tuple[PublicKey, ProductionLaunchConfig]],
+        output: TextIO
+    ) -> Dict[str, Any]:
+        """
+        Stream audit results as JSONL and return throughput stats
+
+        Args:
+            launches: (mint, config) pairs
+            output: Writable text stream for the report
+
+        Returns:
+            Summary with counts, elapsed time and mints per second
+        """
+        start = time.perf_counter()
+        requests_before = self.accounts.rpc_requests
+        audited = 0
+        ready = 0
+
+        for result in self.audit(launches):
+            output.write(json.dumps(result) + "\n")
+            audited += 1
+            ready += result["ready"]
+
+        elapsed = time.perf_counter() - start
+        summary = {
+            "audited": audited,
+            "ready": ready,
+            "not_ready": audited - ready,
+            "rpc_requests": self.accounts.rpc_requests - requests_before,
+            "elapsed_seconds": round(elapsed, 3),
+            "mints_per_second": round(audited / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+        # Stats go to stderr so a stdout report stays valid JSONL
+        print(f"\n📋 Audited {audited:,} mints in {elapsed:.2f}s "
+              f"({summary['mints_per_second']:,} mints/s, {summary['rpc_requests']} RPC requests)",
+              file=sys.stderr)
+        print(f"✅ Ready: {ready:,}  ❌ Not ready: {audited - ready:,}", file=sys.stderr)
+
+        return summary
+
+    def _audit_chunk(
+        self,
+        chunk: List[Tuple[PublicKey, ProductionLaunchConfig]]
+    ) -> Iterator[Dict[str, Any]]:
+        pdas = derive_many([
+            ([b"metadata", bytes(METAPLEX_METADATA_PROGRAM_ID), bytes(mint)], METAPLEX_METADATA_PROGRAM_ID)
+            for mint, _ in chunk
+        ])
+        metadata_pdas = [pda for pda, _ in pdas]
+
+        accounts = self.accounts.get_many([mint for mint, _ in chunk] + metadata_pdas)
+        mint_accounts = accounts[:len(chunk)]
+        metadata_accounts = accounts[len(chunk):]
+
+        for (mint, config), mint_info, metadata_info in zip(chunk, mint_accounts, metadata_accounts):
+            yield audit_accounts(mint, config, mint_info, metadata_info)
+
+
+def audit_accounts(
+    mint: PublicKey,
+    config: ProductionLaunchConfig,
+    mint_info: Optional[Dict[str, Any]],
+    metadata_info: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run every readiness check against already-fetched accounts"""
+    results = {
+        "mint": str(mint),
+        "checks": {},
+        "ready": True
+    }
+
+    results["checks"]["mint_exists"] = mint_info is not None
+
+    try:
+        mint_state = decode_mint_account(account_data(mint_info))
+        expected_supply = config.total_supply * (10 ** config.decimals)
+        results["checks"]["correct_supply"] = mint_state["supply"] == expected_supply
+        results["checks"]["mint_authority_renounced"] = mint_state["mint_authority"] is None
+        results["actual_supply"] = mint_state["supply"]
+    except Exception:
+        results["checks"]["correct_supply"] = False
+        results["checks"]["mint_authority_renounced"] = False
+
+    results["checks"]["metadata_exists"] = metadata_info is not None
+
+    try:
+        metadata_state = decode_metadata_account(account_data(metadata_info))
+        results["checks"]["metadata_immutable"] = not metadata_state["is_mutable"]
+    except Exception:
+        results["checks"]["metadata_immutable"] = False
+
+    results["ready"] = all(results["checks"].values())
+    return results
+
+
+def read_launch_manifest(lines: Iterable[str]) -> Iterator[Tuple[PublicKey, ProductionLaunchConfig]]:
+    """
+    Parse JSONL rows of {"mint": ..., "config": {...ProductionLaunchConfig fields}}
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        row = json.loads(line)
+        yield PublicKey(row["mint"]), ProductionLaunchConfig(**row["config"])
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Bulk launch-readiness audit")
+    parser.add_argument("manifest", help="JSONL file of {mint, config} rows")
+    parser.add_argument("--output", "-o", help="JSONL report path (default: stdout)")
+    parser.add_argument("--rpc-url", default=MAINNET_RPC_ENDPOINTS[0])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_AUDIT_CHUNK)
+    args = parser.parse_args(argv)
+
+    client = Client(args.rpc_url, commitment=Confirmed)
+    auditor = LaunchAuditor(AccountReadBatcher(client, rpc_url=args.rpc_url), args.chunk_size)
+
+    with open(args.manifest) as manifest:
+        launches = read_launch_manifest(manifest)
+        if args.output:
+            with open(args.output, "w") as output:
+                auditor.audit_to_jsonl(launches, output)
+        else:
+            auditor.audit_to_jsonl(launches, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+"""
+Resumable Launch Pipeline
+Runs the launch as a step graph backed by a write-ahead journal
+"""
+
+import os
+import json
+import base64
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import Transaction
+
+from compute_budget import BUDGET_RESERVE
+from confirmation_tracker import COMMITMENT_RANK, commitment_rank
+from derivation_cache import get_associated_token_address
+from solana_memecoin_launchpad_production import (
+    ProductionLaunchConfig,
+    ProductionMemecoinLaunchpad,
+    TokenMetadata,
+)
+from tracing import propagate, set_trace_attribute, span
+from transaction_packer import TransactionPacker
+
+DEFAULT_MAX_PARALLEL_STEPS = 4
+EXPIRY_POLL_INTERVAL = 2.0  # Seconds between block height checks on resume
+
+
+class LaunchJournal:
+    """
+    Append-only JSONL journal of launch progress
+
+    Each record is flushed and fsynced before the pipeline moves on:
+
+    - launch: header with the payer and token symbol
+    - account: a keypair created for the launch (the mint). The secret key
+      is stored so a resumed run can re-sign, so the file is created 0600.
+    - sent: one transaction attempt's signature with its blockhash and the
+      blockhash's lastValidBlockHeight, written as soon as the RPC node
+      accepts it and before waiting for confirmation
+    - plan: inputs a step fixed before sending (async launches record the
+      token accounts to create), reused on resume so transactions pack the
+      same way
+    - done: a finished step and its JSON result
+    - failed: a step that raised
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._records = self._load()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._file = os.fdopen(fd, "a")
+
+    def __enter__(self) -> "LaunchJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._records)
+
+    def append(self, record_type: str, **fields) -> Dict[str, Any]:
+        """Durably append one record"""
+        record = {"type": record_type, "ts": time.time(), **fields}
+        line = json.dumps(record)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._records.append(record)
+        return record
+
+    def close(self):
+        self._file.close()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            # Drop a torn final line left by a crash mid-write
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+
+        return [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+
+
+@dataclass
+class PipelineStep:
+    """One node of the launch graph"""
+    name: str
+    run: Callable[["StepContext"], Dict[str, Any]]
+    depends_on: Tuple[str, ...] = ()
+    description: str = ""
+
+
+class StepContext:
+    """What a running step sees: finished results and journaled sends"""
+
+    def __init__(self, pipeline: "LaunchPipeline", step: PipelineStep):
+        self.pipeline = pipeline
+        self.step = step
+
+    @property
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        return self.pipeline.results
+
+    def landed(self, key: str) -> Optional[str]:
+        """Signature of this step's `key` transaction if it is known to have landed"""
+        return self.pipeline._landed.get((self.step.name, key))
+
+    def send(self, key: str, transaction: Transaction, signers: List[Keypair]) -> str:
+        """
+        Send a transaction at most once across runs
+
+        Args:
+            key: Name of the transaction, unique within the step
+            transaction: Transaction to send
+            signers: Signing keypairs
+
+        Returns:
+            Confirmed signature (the journaled one when skipped on resume)
+        """
+        signature = self.landed(key)
+        if signature is not None:
+            print(f"⏭️  {self.step.name}/{key} already landed: {signature}")
+            return signature
+
+        journal = self.pipeline.journal
+        signature = self.pipeline.launchpad._send_transaction_with_retry(
+            transaction,
+            signers,
+            on_sent=lambda sig, blockhash, last_valid_block_height: journal.append(
+                "sent",
+                step=self.step.name,
+                key=key,
+                signature=sig,
+                blockhash=blockhash,
+                last_valid_block_height=last_valid_block_height
+            )
+        )
+        self.pipeline._landed[(self.step.name, key)] = signature
+        return signature
+
+    def keypair(self, name: str, source: Optional[Callable[[], Keypair]] = None) -> Keypair:
+        """Keypair created for this launch, generated (by `source` if given) and journaled on first use"""
+        for record in self.pipeline.journal.records:
+            if record["type"] == "account" and record["name"] == name:
+                return Keypair.from_secret_key(base64.b64decode(record["secret_key"]))
+
+        keypair = source() if source else Keypair()
+        self.pipeline.journal.append(
+            "account",
+            name=name,
+            pubkey=str(keypair.public_key),
+            secret_key=base64.b64encode(keypair.secret_key).decode()
+        )
+        return keypair
+
+
+class LaunchPipeline:
+    """
+    Runs PipelineSteps in dependency order, resuming from a LaunchJournal
+
+    Steps whose dependencies are all done run concurrently on a thread
+    pool. On start, steps with a `done` record are skipped, and every
+    signature journaled by an unfinished step is checked with one batched
+    getSignatureStatuses lookup so those steps skip what already landed.
+    A signature the node does not know may still land until its blockhash
+    expires, so recovery waits for the block height to pass its
+    lastValidBlockHeight and checks again before the step may re-send.
+    """
+
+    def __init__(
+        self,
+        launchpad: ProductionMemecoinLaunchpad,
+        journal: LaunchJournal,
+        steps: List[PipelineStep],
+        max_parallel_steps: int = DEFAULT_MAX_PARALLEL_STEPS
+    ):
+        self.launchpad = launchpad
+        self.journal = journal
+        self.steps = steps
+        self.max_parallel_steps = max_parallel_steps
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._landed: Dict[Tuple[str, str], str] = {}
+        _check_graph(steps)
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every unfinished step
+
+        Returns:
+            Result per step name; raises the first step failure after the
+            steps already running have finished
+        """
+        with span("launch_pipeline", journal=self.journal.path):
+            return self._run()
+
+    def _run(self) -> Dict[str, Dict[str, Any]]:
+        self._recover()
+        mint = self.results.get("create_token", {}).get("mint")
+        if mint is not None:
+            set_trace_attribute("mint", mint)
+
+        for step in self.steps:
+            if step.name in self.results:
+                print(f"⏭️  {step.name}: already complete")
+
+        pending = [step for step in self.steps if step.name not in self.results]
+        running = {}
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel_steps) as pool:
+            while pending or running:
+                if not errors:
+                    for step in [s for s in pending if all(d in self.results for d in s.depends_on)]:
+                        pending.remove(step)
+                        running[pool.submit(propagate(self._run_step), step)] = step
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        self.results[step.name] = future.result()
+                    except Exception as e:
+                        errors.append(e)
+
+        if errors:
+            raise errors[0]
+        return self.results
+
+    def _run_step(self, step: PipelineStep) -> Dict[str, Any]:
+        if step.description:
+            print(step.description)
+        try:
+            with span(f"step.{step.name}"):
+                result = step.run(StepContext(self, step))
+        except Exception as e:
+            self.journal.append("failed", step=step.name, error=str(e))
+            raise
+        self.journal.append("done", step=step.name, result=result)
+        return result
+
+    def _recover(self):
+        sent = []
+        for record in self.journal.records:
+            if record["type"] == "done":
+                self.results[record["step"]] = record["result"]
+            elif record["type"] == "sent":
+                sent.append(record)
+        sent = [record for record in sent if record["step"] not in self.results]
+
+        if not sent:
+            return
+
+        print(f"🔁 Resuming: checking {len(sent)} journaled signature(s)...")
+        confirmations = self.launchpad.confirmations
+        statuses = confirmations.get_statuses(
+            (record["signature"] for record in sent), search_history=True
+        )
+
+        # Unknown but unexpired: it can still land, so re-sending now could
+        # apply the step twice (e.g. a second mint_to)
+        unknown = [record for record in sent if statuses.get(record["signature"]) is None]
+        if unknown:
+            self._await_expiry(max(record["last_valid_block_height"] for record in unknown))
+            statuses.update(confirmations.get_statuses(
+                (record["signature"] for record in unknown), search_history=True
+            ))
+
+        processed = []
+        for record in sent:
+            status = statuses.get(record["signature"])
+            if status is None or status.get("err") is not None:
+                continue
+            if commitment_rank(status) >= COMMITMENT_RANK["confirmed"]:
+                self._landed[(record["step"], record["key"])] = record["signature"]
+            else:
+                processed.append(record)
+
+        # Seen but not yet confirmed: wait rather than risk sending twice
+        futures = confirmations.track_many(record["signature"] for record in processed)
+        for record, future in zip(processed, futures):
+            try:
+                future.result()
+                self._landed[(record["step"], record["key"])] = record["signature"]
+            except Exception:
+                pass
+
+    def _await_expiry(self, last_valid_block_height: int):
+        """Block until the chain is past `last_valid_block_height`"""
+        client = self.launchpad.client
+        block_height = client.get_block_height()['result']
+        if block_height > last_valid_block_height:
+            return
+
+        print(f"⏳ Waiting {last_valid_block_height - block_height + 1} block(s) "
+              f"for unconfirmed sends to expire...")
+        while block_height <= last_valid_block_height:
+            time.sleep(EXPIRY_POLL_INTERVAL)
+            block_height = client.get_block_height()['result']
+
+
+def _check_graph(steps: List[PipelineStep]):
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError("Pipeline step names must be unique")
+
+    for step in steps:
+        for dependency in step.depends_on:
+            if dependency not in names:
+                raise ValueError(f"Step {step.name} depends on unknown step {dependency}")
+
+    done = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if set(step.depends_on) <= done]
+        if not ready:
+            raise ValueError(f"Pipeline has a dependency cycle among {[s.name for s in remaining]}")
+        for step in ready:
+            done.add(step.name)
+            remaining.remove(step)
+
+
+def build_launch_pipeline(
+    launchpad: ProductionMemecoinLaunchpad,
+    payer: Keypair,
+    metadata: TokenMetadata,
+    config: ProductionLaunchConfig,
+    journal: LaunchJournal,
+    dev_wallet: Optional[PublicKey] = None,
+    marketing_wallet: Optional[PublicKey] = None,
+    max_parallel_steps: int = DEFAULT_MAX_PARALLEL_STEPS,
+    mint_keypair_source: Optional[Callable[[], Keypair]] = None
+) -> LaunchPipeline:
+    """
+    Build the mainnet launch graph
+
+    create_token -> token_account_* (one per distinct wallet, concurrent)
+    -> distribute -> create_pool -> renounce_mint + lock_metadata
+    (concurrent) -> verify
+
+    Args:
+        launchpad: Launchpad used to build and send transactions
+        payer: Funded payer and mint authority; must match a resumed journal
+        metadata: Token metadata
+        config: Launch configuration
+        journal: New or existing journal for this launch
+        dev_wallet: Developer wallet (optional, defaults to payer)
+        marketing_wallet: Marketing wallet (optional, defaults to payer)
+        max_parallel_steps: Steps run concurrently once their dependencies land
+        mint_keypair_source: Supplies the mint keypair on a fresh launch; ignored on resume
+
+    Returns:
+        Pipeline ready to run
+    """
+    header = next((r for r in journal.records if r["type"] == "launch"), None)
+    if header is None:
+        journal.append("launch", payer=str(payer.public_key), symbol=metadata.symbol)
+    elif header["payer"] != str(payer.public_key):
+        raise ValueError(f"Journal {journal.path} belongs to payer {header['payer']}")
+
+    plan = launchpad._distribution_plan(payer, config, dev_wallet, marketing_wallet)
+
+    def mint_of(ctx: StepContext) -> PublicKey:
+        return PublicKey(ctx.results["create_token"]["mint"])
+
+    def create_token(ctx: StepContext) -> Dict[str, Any]:
+        mint_keypair = ctx.keypair("mint", mint_keypair_source)
+        set_trace_attribute("mint", str(mint_keypair.public_key))
+        instructions, metadata_pda = launchpad._create_token_instructions(
+            payer, mint_keypair.public_key, metadata, config
+        )
+
+        signature = ctx.landed("create")
+        if signature is None and launchpad.accounts.get(mint_keypair.public_key).result() is None:
+            transaction = Transaction()
+            for ix in instructions:
+                transaction.add(ix)
+            signature = ctx.send("create", transaction, [payer, mint_keypair])
+
+        print(f"Mint address: {mint_keypair.public_key}")
+        return {
+            "mint": str(mint_keypair.public_key),
+            "metadata_pda": str(metadata_pda),
+            "transaction": signature,
+            "decimals": config.decimals,
+            "explorer_url": f"https://solscan.io/token/{mint_keypair.public_key}"
+        }
+
+    def create_token_account(owner: PublicKey) -> Callable[[StepContext], Dict[str, Any]]:
+        def run(ctx: StepContext) -> Dict[str, Any]:
+            mint = mint_of(ctx)
+            ix = launchpad._create_token_account_instruction_if_missing(payer, mint, owner)
+            signature = None
+            if ix is not None:
+                transaction = Transaction()
+                transaction.add(ix)
+                signature = ctx.send("create", transaction, [payer])
+            return {
+                "owner": str(owner),
+                "token_account": str(get_associated_token_address(owner, mint)),
+                "transaction": signature
+            }
+        return run
+
+    def distribute(ctx: StepContext) -> Dict[str, Any]:
+        instructions, distribution = launchpad._distribution_instructions(
+            payer, mint_of(ctx), config, plan
+        )
+        # Packing is deterministic, so transaction keys are stable across runs
+        packer = TransactionPacker(payer.public_key, reserved=BUDGET_RESERVE)
+        for i, planned in enumerate(packer.pack(instructions)):
+            signature = ctx.send(f"mint_{i}", planned.build(), [payer])
+            distribution["transactions"].append(signature)
+            distribution["packed_transactions"].append({
+                "signature": signature,
+                "instructions": len(planned.instructions),
+                "size_bytes": planned.size_bytes
+            })
+        return distribution
+
+    def create_pool(ctx: StepContext) -> Dict[str, Any]:
+        return launchpad.create_raydium_pool(
+            payer=payer,
+            mint=mint_of(ctx),
+            base_amount=int(ctx.results["distribute"]["allocations"]["liquidity"]),
+            quote_amount=int(config.initial_liquidity_sol * 1e9),
+            config=config
+        )
+
+    def renounce_mint(ctx: StepContext) -> Dict[str, Any]:
+        transaction = Transaction()
+        transaction.add(launchpad._renounce_mint_instruction(payer, mint_of(ctx)))
+        return {"signature": ctx.send("renounce", transaction, [payer])}
+
+    def lock_metadata(ctx: StepContext) -> Dict[str, Any]:
+        transaction = Transaction()
+        transaction.add(launchpad._update_metadata_to_immutable(
+            metadata_pda=PublicKey(ctx.results["create_token"]["metadata_pda"]),
+            update_authority=payer.public_key
+        ))
+        return {"signature": ctx.send("immutable", transaction, [payer])}
+
+    def verify(ctx: StepContext) -> Dict[str, Any]:
+        return launchpad.verify_launch_readiness(mint_of(ctx), config)
+
+    steps = [PipelineStep("create_token", create_token, (), "\n📝 Creating token with metadata...")]
+
+    # One step per distinct owner; wallets defaulting to the payer share its account
+    account_steps = []
+    owners = set()
+    for name, owner, _ in plan:
+        if str(owner) in owners:
+            continue
+        owners.add(str(owner))
+        account_steps.append(PipelineStep(
+            f"token_account_{name}",
+            create_token_account(owner),
+            ("create_token",),
+            f"\n🪙 Creating {name} token account..."
+        ))
+    steps.extend(account_steps)
+
+    steps.extend([
+        PipelineStep("distribute", distribute, tuple(s.name for s in account_steps),
+                     "\n💰 Minting token distribution..."),
+        PipelineStep("create_pool", create_pool, ("distribute",), "\n🏊 Creating liquidity pool..."),
+        PipelineStep("renounce_mint", renounce_mint, ("create_pool",), "\n🔒 Renouncing mint authority..."),
+        PipelineStep("lock_metadata", lock_metadata, ("create_pool",), "\n🔒 Making metadata immutable..."),
+        PipelineStep("verify", verify, ("renounce_mint", "lock_metadata"), "\n✅ Verifying launch readiness..."),
+    ])
+
+    return LaunchPipeline(launchpad, journal, steps, max_parallel_steps)
@@ -0,0 +1,293 @@
+"""
+Launch Record Store
+Append-only SQLite store of launches indexed by mint, symbol, creator and time
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Iterator, TextIO, Union
+
+from solana_memecoin_launchpad_production import ProductionLaunchConfig, TokenMetadata
+
+DEFAULT_STORE_PATH = "launches.db"
+SCAN_BATCH_SIZE = 500  # Rows fetched per cursor round trip while streaming
+
+Timestamp = Union[float, datetime, None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY,
+    mint TEXT NOT NULL UNIQUE,
+    symbol TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS launches_symbol ON launches (symbol, created_at);
+CREATE INDEX IF NOT EXISTS launches_creator ON launches (creator, created_at);
+CREATE INDEX IF NOT EXISTS launches_created_at ON launches (created_at);
+CREATE TRIGGER IF NOT EXISTS launches_no_update BEFORE UPDATE ON launches
+BEGIN
+    SELECT RAISE(ABORT, 'launches is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS launches_no_delete BEFORE DELETE ON launches
+BEGIN
+    SELECT RAISE(ABORT, 'launches is append-only');
+END;
+"""
+
+
+@dataclass
+class LaunchRecord:
+    """One completed launch"""
+    mint: str
+    symbol: str
+    creator: str  # Payer / mint authority public key
+    config: ProductionLaunchConfig
+    metadata: TokenMetadata
+    token: Dict[str, Any] = field(default_factory=dict)
+    distribution: Dict[str, Any] = field(default_factory=dict)
+    pool: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    def payload(self) -> Dict[str, Any]:
+        """Everything not stored in an indexed column"""
+        return {
+            "config": dataclass_values(self.config),
+            "metadata": dataclass_values(self.metadata),
+            "token": self.token,
+            "distribution": self.distribution,
+            "pool": self.pool,
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "mint": self.mint,
+            "symbol": self.symbol,
+            "creator": self.creator,
+            "created_at": self.created_at,
+            **self.payload(),
+        }
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    return tuple(f.name for f in fields(cls))
+
+
+def dataclass_values(obj: Any) -> Dict[str, Any]:
+    """Shallow field-name -> value mapping of a flat dataclass instance"""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+class LaunchStore:
+    """
+    Embedded launch index
+
+    Rows can only be appended; triggers reject updates and deletes. Queries
+    are range scans over the (symbol, created_at), (creator, created_at) and
+    created_at indexes and stream rows in batches instead of loading the
+    whole result set.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "LaunchStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def append(self, record: LaunchRecord) -> int:
+        """
+        Append a launch
+
+        Re-appending a mint that is already stored (e.g. from a resumed
+        launch) is a no-op.
+
+        Returns:
+            Row id of the stored launch
+        """
+        payload = json.dumps(record.payload(), separators=(",", ":"))
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO launches (mint, symbol, creator, created_at, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (record.mint, record.symbol, record.creator, record.created_at, payload)
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid
+            row = self._conn.execute("SELECT id FROM launches WHERE mint = ?", (record.mint,)).fetchone()
+            return row[0]
+
+    def get(self, mint: str) -> Optional[LaunchRecord]:
+        """Look up one launch by mint address"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mint, symbol, creator, created_at, payload FROM launches WHERE mint = ?",
+                (str(mint),)
+            ).fetchone()
+        return _to_record(row) if row else None
+
+    def scan(
+        self,
+        symbol: Optional[str] = None,
+        creator: Optional[str] = None,
+        since: Timestamp = None,
+        until: Timestamp = None,
+        limit: Optional[int] = None
+    ) -> Iterator[LaunchRecord]:
+        """
+        Stream launches in creation order
+
+        Args:
+            symbol: Only this token symbol
+            creator: Only launches by this payer
+            since: Inclusive lower bound (unix seconds or datetime)
+            until: Exclusive upper bound (unix seconds or datetime)
+            limit: Maximum rows
+
+        Yields:
+            Matching LaunchRecords
+        """
+        for row in self._rows(symbol, creator, since, until, limit):
+            yield _to_record(row)
+
+    def by_symbol(self, symbol: str, since: Timestamp = None, until: Timestamp = None) -> Iterator[LaunchRecord]:
+        return self.scan(symbol=symbol, since=since, until=until)
+
+    def by_creator(self, creator: str, since: Timestamp = None, until: Timestamp = None) -> Iterator[LaunchRecord]:
+        return self.scan(creator=str(creator), since=since, until=until)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM launches").fetchone()[0]
+
+    def export_jsonl(self, output: TextIO, **filters) -> int:
+        """
+        Stream matching launches as JSONL without decoding them into records
+
+        Args:
+            output: Writable text stream
+            **filters: Same filters as scan()
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for mint, symbol, creator, created_at, payload in self._rows(**filters):
+            # Splice the stored payload in as-is instead of re-encoding it
+            head = json.dumps({"mint": mint, "symbol": symbol, "creator": creator, "created_at": created_at})
+            output.write(f"{head[:-1]},{payload[1:]}\n")
+            written += 1
+        return written
+
+    def _rows(
+        self,
+        symbol: Optional[str] = None,
+        creator: Optional[str] = None,
+        since: Timestamp = None,
+        until: Timestamp = None,
+        limit: Optional[int] = None
+    ) -> Iterator[tuple]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if creator is not None:
+            clauses.append("creator = ?")
+            params.append(creator)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(_timestamp(until))
+
+        query = "SELECT mint, symbol, creator, created_at, payload FROM launches"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        # A dedicated connection keeps a long export from holding the write lock
+        conn = sqlite3.connect(self.path)
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(SCAN_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+
+def _timestamp(value: Union[float, datetime]) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+def _to_record(row: tuple) -> LaunchRecord:
+    mint, symbol, creator, created_at, payload = row
+    data = json.loads(payload)
+    return LaunchRecord(
+        mint=mint,
+        symbol=symbol,
+        creator=creator,
+        config=ProductionLaunchConfig(**data["config"]),
+        metadata=TokenMetadata(**data["metadata"]),
+        token=data["token"],
+        distribution=data["distribution"],
+        pool=data["pool"],
+        created_at=created_at,
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Query or export the launch store")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH)
+    parser.add_argument("--symbol")
+    parser.add_argument("--creator")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="ISO date/time (UTC)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="ISO date/time (UTC)")
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args(argv)
+
+    with LaunchStore(args.store) as store:
+        written = store.export_jsonl(
+            sys.stdout,
+            symbol=args.symbol,
+            creator=args.creator,
+            since=args.since,
+            until=args.until,
+            limit=args.limit
+        )
+    print(f"📦 Exported {written:,} launches", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
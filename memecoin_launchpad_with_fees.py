@@ -4,11 +4,11 @@ Includes transaction fee sharing and creator rewards
 """
 
 import os
-import json
 import time
 import base64
-from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -19,19 +19,41 @@ from solana.publickey import PublicKey
 from solana.transaction import Transaction
 from solana.system_program import SYS_PROGRAM_ID, transfer, TransferParams
 from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
-from spl.token.instructions import (
-    create_mint,
-    create_associated_token_account,
-    mint_to,
-    transfer_checked,
-    set_authority,
-    AuthorityType,
-    get_associated_token_address
-)
+
+from blockhash_cache import get_blockhash_provider
+from confirmation_tracker import ConfirmationTracker
+from derivation_cache import find_program_address, get_associated_token_address
+from metadata_codec import Creator, encode_create_metadata_v3
+from milestone_tracker import MilestoneSchedule, MilestoneTracker
+from rpc_metrics import record_retry
+from rpc_pool import shared_client
 
 # Program IDs
 METAPLEX_METADATA_PROGRAM_ID = PublicKey("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
 TOKEN_2022_PROGRAM_ID = PublicKey("TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb")  # Token-2022 for fee support
+BPS_DENOMINATOR = 10_000
+
+
+@lru_cache(maxsize=1_024)
+def _share_basis_points(creator: float, liquidity: float, burn: float) -> Tuple[int, int, int]:
+    shares = tuple(round(percentage * 100) for percentage in (creator, liquidity, burn))
+    if min(shares) < 0 or sum(shares) > BPS_DENOMINATOR:
+        raise ValueError(f"Fee shares must be non-negative and total at most 100%, got {shares} bps")
+    return shares
+
+
+def split_fee(total_fee: int, share_bps: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
+    """
+    Integer split of a fee into (creator, liquidity, burn, treasury)
+
+    Each share is floored; treasury takes the remainder, so the parts
+    always sum to total_fee.
+    """
+    creator_bps, liquidity_bps, burn_bps = share_bps
+    creator = total_fee * creator_bps // BPS_DENOMINATOR
+    liquidity = total_fee * liquidity_bps // BPS_DENOMINATOR
+    burn = total_fee * burn_bps // BPS_DENOMINATOR
+    return creator, liquidity, burn, total_fee - creator - liquidity - burn
 
 
 @dataclass
@@ -51,6 +73,11 @@ class CreatorFeeConfig:
     volume_milestone_rewards: Dict[int, int] = None  # Volume milestones and rewards
     holder_rewards_enabled: bool = True  # Enable holder rewards
     
+    # (rewards dict, schedule built from it), see milestone_schedule()
+    _milestone_schedule: Optional[Tuple[Dict[int, int], MilestoneSchedule]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         if self.volume_milestone_rewards is None:
             self.volume_milestone_rewards = {
@@ -58,6 +85,38 @@ class CreatorFeeConfig:
                 10_000_000: 50_000,   # 50k tokens at 10M volume
                 100_000_000: 200_000, # 200k tokens at 100M volume
             }
+    
+    def share_basis_points(self) -> Tuple[int, int, int]:
+        """
+        Creator, liquidity and burn shares in basis points
+        
+        Treasury takes whatever these leave, which absorbs rounding. Results
+        are cached by the percentages, so per-event callers pay a lookup.
+        """
+        return _share_basis_points(
+            self.creator_share_percentage,
+            self.liquidity_share_percentage,
+            self.burn_share_percentage,
+        )
+    
+    def milestone_schedule(self) -> MilestoneSchedule:
+        """
+        volume_milestone_rewards as a MilestoneSchedule, built once per rewards dict
+        
+        The cache is checked by identity, so per-trade callers skip sorting
+        the rewards; it is rebuilt when volume_milestone_rewards is assigned
+        a new dict, but not when the current dict is edited in place.
+        """
+        cached = self._milestone_schedule
+        if cached is None or cached[0] is not self.volume_milestone_rewards:
+            cached = self._milestone_schedule = (
+                self.volume_milestone_rewards, MilestoneSchedule(self.volume_milestone_rewards)
+            )
+        return cached[1]
+    
+    def transfer_fee(self, amount: int) -> int:
+        """Fee Token-2022 withholds on a transfer: ceil(amount * bps / 10_000), capped at max_fee"""
+        return min(-(-amount * self.transfer_fee_basis_points // BPS_DENOMINATOR), self.max_fee)
 
 
 @dataclass
@@ -106,7 +165,7 @@ class FeeDistributionManager:
     def __init__(self, client: Client):
         self.client = client
         self.fee_accounts = {}
-        self.volume_tracker = {}
+        self.volume_tracker = MilestoneTracker()
         self.distributed_fees = {}
     
     def setup_fee_accounts(
@@ -170,20 +229,9 @@ class FeeDistributionManager:
         Returns:
             Distribution amounts
         """
-        distribution = {}
-        
-        # Calculate each portion
-        distribution['creator'] = int(total_fee * fee_config.creator_share_percentage / 100)
-        distribution['liquidity'] = int(total_fee * fee_config.liquidity_share_percentage / 100)
-        distribution['burn'] = int(total_fee * fee_config.burn_share_percentage / 100)
-        distribution['treasury'] = int(total_fee * fee_config.treasury_share_percentage / 100)
-        
-        # Ensure total equals original fee (handle rounding)
-        total_distributed = sum(distribution.values())
-        if total_distributed < total_fee:
-            distribution['treasury'] += total_fee - total_distributed
-        
-        return distribution
+        # Integer basis points keep every split exact; treasury takes the rounding remainder
+        creator, liquidity, burn, treasury = split_fee(total_fee, fee_config.share_basis_points())
+        return {'creator': creator, 'liquidity': liquidity, 'burn': burn, 'treasury': treasury}
     
     def track_volume_milestone(
         self,
@@ -194,40 +242,43 @@ class FeeDistributionManager:
         """
         Track volume and check for milestone rewards
         
+        Volumes are counted in base units: ints, or floats with an integral
+        value, and a mint's running total must fit in a u64.
+        
         Args:
             token_address: Token mint address
             volume: Current volume
             fee_config: Fee configuration
             
         Returns:
-            Reward amount if milestone reached
+            Summed reward of every milestone this volume crossed, or None
         """
-        if token_address not in self.volume_tracker:
-            self.volume_tracker[token_address] = {
-                'total_volume': 0,
-                'milestones_reached': []
-            }
-        
-        tracker = self.volume_tracker[token_address]
-        tracker['total_volume'] += volume
-        
-        # Check for new milestones
-        for milestone, reward in fee_config.volume_milestone_rewards.items():
-            if (tracker['total_volume'] >= milestone and 
-                milestone not in tracker['milestones_reached']):
-                tracker['milestones_reached'].append(milestone)
-                return reward
-        
-        return None
+        if not isinstance(volume, int):
+            if not isinstance(volume, float) or not volume.is_integer():
+                raise ValueError(f"Volume must be a whole number of base units, got {volume!r}")
+            volume = int(volume)
+        
+        cached = fee_config._milestone_schedule
+        if cached is None or cached[0] is not fee_config.volume_milestone_rewards:
+            return self.volume_tracker.track_reward(token_address, volume, fee_config.milestone_schedule())
+        return self.volume_tracker.track_reward(token_address, volume, cached[1])
 
 
 class EnhancedMemecoinLaunchpad:
     """Production-ready launchpad with creator fees and rewards"""
     
-    def __init__(self, rpc_url: str = "https://api.mainnet-beta.solana.com"):
-        self.client = Client(rpc_url, commitment=Confirmed)
+    def __init__(
+        self,
+        rpc_url: str = "https://api.mainnet-beta.solana.com",
+        client: Optional[Client] = None,
+        verify_connection: bool = True
+    ):
+        self.client = client or shared_client(rpc_url, Confirmed)
         self.fee_manager = FeeDistributionManager(self.client)
-        self._verify_connection()
+        self.confirmations = ConfirmationTracker(self.client, commitment=Confirmed)
+        self.blockhash = get_blockhash_provider(self.client)
+        if verify_connection:
+            self._verify_connection()
     
     def _verify_connection(self):
         """Verify RPC connection"""
@@ -237,11 +288,40 @@ class EnhancedMemecoinLaunchpad:
         except Exception as e:
             raise ConnectionError(f"Failed to connect: {e}")
     
+    def _send_transaction_with_retry(
+        self,
+        transaction: Transaction,
+        signers: List[Keypair],
+        max_retries: int = 3
+    ) -> str:
+        """Send transaction with retry logic"""
+        for attempt in range(max_retries):
+            try:
+                response = self.client.send_transaction(
+                    transaction,
+                    *signers,
+                    opts={"skip_preflight": False, "preflight_commitment": Confirmed},
+                    recent_blockhash=self.blockhash.get_blockhash()
+                )
+                
+                # Wait for confirmation
+                self.confirmations.track(response['result'], Confirmed).result()
+                return response['result']
+                
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    raise e
+                print(f"Transaction failed, retrying... ({attempt + 1}/{max_retries})")
+                record_retry(self.client, "send_transaction")
+                self.blockhash.invalidate()
+                time.sleep(2)
+    
     def create_token_with_fees(
         self,
         payer: Keypair,
         metadata: EnhancedTokenMetadata,
-        config: LaunchpadConfigWithFees
+        config: LaunchpadConfigWithFees,
+        mint_keypair_source: Optional[Callable[[], Keypair]] = None
     ) -> Dict[str, Any]:
         """
         Create token with built-in fee mechanism using Token-2022
@@ -250,6 +330,7 @@ class EnhancedMemecoinLaunchpad:
             payer: Transaction payer
             metadata: Enhanced token metadata
             config: Launch configuration with fees
+            mint_keypair_source: Supplies the mint keypair (e.g. a vanity grinder); random if omitted
             
         Returns:
             Token creation details
@@ -257,7 +338,7 @@ class EnhancedMemecoinLaunchpad:
         # For tokens with transfer fees, we should use Token-2022 program
         # which supports native transfer fees
         
-        mint_keypair = Keypair()
+        mint_keypair = mint_keypair_source() if mint_keypair_source else Keypair()
         
         print(f"Creating token with creator fees...")
         print(f"Transfer fee: {config.fee_config.transfer_fee_basis_points / 100}%")
@@ -275,7 +356,7 @@ class EnhancedMemecoinLaunchpad:
         )
         
         # Create metadata
-        metadata_pda, _ = PublicKey.find_program_address(
+        metadata_pda, _ = find_program_address(
             [
                 b"metadata",
                 bytes(METAPLEX_METADATA_PROGRAM_ID),
@@ -460,31 +541,14 @@ class EnhancedMemecoinLaunchpad:
         from solana.transaction import TransactionInstruction, AccountMeta
         
         # Enhanced metadata with creator info
-        data = bytearray()
-        data.extend(bytes([33]))  # CreateMetadataAccountV3
-        
-        # Encode enhanced metadata
-        metadata_dict = {
-            "name": metadata.name,
-            "symbol": metadata.symbol,
-            "uri": metadata.image_url,
-            "seller_fee_basis_points": creator_fee_basis_points,
-            "creators": [{
-                "address": str(metadata.creator_wallet),
-                "verified": True,
-                "share": 100
-            }],
-            "collection": None,
-            "uses": None
-        }
-        
-        # Serialize metadata (simplified)
-        metadata_json = json.dumps(metadata_dict)
-        data.extend(len(metadata_json).to_bytes(4, 'little'))
-        data.extend(metadata_json.encode('utf-8'))
-        
-        # Is mutable
-        data.append(1)  # True initially, set to False after launch
+        data = encode_create_metadata_v3(
+            metadata.name,
+            metadata.symbol,
+            metadata.image_url,
+            seller_fee_basis_points=creator_fee_basis_points,
+            creators=[Creator(address=metadata.creator_wallet, verified=True, share=100)],
+            is_mutable=True  # Set to False after launch
+        )
         
         return TransactionInstruction(
             program_id=METAPLEX_METADATA_PROGRAM_ID,
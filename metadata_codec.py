@@ -0,0 +1,322 @@
+"""
+Metaplex Metadata Codec
+Precompiled Borsh layouts for CreateMetadataAccountV3 and UpdateMetadataAccountV2 data and metadata accounts
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Iterable, Iterator, Union
+
+from solana.publickey import PublicKey
+
+# Token Metadata instruction indexes
+UPDATE_METADATA_ACCOUNT_V2 = 15
+CREATE_METADATA_ACCOUNT_V3 = 33
+
+MAX_NAME_LENGTH = 32
+MAX_SYMBOL_LENGTH = 10
+MAX_URI_LENGTH = 200
+MAX_CREATOR_LIMIT = 5
+
+# Precompiled layouts (little-endian Borsh)
+_INSTRUCTION = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_SELLER_FEE_AND_CREATORS_TAG = struct.Struct("<HB")
+_CREATOR = struct.Struct("<32sBB")
+# collection: None, uses: None, is_mutable, collection_details: None
+_V3_TAIL = struct.Struct("<BBBB")
+
+_ACCOUNT_HEADER = struct.Struct("<B32s32s")  # key, update_authority, mint
+
+# Borsh Option: a 0/1 tag, then the value when Some
+_SOME_PUBKEY = struct.Struct("<B32s")
+_SOME_BOOL = struct.Struct("<BB")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+@dataclass
+class Creator:
+    """Metaplex creator entry"""
+    address: PublicKey
+    verified: bool = False
+    share: int = 100
+
+
+def create_metadata_v3_size(
+    name: bytes,
+    symbol: bytes,
+    uri: bytes,
+    num_creators: Optional[int] = None
+) -> int:
+    """Exact encoded size of CreateMetadataAccountV3 instruction data"""
+    size = _INSTRUCTION.size
+    size += 3 * _U32.size + len(name) + len(symbol) + len(uri)
+    size += _SELLER_FEE_AND_CREATORS_TAG.size
+    if num_creators is not None:
+        size += _U32.size + num_creators * _CREATOR.size
+    return size + _V3_TAIL.size
+
+
+def encode_create_metadata_v3_into(
+    buffer: Union[bytearray, memoryview],
+    offset: int,
+    name: bytes,
+    symbol: bytes,
+    uri: bytes,
+    seller_fee_basis_points: int = 0,
+    creators: Optional[Sequence[Creator]] = None,
+    is_mutable: bool = True
+) -> int:
+    """
+    Write CreateMetadataAccountV3 instruction data into a preallocated buffer
+
+    Args:
+        buffer: Writable buffer with at least create_metadata_v3_size() bytes free
+        offset: Position to start writing at
+        name, symbol, uri: UTF-8 encoded strings
+
+    Returns:
+        Offset just past the written data
+    """
+    _INSTRUCTION.pack_into(buffer, offset, CREATE_METADATA_ACCOUNT_V3)
+    offset += _INSTRUCTION.size
+
+    view = memoryview(buffer)
+    for field in (name, symbol, uri):
+        _U32.pack_into(buffer, offset, len(field))
+        offset += _U32.size
+        view[offset:offset + len(field)] = field
+        offset += len(field)
+
+    _SELLER_FEE_AND_CREATORS_TAG.pack_into(
+        buffer, offset, seller_fee_basis_points, 1 if creators is not None else 0
+    )
+    offset += _SELLER_FEE_AND_CREATORS_TAG.size
+
+    if creators is not None:
+        _U32.pack_into(buffer, offset, len(creators))
+        offset += _U32.size
+        for creator in creators:
+            _CREATOR.pack_into(
+                buffer, offset, bytes(creator.address), 1 if creator.verified else 0, creator.share
+            )
+            offset += _CREATOR.size
+
+    _V3_TAIL.pack_into(buffer, offset, 0, 0, 1 if is_mutable else 0, 0)
+    return offset + _V3_TAIL.size
+
+
+def encode_create_metadata_v3(
+    name: str,
+    symbol: str,
+    uri: str,
+    seller_fee_basis_points: int = 0,
+    creators: Optional[Sequence[Creator]] = None,
+    is_mutable: bool = True
+) -> bytes:
+    """
+    Encode CreateMetadataAccountV3 instruction data
+
+    Args:
+        name: Token name (max 32 bytes)
+        symbol: Token symbol (max 10 bytes)
+        uri: Off-chain metadata URI (max 200 bytes)
+        seller_fee_basis_points: Royalty in basis points
+        creators: Optional creator list (max 5)
+        is_mutable: Whether the metadata can be updated later
+
+    Returns:
+        Serialized instruction data
+    """
+    name_bytes, symbol_bytes, uri_bytes = _validated_fields(name, symbol, uri, creators)
+    buffer = bytearray(create_metadata_v3_size(
+        name_bytes, symbol_bytes, uri_bytes, None if creators is None else len(creators)
+    ))
+    encode_create_metadata_v3_into(
+        buffer, 0, name_bytes, symbol_bytes, uri_bytes,
+        seller_fee_basis_points, creators, is_mutable
+    )
+    return bytes(buffer)
+
+
+def encode_create_metadata_v3_batch(
+    entries: Sequence[Tuple[str, str, str]],
+    is_mutable: bool = True
+) -> Tuple[bytearray, List[int]]:
+    """
+    Encode many (name, symbol, uri) entries into one contiguous buffer
+
+    Returns:
+        The buffer and the start offset of each entry (plus the end offset)
+    """
+    encoded = [_validated_fields(name, symbol, uri, None) for name, symbol, uri in entries]
+    offsets = [0]
+    for fields in encoded:
+        offsets.append(offsets[-1] + create_metadata_v3_size(*fields))
+
+    buffer = bytearray(offsets[-1])
+    for (name_bytes, symbol_bytes, uri_bytes), start in zip(encoded, offsets):
+        encode_create_metadata_v3_into(
+            buffer, start, name_bytes, symbol_bytes, uri_bytes, is_mutable=is_mutable
+        )
+    return buffer, offsets
+
+
+def encode_update_metadata_v2(
+    update_authority: Optional[PublicKey] = None,
+    primary_sale_happened: Optional[bool] = None,
+    is_mutable: Optional[bool] = None
+) -> bytes:
+    """
+    Encode UpdateMetadataAccountV2 instruction data
+
+    The data option is always None, leaving name, symbol, uri and creators
+    unchanged; each other argument left as None keeps its current value.
+
+    Returns:
+        Serialized instruction data, e.g. is_mutable=False to lock metadata
+    """
+    data = bytearray(_INSTRUCTION.pack(UPDATE_METADATA_ACCOUNT_V2))
+    data.append(0)  # data: None
+    if update_authority is None:
+        data.append(0)
+    else:
+        data += _SOME_PUBKEY.pack(1, bytes(update_authority))
+    for value in (primary_sale_happened, is_mutable):
+        data += bytes([0]) if value is None else _SOME_BOOL.pack(1, 1 if value else 0)
+    return bytes(data)
+
+
+def decode_update_metadata_v2(data: Buffer) -> Dict[str, Any]:
+    """
+    Decode UpdateMetadataAccountV2 instruction data written with a None data option
+
+    Returns:
+        update_authority, primary_sale_happened and is_mutable (None when unchanged)
+    """
+    view = memoryview(data)
+    if len(view) < 2 or view[0] != UPDATE_METADATA_ACCOUNT_V2:
+        raise ValueError("Not UpdateMetadataAccountV2 instruction data")
+    if view[1]:
+        raise ValueError("Decoding a replacement data field is not supported")
+    offset = 2
+
+    result: Dict[str, Any] = {}
+    for field_name, layout in (
+        ("update_authority", _SOME_PUBKEY),
+        ("primary_sale_happened", _SOME_BOOL),
+        ("is_mutable", _SOME_BOOL),
+    ):
+        if offset >= len(view):
+            raise ValueError(f"UpdateMetadataAccountV2 data is truncated at {field_name}")
+        if not view[offset]:
+            result[field_name] = None
+            offset += 1
+            continue
+        if offset + layout.size > len(view):
+            raise ValueError(f"UpdateMetadataAccountV2 data is truncated at {field_name}")
+        _, value = layout.unpack_from(view, offset)
+        result[field_name] = str(PublicKey(value)) if layout is _SOME_PUBKEY else bool(value)
+        offset += layout.size
+
+    if offset != len(view):
+        raise ValueError("Unexpected trailing UpdateMetadataAccountV2 data")
+    return result
+
+
+def decode_metadata_account(data: Buffer) -> Dict[str, Any]:
+    """
+    Decode a Metaplex metadata account without copying the account data
+
+    Fields after is_mutable (edition nonce, token standard) are decoded when
+    present; collection, uses and later fields are not.
+    """
+    view = memoryview(data)
+    key, update_authority, mint = _ACCOUNT_HEADER.unpack_from(view, 0)
+    offset = _ACCOUNT_HEADER.size
+
+    strings = []
+    for _ in range(3):
+        (length,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        if offset + length > len(view):
+            raise ValueError("Metadata account data is truncated")
+        strings.append(str(view[offset:offset + length], "utf-8").rstrip("\x00"))
+        offset += length
+
+    seller_fee_basis_points, has_creators = _SELLER_FEE_AND_CREATORS_TAG.unpack_from(view, offset)
+    offset += _SELLER_FEE_AND_CREATORS_TAG.size
+
+    creators = None
+    if has_creators:
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        creators = []
+        for _ in range(count):
+            address, verified, share = _CREATOR.unpack_from(view, offset)
+            offset += _CREATOR.size
+            creators.append({"address": str(PublicKey(address)), "verified": bool(verified), "share": share})
+
+    primary_sale_happened, is_mutable = view[offset], view[offset + 1]
+    offset += 2
+
+    result = {
+        "key": key,
+        "update_authority": str(PublicKey(update_authority)),
+        "mint": str(PublicKey(mint)),
+        "name": strings[0],
+        "symbol": strings[1],
+        "uri": strings[2],
+        "seller_fee_basis_points": seller_fee_basis_points,
+        "creators": creators,
+        "primary_sale_happened": bool(primary_sale_happened),
+        "is_mutable": bool(is_mutable),
+        "edition_nonce": None,
+        "token_standard": None,
+    }
+
+    for field_name in ("edition_nonce", "token_standard"):
+        if offset >= len(view):
+            break
+        if view[offset]:
+            result[field_name] = view[offset + 1]
+            offset += 2
+        else:
+            offset += 1
+
+    return result
+
+
+def decode_metadata_accounts(accounts: Iterable[Optional[Buffer]]) -> Iterator[Optional[Dict[str, Any]]]:
+    """Decode metadata accounts in bulk; missing or malformed accounts yield None"""
+    for data in accounts:
+        if data is None:
+            yield None
+            continue
+        try:
+            yield decode_metadata_account(data)
+        except (ValueError, IndexError, struct.error, UnicodeDecodeError):
+            yield None
+
+
+def _validated_fields(
+    name: str,
+    symbol: str,
+    uri: str,
+    creators: Optional[Sequence[Creator]]
+) -> Tuple[bytes, bytes, bytes]:
+    name_bytes = name.encode("utf-8")
+    symbol_bytes = symbol.encode("utf-8")
+    uri_bytes = uri.encode("utf-8")
+
+    if len(name_bytes) > MAX_NAME_LENGTH:
+        raise ValueError(f"Name exceeds {MAX_NAME_LENGTH} bytes: {name!r}")
+    if len(symbol_bytes) > MAX_SYMBOL_LENGTH:
+        raise ValueError(f"Symbol exceeds {MAX_SYMBOL_LENGTH} bytes: {symbol!r}")
+    if len(uri_bytes) > MAX_URI_LENGTH:
+        raise ValueError(f"URI exceeds {MAX_URI_LENGTH} bytes")
+    if creators is not None and len(creators) > MAX_CREATOR_LIMIT:
+        raise ValueError(f"At most {MAX_CREATOR_LIMIT} creators are allowed")
+
+    return name_bytes, symbol_bytes, uri_bytes
@@ -0,0 +1,258 @@
+"""
+Volume Milestone Tracker
+Compact per-mint volume totals with bisect lookups over sorted milestone thresholds
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Optional, Dict, List, Tuple, Sequence
+
+MAX_TRACKED_VOLUME = 2 ** 64 - 1  # Volumes are stored as u64
+MAX_SCHEDULES = 0xFFFF  # Schedule ids are stored as u16
+
+
+def schedule_key(volume_milestone_rewards: Dict[int, int]) -> Tuple[Tuple[int, int], ...]:
+    """Hashable identity of a rewards dict: its (threshold, reward) pairs in order"""
+    return tuple(sorted(volume_milestone_rewards.items()))
+
+
+class MilestoneSchedule:
+    """
+    Volume milestones sorted by threshold, with prefix sums of their rewards
+
+    Volume only grows, so the milestones a mint has reached are always a
+    prefix of the sorted thresholds. A tracker therefore stores only how
+    many it has reached, and the rewards for any newly crossed run are one
+    prefix-sum subtraction.
+    """
+    __slots__ = ("key", "thresholds", "rewards", "_cumulative", "_next", "_source")
+
+    def __init__(self, volume_milestone_rewards: Dict[int, int]):
+        if len(volume_milestone_rewards) > 0xFFFF:
+            raise ValueError("At most 65535 milestones are supported")
+        self.key = schedule_key(volume_milestone_rewards)
+        self.thresholds: Tuple[int, ...] = tuple(threshold for threshold, _ in self.key)
+        self.rewards: Tuple[int, ...] = tuple(reward for _, reward in self.key)
+        self._cumulative: Tuple[int, ...] = (0,) + tuple(accumulate(self.rewards))
+        # Threshold after `reached` milestones, with an unreachable one past the last
+        self._next: Tuple[int, ...] = self.thresholds + (MAX_TRACKED_VOLUME + 1,)
+        self._source = dict(volume_milestone_rewards)
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def matches(self, volume_milestone_rewards: Dict[int, int]) -> bool:
+        """Whether this schedule was built from an equal rewards dict"""
+        return self._source == volume_milestone_rewards
+
+    def reached(self, total_volume: int) -> int:
+        """Number of milestones at or below total_volume"""
+        return bisect_right(self.thresholds, total_volume)
+
+    def reward_between(self, start: int, end: int) -> int:
+        """Summed reward of milestones [start, end) in threshold order"""
+        return self._cumulative[end] - self._cumulative[start]
+
+
+class MilestoneTracker:
+    """
+    Per-mint cumulative volume and milestones reached
+
+    State lives in parallel arrays (u64 volume, u16 milestones reached, u16
+    schedule id) indexed through one dict of mint -> slot, so a tracked mint
+    costs a dict entry plus 12 bytes instead of a dict holding a list. A
+    trade that crosses no milestone is one comparison against the next
+    threshold; otherwise a bisect finds every milestone it crossed.
+
+    The milestones reached are a count into the schedule the mint was last
+    tracked against, so each mint records that schedule's id. Schedules are
+    registered by value (equal rewards share an id). When a mint is tracked
+    against a different schedule, its count is rebased onto the new one:
+    milestones at or below its current volume count as reached, without
+    paying their rewards.
+
+    Volumes must be non-negative integers, and a mint's total must fit in
+    a u64.
+
+    Args:
+        schedule: Milestones used when track() is not given one
+    """
+    __slots__ = (
+        "schedule", "schedules", "_schedule_ids", "_ids_by_schedule", "_slots", "_volumes", "_reached", "_schedule_of"
+    )
+
+    def __init__(self, schedule: Optional[MilestoneSchedule] = None):
+        self.schedule = schedule
+        self.schedules: List[MilestoneSchedule] = []  # Indexed by schedule id
+        self._schedule_ids: Dict[Tuple[Tuple[int, int], ...], int] = {}
+        # By object identity, so a known schedule costs one pointer-hash lookup per trade
+        self._ids_by_schedule: Dict[MilestoneSchedule, int] = {}
+        self._slots: Dict[str, int] = {}
+        self._volumes = array("Q")
+        self._reached = array("H")
+        self._schedule_of = array("H")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, mint: str) -> bool:
+        return mint in self._slots
+
+    def schedule_id(self, schedule: MilestoneSchedule) -> int:
+        """Id of a schedule, registering it on first use"""
+        schedule_id = self._ids_by_schedule.get(schedule)
+        if schedule_id is not None:
+            return schedule_id
+        schedule_id = self._schedule_ids.get(schedule.key)
+        if schedule_id is None:
+            if len(self.schedules) >= MAX_SCHEDULES:
+                raise ValueError(f"At most {MAX_SCHEDULES} distinct milestone schedules are supported")
+            schedule_id = self._schedule_ids[schedule.key] = len(self.schedules)
+            self.schedules.append(schedule)
+        self._ids_by_schedule[schedule] = schedule_id
+        return schedule_id
+
+    def _advance(
+        self,
+        mint: str,
+        volume: int,
+        schedule: Optional[MilestoneSchedule]
+    ) -> Tuple[MilestoneSchedule, int, int]:
+        """Add volume; returns the schedule and the [start, end) milestones it crossed"""
+        if volume < 0:
+            raise ValueError("Volume must be non-negative")
+        if schedule is None:
+            schedule = self.schedule
+            if schedule is None:
+                raise ValueError("No milestone schedule given")
+        schedule_id = self._ids_by_schedule.get(schedule)
+        if schedule_id is None:
+            schedule_id = self.schedule_id(schedule)
+
+        slot = self._slots.get(mint)
+        if slot is None:
+            if volume > MAX_TRACKED_VOLUME:
+                raise OverflowError(f"Volume for {mint} exceeds the u64 range")
+            slot = self._slots[mint] = len(self._volumes)
+            self._volumes.append(volume)
+            self._reached.append(0)
+            self._schedule_of.append(schedule_id)
+            total, start = volume, 0
+        else:
+            volumes = self._volumes
+            previous = volumes[slot]
+            total = previous + volume
+            try:
+                volumes[slot] = total  # The u64 array rejects an overflowing total unchanged
+            except OverflowError:
+                raise OverflowError(f"Cumulative volume for {mint} exceeds the u64 range") from None
+            start = self._reached[slot]
+            if self._schedule_of[slot] != schedule_id:
+                # Rebase onto the new schedule; what the old volume passed is not paid again
+                start = self._reached[slot] = schedule.reached(previous)
+                self._schedule_of[slot] = schedule_id
+
+        if total < schedule._next[start]:
+            return schedule, start, start
+        end = bisect_right(schedule.thresholds, total, start)
+        self._reached[slot] = end
+        return schedule, start, end
+
+    def track(
+        self,
+        mint: str,
+        volume: int,
+        schedule: Optional[MilestoneSchedule] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Add traded volume for a mint
+
+        Args:
+            mint: Token mint address
+            volume: Volume of this trade
+            schedule: Milestones to check (defaults to the tracker's)
+
+        Returns:
+            (threshold, reward) of every milestone this trade crossed, lowest first
+        """
+        schedule, start, end = self._advance(mint, volume, schedule)
+        return list(zip(schedule.thresholds[start:end], schedule.rewards[start:end]))
+
+    def track_reward(
+        self,
+        mint: str,
+        volume: int,
+        schedule: Optional[MilestoneSchedule] = None
+    ) -> Optional[int]:
+        """Add traded volume; summed reward of the milestones it crossed, or None if none"""
+        slot = self._slots.get(mint)
+        if (slot is not None and volume >= 0
+                and self._schedule_of[slot] == self._ids_by_schedule.get(schedule)):
+            # Hot path: a known mint on its own schedule that crosses nothing.
+            # Below the next threshold the total cannot overflow the u64 array.
+            total = self._volumes[slot] + volume
+            if total < schedule._next[self._reached[slot]]:
+                self._volumes[slot] = total
+                return None
+        schedule, start, end = self._advance(mint, volume, schedule)
+        return schedule.reward_between(start, end) if end > start else None
+
+    def state(self, mint: str) -> Tuple[int, int, int]:
+        """(total volume, milestones reached, schedule id) for a mint"""
+        slot = self._slots.get(mint)
+        if slot is None:
+            return 0, 0, 0
+        return self._volumes[slot], self._reached[slot], self._schedule_of[slot]
+
+    def restore(self, mint: str, total_volume: int, reached: int, schedule_id: int = 0):
+        """Overwrite a mint's state, e.g. when replaying a journal"""
+        slot = self._slots.get(mint)
+        if slot is None:
+            slot = self._slots[mint] = len(self._volumes)
+            self._volumes.append(total_volume)
+            self._reached.append(reached)
+            self._schedule_of.append(schedule_id)
+            return
+        self._volumes[slot] = total_volume
+        self._reached[slot] = reached
+        self._schedule_of[slot] = schedule_id
+
+    def export(self) -> Tuple[List[str], array, array, array, List[MilestoneSchedule]]:
+        """Mints in slot order, the volume, reached and schedule-id arrays (not copies), and the schedules"""
+        return list(self._slots), self._volumes, self._reached, self._schedule_of, list(self.schedules)
+
+    @classmethod
+    def from_export(
+        cls,
+        mints: Sequence[str],
+        volumes: array,
+        reached: array,
+        schedule_ids: array,
+        schedules: Sequence[MilestoneSchedule],
+        schedule: Optional[MilestoneSchedule] = None
+    ) -> "MilestoneTracker":
+        """Rebuild a tracker from export() output"""
+        if not len(mints) == len(volumes) == len(reached) == len(schedule_ids):
+            raise ValueError("Tracker export arrays differ in length")
+        tracker = cls(schedule)
+        for registered in schedules:
+            tracker.schedule_id(registered)
+        if len(tracker.schedules) != len(schedules):
+            raise ValueError("Tracker export lists a schedule twice")
+        tracker._slots = dict(zip(mints, range(len(mints))))
+        tracker._volumes = volumes
+        tracker._reached = reached
+        tracker._schedule_of = schedule_ids
+        return tracker
+
+    def total_volume(self, mint: str) -> int:
+        slot = self._slots.get(mint)
+        return self._volumes[slot] if slot is not None else 0
+
+    def milestones_reached(self, mint: str) -> List[int]:
+        """Thresholds the mint has reached under the schedule it was last tracked against"""
+        slot = self._slots.get(mint)
+        if slot is None:
+            return []
+        return list(self.schedules[self._schedule_of[slot]].thresholds[:self._reached[slot]])
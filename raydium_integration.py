@@ -15,7 +15,8 @@ from solana.publickey import PublicKey
 from solana.transaction import Transaction
 from solana.system_program import SYS_PROGRAM_ID
 from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
-from spl.token.instructions import get_associated_token_address
+
+from derivation_cache import find_program_address
 
 # Raydium Program IDs (Mainnet)
 RAYDIUM_AMM_PROGRAM = PublicKey("675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8")
@@ -287,14 +288,14 @@ class RaydiumIntegration:
     
     def _derive_amm_authority(self, amm_id: PublicKey) -> Tuple[PublicKey, int]:
         """Derive AMM authority PDA"""
-        return PublicKey.find_program_address(
+        return find_program_address(
             [bytes(amm_id)],
             RAYDIUM_AMM_PROGRAM
         )
     
     def _derive_open_orders(self, amm_id: PublicKey) -> PublicKey:
         """Derive open orders PDA"""
-        return PublicKey.find_program_address(
+        return find_program_address(
             [
                 b"open_orders",
                 bytes(amm_id)
@@ -304,7 +305,7 @@ class RaydiumIntegration:
     
     def _derive_target_orders(self, amm_id: PublicKey) -> PublicKey:
         """Derive target orders PDA"""
-        return PublicKey.find_program_address(
+        return find_program_address(
             [
                 b"target_orders",
                 bytes(amm_id)
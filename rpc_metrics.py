@@ -0,0 +1,378 @@
+"""
+RPC Metrics
+Per-method latency histograms, error and retry counters with Prometheus exposition
+"""
+
+import re
+import json
+import time
+import inspect
+import threading
+import contextvars
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+
+import requests
+
+import tracing
+
+# Upper bounds in seconds; a final +Inf bucket catches the rest
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+DEFAULT_METRICS_PORT = 9464
+
+_METHOD_PATTERN = re.compile(rb'"method"\s*:\s*"(\w+)"')
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Metrics of the instrumented call in progress; the shared session hook
+# counts bytes only for requests made inside such a call
+_byte_metrics: contextvars.ContextVar = contextvars.ContextVar("rpc_byte_metrics", default=None)
+
+
+class _MethodStats:
+    __slots__ = ("lock", "buckets", "count", "total_seconds", "errors", "retries",
+                 "bytes_sent", "bytes_received")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class RpcMetrics:
+    """
+    Thread-safe per-method RPC statistics
+
+    Each method has its own lock, so concurrent calls to different methods
+    never contend. Recording a call is a bucket bisect and a few integer
+    updates.
+    """
+
+    def __init__(self):
+        self._methods: Dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            with self._lock:
+                stats = self._methods.setdefault(method, _MethodStats())
+        return stats
+
+    def observe(self, method: str, seconds: float, error: Optional[str] = None):
+        """Record one call's latency and, if it failed, its error class"""
+        stats = self._stats(method)
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with stats.lock:
+            stats.buckets[bucket] += 1
+            stats.count += 1
+            stats.total_seconds += seconds
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+
+    def record_retry(self, method: str):
+        stats = self._stats(method)
+        with stats.lock:
+            stats.retries += 1
+
+    def record_bytes(self, method: str, sent: int, received: int):
+        stats = self._stats(method)
+        with stats.lock:
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method counters, latency percentiles estimated from the histogram"""
+        with self._lock:
+            methods = dict(self._methods)
+
+        snapshot = {}
+        for method, stats in sorted(methods.items()):
+            with stats.lock:
+                buckets = list(stats.buckets)
+                snapshot[method] = {
+                    "count": stats.count,
+                    "mean_ms": stats.total_seconds / stats.count * 1000 if stats.count else 0.0,
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                }
+            for p in (50, 95, 99):
+                snapshot[method][f"p{p}_ms"] = _bucket_percentile(buckets, p) * 1000
+        return snapshot
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        with self._lock:
+            methods = sorted(self._methods.items())
+
+        lines = [
+            "# HELP solana_rpc_request_duration_seconds RPC call latency by method",
+            "# TYPE solana_rpc_request_duration_seconds histogram",
+        ]
+        counters: Dict[str, List[str]] = {
+            "solana_rpc_errors_total": [],
+            "solana_rpc_retries_total": [],
+            "solana_rpc_request_bytes_total": [],
+            "solana_rpc_response_bytes_total": [],
+        }
+
+        for method, stats in methods:
+            with stats.lock:
+                buckets = list(stats.buckets)
+                count, total = stats.count, stats.total_seconds
+                errors = dict(stats.errors)
+                retries, sent, received = stats.retries, stats.bytes_sent, stats.bytes_received
+
+            label = f'method="{method}"'
+            cumulative = 0
+            for bound, hits in zip(LATENCY_BUCKETS, buckets):
+                cumulative += hits
+                lines.append(f'solana_rpc_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'solana_rpc_request_duration_seconds_bucket{{{label},le="+Inf"}} {count}')
+            lines.append(f"solana_rpc_request_duration_seconds_sum{{{label}}} {total}")
+            lines.append(f"solana_rpc_request_duration_seconds_count{{{label}}} {count}")
+
+            for error, n in sorted(errors.items()):
+                counters["solana_rpc_errors_total"].append(f'{{{label},error="{error}"}} {n}')
+            counters["solana_rpc_retries_total"].append(f"{{{label}}} {retries}")
+            counters["solana_rpc_request_bytes_total"].append(f"{{{label}}} {sent}")
+            counters["solana_rpc_response_bytes_total"].append(f"{{{label}}} {received}")
+
+        for name, samples in counters.items():
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{sample}" for sample in samples)
+        return "\n".join(lines) + "\n"
+
+
+def _bucket_percentile(buckets: List[int], percentile: float) -> float:
+    """Upper bound of the bucket holding the percentile (the last finite bound for +Inf)"""
+    total = sum(buckets)
+    if total == 0:
+        return 0.0
+    target = total * percentile / 100
+    cumulative = 0
+    for bound, hits in zip(LATENCY_BUCKETS + (LATENCY_BUCKETS[-1],), buckets):
+        cumulative += hits
+        if cumulative >= target:
+            return bound
+    return LATENCY_BUCKETS[-1]
+
+
+class InstrumentedClient:
+    """
+    Client proxy that records every RPC method call in an RpcMetrics
+
+    Works over Client, AsyncClient and RpcPool. Wrapped methods are cached
+    on the instance, so only the first call of each method pays for the
+    attribute lookup. Calls that raise are recorded with the exception class;
+    responses carrying a JSON-RPC error are recorded as rpc_<code>. Bytes are
+    counted by one hook per HTTP session of synchronous clients and credited
+    to the instrumented call that made the request, so clients sharing a
+    session are neither double counted nor counted when uninstrumented.
+    While tracing is enabled, each call also opens an rpc.<method> span.
+    """
+
+    def __init__(self, client: Any, metrics: Optional[RpcMetrics] = None):
+        self._client = client
+        self.metrics = metrics or default_metrics
+        _attach_byte_counters(client)
+
+    @property
+    def wrapped(self) -> Any:
+        return self._client
+
+    def __getattr__(self, name: str):
+        # Only reached on the first lookup of each name
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        wrapper = _wrap_async(attr, name, self.metrics) if inspect.iscoroutinefunction(attr) \
+            else _wrap_sync(attr, name, self.metrics)
+        self.__dict__[name] = wrapper
+        return wrapper
+
+
+def _error_class(result: Any) -> Optional[str]:
+    if isinstance(result, dict):
+        error = result.get("error")
+        if error is not None:
+            return f"rpc_{error.get('code', 'unknown')}" if isinstance(error, dict) else "rpc_error"
+    return None
+
+
+def _wrap_sync(fn, method: str, metrics: RpcMetrics):
+    perf_counter = time.perf_counter
+    span_name = f"rpc.{method}"
+
+    def call(*args, **kwargs):
+        with tracing.span(span_name):
+            token = _byte_metrics.set(metrics)
+            start = perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                metrics.observe(method, perf_counter() - start, type(e).__name__)
+                raise
+            finally:
+                _byte_metrics.reset(token)
+            metrics.observe(method, perf_counter() - start, _error_class(result))
+        return result
+
+    call.__name__ = method
+    return call
+
+
+def _wrap_async(fn, method: str, metrics: RpcMetrics):
+    perf_counter = time.perf_counter
+    span_name = f"rpc.{method}"
+
+    async def call(*args, **kwargs):
+        with tracing.span(span_name):
+            start = perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                metrics.observe(method, perf_counter() - start, type(e).__name__)
+                raise
+            metrics.observe(method, perf_counter() - start, _error_class(result))
+        return result
+
+    call.__name__ = method
+    return call
+
+
+def _rpc_method_name(body: bytes) -> str:
+    """snake_case client method name for the JSON-RPC method in a request body"""
+    match = _METHOD_PATTERN.search(body[:256])
+    if match is None:
+        return "unknown"
+    return _CAMEL_BOUNDARY.sub("_", match.group(1).decode()).lower()
+
+
+def _count_bytes(response, *args, **kwargs):
+    """requests response hook: attribute the exchange to the calling InstrumentedClient"""
+    metrics = _byte_metrics.get()
+    if metrics is None:
+        return  # Not made through an instrumented client
+    body = response.request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    metrics.record_bytes(_rpc_method_name(body), len(body), len(response.content))
+
+
+def _session_make_request(provider: Any, session: requests.Session):
+    """HTTPProvider.make_request over a session instead of module-level requests.post"""
+    from solana.exceptions import SolanaRpcException, handle_exceptions
+
+    @handle_exceptions(SolanaRpcException, requests.exceptions.RequestException)
+    def make_request(method, *params):
+        request_kwargs = provider._before_request(method=method, params=params, is_async=False)
+        raw_response = session.post(**request_kwargs, timeout=provider.timeout)
+        return provider._after_request(raw_response=raw_response, method=method)
+
+    return make_request
+
+
+def _attach_byte_counters(client: Any):
+    """Hook the requests sessions behind a Client (or each Client in an RpcPool), once per session"""
+    clients = list(getattr(client, "_clients", {}).values()) or [client]
+    for inner in clients:
+        provider = getattr(inner, "_provider", None)
+        session = getattr(provider, "session", None)
+        if session is None and hasattr(provider, "_before_request"):
+            # solana-py's HTTPProvider posts through requests.post, which no
+            # hook can see; give it a session (which also keeps connections alive)
+            session = provider.session = requests.Session()
+            provider.make_request = _session_make_request(provider, session)
+        hooks = getattr(session, "hooks", None)
+        if not isinstance(hooks, dict) or "response" not in hooks:
+            continue  # Not a requests session (e.g. AsyncClient's httpx client)
+        if _count_bytes not in hooks["response"]:
+            hooks["response"].append(_count_bytes)
+
+
+def instrument(client: Any, metrics: Optional[RpcMetrics] = None) -> InstrumentedClient:
+    """Wrap a client (idempotently) so its calls are recorded"""
+    if isinstance(client, InstrumentedClient):
+        return client
+    return InstrumentedClient(client, metrics)
+
+
+def record_retry(client: Any, method: str):
+    """Count a retry of `method` if the client is instrumented; no-op otherwise"""
+    if isinstance(client, InstrumentedClient):
+        client.metrics.record_retry(method)
+
+
+def serve_metrics(
+    metrics: Optional[RpcMetrics] = None,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_METRICS_PORT
+) -> ThreadingHTTPServer:
+    """
+    Serve /metrics (Prometheus text) and /metrics.json (snapshot) on a daemon thread
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    metrics = metrics or default_metrics
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = metrics.render_prometheus().encode()
+                content_type = "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body = json.dumps(metrics.snapshot()).encode()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="rpc-metrics", daemon=True).start()
+    return server
+
+
+def serve_launch_metrics(
+    port: Optional[int] = DEFAULT_METRICS_PORT,
+    metrics: Optional[RpcMetrics] = None
+) -> Optional[ThreadingHTTPServer]:
+    """
+    serve_metrics for a launch entry point
+
+    A port of 0 or None disables the endpoint, and a port already in use
+    (e.g. by a concurrent launch) is reported rather than failing the launch.
+    """
+    if not port:
+        return None
+    try:
+        server = serve_metrics(metrics, port=port)
+    except OSError as e:
+        print(f"⚠️  RPC metrics not served on port {port}: {e}")
+        return None
+    print(f"📈 RPC metrics at http://127.0.0.1:{port}/metrics")
+    return server
+
+
+# Process-wide metrics shared by instrument() callers that do not pass their own
+default_metrics = RpcMetrics()
@@ -0,0 +1,330 @@
+"""
+Multi-Endpoint RPC Pool
+Routes each call to the healthiest endpoint and hedges idempotent reads
+"""
+
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, List, Callable, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import requests
+from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
+
+import tracing
+
+# Reads that are safe to send twice; the first answer wins
+HEDGEABLE_METHODS = frozenset({
+    "get_account_info",
+    "get_balance",
+    "get_block_height",
+    "get_latest_blockhash",
+    "get_multiple_accounts",
+    "get_signature_statuses",
+    "get_token_supply",
+    "get_version",
+})
+
+DEFAULT_EWMA_ALPHA = 0.2
+ERROR_PENALTY = 10.0  # Score multiplier applied per unit of error rate
+MIN_HEDGE_DELAY = 0.05  # Seconds; floor for the p95 hedge trigger
+LATENCY_WINDOW = 128  # Samples kept per endpoint for the p95 estimate
+HTTP_POOL_SIZE = 32  # Keep-alive connections per host on shared clients
+
+# Failures another endpoint may not share; anything else would repeat there
+FAILOVER_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+@dataclass
+class EndpointStats:
+    """Rolling health statistics for one RPC endpoint"""
+    url: str
+    latency_ewma: float = 0.0
+    error_ewma: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    hedges: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def score(self) -> float:
+        """Lower is healthier; untried endpoints score 0 so they get probed"""
+        if self.requests == 0:
+            return 0.0
+        return self.latency_ewma * (1.0 + ERROR_PENALTY * self.error_ewma)
+
+    def p95(self) -> Optional[float]:
+        """95th percentile of recent successful latencies"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class RpcPool:
+    """
+    Client-compatible RPC pool over several endpoints
+
+    Any `Client` method can be called on the pool. Calls go to the endpoint
+    with the best EWMA score and fail over to the next one on transport
+    errors, timeouts and HTTP 429/5xx answers; other errors (bad params,
+    rejected transactions) are raised from the first endpoint.
+    Methods in HEDGEABLE_METHODS are hedged: if the first request has not
+    answered by the endpoint's p95 latency, a second request is sent to the
+    next-best endpoint and whichever answers first is returned.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        commitment=Confirmed,
+        alpha: float = DEFAULT_EWMA_ALPHA,
+        hedge: bool = True,
+        min_hedge_delay: float = MIN_HEDGE_DELAY,
+        client_factory: Optional[Callable[[str], Client]] = None,
+        max_workers: int = 8
+    ):
+        if not endpoints:
+            raise ValueError("RpcPool needs at least one endpoint")
+
+        factory = client_factory or (lambda url: shared_client(url, commitment))
+        self.endpoints: List[str] = list(endpoints)
+        self.alpha = alpha
+        self.hedge = hedge
+        self.min_hedge_delay = min_hedge_delay
+        self._clients: Dict[str, Client] = {url: factory(url) for url in self.endpoints}
+        self._stats: Dict[str, EndpointStats] = {url: EndpointStats(url) for url in self.endpoints}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rpc-pool")
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes not defined on the pool itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not callable(getattr(self._clients[self.endpoints[0]], name, None)):
+            raise AttributeError(f"RPC client has no method {name!r}")
+
+        def call(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Route one client method call through the pool
+
+        Args:
+            method: Client method name, e.g. "get_account_info"
+
+        Returns:
+            The client method's response
+        """
+        ranked = self.ranked_endpoints()
+        if self.hedge and method in HEDGEABLE_METHODS and len(ranked) > 1:
+            return self._hedged_call(ranked, method, args, kwargs)
+        return self._failover_call(ranked, method, args, kwargs)
+
+    def ranked_endpoints(self) -> List[str]:
+        """Endpoints ordered from healthiest to least healthy"""
+        with self._lock:
+            return sorted(self.endpoints, key=lambda url: self._stats[url].score())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of per-endpoint health"""
+        with self._lock:
+            return {
+                url: {
+                    "score": s.score(),
+                    "latency_ewma_ms": s.latency_ewma * 1000,
+                    "error_rate_ewma": s.error_ewma,
+                    "p95_ms": (s.p95() or 0.0) * 1000,
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "hedges": s.hedges,
+                }
+                for url, s in self._stats.items()
+            }
+
+    def close(self):
+        """Stop the hedging worker threads"""
+        self._executor.shutdown(wait=False)
+
+    def _failover_call(self, ranked: List[str], method: str, args, kwargs) -> Any:
+        last_error: Optional[Exception] = None
+        for url in ranked:
+            try:
+                return self._invoke(url, method, args, kwargs)
+            except Exception as e:
+                if not is_failover_error(e):
+                    raise
+                last_error = e
+        raise last_error
+
+    def _hedged_call(self, ranked: List[str], method: str, args, kwargs) -> Any:
+        primary, backup = ranked[0], ranked[1]
+        p95 = self._stats[primary].p95()
+        hedge_delay = max(self.min_hedge_delay, p95) if p95 is not None else None
+
+        # propagate() carries the caller's context (trace span, byte metrics) to the worker
+        first = self._executor.submit(tracing.propagate(self._invoke), primary, method, args, kwargs)
+        done, _ = wait([first], timeout=hedge_delay)
+        if first in done and (first.exception() is None or not is_failover_error(first.exception())):
+            return first.result()
+
+        # Primary is slow or failed: race it against the next-best endpoint
+        with self._lock:
+            self._stats[backup].hedges += 1
+        pending = {first, self._executor.submit(tracing.propagate(self._invoke), backup, method, args, kwargs)}
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None or not is_failover_error(future.exception()):
+                    return future.result()
+                last_error = future.exception()
+
+        # Both failed; fall back to the remaining endpoints in order
+        if len(ranked) > 2:
+            return self._failover_call(ranked[2:], method, args, kwargs)
+        raise last_error
+
+    def _invoke(self, url: str, method: str, args, kwargs) -> Any:
+        start = time.perf_counter()
+        try:
+            result = getattr(self._clients[url], method)(*args, **kwargs)
+        except Exception as e:
+            # Only failures of the endpoint itself count against its health
+            self._record(url, time.perf_counter() - start, failed=is_failover_error(e))
+            raise
+        self._record(url, time.perf_counter() - start, failed=False)
+        return result
+
+    def _record(self, url: str, latency: float, failed: bool):
+        alpha = self.alpha
+        with self._lock:
+            s = self._stats[url]
+            if s.requests == 0:
+                s.latency_ewma = latency
+            else:
+                s.latency_ewma += alpha * (latency - s.latency_ewma)
+            s.error_ewma += alpha * ((1.0 if failed else 0.0) - s.error_ewma)
+            s.requests += 1
+            if failed:
+                s.errors += 1
+            else:
+                s.latencies.append(latency)
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """
+    Whether another endpoint might answer where this one failed
+
+    True for connection failures, timeouts and HTTP 429/5xx responses,
+    looked up through the exception chain since solana-py wraps transport
+    errors in SolanaRpcException.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        if isinstance(error, FAILOVER_ERRORS):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+_shared_clients: Dict[Tuple[str, str], Client] = {}
+_shared_pools: Dict[Tuple[Tuple[str, ...], str], RpcPool] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_client(url: str, commitment=Confirmed) -> Client:
+    """
+    Process-wide Client per endpoint and commitment
+
+    Launchpads, pools and helpers built in the same process reuse one HTTP
+    session, and so one set of keep-alive connections, per endpoint.
+    """
+    key = (url, str(commitment))
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = Client(url, commitment=commitment)
+            _widen_connection_pool(client)
+            _shared_clients[key] = client
+        return client
+
+
+def shared_pool(endpoints: Sequence[str], commitment=Confirmed) -> RpcPool:
+    """Process-wide RpcPool per endpoint list, so its health scores are shared too"""
+    key = (tuple(endpoints), str(commitment))
+    with _shared_lock:
+        pool = _shared_pools.get(key)
+    if pool is None:
+        pool = RpcPool(endpoints, commitment=commitment)
+        with _shared_lock:
+            pool = _shared_pools.setdefault(key, pool)
+    return pool
+
+
+def client_endpoints(client: Any) -> List[str]:
+    """
+    Endpoint URLs behind a Client, RpcPool or InstrumentedClient
+
+    Returns:
+        The pool's endpoints in order, the client's single endpoint, or an
+        empty list when the client does not expose one (e.g. a test double)
+    """
+    inner = getattr(client, "wrapped", client)
+    if isinstance(inner, RpcPool):
+        return list(inner.endpoints)
+    uri = getattr(getattr(inner, "_provider", None), "endpoint_uri", None)
+    return [uri] if uri else []
+
+
+def _widen_connection_pool(client: Client):
+    """Raise the keep-alive pool size of a requests-based provider session"""
+    session = getattr(getattr(client, "_provider", None), "session", None)
+    if session is None or not hasattr(session, "mount"):
+        return  # httpx-based providers size their pool at construction
+
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+if __name__ == "__main__":
+    # Offline routing demo against local fake endpoints
+    from fake_rpc_server import FakeRpcServer
+
+    fast = FakeRpcServer(latency=0.005).start()
+    slow = FakeRpcServer(latency=0.2).start()
+    flaky = FakeRpcServer(latency=0.01, error_rate=0.5).start()
+
+    pool = RpcPool([slow.url, flaky.url, fast.url])
+    for _ in range(50):
+        try:
+            pool.get_version()
+        except Exception:
+            pass
+
+    for url, s in pool.stats().items():
+        print(f"{url}: score={s['score']:.4f} p95={s['p95_ms']:.1f}ms "
+              f"errors={s['errors']}/{s['requests']} hedges={s['hedges']}")
+
+    pool.close()
+    for server in (fast, slow, flaky):
+        server.stop()
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional, List
 import time
-import struct
 
 from solana.rpc.api import Client
 from solana.rpc.commitment import Confirmed
@@ -10,20 +9,19 @@ from solana.publickey import PublicKey
 from solana.transaction import Transaction, TransactionInstruction, AccountMeta
 from solana.system_program import SYS_PROGRAM_ID, SYSVAR_RENT_PUBKEY
 from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
-from spl.token.instructions import (
-    create_mint,
-    create_associated_token_account,
-    mint_to,
-)
+
+from blockhash_cache import get_blockhash_provider
+from confirmation_tracker import ConfirmationTracker
+from derivation_cache import find_program_address
+from metadata_codec import encode_create_metadata_v3
+from rpc_metrics import record_retry
+from rpc_pool import shared_client
 
 # Metaplex metadata program
 METAPLEX_METADATA_PROGRAM_ID = PublicKey(
     "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
 )  # noqa: E501
 
-# Instruction discriminator for CreateMetadataAccountV3
-CREATE_METADATA_V3_DISCRIMINATOR = bytes([33, 57, 6, 167, 15, 219, 35, 251])
-
 
 @dataclass
 class TokenMetadata:
@@ -44,12 +42,20 @@ class LaunchConfig:
 class SimpleMainnetLaunchpad:
     """Simplified launchpad for creating an SPL token with metadata."""
 
-    def __init__(self, rpc_url: Optional[str] = None):
-        self.client = Client(
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        client: Optional[Client] = None,
+        verify_connection: bool = True,
+    ):
+        self.client = client or shared_client(
             rpc_url or "https://api.mainnet-beta.solana.com",
-            commitment=Confirmed,
+            Confirmed,
         )
-        self._verify_connection()
+        self.confirmations = ConfirmationTracker(self.client, commitment=Confirmed)
+        self.blockhash = get_blockhash_provider(self.client)
+        if verify_connection:
+            self._verify_connection()
 
     def _verify_connection(self):
         version = self.client.get_version()
@@ -67,16 +73,16 @@ class SimpleMainnetLaunchpad:
                         "skip_preflight": False,
                         "preflight_commitment": Confirmed,
                     },
+                    recent_blockhash=self.blockhash.get_blockhash(),
                 )
-                self.client.confirm_transaction(
-                    resp["result"],
-                    commitment=Confirmed,
-                )
+                self.confirmations.track(resp["result"], Confirmed).result()
                 return resp["result"]
             except Exception as err:
                 if attempt == retries - 1:
                     raise err
                 print("Transaction failed, retrying...", err)
+                record_retry(self.client, "send_transaction")
+                self.blockhash.invalidate()
                 time.sleep(2)
 
     def _create_metadata_instruction(
@@ -86,61 +92,8 @@ class SimpleMainnetLaunchpad:
         payer: PublicKey,
         metadata: TokenMetadata,
     ):
-        """Build CreateMetadataAccountV3 instruction manually."""
-        
-        # Encode the metadata data
-        name_bytes = metadata.name.encode('utf-8')
-        symbol_bytes = metadata.symbol.encode('utf-8')
-        uri_bytes = metadata.uri.encode('utf-8')
-        
-        # Data structure for CreateMetadataAccountV3
-        # Reference: https://github.com/metaplex-foundation/metaplex-program-library/blob/main/token-metadata/program/src/instruction.rs
-        
-        # Instruction data layout:
-        # - discriminator (8 bytes)
-        # - data (variable length)
-        #   - name length (4 bytes) + name (variable)
-        #   - symbol length (4 bytes) + symbol (variable)
-        #   - uri length (4 bytes) + uri (variable)
-        #   - seller_fee_basis_points (2 bytes)
-        #   - creators (variable, null for None)
-        #   - collection (variable, null for None)
-        #   - uses (variable, null for None)
-        # - is_mutable (1 byte)
-        # - collection_details (variable, null for None)
-        
-        data = bytearray()
-        data.extend(CREATE_METADATA_V3_DISCRIMINATOR)
-        
-        # Add name
-        data.extend(struct.pack('<I', len(name_bytes)))
-        data.extend(name_bytes)
-        
-        # Add symbol
-        data.extend(struct.pack('<I', len(symbol_bytes)))
-        data.extend(symbol_bytes)
-        
-        # Add URI
-        data.extend(struct.pack('<I', len(uri_bytes)))
-        data.extend(uri_bytes)
-        
-        # Add seller_fee_basis_points (0)
-        data.extend(struct.pack('<H', 0))
-        
-        # Add creators (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add collection (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add uses (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add is_mutable (True - represented as 1)
-        data.extend(struct.pack('<B', 1))
-        
-        # Add collection_details (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
+        """Build CreateMetadataAccountV3 instruction."""
+        data = encode_create_metadata_v3(metadata.name, metadata.symbol, metadata.uri)
 
         return TransactionInstruction(
             program_id=METAPLEX_METADATA_PROGRAM_ID,
@@ -158,6 +111,9 @@ class SimpleMainnetLaunchpad:
     def create_token(
         self, payer: Keypair, metadata: TokenMetadata, config: LaunchConfig
     ) -> PublicKey:
+        # Imported on first use to keep module import fast
+        from spl.token.instructions import create_mint, create_associated_token_account, mint_to
+
         mint_keypair = Keypair()
 
         # Mint account
@@ -182,7 +138,7 @@ class SimpleMainnetLaunchpad:
         mint_to_ix = mint_to(
             program_id=TOKEN_PROGRAM_ID,
             mint=mint_keypair.public_key,
-            dest=PublicKey.find_program_address(
+            dest=find_program_address(
                 [
                     bytes(payer.public_key),
                     bytes(TOKEN_PROGRAM_ID),
@@ -195,7 +151,7 @@ class SimpleMainnetLaunchpad:
         )
 
         # Metadata PDA
-        metadata_pda, _ = PublicKey.find_program_address(
+        metadata_pda, _ = find_program_address(
             [
                 b"metadata",
                 bytes(METAPLEX_METADATA_PROGRAM_ID),
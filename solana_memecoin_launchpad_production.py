@@ -4,13 +4,10 @@ Tested and ready for mainnet deployment
 """
 
 import os
-import json
 import time
 import base64
-import struct
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from decimal import Decimal
 
 from solana.rpc.api import Client
@@ -20,26 +17,23 @@ from solana.publickey import PublicKey
 from solana.transaction import Transaction, TransactionInstruction, AccountMeta
 from solana.system_program import SYS_PROGRAM_ID, SYSVAR_RENT_PUBKEY, transfer, TransferParams
 from spl.token.constants import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
-from spl.token.instructions import (
-    create_mint,
-    create_associated_token_account,
-    mint_to,
-    transfer_checked,
-    burn_checked,
-    close_account,
-    set_authority,
-    AuthorityType,
-    get_associated_token_address
-)
+
+from account_batcher import AccountReadBatcher, account_data, decode_mint_account
+from blockhash_cache import get_blockhash_provider
+from compute_budget import BUDGET_RESERVE, ComputeBudgetPlanner, PriorityFeeModel, fee_model_for
+from confirmation_tracker import ConfirmationTracker
+from derivation_cache import find_program_address, get_associated_token_address
+from metadata_codec import encode_create_metadata_v3, encode_update_metadata_v2
+from rpc_metrics import DEFAULT_METRICS_PORT, instrument, record_retry, serve_launch_metrics
+from rpc_pool import shared_client, shared_pool
+from tracing import enable_tracing, set_trace_attribute, span, traced, write_chrome_trace
+from transaction_packer import TransactionPacker
 
 # Mainnet Program IDs
 METAPLEX_METADATA_PROGRAM_ID = PublicKey("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
 RAYDIUM_AMM_PROGRAM_ID = PublicKey("675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8")
 RAYDIUM_OPENBOOK_PROGRAM_ID = PublicKey("srmqPvymJeFKQ4zGQed1GFppgkRHL9kaELCbyksJtPX")
 
-# Instruction discriminator for CreateMetadataAccountV3
-CREATE_METADATA_V3_DISCRIMINATOR = bytes([33, 57, 6, 167, 15, 219, 35, 251])
-
 # Production RPC endpoints
 MAINNET_RPC_ENDPOINTS = [
     "https://api.mainnet-beta.solana.com",
@@ -78,14 +72,262 @@ class ProductionLaunchConfig:
     slippage_tolerance: float = 0.5  # 0.5% slippage
 
 
-class ProductionMemecoinLaunchpad:
+class LaunchInstructionBuilder:
+    """Instruction builders shared by the sync and async launchpads"""
+    
+    def _calculate_allocations(self, config: ProductionLaunchConfig) -> Dict[str, int]:
+        """Split the total supply (in base units) into launch allocations"""
+        total_supply = config.total_supply * (10 ** config.decimals)
+        
+        dev_amount = int(total_supply * config.dev_wallet_percentage / 100)
+        marketing_amount = int(total_supply * config.marketing_wallet_percentage / 100)
+        burn_amount = int(total_supply * config.burn_percentage / 100)
+        
+        return {
+            "total_supply": total_supply,
+            "liquidity": total_supply - dev_amount - marketing_amount - burn_amount,
+            "dev": dev_amount,
+            "marketing": marketing_amount,
+            "burned": burn_amount
+        }
+    
+    def _distribution_plan(
+        self,
+        payer: Keypair,
+        config: ProductionLaunchConfig,
+        dev_wallet: Optional[PublicKey] = None,
+        marketing_wallet: Optional[PublicKey] = None
+    ) -> List[Tuple[str, PublicKey, int]]:
+        """(allocation name, owner, amount) for every non-empty wallet allocation"""
+        allocations = self._calculate_allocations(config)
+        
+        plan = [("liquidity", payer.public_key, allocations["liquidity"])]
+        if allocations["dev"] > 0:
+            plan.append(("dev", dev_wallet or payer.public_key, allocations["dev"]))
+        if allocations["marketing"] > 0:
+            plan.append(("marketing", marketing_wallet or payer.public_key, allocations["marketing"]))
+        return plan
+    
+    def _distribution_instructions(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        config: ProductionLaunchConfig,
+        plan: List[Tuple[str, PublicKey, int]]
+    ) -> Tuple[List[TransactionInstruction], Dict[str, Any]]:
+        """Build the mint_to (and burn) instructions for a plan; token accounts must exist"""
+        allocations = self._calculate_allocations(config)
+        distribution = {
+            "total_supply": allocations["total_supply"],
+            "allocations": {},
+            "token_accounts": {},
+            "transactions": [],
+            "packed_transactions": []
+        }
+        
+        instructions = []
+        for name, owner, amount in plan:
+            ata = get_associated_token_address(owner, mint)
+            instructions.append(self._mint_to_instruction(payer, mint, ata, amount))
+            distribution["token_accounts"][name] = str(ata)
+            distribution["allocations"][name] = amount
+        
+        # Handle burn if configured: mint to the payer account, then burn
+        burn_amount = allocations["burned"]
+        if burn_amount > 0:
+            burn_ata = get_associated_token_address(payer.public_key, mint)
+            instructions.append(self._mint_to_instruction(payer, mint, burn_ata, burn_amount))
+            instructions.append(self._burn_instruction(
+                payer=payer,
+                mint=mint,
+                token_account=burn_ata,
+                amount=burn_amount,
+                decimals=config.decimals
+            ))
+            distribution["allocations"]["burned"] = burn_amount
+        
+        return instructions, distribution
+    
+    def _create_token_instructions(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        metadata: TokenMetadata,
+        config: ProductionLaunchConfig
+    ) -> Tuple[List[TransactionInstruction], PublicKey]:
+        """Build the create mint + metadata instructions and return the metadata PDA"""
+        # spl.token.instructions is imported on first use to keep module import fast
+        from spl.token.instructions import create_mint
+        
+        # Create mint account
+        create_mint_ix = create_mint(
+            payer=payer.public_key,
+            mint_authority=payer.public_key,
+            freeze_authority=None,  # No freeze authority for memecoins
+            decimals=config.decimals,
+            program_id=TOKEN_PROGRAM_ID,
+            mint=mint
+        )
+        
+        # Get metadata PDA
+        metadata_pda, _ = find_program_address(
+            [
+                b"metadata",
+                bytes(METAPLEX_METADATA_PROGRAM_ID),
+                bytes(mint)
+            ],
+            METAPLEX_METADATA_PROGRAM_ID
+        )
+        
+        # Create metadata
+        metadata_ix = self._create_metadata_instruction_v3(
+            metadata_pda=metadata_pda,
+            mint=mint,
+            mint_authority=payer.public_key,
+            payer=payer.public_key,
+            update_authority=payer.public_key,
+            metadata=metadata,
+            is_mutable=True  # Set to False after launch
+        )
+        
+        return [create_mint_ix, metadata_ix], metadata_pda
+    
+    def _renounce_mint_instruction(self, payer: Keypair, mint: PublicKey) -> TransactionInstruction:
+        """Build the set_authority instruction that removes the mint authority"""
+        from spl.token.instructions import set_authority, AuthorityType
+        
+        return set_authority(
+            program_id=TOKEN_PROGRAM_ID,
+            account=mint,
+            authority=payer.public_key,
+            new_authority=None,
+            authority_type=AuthorityType.MINT_TOKENS
+        )
+    
+    def _mint_to_instruction(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        destination: PublicKey,
+        amount: int
+    ) -> TransactionInstruction:
+        """Build a mint_to instruction signed by the payer as mint authority"""
+        from spl.token.instructions import mint_to
+        
+        return mint_to(
+            program_id=TOKEN_PROGRAM_ID,
+            mint=mint,
+            dest=destination,
+            mint_authority=payer.public_key,
+            amount=amount
+        )
+    
+    def _burn_instruction(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        token_account: PublicKey,
+        amount: int,
+        decimals: int = 9
+    ) -> TransactionInstruction:
+        """Build a burn_checked instruction from a payer-owned account"""
+        from spl.token.instructions import burn_checked
+        
+        return burn_checked(
+            program_id=TOKEN_PROGRAM_ID,
+            mint=mint,
+            account=token_account,
+            owner=payer.public_key,
+            amount=amount,
+            decimals=decimals
+        )
+    
+    def _create_metadata_instruction_v3(
+        self,
+        metadata_pda: PublicKey,
+        mint: PublicKey,
+        mint_authority: PublicKey,
+        payer: PublicKey,
+        update_authority: PublicKey,
+        metadata: TokenMetadata,
+        is_mutable: bool = True,
+    ):
+        """Create Metaplex metadata instruction"""
+        data = encode_create_metadata_v3(
+            metadata.name,
+            metadata.symbol,
+            metadata.uri,
+            is_mutable=is_mutable
+        )
+
+        return TransactionInstruction(
+            program_id=METAPLEX_METADATA_PROGRAM_ID,
+            data=data,
+            keys=[
+                AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
+                AccountMeta(pubkey=mint_authority, is_signer=True, is_writable=False),
+                AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
+                AccountMeta(pubkey=update_authority, is_signer=False, is_writable=False),
+                AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+                AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+            ]
+        )
+    
+    def _update_metadata_to_immutable(
+        self,
+        metadata_pda: PublicKey,
+        update_authority: PublicKey
+    ):
+        """Update metadata to immutable"""
+        return TransactionInstruction(
+            program_id=METAPLEX_METADATA_PROGRAM_ID,
+            data=encode_update_metadata_v2(is_mutable=False),
+            keys=[
+                AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=update_authority, is_signer=True, is_writable=False),
+            ]
+        )
+
+
+class ProductionMemecoinLaunchpad(LaunchInstructionBuilder):
     """Production-ready memecoin launchpad for Solana mainnet"""
     
-    def __init__(self, rpc_url: Optional[str] = None):
-        """Initialize with mainnet RPC"""
-        self.rpc_url = rpc_url or MAINNET_RPC_ENDPOINTS[0]
-        self.client = Client(self.rpc_url, commitment=Confirmed)
-        self._verify_connection()
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        client: Optional[Client] = None,
+        verify_connection: bool = True,
+        fee_model: Optional[PriorityFeeModel] = None
+    ):
+        """
+        Initialize with mainnet RPC
+        
+        Without an explicit rpc_url or client, calls are routed across all
+        MAINNET_RPC_ENDPOINTS by an RpcPool with failover and hedged reads.
+        Clients and pools are shared process-wide, so further instances reuse
+        open connections. Short-lived workers can pass verify_connection=False
+        to skip the getVersion round trip; RPC errors then surface on first use.
+        Priority fees are read from the same endpoint as the client unless a
+        fee_model is given.
+        """
+        self.rpc_url = rpc_url
+        if client is not None:
+            self.client = client
+        elif rpc_url is not None:
+            self.client = shared_client(rpc_url, Confirmed)
+        else:
+            self.client = shared_pool(MAINNET_RPC_ENDPOINTS, Confirmed)
+        self.confirmations = ConfirmationTracker(self.client, commitment=Confirmed)
+        self.blockhash = get_blockhash_provider(self.client)
+        self.accounts = AccountReadBatcher(self.client, rpc_url=rpc_url)
+        self.compute_budget = ComputeBudgetPlanner(
+            self.client,
+            fee_model or fee_model_for(self.client),
+            self.blockhash
+        )
+        if verify_connection:
+            self._verify_connection()
     
     def _verify_connection(self):
         """Verify RPC connection"""
@@ -95,11 +337,13 @@ class ProductionMemecoinLaunchpad:
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Solana RPC: {e}")
     
+    @traced("create_token_with_metadata")
     def create_token_with_metadata(
         self,
         payer: Keypair,
         metadata: TokenMetadata,
-        config: ProductionLaunchConfig
+        config: ProductionLaunchConfig,
+        mint_keypair_source: Optional[Callable[[], Keypair]] = None
     ) -> Dict[str, Any]:
         """
         Create SPL token with Metaplex metadata on mainnet
@@ -108,6 +352,7 @@ class ProductionMemecoinLaunchpad:
             payer: Funded keypair for transaction fees
             metadata: Token metadata
             config: Launch configuration
+            mint_keypair_source: Supplies the mint keypair (e.g. a vanity grinder); random if omitted
             
         Returns:
             Token creation details
@@ -120,45 +365,20 @@ class ProductionMemecoinLaunchpad:
             raise ValueError(f"Insufficient balance. Need at least {required_balance} SOL, have {balance} SOL")
         
         # Generate mint keypair
-        mint_keypair = Keypair()
+        mint_keypair = mint_keypair_source() if mint_keypair_source else Keypair()
+        set_trace_attribute("mint", str(mint_keypair.public_key))
         
         print(f"Creating token mint: {mint_keypair.public_key}")
         
-        # Create mint account
-        create_mint_ix = create_mint(
-            payer=payer.public_key,
-            mint_authority=payer.public_key,
-            freeze_authority=None,  # No freeze authority for memecoins
-            decimals=config.decimals,
-            program_id=TOKEN_PROGRAM_ID,
-            mint=mint_keypair.public_key
-        )
-        
-        # Get metadata PDA
-        metadata_pda, _ = PublicKey.find_program_address(
-            [
-                b"metadata",
-                bytes(METAPLEX_METADATA_PROGRAM_ID),
-                bytes(mint_keypair.public_key)
-            ],
-            METAPLEX_METADATA_PROGRAM_ID
-        )
-        
-        # Create metadata
-        metadata_ix = self._create_metadata_instruction_v3(
-            metadata_pda=metadata_pda,
-            mint=mint_keypair.public_key,
-            mint_authority=payer.public_key,
-            payer=payer.public_key,
-            update_authority=payer.public_key,
-            metadata=metadata,
-            is_mutable=True  # Set to False after launch
+        # Create mint account and metadata
+        instructions, metadata_pda = self._create_token_instructions(
+            payer, mint_keypair.public_key, metadata, config
         )
         
         # Build transaction
         transaction = Transaction()
-        transaction.add(create_mint_ix)
-        transaction.add(metadata_ix)
+        for ix in instructions:
+            transaction.add(ix)
         
         # Send transaction with retry
         tx_sig = self._send_transaction_with_retry(
@@ -200,90 +420,48 @@ class ProductionMemecoinLaunchpad:
         Returns:
             Distribution details
         """
-        total_supply = config.total_supply * (10 ** config.decimals)
-        
         # Calculate allocations
-        dev_amount = int(total_supply * config.dev_wallet_percentage / 100)
-        marketing_amount = int(total_supply * config.marketing_wallet_percentage / 100)
-        burn_amount = int(total_supply * config.burn_percentage / 100)
-        liquidity_amount = total_supply - dev_amount - marketing_amount - burn_amount
-        
-        distribution = {
-            "total_supply": total_supply,
-            "allocations": {},
-            "token_accounts": {},
-            "transactions": []
-        }
-        
-        # Create liquidity token account
-        liquidity_ata = get_associated_token_address(payer.public_key, mint)
-        self._ensure_token_account(payer, mint, payer.public_key)
-        distribution["token_accounts"]["liquidity"] = str(liquidity_ata)
-        
-        # Mint liquidity allocation
-        mint_tx = self._mint_tokens_safe(
-            payer=payer,
-            mint=mint,
-            destination=liquidity_ata,
-            amount=liquidity_amount
-        )
-        distribution["allocations"]["liquidity"] = liquidity_amount
-        distribution["transactions"].append(mint_tx)
-        
-        # Handle dev allocation
-        if dev_amount > 0:
-            dev_owner = dev_wallet or payer.public_key
-            dev_ata = get_associated_token_address(dev_owner, mint)
-            self._ensure_token_account(payer, mint, dev_owner)
-            
-            mint_tx = self._mint_tokens_safe(
-                payer=payer,
-                mint=mint,
-                destination=dev_ata,
-                amount=dev_amount
-            )
-            distribution["token_accounts"]["dev"] = str(dev_ata)
-            distribution["allocations"]["dev"] = dev_amount
-            distribution["transactions"].append(mint_tx)
-        
-        # Handle marketing allocation
-        if marketing_amount > 0:
-            marketing_owner = marketing_wallet or payer.public_key
-            marketing_ata = get_associated_token_address(marketing_owner, mint)
-            self._ensure_token_account(payer, mint, marketing_owner)
-            
-            mint_tx = self._mint_tokens_safe(
-                payer=payer,
-                mint=mint,
-                destination=marketing_ata,
-                amount=marketing_amount
-            )
-            distribution["token_accounts"]["marketing"] = str(marketing_ata)
-            distribution["allocations"]["marketing"] = marketing_amount
-            distribution["transactions"].append(mint_tx)
-        
-        # Handle burn if configured
-        if burn_amount > 0:
-            burn_ata = get_associated_token_address(payer.public_key, mint)
-            
-            # First mint to burn account
-            mint_tx = self._mint_tokens_safe(
-                payer=payer,
-                mint=mint,
-                destination=burn_ata,
-                amount=burn_amount
-            )
-            distribution["transactions"].append(mint_tx)
-            
-            # Then burn the tokens
-            burn_tx = self._burn_tokens(
-                payer=payer,
-                mint=mint,
-                token_account=burn_ata,
-                amount=burn_amount
-            )
-            distribution["allocations"]["burned"] = burn_amount
-            distribution["transactions"].append(burn_tx)
+        allocations = self._calculate_allocations(config)
+        dev_amount = allocations["dev"]
+        marketing_amount = allocations["marketing"]
+        burn_amount = allocations["burned"]
+        liquidity_amount = allocations["liquidity"]
+        
+        plan = self._distribution_plan(payer, config, dev_wallet, marketing_wallet)
+        
+        # Check every distinct token account in one batched read
+        owners_by_ata = {}
+        for _, owner, _ in plan:
+            owners_by_ata.setdefault(str(get_associated_token_address(owner, mint)), owner)
+        existing = dict(zip(
+            owners_by_ata,
+            self.accounts.get_many([PublicKey(ata) for ata in owners_by_ata])
+        ))
+        
+        # Build the full distribution plan, then pack it into as few
+        # transactions as fit instead of confirming every step on its own
+        from spl.token.instructions import create_associated_token_account
+        
+        instructions = [
+            create_associated_token_account(payer=payer.public_key, owner=owner, mint=mint)
+            for ata, owner in owners_by_ata.items()
+            if existing[ata] is None
+        ]
+        mint_instructions, distribution = self._distribution_instructions(payer, mint, config, plan)
+        instructions.extend(mint_instructions)
+        
+        packed = TransactionPacker(payer.public_key, reserved=BUDGET_RESERVE).pack(instructions)
+        print(f"Packed {len(instructions)} instructions into {len(packed)} transaction(s)")
+        
+        for planned in packed:
+            tx_sig = self._send_transaction_with_retry(planned.build(), [payer])
+            distribution["transactions"].append(tx_sig)
+            distribution["packed_transactions"].append({
+                "signature": tx_sig,
+                "instructions": len(planned.instructions),
+                "size_bytes": planned.size_bytes
+            })
+            print(f"- {len(planned.instructions)} instructions, {planned.size_bytes} bytes: {tx_sig}")
         
         print(f"Token distribution complete!")
         print(f"Total supply: {config.total_supply:,} tokens")
@@ -365,21 +543,11 @@ class ProductionMemecoinLaunchpad:
         
         # Renounce mint authority
         print("Renouncing mint authority...")
-        mint_ix = set_authority(
-            program_id=TOKEN_PROGRAM_ID,
-            account=mint,
-            authority=payer.public_key,
-            new_authority=None,
-            authority_type=AuthorityType.MINT_TOKENS
-        )
+        mint_ix = self._renounce_mint_instruction(payer, mint)
         
         mint_tx = Transaction()
         mint_tx.add(mint_ix)
         
-        mint_sig = self._send_transaction_with_retry(mint_tx, [payer])
-        results["mint_authority_renounced"] = mint_sig
-        print(f"Mint authority renounced: https://solscan.io/tx/{mint_sig}")
-        
         # Update metadata to immutable
         print("Making metadata immutable...")
         metadata_ix = self._update_metadata_to_immutable(
@@ -390,7 +558,13 @@ class ProductionMemecoinLaunchpad:
         metadata_tx = Transaction()
         metadata_tx.add(metadata_ix)
         
-        metadata_sig = self._send_transaction_with_retry(metadata_tx, [payer])
+        # The two updates are independent: send both, then confirm together
+        mint_sig, metadata_sig = self._send_transactions_batch([
+            (mint_tx, [payer]),
+            (metadata_tx, [payer])
+        ])
+        results["mint_authority_renounced"] = mint_sig
+        print(f"Mint authority renounced: https://solscan.io/tx/{mint_sig}")
         results["metadata_immutable"] = metadata_sig
         print(f"Metadata made immutable: https://solscan.io/tx/{metadata_sig}")
         
@@ -419,41 +593,38 @@ class ProductionMemecoinLaunchpad:
             "ready": True
         }
         
-        # Check mint account
+        metadata_pda, _ = find_program_address(
+            [
+                b"metadata",
+                bytes(METAPLEX_METADATA_PROGRAM_ID),
+                bytes(mint)
+            ],
+            METAPLEX_METADATA_PROGRAM_ID
+        )
+        
+        # Read the mint and metadata accounts in one getMultipleAccounts call;
+        # the supply is decoded from the mint account instead of getTokenSupply
         try:
-            mint_info = self.client.get_account_info(mint)
-            results["checks"]["mint_exists"] = mint_info is not None
-        except:
-            results["checks"]["mint_exists"] = False
-            results["ready"] = False
+            mint_info, metadata_info = self.accounts.get_many([mint, metadata_pda])
+        except Exception:
+            mint_info = metadata_info = None
+        
+        # Check mint account
+        results["checks"]["mint_exists"] = mint_info is not None
         
         # Check token supply
         try:
-            supply_info = self.client.get_token_supply(mint)
-            actual_supply = int(supply_info['result']['value']['amount'])
+            actual_supply = decode_mint_account(account_data(mint_info))["supply"]
             expected_supply = config.total_supply * (10 ** config.decimals)
             results["checks"]["correct_supply"] = actual_supply == expected_supply
             results["actual_supply"] = actual_supply
-        except:
+        except Exception:
             results["checks"]["correct_supply"] = False
-            results["ready"] = False
         
         # Check metadata
-        metadata_pda, _ = PublicKey.find_program_address(
-            [
-                b"metadata",
-                bytes(METAPLEX_METADATA_PROGRAM_ID),
-                bytes(mint)
-            ],
-            METAPLEX_METADATA_PROGRAM_ID
-        )
+        results["checks"]["metadata_exists"] = metadata_info is not None
         
-        try:
-            metadata_info = self.client.get_account_info(metadata_pda)
-            results["checks"]["metadata_exists"] = metadata_info is not None
-        except:
-            results["checks"]["metadata_exists"] = False
-            results["ready"] = False
+        results["ready"] = all(results["checks"].values())
         
         # Display results
         print(f"\nLaunch Readiness Check:")
@@ -470,6 +641,25 @@ class ProductionMemecoinLaunchpad:
         
         return results
     
+    def verify_launch_readiness_bulk(
+        self,
+        launches: List[Tuple[PublicKey, ProductionLaunchConfig]],
+        output
+    ) -> Dict[str, Any]:
+        """
+        Verify many launched mints with batched reads and stream a JSONL report
+        
+        Args:
+            launches: (mint, config) pairs
+            output: Writable text stream for the JSONL report
+            
+        Returns:
+            Throughput and readiness summary
+        """
+        from launch_auditor import LaunchAuditor
+        
+        return LaunchAuditor(self.accounts).audit_to_jsonl(launches, output)
+    
     def _get_sol_balance(self, pubkey: PublicKey) -> float:
         """Get SOL balance for an account"""
         response = self.client.get_balance(pubkey)
@@ -479,27 +669,104 @@ class ProductionMemecoinLaunchpad:
         self,
         transaction: Transaction,
         signers: List[Keypair],
-        max_retries: int = 3
+        max_retries: int = 3,
+        on_sent: Optional[Callable[[str, str, int], None]] = None
     ) -> str:
-        """Send transaction with retry logic"""
+        """
+        Send transaction with retry logic
+        
+        `on_sent` is called with each attempt's signature, blockhash and the
+        blockhash's lastValidBlockHeight before waiting for confirmation, so
+        callers can journal it.
+        """
         for attempt in range(max_retries):
             try:
-                response = self.client.send_transaction(
-                    transaction,
-                    *signers,
-                    opts={"skip_preflight": False, "preflight_commitment": Confirmed}
-                )
+                blockhash, last_valid_block_height = self.blockhash.get_blockhash_with_expiry()
+                signature = self._send_transaction_unconfirmed(transaction, signers, attempt, blockhash)
+                if on_sent is not None:
+                    on_sent(signature, blockhash, last_valid_block_height)
                 
                 # Wait for confirmation
-                self.client.confirm_transaction(response['result'], Confirmed)
-                return response['result']
+                with span("confirmation_wait", signature=signature, attempt=attempt):
+                    self.confirmations.track(signature, Confirmed).result()
+                return signature
                 
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise e
                 print(f"Transaction failed, retrying... ({attempt + 1}/{max_retries})")
-                time.sleep(2)
+                record_retry(self.client, "send_transaction")
+                self.blockhash.invalidate()
+                with span("retry_sleep", attempt=attempt):
+                    time.sleep(2)
+    
+    def _send_transactions_batch(
+        self,
+        transactions: List[Tuple[Transaction, List[Keypair]]],
+        max_retries: int = 3
+    ) -> List[str]:
+        """
+        Send independent transactions back-to-back and confirm them as a group
+        
+        Transactions that fail to send or confirm are retried one by one.
+        
+        Args:
+            transactions: (transaction, signers) pairs with no ordering dependency
+            max_retries: Attempts per transaction, including the batched one
+            
+        Returns:
+            Confirmed signatures, in input order
+        """
+        in_flight = []
+        for transaction, signers in transactions:
+            try:
+                signature = self._send_transaction_unconfirmed(transaction, signers)
+                in_flight.append((signature, self.confirmations.track(signature, Confirmed)))
+            except Exception as e:
+                print(f"Transaction send failed, will retry: {e}")
+                in_flight.append((None, None))
+        
+        signatures = []
+        for (transaction, signers), (signature, future) in zip(transactions, in_flight):
+            try:
+                if future is None:
+                    raise RuntimeError("Transaction was not sent")
+                future.result()
+                signatures.append(signature)
+            except Exception:
+                if max_retries <= 1:
+                    raise
+                print("Transaction not confirmed, retrying on its own...")
+                signatures.append(
+                    self._send_transaction_with_retry(transaction, signers, max_retries - 1)
+                )
+        
+        return signatures
+    
+    def _send_transaction_unconfirmed(
+        self,
+        transaction: Transaction,
+        signers: List[Keypair],
+        attempt: int = 0,
+        recent_blockhash: Optional[str] = None
+    ) -> str:
+        """
+        Send a transaction and return its signature without waiting
+        
+        A simulated compute-unit limit and a priority fee are prepended;
+        each retry attempt doubles the fee. The cached blockhash is used
+        unless `recent_blockhash` is given.
+        """
+        budgeted = self.compute_budget.apply(transaction, signers, attempt)
+        response = self.client.send_transaction(
+            budgeted,
+            *signers,
+            opts={"skip_preflight": False, "preflight_commitment": Confirmed},
+            recent_blockhash=recent_blockhash or self.blockhash.get_blockhash()
+        )
+        return response['result']
     
+    @traced("ensure_token_account")
     def _ensure_token_account(
         self,
         payer: Keypair,
@@ -508,18 +775,9 @@ class ProductionMemecoinLaunchpad:
     ) -> PublicKey:
         """Ensure token account exists, create if needed"""
         ata = get_associated_token_address(owner, mint)
+        ix = self._create_token_account_instruction_if_missing(payer, mint, owner)
         
-        # Check if account exists
-        account_info = self.client.get_account_info(ata)
-        
-        if account_info['result']['value'] is None:
-            # Create account
-            ix = create_associated_token_account(
-                payer=payer.public_key,
-                owner=owner,
-                mint=mint
-            )
-            
+        if ix is not None:
             tx = Transaction()
             tx.add(ix)
             
@@ -527,6 +785,29 @@ class ProductionMemecoinLaunchpad:
         
         return ata
     
+    def _create_token_account_instruction_if_missing(
+        self,
+        payer: Keypair,
+        mint: PublicKey,
+        owner: PublicKey
+    ) -> Optional[TransactionInstruction]:
+        """Build the ATA create instruction, or None if the account already exists"""
+        from spl.token.instructions import create_associated_token_account
+        
+        ata = get_associated_token_address(owner, mint)
+        
+        # Check if account exists; concurrent checks share one batched read
+        with span("account_exists_check", account=str(ata)):
+            exists = self.accounts.get(ata).result() is not None
+        if exists:
+            return None
+        
+        return create_associated_token_account(
+            payer=payer.public_key,
+            owner=owner,
+            mint=mint
+        )
+    
     def _mint_tokens_safe(
         self,
         payer: Keypair,
@@ -535,17 +816,8 @@ class ProductionMemecoinLaunchpad:
         amount: int
     ) -> str:
         """Mint tokens with safety checks"""
-        # Create mint instruction
-        ix = mint_to(
-            program_id=TOKEN_PROGRAM_ID,
-            mint=mint,
-            dest=destination,
-            mint_authority=payer.public_key,
-            amount=amount
-        )
-        
         tx = Transaction()
-        tx.add(ix)
+        tx.add(self._mint_to_instruction(payer, mint, destination, amount))
         
         return self._send_transaction_with_retry(tx, [payer])
     
@@ -554,124 +826,14 @@ class ProductionMemecoinLaunchpad:
         payer: Keypair,
         mint: PublicKey,
         token_account: PublicKey,
-        amount: int
+        amount: int,
+        decimals: int = 9
     ) -> str:
         """Burn tokens"""
-        ix = burn_checked(
-            program_id=TOKEN_PROGRAM_ID,
-            mint=mint,
-            account=token_account,
-            owner=payer.public_key,
-            amount=amount,
-            decimals=9  # Assuming 9 decimals
-        )
-        
         tx = Transaction()
-        tx.add(ix)
+        tx.add(self._burn_instruction(payer, mint, token_account, amount, decimals))
         
         return self._send_transaction_with_retry(tx, [payer])
-    
-    def _create_metadata_instruction_v3(
-        self,
-        metadata_pda: PublicKey,
-        mint: PublicKey,
-        mint_authority: PublicKey,
-        payer: PublicKey,
-        update_authority: PublicKey,
-        metadata: TokenMetadata,
-        is_mutable: bool = True,
-    ):
-        """Create Metaplex metadata instruction manually"""
-        
-        # Encode the metadata data
-        name_bytes = metadata.name.encode('utf-8')
-        symbol_bytes = metadata.symbol.encode('utf-8')
-        uri_bytes = metadata.uri.encode('utf-8')
-        
-        # Data structure for CreateMetadataAccountV3
-        # Reference: https://github.com/metaplex-foundation/metaplex-program-library/blob/main/token-metadata/program/src/instruction.rs
-        
-        # Instruction data layout:
-        # - discriminator (8 bytes)
-        # - data (variable length)
-        #   - name length (4 bytes) + name (variable)
-        #   - symbol length (4 bytes) + symbol (variable)
-        #   - uri length (4 bytes) + uri (variable)
-        #   - seller_fee_basis_points (2 bytes)
-        #   - creators (variable, null for None)
-        #   - collection (variable, null for None)
-        #   - uses (variable, null for None)
-        # - is_mutable (1 byte)
-        # - collection_details (variable, null for None)
-        
-        data = bytearray()
-        data.extend(CREATE_METADATA_V3_DISCRIMINATOR)
-        
-        # Add name
-        data.extend(struct.pack('<I', len(name_bytes)))
-        data.extend(name_bytes)
-        
-        # Add symbol
-        data.extend(struct.pack('<I', len(symbol_bytes)))
-        data.extend(symbol_bytes)
-        
-        # Add URI
-        data.extend(struct.pack('<I', len(uri_bytes)))
-        data.extend(uri_bytes)
-        
-        # Add seller_fee_basis_points (0)
-        data.extend(struct.pack('<H', 0))
-        
-        # Add creators (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add collection (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add uses (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-        
-        # Add is_mutable (True/False - represented as 1/0)
-        data.extend(struct.pack('<B', 1 if is_mutable else 0))
-        
-        # Add collection_details (None - represented as 0)
-        data.extend(struct.pack('<I', 0))
-
-        return TransactionInstruction(
-            program_id=METAPLEX_METADATA_PROGRAM_ID,
-            data=data,
-            keys=[
-                AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-                AccountMeta(pubkey=mint_authority, is_signer=True, is_writable=False),
-                AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
-                AccountMeta(pubkey=update_authority, is_signer=False, is_writable=False),
-                AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-                AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
-            ]
-        )
-    
-    def _update_metadata_to_immutable(
-        self,
-        metadata_pda: PublicKey,
-        update_authority: PublicKey
-    ):
-        """Update metadata to immutable"""
-        
-        # Instruction discriminator for UpdateMetadataAccountV2
-        data = bytes([15])  # UpdateMetadataAccountV2
-        
-        # Add update parameters (set is_mutable to false)
-        data += bytes([0])  # is_mutable = false
-        
-        return TransactionInstruction(
-            program_id=METAPLEX_METADATA_PROGRAM_ID,
-            data=data,
-            keys=[
-                AccountMeta(pubkey=metadata_pda, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=update_authority, is_signer=True, is_writable=False),
-            ]
-        )
 
 
 def launch_memecoin_mainnet():
@@ -681,20 +843,34 @@ def launch_memecoin_mainnet():
     print("🚀 Solana Memecoin Launchpad - Mainnet Production")
     print("=" * 50)
     
-    # Initialize launchpad
-    launchpad = ProductionMemecoinLaunchpad()
+    # Initialize launchpad; RPC metrics are served on LAUNCH_METRICS_PORT
+    # (0 disables them) and LAUNCH_TRACE_FILE records a Chrome trace of the launch
+    serve_launch_metrics(int(os.getenv("LAUNCH_METRICS_PORT", DEFAULT_METRICS_PORT)))
+    trace_path = os.getenv("LAUNCH_TRACE_FILE")
+    if trace_path:
+        enable_tracing()
+    launchpad = ProductionMemecoinLaunchpad(
+        client=instrument(shared_pool(MAINNET_RPC_ENDPOINTS, Confirmed))
+    )
     
     # IMPORTANT: Use your funded mainnet keypair
     # For production, load this securely (e.g., from environment variable)
     # Example: payer = Keypair.from_secret_key(base58.b58decode(os.getenv("SOLANA_PRIVATE_KEY")))
     
-    # For this example, we'll create a new keypair (YOU MUST FUND THIS WITH SOL)
-    payer = Keypair()
-    print(f"\n⚠️  IMPORTANT: Fund this wallet with at least 0.5 SOL:")
-    print(f"Wallet address: {payer.public_key}")
-    print(f"Private key: {base64.b64encode(payer.secret_key).decode()}")
-    print("\nPress Enter after funding the wallet...")
-    input()
+    # Reuse the payer from SOLANA_PAYER_SECRET_KEY (base64) so an interrupted
+    # launch can be resumed; otherwise create a new keypair (YOU MUST FUND THIS WITH SOL)
+    payer_secret = os.getenv("SOLANA_PAYER_SECRET_KEY")
+    if payer_secret:
+        payer = Keypair.from_secret_key(base64.b64decode(payer_secret))
+        print(f"\nUsing payer: {payer.public_key}")
+    else:
+        payer = Keypair()
+        print(f"\n⚠️  IMPORTANT: Fund this wallet with at least 0.5 SOL:")
+        print(f"Wallet address: {payer.public_key}")
+        print(f"Private key: {base64.b64encode(payer.secret_key).decode()}")
+        print("Set SOLANA_PAYER_SECRET_KEY to this value to resume an interrupted launch.")
+        print("\nPress Enter after funding the wallet...")
+        input()
     
     # Verify balance
     balance = launchpad._get_sol_balance(payer.public_key)
@@ -731,45 +907,24 @@ def launch_memecoin_mainnet():
         slippage_tolerance=0.5
     )
     
+    from launch_pipeline import LaunchJournal, build_launch_pipeline
+    from launch_store import DEFAULT_STORE_PATH, LaunchRecord, LaunchStore
+    
+    # Every sent signature and the mint keypair are journaled before the
+    # launch moves on; re-running with the same payer resumes from here
+    journal_path = f"launch_{metadata.symbol}.journal.jsonl"
+    if os.path.exists(journal_path):
+        print(f"\n🔁 Resuming launch from {journal_path}")
+    
     try:
-        # Step 1: Create token with metadata
-        print("\n📝 Step 1: Creating token with metadata...")
-        token_info = launchpad.create_token_with_metadata(payer, metadata, config)
-        mint = PublicKey(token_info["mint"])
-        metadata_pda = PublicKey(token_info["metadata_pda"])
-        
-        # Step 2: Setup distribution
-        print("\n💰 Step 2: Setting up token distribution...")
-        distribution = launchpad.setup_token_distribution(
-            payer=payer,
-            mint=mint,
-            config=config
-        )
-        
-        # Step 3: Create liquidity pool
-        print("\n🏊 Step 3: Creating liquidity pool...")
-        liquidity_tokens = int(distribution["allocations"]["liquidity"])
-        liquidity_sol = int(config.initial_liquidity_sol * 1e9)  # Convert to lamports
-        
-        pool_info = launchpad.create_raydium_pool(
-            payer=payer,
-            mint=mint,
-            base_amount=liquidity_tokens,
-            quote_amount=liquidity_sol,
-            config=config
-        )
-        
-        # Step 4: Renounce authorities
-        print("\n🔒 Step 4: Renouncing authorities...")
-        renounce_results = launchpad.renounce_authorities(
-            payer=payer,
-            mint=mint,
-            metadata_pda=metadata_pda
-        )
+        with LaunchJournal(journal_path) as journal:
+            pipeline = build_launch_pipeline(launchpad, payer, metadata, config, journal)
+            results = pipeline.run()
         
-        # Step 5: Verify launch
-        print("\n✅ Step 5: Verifying launch readiness...")
-        verification = launchpad.verify_launch_readiness(mint, config)
+        token_info = results["create_token"]
+        distribution = results["distribute"]
+        pool_info = results["create_pool"]
+        mint = PublicKey(token_info["mint"])
         
         # Summary
         print("\n" + "=" * 50)
@@ -790,24 +945,34 @@ def launch_memecoin_mainnet():
         print(f"Birdeye: https://birdeye.so/token/{mint}")
         print(f"DexScreener: https://dexscreener.com/solana/{mint}")
         
-        # Save launch data
-        launch_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "token": token_info,
-            "distribution": distribution,
-            "pool": pool_info,
-            "config": config.__dict__,
-            "metadata": metadata.__dict__
-        }
-        
-        with open(f"launch_{metadata.symbol}_{mint}.json", "w") as f:
-            json.dump(launch_data, f, indent=2)
-        
-        print(f"\n💾 Launch data saved to: launch_{metadata.symbol}_{mint}.json")
+        # Record the launch in the indexed store
+        with LaunchStore() as store:
+            store.append(LaunchRecord(
+                mint=str(mint),
+                symbol=metadata.symbol,
+                creator=str(payer.public_key),
+                config=config,
+                metadata=metadata,
+                token=token_info,
+                distribution=distribution,
+                pool=pool_info
+            ))
+        
+        print(f"\n💾 Launch recorded in {DEFAULT_STORE_PATH}")
+        
+        # Archive the journal under the mint so a later launch of the same
+        # symbol starts fresh instead of resuming this one
+        archive_path = f"launch_{mint}.journal.jsonl"
+        os.replace(journal_path, archive_path)
+        print(f"🗄️  Launch journal archived to {archive_path}")
         
     except Exception as e:
         print(f"\n❌ Error during launch: {e}")
         raise
+    finally:
+        if trace_path:
+            spans = write_chrome_trace(trace_path)
+            print(f"🧭 Wrote {spans} spans to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+import base64
+import threading
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from solana.keypair import Keypair
+from solana.rpc.api import Client
+
+from account_batcher import MINT_LAYOUT, AccountReadBatcher, account_data, decode_mint_account
+from fake_rpc_server import FakeRpcServer
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer() as server:
+        yield server
+
+
+def put_account(server: FakeRpcServer, data: bytes) -> str:
+    pubkey = str(Keypair().public_key)
+    server.accounts[pubkey] = {
+        "data": [base64.b64encode(data).decode(), "base64"],
+        "executable": False,
+        "lamports": 1_000_000,
+        "owner": str(Keypair().public_key),
+        "rentEpoch": 0,
+    }
+    return pubkey
+
+
+def test_concurrent_gets_in_one_window_share_a_call(server):
+    batcher = AccountReadBatcher(Client(server.url), window=0.1)
+    pubkeys = [put_account(server, bytes([i])) for i in range(5)]
+    missing = str(Keypair().public_key)
+
+    barrier = threading.Barrier(6)
+    futures = {}
+
+    def lookup(pubkey):
+        barrier.wait()
+        futures[pubkey] = batcher.get(pubkey)
+
+    threads = [threading.Thread(target=lookup, args=(p,)) for p in pubkeys + [missing]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    values = {pubkey: future.result(timeout=5) for pubkey, future in futures.items()}
+
+    assert [account_data(values[p]) for p in pubkeys] == [bytes([i]) for i in range(5)]
+    assert values[missing] is None
+    assert server.method_counts["getMultipleAccounts"] == 1
+    assert batcher.rpc_requests == 1
+    assert batcher.accounts_read == 6
+    # Duplicates within a window are fetched once and fan out to every caller
+    first, again = batcher.get(pubkeys[0]), batcher.get(pubkeys[0])
+    assert account_data(first.result(timeout=5)) == account_data(again.result(timeout=5)) == bytes([0])
+    assert batcher.accounts_read == 7
+
+
+def test_get_many_splits_at_100_accounts_and_keeps_input_order(server):
+    batcher = AccountReadBatcher(Client(server.url))
+    pubkeys = [put_account(server, i.to_bytes(2, "little")) for i in range(250)]
+
+    values = batcher.get_many(pubkeys + [pubkeys[0]])
+
+    assert [account_data(v) for v in values] == [i.to_bytes(2, "little") for i in range(250)] + [b"\x00\x00"]
+    assert server.method_counts["getMultipleAccounts"] == 3
+    assert batcher.rpc_requests == 3
+    assert batcher.get_many([]) == []
+
+
+def test_rpc_url_groups_calls_into_one_http_batch(server):
+    batcher = AccountReadBatcher(Client(server.url), rpc_url=server.url)
+    pubkeys = [put_account(server, b"x") for _ in range(250)]
+    requests_before = server.request_count
+
+    values = batcher.get_many(pubkeys)
+
+    assert all(account_data(v) == b"x" for v in values)
+    assert server.method_counts["getMultipleAccounts"] == 3
+    assert server.request_count - requests_before == 1
+    assert batcher.rpc_requests == 1
+
+
+def test_decode_mint_account():
+    authority = Keypair().public_key
+    data = MINT_LAYOUT.pack(1, bytes(authority), 1_000_000_000, 9, 1, 0, bytes(32))
+
+    assert decode_mint_account(data) == {
+        "mint_authority": str(authority),
+        "supply": 1_000_000_000,
+        "decimals": 9,
+        "is_initialized": True,
+        "freeze_authority": None,
+    }
+    # Trailing extension bytes are ignored
+    revoked = MINT_LAYOUT.pack(0, bytes(32), 5, 6, 1, 1, bytes(authority)) + b"\x01" * 10
+    assert decode_mint_account(revoked)["mint_authority"] is None
+    assert decode_mint_account(revoked)["freeze_authority"] == str(authority)
+
+
+def test_account_data_accepts_both_encodings():
+    encoded = base64.b64encode(b"abc").decode()
+    assert account_data({"data": [encoded, "base64"]}) == b"abc"
+    assert account_data({"data": encoded}) == b"abc"
+    assert account_data(None) is None
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("solana.rpc.async_api")
+
+from solana.keypair import Keypair
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.system_program import TransferParams, transfer
+from solana.transaction import Transaction
+
+from async_launchpad import AsyncLaunchEngine, AsyncMemecoinLaunchpad, LaunchRequest
+from compute_budget import PriorityFeeModel
+from fake_rpc_server import FakeRpcServer
+from solana_memecoin_launchpad_production import ProductionLaunchConfig, TokenMetadata
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer(slot_time=0.01) as server:
+        yield server
+
+
+def request(symbol: str) -> LaunchRequest:
+    return LaunchRequest(
+        payer=Keypair(),
+        metadata=TokenMetadata(name=symbol, symbol=symbol, description="", image_url="", uri=""),
+        config=ProductionLaunchConfig(total_supply=1_000_000),
+    )
+
+
+def scripted_engine(server: FakeRpcServer, max_concurrent_launches: int, run_launch) -> AsyncLaunchEngine:
+    engine = AsyncLaunchEngine(
+        rpc_url=server.url,
+        max_concurrent_launches=max_concurrent_launches,
+        sync_client=Client(server.url)
+    )
+    engine.run_launch = run_launch
+    return engine
+
+
+def test_launch_many_is_bounded_by_the_semaphore(server):
+    in_flight, peak = 0, 0
+
+    async def run_launch(launch_request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return launch_request.metadata.symbol
+
+    async def main():
+        engine = scripted_engine(server, 3, run_launch)
+        try:
+            return await engine.launch_many([request(f"T{i}") for i in range(10)])
+        finally:
+            await engine.close()
+
+    assert asyncio.run(main()) == [f"T{i}" for i in range(10)]
+    assert peak == 3
+
+
+def test_launch_many_isolates_failed_launches(server):
+    async def run_launch(launch_request):
+        await asyncio.sleep(0)
+        if launch_request.metadata.symbol == "BAD":
+            raise ValueError("launch failed")
+        return launch_request.metadata.symbol
+
+    async def main():
+        engine = scripted_engine(server, 2, run_launch)
+        try:
+            return await engine.launch_many([request("A"), request("BAD"), request("C")])
+        finally:
+            await engine.close()
+
+    first, failed, last = asyncio.run(main())
+    assert (first, last) == ("A", "C")
+    assert isinstance(failed, ValueError)
+
+
+def test_engine_rejects_a_zero_limit(server):
+    with pytest.raises(ValueError, match="at least 1"):
+        AsyncLaunchEngine(rpc_url=server.url, max_concurrent_launches=0)
+
+
+def test_launchpad_needs_an_endpoint_or_sync_client():
+    with pytest.raises(ValueError, match="sync_client"):
+        AsyncMemecoinLaunchpad(object())
+
+
+def test_send_uses_the_shared_blockhash_budget_and_tracker(server):
+    payer, recipient = Keypair(), Keypair()
+    server.fund(str(payer.public_key), 10_000_000_000)
+
+    async def main():
+        client = AsyncClient(server.url)
+        launchpad = AsyncMemecoinLaunchpad(
+            client, retry_delay=0, sync_client=Client(server.url), fee_model=PriorityFeeModel(None)
+        )
+        try:
+            signatures = []
+            for lamports in (1_000, 2_000):
+                transaction = Transaction().add(transfer(TransferParams(
+                    from_pubkey=payer.public_key, to_pubkey=recipient.public_key, lamports=lamports
+                )))
+                signatures.append(await launchpad._send_transaction_with_retry(transaction, [payer]))
+            return launchpad, signatures
+        finally:
+            launchpad.confirmations.stop()
+            await client.close()
+
+    launchpad, signatures = asyncio.run(main())
+
+    assert len(set(signatures)) == 2
+    assert all(server.transactions[signature]["err"] is None for signature in signatures)
+    assert server.balances[str(recipient.public_key)] == 3_000
+    # One blockhash fetch and one simulation serve both sends
+    assert server.method_counts["getLatestBlockhash"] == 1
+    assert server.method_counts["simulateTransaction"] == 1
+    assert launchpad.compute_budget.stats()["cache_hits"] == 1
+    assert server.method_counts["getSignatureStatuses"] >= 1
+    assert "confirmTransaction" not in server.method_counts
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from blockhash_cache import BlockhashProvider, get_blockhash_provider
+
+
+class CountingClient:
+    """Client double serving a new blockhash per fetch, optionally slowly"""
+
+    def __init__(self, validity: int = 150, delay: float = 0.0):
+        self.validity = validity
+        self.delay = delay
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def get_latest_blockhash(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.fetches += 1
+            n = self.fetches
+        return {"result": {"value": {"blockhash": f"hash{n}", "lastValidBlockHeight": 1_000 + self.validity}}}
+
+    def get_block_height(self):
+        return {"result": 1_000}
+
+
+def test_serves_the_cached_blockhash_while_it_has_headroom():
+    client = CountingClient()
+    provider = BlockhashProvider(client, background=False)
+
+    assert provider.get_blockhash() == "hash1"
+    assert provider.get_blockhash_with_expiry() == ("hash1", 1_150)
+    assert (client.fetches, provider.fetches, provider.hits) == (1, 1, 1)
+
+    provider.invalidate()
+    assert provider.get_blockhash() == "hash2"
+
+
+def test_refetches_below_min_headroom():
+    client = CountingClient(validity=20)
+    provider = BlockhashProvider(client, min_headroom=30, refresh_headroom=75, background=False)
+
+    assert provider.get_blockhash() == "hash1"
+    assert provider.get_blockhash() == "hash2"
+    assert provider.hits == 0
+
+
+def test_concurrent_stale_callers_share_one_fetch():
+    client = CountingClient(delay=0.1)
+    provider = BlockhashProvider(client, background=False)
+    start = threading.Barrier(8)
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(provider.get_blockhash())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["hash1"] * 8
+    assert client.fetches == 1
+    assert provider.hits == 7
+
+
+def test_background_thread_refreshes_and_goes_idle():
+    client = CountingClient()
+    provider = BlockhashProvider(client, min_headroom=30, refresh_headroom=200, idle_timeout=0.3)
+    try:
+        provider.get_blockhash()
+        deadline = time.monotonic() + 2
+        while client.fetches < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.fetches >= 3
+
+        # Past the idle timeout the thread exits and polling stops
+        deadline = time.monotonic() + 2
+        while provider._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert provider._thread is None
+    finally:
+        provider.stop()
+
+
+def test_validates_headroom():
+    with pytest.raises(ValueError, match="refresh_headroom"):
+        BlockhashProvider(CountingClient(), min_headroom=50, refresh_headroom=50)
+
+
+def test_providers_are_shared_per_endpoint():
+    from solana.rpc.api import Client
+
+    first = get_blockhash_provider(Client("http://127.0.0.1:1/shared"))
+    assert get_blockhash_provider(Client("http://127.0.0.1:1/shared")) is first
+    assert get_blockhash_provider(Client("http://127.0.0.1:1/other")) is not first
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+pytest.importorskip("solana.rpc.async_api")
+
+from solana.keypair import Keypair
+
+from async_launchpad import JournaledLaunch
+from bulk_launch import BulkLauncher, LaunchProgress, parse_manifest_entry, read_manifest
+from launch_store import LaunchStore
+
+DEV_WALLET = str(Keypair().public_key)
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-launch"""
+
+
+class ScriptedEngine:
+    """AsyncLaunchEngine double: journals the mint like the real launchpad, then finishes or crashes"""
+
+    def __init__(self, crash_symbols=()):
+        self.crash_symbols = set(crash_symbols)
+        self.launched = []
+        self._slot = asyncio.Semaphore(1)
+
+    def slot(self) -> asyncio.Semaphore:
+        return self._slot
+
+    async def run_launch(self, request):
+        launch = JournaledLaunch(request.journal)
+        mint = await launch.keypair("mint", request.mint_keypair_source)
+        if request.metadata.symbol in self.crash_symbols:
+            raise Crash()
+        self.launched.append(request.metadata.symbol)
+        return {"token": {"mint": str(mint.public_key)}, "distribution": {}}
+
+
+def write(path, text: str) -> str:
+    with open(path, "w") as f:
+        f.write(text)
+    return str(path)
+
+
+def test_csv_columns_are_coerced_to_field_types(tmp_path):
+    path = write(tmp_path / "launches.csv", (
+        "name,symbol,description,image_url,uri,twitter,total_supply,decimals,burn_percentage,dev_wallet,extra\n"
+        f"Moon,MOON,To the moon,ar://img,ar://meta,,1000000,6,2.5,{DEV_WALLET},ignored\n"
+        "Doge,DOGE,,,,,5000,,,,\n"
+    ))
+
+    moon, doge = read_manifest(path)
+    assert (moon.row, doge.row) == (0, 1)
+    assert moon.metadata.twitter is None  # Empty cells fall back to the default
+    assert moon.config.total_supply == 1_000_000
+    assert moon.config.decimals == 6
+    assert moon.config.burn_percentage == 2.5
+    assert str(moon.dev_wallet) == DEV_WALLET
+    assert moon.marketing_wallet is None
+    assert doge.metadata.description == ""  # Required string fields keep empty cells
+    assert doge.config.decimals == 9
+
+
+def test_jsonl_entries_may_be_nested_and_skip_blank_lines(tmp_path):
+    nested = {
+        "metadata": {"name": "Moon", "symbol": "MOON", "description": "", "image_url": "", "uri": "ar://m"},
+        "config": {"total_supply": 42, "dev_wallet_percentage": 1},
+        "marketing_wallet": DEV_WALLET,
+    }
+    flat = {"name": "Doge", "symbol": "DOGE", "description": "", "image_url": "", "uri": "", "total_supply": "7"}
+    path = write(tmp_path / "launches.jsonl", f"{json.dumps(nested)}\n\n{json.dumps(flat)}\n")
+
+    moon, doge = read_manifest(path)
+    assert (moon.row, doge.row) == (0, 1)
+    assert moon.config.total_supply == 42
+    assert isinstance(moon.config.dev_wallet_percentage, float)
+    assert str(moon.marketing_wallet) == DEV_WALLET
+    assert doge.config.total_supply == 7
+
+
+def test_missing_required_fields_raise():
+    with pytest.raises(TypeError):
+        parse_manifest_entry(0, {"name": "Moon", "symbol": "MOON"})
+
+
+def rows():
+    return [
+        parse_manifest_entry(i, {"name": s, "symbol": s, "description": "", "image_url": "", "uri": "", "total_supply": 1})
+        for i, s in enumerate(["AAA", "BBB"])
+    ]
+
+
+def test_interrupted_row_resumes_with_its_journaled_mint(tmp_path):
+    payer = Keypair()
+    progress_path = str(tmp_path / "manifest.progress.jsonl")
+
+    # First run: AAA finishes, then the process dies while launching BBB
+    progress = LaunchProgress(progress_path)
+    try:
+        with pytest.raises(Crash):
+            asyncio.run(BulkLauncher(ScriptedEngine(crash_symbols={"BBB"}), payer, progress).run(rows()))
+    finally:
+        progress.close()
+    with open(progress.journal_path(1)) as f:
+        journaled_mint = next(json.loads(line)["pubkey"] for line in f if '"account"' in line)
+
+    # Second run skips AAA and finishes BBB with the same mint
+    progress = LaunchProgress(progress_path)
+    assert progress.done == {0}
+    assert progress.incomplete() == {1}
+
+    sources = []
+    engine = ScriptedEngine()
+    with LaunchStore(str(tmp_path / "launches.db")) as store:
+        launcher = BulkLauncher(engine, payer, progress, store, mint_keypair_source=lambda: sources.append(1) or Keypair())
+        try:
+            summary = asyncio.run(launcher.run(rows()))
+        finally:
+            progress.close()
+
+        assert engine.launched == ["BBB"]
+        assert sources == []  # The journaled keypair was reused, not a new one
+        assert summary["attempted"] == 1 and summary["skipped"] == 1 and summary["launched"] == 1
+        assert store.get(journaled_mint).symbol == "BBB"
+
+    assert not os.path.exists(progress.journal_path(1))
+    finished = LaunchProgress(progress_path)
+    finished.close()
+    assert finished.done == {0, 1}
+    assert finished.incomplete() == set()
+
+
+def test_progress_ignores_a_torn_line_and_retries_failed_rows(tmp_path):
+    progress_path = write(tmp_path / "progress.jsonl", (
+        '{"row": 0, "status": "started"}\n'
+        '{"row": 0, "status": "done"}\n'
+        '{"row": 1, "status": "started"}\n'
+        '{"row": 1, "status": "failed"}\n'
+        '{"row": 2, "status": "sta'
+    ))
+    progress = LaunchProgress(progress_path)
+    engine = ScriptedEngine()
+    try:
+        asyncio.run(BulkLauncher(engine, Keypair(), progress).run(rows()))
+    finally:
+        progress.close()
+
+    assert progress.done == {0}
+    assert progress.failed == {1}
+    assert engine.launched == ["BBB"]  # Failed rows are retried, done rows skipped
@@ -0,0 +1,155 @@
+import pytest
+
+pytest.importorskip("solana.transaction")
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import AccountMeta, Transaction, TransactionInstruction
+
+from compute_budget import (
+    BUDGET_INSTRUCTION_UNITS,
+    COMPUTE_BUDGET_PROGRAM_ID,
+    DEFAULT_UNITS_PER_INSTRUCTION,
+    MAX_COMPUTE_UNITS,
+    ComputeBudgetPlanner,
+    PriorityFeeModel,
+)
+
+BLOCKHASH = str(PublicKey(bytes([7]) * 32))
+PROGRAM = PublicKey(bytes([200]) * 32)
+
+
+class FixedBlockhash:
+    def get_blockhash(self):
+        return BLOCKHASH
+
+
+class SimulatingClient:
+    """simulateTransaction answering a fixed consumption, or an error"""
+
+    def __init__(self, units_consumed=50_000, err=None):
+        self.units_consumed = units_consumed
+        self.err = err
+        self.simulated = []
+
+    def simulate_transaction(self, transaction):
+        self.simulated.append(transaction)
+        return {"result": {"value": {"err": self.err, "unitsConsumed": self.units_consumed}}}
+
+
+def instruction(account: PublicKey, data: bytes = b"\x01" * 8) -> TransactionInstruction:
+    # No signer keys, like a permissionless harvest: only the fee payer signs
+    return TransactionInstruction(
+        keys=[AccountMeta(pubkey=account, is_signer=False, is_writable=True)],
+        program_id=PROGRAM,
+        data=data
+    )
+
+
+def planner(client, min_price=0, **kwargs):
+    return ComputeBudgetPlanner(client, PriorityFeeModel(None, min_price=min_price), FixedBlockhash(), **kwargs)
+
+
+def samples(fees, first_slot=1):
+    return [{"slot": first_slot + i, "prioritizationFee": fee} for i, fee in enumerate(fees)]
+
+
+def test_budgeted_transaction_signs_and_serializes_with_the_payer_first():
+    payer = Keypair()
+    client = SimulatingClient()
+    transaction = Transaction()
+    transaction.add(instruction(PublicKey(bytes([1]) * 32)))
+
+    budgeted = planner(client, min_price=10).apply(transaction, [payer])
+    budgeted.recent_blockhash = BLOCKHASH
+    budgeted.sign(payer)
+
+    assert budgeted.fee_payer == payer.public_key
+    assert [ix.program_id for ix in budgeted.instructions[:2]] == [COMPUTE_BUDGET_PROGRAM_ID] * 2
+    assert budgeted.instructions[2:] == transaction.instructions
+    assert budgeted.serialize()
+    assert budgeted.compile_message().account_keys[0] == payer.public_key
+    # The simulated copy was signed by the payer too
+    assert client.simulated[0].fee_payer == payer.public_key
+    assert client.simulated[0].serialize()
+
+
+def test_units_are_simulated_once_per_shape():
+    client = SimulatingClient(units_consumed=10_000)
+    budget = planner(client)
+    payer = Keypair()
+
+    first = budget.units_for([instruction(PublicKey(bytes([1]) * 32))], [payer])
+    # Same program, roles and data length at another address: cached
+    second = budget.units_for([instruction(PublicKey(bytes([2]) * 32), b"\x01" + bytes(7))], [payer])
+    other = budget.units_for([instruction(PublicKey(bytes([1]) * 32), b"\x02")], [payer])
+
+    assert first == second == int(10_000 * 1.1) + BUDGET_INSTRUCTION_UNITS
+    assert other == first
+    assert (budget.simulations, budget.cache_hits) == (2, 1)
+    assert budget.stats()["shapes"] == 2
+
+
+def test_failed_simulation_falls_back_and_is_not_cached():
+    client = SimulatingClient(err={"InstructionError": [1, "Custom"]})
+    budget = planner(client)
+    instructions = [instruction(PublicKey(bytes([1]) * 32))] * 3
+
+    assert budget.units_for(instructions, [Keypair()]) == 3 * DEFAULT_UNITS_PER_INSTRUCTION
+    assert budget.units_for(instructions, [Keypair()]) == 3 * DEFAULT_UNITS_PER_INSTRUCTION
+    assert budget.simulations == 2
+
+
+def test_units_are_capped_and_the_cache_is_bounded():
+    client = SimulatingClient(units_consumed=MAX_COMPUTE_UNITS)
+    budget = planner(client, cache_size=2)
+    payer = Keypair()
+    shapes = [[instruction(PublicKey(bytes([1]) * 32), bytes(n))] for n in (1, 2, 3)]
+
+    assert budget.units_for(shapes[0], [payer]) == MAX_COMPUTE_UNITS
+    budget.units_for(shapes[1], [payer])
+    budget.units_for(shapes[0], [payer])  # Most recently used again
+    budget.units_for(shapes[2], [payer])  # Evicts shapes[1]
+    budget.units_for(shapes[0], [payer])
+    budget.units_for(shapes[1], [payer])
+
+    assert budget.simulations == 4
+    assert budget.cache_hits == 2
+
+
+def test_priority_fee_percentile_and_clamps():
+    model = PriorityFeeModel(None, percentile=75, max_price=500, min_price=5)
+    assert model.price() == 5
+
+    model.observe(samples([0, 100, 200, 300]))
+    assert model.price() == 300  # Index 3 of 4
+    model.percentile = 50
+    assert model.price() == 200
+    model.observe(samples([10_000] * 4, first_slot=5))
+    assert model.price() == 500
+
+
+def test_priority_fee_window_drops_old_slots():
+    model = PriorityFeeModel(None, percentile=0, window_slots=3)
+    model.observe(samples([1, 2, 3, 4, 5]))
+
+    assert model.price() == 3
+    model.observe([{"slot": 100, "prioritizationFee": 9}])
+    assert model.price() == 9
+
+
+def test_retry_attempts_raise_the_price():
+    payer = Keypair()
+    budget = planner(SimulatingClient(), min_price=0)
+    budget.fee_model.max_price = 100
+    budget.fee_model.observe(samples([10]))
+    transaction = Transaction()
+    transaction.add(instruction(PublicKey(bytes([1]) * 32)))
+
+    prices = [
+        int.from_bytes(bytes(budget.apply(transaction, [payer], attempt).instructions[1].data[1:]), "little")
+        for attempt in range(4)
+    ]
+
+    assert prices == [10, 20, 40, 80]
+    assert int.from_bytes(bytes(budget.apply(transaction, [payer], 5).instructions[1].data[1:]), "little") == 100
@@ -0,0 +1,110 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from solana.rpc.commitment import Finalized
+
+from confirmation_tracker import (
+    COMMITMENT_RANK,
+    MAX_SIGNATURES_PER_REQUEST,
+    ConfirmationTracker,
+    TransactionFailedError,
+    commitment_rank,
+)
+from fake_rpc_server import FakeRpcServer, _b58encode
+
+SLOT_TIME = 0.01
+
+
+class DispatchClient:
+    """The slice of solana.rpc.api.Client the tracker uses, answered in-process"""
+
+    def __init__(self, server: FakeRpcServer):
+        self.server = server
+        self.history_flags = []
+
+    def get_signature_statuses(self, signatures, search_transaction_history=False):
+        self.history_flags.append(search_transaction_history)
+        return {"result": self.server.dispatch("getSignatureStatuses", [signatures])}
+
+
+def send(server: FakeRpcServer) -> str:
+    """Send an empty legacy transaction; returns its signature"""
+    message = bytes([1, 0, 0, 1]) + os.urandom(32) + bytes(32) + bytes([0])
+    return server.dispatch("sendTransaction", [_b58encode(bytes([1]) + os.urandom(64) + message)])
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer(slot_time=SLOT_TIME) as server:
+        yield server
+
+
+@pytest.fixture
+def tracker(server):
+    tracker = ConfirmationTracker(DispatchClient(server), poll_interval=SLOT_TIME, timeout=5.0)
+    yield tracker
+    tracker.stop()
+
+
+@pytest.mark.parametrize("status, rank", [
+    ({"confirmations": 0, "confirmationStatus": "processed"}, 0),
+    ({"confirmations": 3, "confirmationStatus": "confirmed"}, 1),
+    ({"confirmations": None, "confirmationStatus": "finalized"}, 2),
+    ({"confirmations": None, "confirmationStatus": None}, 2),  # Rooted, from an older node
+])
+def test_commitment_rank(status, rank):
+    assert commitment_rank(status) == rank
+
+
+def test_confirm_all_waits_for_the_requested_commitment(server, tracker):
+    signatures = [send(server) for _ in range(5)]
+
+    statuses = tracker.confirm_all(signatures)
+
+    assert set(statuses) == set(signatures)
+    assert all(commitment_rank(status) >= COMMITMENT_RANK["confirmed"] for status in statuses.values())
+
+    finalized = tracker.confirm_all(signatures[:1], commitment=Finalized)
+    assert finalized[signatures[0]]["confirmationStatus"] == "finalized"
+
+
+def test_polls_are_shared_between_signatures(server, tracker):
+    signatures = [send(server) for _ in range(MAX_SIGNATURES_PER_REQUEST + 10)]
+
+    tracker.confirm_all(signatures)
+
+    # Two chunks per poll, a few polls, never one request per signature
+    assert server.method_counts["getSignatureStatuses"] < len(signatures) // 10
+
+
+def test_failed_transaction_raises(server, tracker):
+    server.tx_error_rate = 1.0
+    signature = send(server)
+
+    with pytest.raises(TransactionFailedError) as failure:
+        tracker.track(signature).result(timeout=5)
+    assert failure.value.signature == signature
+    assert failure.value.err == {"InstructionError": [0, {"Custom": 1}]}
+
+
+def test_unknown_signature_times_out(tracker):
+    started = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        tracker.track("unknown", timeout=0.1).result(timeout=5)
+    assert time.monotonic() - started < 2
+
+
+def test_get_statuses_deduplicates_and_chunks(server, tracker):
+    signatures = [send(server) for _ in range(MAX_SIGNATURES_PER_REQUEST + 1)]
+
+    statuses = tracker.get_statuses(signatures + signatures[:3] + ["unknown"], search_history=True)
+
+    assert len(statuses) == len(signatures) + 1
+    assert statuses["unknown"] is None
+    assert all(statuses[signature]["err"] is None for signature in signatures)
+    assert tracker.client.history_flags == [True, True]
@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("solana.publickey")
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
+
+import derivation_cache
+from derivation_cache import METAPLEX_METADATA_PROGRAM_ID, DerivationCache
+
+
+def metadata_seeds(mint: PublicKey):
+    return [b"metadata", bytes(METAPLEX_METADATA_PROGRAM_ID), bytes(mint)]
+
+
+def test_repeat_lookups_hit_and_match_the_uncached_derivation():
+    cache = DerivationCache()
+    owner, mint = Keypair().public_key, Keypair().public_key
+
+    first = cache.get_associated_token_address(owner, mint)
+    assert cache.get_associated_token_address(owner, mint) == first
+    assert first == get_associated_token_address(owner, mint)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = DerivationCache(maxsize=2)
+    a, b, c = (Keypair().public_key for _ in range(3))
+
+    cache.find_metadata_pda(a)
+    cache.find_metadata_pda(b)
+    cache.find_metadata_pda(a)  # a is now the most recent
+    cache.find_metadata_pda(c)  # evicts b
+
+    assert cache.stats()["size"] == 2
+    misses = cache.misses
+    cache.find_metadata_pda(a)
+    assert cache.misses == misses
+    cache.find_metadata_pda(b)
+    assert cache.misses == misses + 1
+
+
+def test_prime_serves_later_lookups_without_a_bump_search():
+    cache = DerivationCache()
+    mint = Keypair().public_key
+    primed = (Keypair().public_key, 7)  # Deliberately not the real PDA
+
+    cache.prime(metadata_seeds(mint), METAPLEX_METADATA_PROGRAM_ID, primed)
+    assert cache.find_program_address(metadata_seeds(mint), METAPLEX_METADATA_PROGRAM_ID) == primed
+    assert cache.stats()["misses"] == 0
+
+    cache.clear()
+    assert cache.stats() == {"size": 0, "maxsize": cache.maxsize, "hits": 0, "misses": 0, "hit_rate": 0.0}
+
+
+@pytest.mark.parametrize("processes", [1, 2], ids=["inline", "process_pool"])
+def test_derive_many_fills_the_cache_in_input_order(processes):
+    cache = DerivationCache()
+    mints = [Keypair().public_key for _ in range(6)]
+    cache.find_metadata_pda(mints[2])
+
+    requests = [(metadata_seeds(mint), METAPLEX_METADATA_PROGRAM_ID) for mint in mints]
+    results = cache.derive_many(requests, processes=processes, chunksize=2)
+
+    assert results == [PublicKey.find_program_address(seeds, program) for seeds, program in requests]
+    assert (cache.hits, cache.misses) == (1, 6)
+    assert cache.find_metadata_pda(mints[5]) == results[5][0]
+    assert cache.hits == 2
+
+
+def test_derive_many_hits_refresh_recency():
+    cache = DerivationCache(maxsize=2)
+    a, b, c = (Keypair().public_key for _ in range(3))
+    cache.find_metadata_pda(a)
+    cache.find_metadata_pda(b)
+
+    cache.derive_many([(metadata_seeds(a), METAPLEX_METADATA_PROGRAM_ID)])
+    cache.find_metadata_pda(c)  # Evicts b, not the bulk-read a
+
+    misses = cache.misses
+    cache.find_metadata_pda(a)
+    assert cache.misses == misses
+
+
+def test_module_derive_many_uses_the_given_cache():
+    cache = DerivationCache()
+    owner, mint = Keypair().public_key, Keypair().public_key
+    seeds = [bytes(owner), bytes(derivation_cache.TOKEN_PROGRAM_ID), bytes(mint)]
+
+    [(address, _)] = derivation_cache.derive_many([(seeds, ASSOCIATED_TOKEN_PROGRAM_ID)], cache=cache)
+    assert address == get_associated_token_address(owner, mint)
+    assert cache.stats()["size"] == 1
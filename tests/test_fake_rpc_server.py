@@ -0,0 +1,250 @@
+import base64
+import json
+import os
+import struct
+import urllib.request
+
+import pytest
+
+from fake_rpc_server import (
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    BLOCKHASH_VALIDITY,
+    FINALIZED_AFTER_SLOTS,
+    METADATA_PROGRAM_ID,
+    SIGNATURE_FEE,
+    SYSTEM_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+    FakeRpcServer,
+    RpcError,
+    _b58decode,
+    _b58encode,
+    _metadata_is_mutable_offset,
+)
+
+SYSTEM, TOKEN, ATA, METADATA = (
+    _b58decode(program) for program in (SYSTEM_PROGRAM_ID, TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID, METADATA_PROGRAM_ID)
+)
+
+
+def compact_u16(value: int) -> bytes:
+    out = b""
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        if not value:
+            return out + bytes([byte])
+        out += bytes([byte | 0x80])
+
+
+def transaction(signers, instructions, blockhash: bytes = bytes(32)) -> str:
+    """Base58 legacy wire transaction with random signatures"""
+    keys = list(signers)
+    for program, accounts, _ in instructions:
+        for account in list(accounts) + [program]:
+            if account not in keys:
+                keys.append(account)
+    message = bytes([len(signers), 0, 0]) + compact_u16(len(keys)) + b"".join(keys) + blockhash
+    message += compact_u16(len(instructions))
+    for program, accounts, data in instructions:
+        message += bytes([keys.index(program)]) + compact_u16(len(accounts))
+        message += bytes(keys.index(account) for account in accounts) + compact_u16(len(data)) + data
+    return _b58encode(compact_u16(len(signers)) + os.urandom(64 * len(signers)) + message)
+
+
+def advance(server: FakeRpcServer, slots: int):
+    server._started_at -= slots * server.slot_time
+
+
+def borsh_string(value: bytes) -> bytes:
+    return struct.pack("<I", len(value)) + value
+
+
+def create_mint(payer, mint, decimals=9):
+    return [
+        (SYSTEM, [payer, mint], struct.pack("<IQQ", 0, 1_500_000, 82) + TOKEN),
+        (TOKEN, [mint, os.urandom(32)], bytes([0, decimals]) + payer + bytes([0]) + bytes(32)),
+    ]
+
+
+def mint_to(mint, destination, authority, amount):
+    return (TOKEN, [mint, destination, authority], bytes([7]) + struct.pack("<Q", amount))
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer() as server:
+        yield server
+
+
+@pytest.fixture
+def payer(server):
+    payer = os.urandom(32)
+    server.fund(_b58encode(payer), 10 ** 10)
+    return payer
+
+
+def test_base58_round_trip():
+    for data in (b"", bytes(3), bytes(2) + b"\x01\xff", os.urandom(32)):
+        assert _b58decode(_b58encode(data)) == data
+    assert _b58encode(bytes(32)) == SYSTEM_PROGRAM_ID
+    with pytest.raises(RpcError):
+        _b58decode("0OIl")
+
+
+def test_signature_status_moves_from_processed_to_finalized(server, payer):
+    signature = server.dispatch("sendTransaction", [transaction([payer], [])])
+
+    def status():
+        return server.dispatch("getSignatureStatuses", [[signature, "unknown"]])["value"]
+
+    first, missing = status()
+    assert first["confirmationStatus"] == "processed" and missing is None
+    advance(server, 1)
+    assert status()[0]["confirmationStatus"] == "confirmed"
+    advance(server, FINALIZED_AFTER_SLOTS)
+    assert status()[0]["confirmationStatus"] == "finalized"
+    assert server.balances[_b58encode(payer)] == 10 ** 10 - SIGNATURE_FEE
+
+
+def test_launch_instructions_update_accounts_and_supply(server, payer):
+    mint, owner, token_account = os.urandom(32), os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction([payer, mint], create_mint(payer, mint, decimals=6))])
+    create_ata = (ATA, [payer, token_account, owner, mint, SYSTEM, TOKEN], b"")
+    server.dispatch("sendTransaction", [transaction([payer], [create_ata, mint_to(mint, token_account, payer, 5_000_000)])])
+    burn = (TOKEN, [token_account, mint, owner], bytes([15]) + struct.pack("<QB", 1_000_000, 6))
+    server.dispatch("sendTransaction", [transaction([owner], [burn])])
+
+    supply = server.dispatch("getTokenSupply", [_b58encode(mint)])["value"]
+    assert (supply["amount"], supply["decimals"], supply["uiAmount"]) == ("4000000", 6, 4.0)
+    owned = server.dispatch("getProgramAccounts", [TOKEN_PROGRAM_ID, {"filters": [{"dataSize": 165}]}])
+    assert [account["pubkey"] for account in owned] == [_b58encode(token_account)]
+
+
+def test_failing_instruction_rolls_back_the_whole_transaction(server, payer):
+    mint, other = os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction([payer, mint], create_mint(payer, mint))])
+    balance = server.balances[_b58encode(payer)]
+
+    # Renounce, then mint: the mint fails, so the renounce must not land either
+    renounce = (TOKEN, [mint, payer], bytes([6, 0, 0]) + bytes(32))
+    transfer = (SYSTEM, [payer, other], struct.pack("<IQ", 2, 1_000))
+    with pytest.raises(RpcError, match="InstructionError"):
+        server.dispatch("sendTransaction", [transaction([payer], [transfer, renounce, mint_to(mint, other, payer, 1)])])
+
+    assert server.balances[_b58encode(payer)] == balance
+    assert _b58encode(other) not in server.balances
+    with pytest.raises(RpcError, match="Custom"):
+        server.dispatch("sendTransaction", [transaction([payer, mint], create_mint(payer, mint))])
+
+
+def test_skip_preflight_lands_the_transaction_with_its_error(server, payer):
+    mint, destination, stranger = os.urandom(32), os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction([payer, mint], create_mint(payer, mint))])
+
+    signature = server.dispatch(
+        "sendTransaction", [transaction([stranger], [mint_to(mint, destination, stranger, 1)]), {"skipPreflight": True}]
+    )
+
+    status = server.dispatch("getSignatureStatuses", [[signature]])["value"][0]
+    assert status["err"] == {"InstructionError": [0, {"Custom": 4}]}
+    assert status["status"] == {"Err": status["err"]}
+    assert server.dispatch("getTokenSupply", [_b58encode(mint)])["value"]["amount"] == "0"
+
+
+def create_metadata(payer, mint, metadata):
+    data = (
+        bytes([33]) + borsh_string(b"Moon") + borsh_string(b"MOON") + borsh_string(b"https://m")
+        + struct.pack("<HB", 0, 0) + bytes([0, 0, 1, 0])
+    )
+    return (METADATA, [metadata, mint, payer, payer, payer], data)
+
+
+def metadata_is_mutable(server, metadata) -> bool:
+    raw = base64.b64decode(server.dispatch("getAccountInfo", [_b58encode(metadata)])["value"]["data"][0])
+    return bool(raw[_metadata_is_mutable_offset(bytearray(raw))])
+
+
+def test_metadata_is_created_and_becomes_immutable(server, payer):
+    mint, metadata = os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction(
+        [payer, mint], create_mint(payer, mint) + [create_metadata(payer, mint, metadata)]
+    )])
+    assert metadata_is_mutable(server, metadata)
+
+    lock = (METADATA, [metadata, payer], bytes([15, 0, 0, 0, 1, 0]))
+    server.dispatch("sendTransaction", [transaction([payer], [lock])])
+
+    account = server.dispatch("getAccountInfo", [_b58encode(metadata)])["value"]
+    assert account["owner"] == METADATA_PROGRAM_ID
+    assert not metadata_is_mutable(server, metadata)
+    with pytest.raises(RpcError, match="28"):
+        server.dispatch("sendTransaction", [transaction([payer], [lock])])
+
+
+@pytest.mark.parametrize("data", [
+    bytes([15, 0]),  # Options missing
+    bytes([15, 0, 0, 0, 1]),  # is_mutable value missing
+    bytes([15, 0, 1]) + bytes(31),  # Truncated update authority
+    bytes([15, 0, 0, 0, 1, 0, 0]),  # Trailing byte
+    bytes([15, 0, 0, 0, 2, 0]),  # Not an Option tag
+], ids=["no-options", "no-value", "short-authority", "trailing", "bad-tag"])
+def test_malformed_metadata_update_is_rejected(server, payer, data):
+    mint, metadata = os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction(
+        [payer, mint], create_mint(payer, mint) + [create_metadata(payer, mint, metadata)]
+    )])
+
+    with pytest.raises(RpcError, match="InvalidInstructionData"):
+        server.dispatch("sendTransaction", [transaction([payer], [(METADATA, [metadata, payer], data)])])
+    assert metadata_is_mutable(server, metadata)
+
+
+def test_launchpad_lock_instruction_makes_metadata_immutable(server, payer):
+    pytest.importorskip("solana.publickey")
+    from solana.publickey import PublicKey
+    from solana_memecoin_launchpad_production import LaunchInstructionBuilder
+
+    mint, metadata = os.urandom(32), os.urandom(32)
+    server.dispatch("sendTransaction", [transaction(
+        [payer, mint], create_mint(payer, mint) + [create_metadata(payer, mint, metadata)]
+    )])
+    ix = LaunchInstructionBuilder()._update_metadata_to_immutable(PublicKey(metadata), PublicKey(payer))
+
+    server.dispatch("sendTransaction", [transaction(
+        [payer], [(bytes(ix.program_id), [bytes(meta.pubkey) for meta in ix.keys], bytes(ix.data))]
+    )])
+
+    assert not metadata_is_mutable(server, metadata)
+
+
+def test_expired_blockhash_is_rejected(server, payer):
+    blockhash = server.dispatch("getLatestBlockhash", [])["value"]
+    assert blockhash["lastValidBlockHeight"] == server.slot + BLOCKHASH_VALIDITY
+
+    advance(server, BLOCKHASH_VALIDITY + 1)
+
+    with pytest.raises(RpcError, match="Blockhash not found"):
+        server.dispatch("sendTransaction", [transaction([payer], [], _b58decode(blockhash["blockhash"]))])
+
+
+def test_resending_a_signature_is_idempotent(server, payer):
+    wire = transaction([payer], [])
+    assert server.dispatch("sendTransaction", [wire]) == server.dispatch("sendTransaction", [wire])
+    assert server.stats()["transactions"] == 1
+    assert server.balances[_b58encode(payer)] == 10 ** 10 - SIGNATURE_FEE
+
+
+def test_http_batches_and_errors(server):
+    body = json.dumps([
+        {"jsonrpc": "2.0", "id": 1, "method": "getHealth"},
+        {"jsonrpc": "2.0", "id": 2, "method": "noSuchMethod"},
+        {"jsonrpc": "2.0", "id": 3, "method": "getBalance", "params": [SYSTEM_PROGRAM_ID]},
+    ]).encode()
+    request = urllib.request.Request(server.url, body, {"Content-Type": "application/json"})
+
+    with urllib.request.urlopen(request, timeout=5) as response:
+        answers = json.loads(response.read())
+
+    assert answers[0]["result"] == "ok"
+    assert answers[1]["error"]["code"] == -32601
+    assert answers[2]["result"]["value"] == 0
+    assert server.stats()["requests"] == 1
@@ -0,0 +1,200 @@
+import base64
+import struct
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+
+from fee_harvester import (
+    ACCOUNT_TYPE_ACCOUNT,
+    EXTENSION_TRANSFER_FEE_AMOUNT,
+    HARVEST_WITHHELD_TOKENS_TO_MINT,
+    MAX_WITHDRAW_SOURCES,
+    TOKEN_ACCOUNT_SIZE,
+    TRANSFER_FEE_EXTENSION,
+    WITHDRAW_WITHHELD_TOKENS_FROM_ACCOUNTS,
+    WithheldFeeHarvester,
+    decode_withheld_amount,
+    harvest_withheld_tokens_to_mint,
+    withdraw_withheld_tokens_from_accounts,
+)
+from compute_budget import ComputeBudgetPlanner, PriorityFeeModel
+from transaction_packer import PACKET_DATA_SIZE
+
+EXTENSION_IMMUTABLE_OWNER = 7
+
+
+def key(n: int) -> PublicKey:
+    return PublicKey(bytes([n]) * 32)
+
+
+def tlv(extension_type: int, value: bytes) -> bytes:
+    return struct.pack("<HH", extension_type, len(value)) + value
+
+
+def token_account(*extensions: bytes, account_type: int = ACCOUNT_TYPE_ACCOUNT) -> bytes:
+    return bytes(TOKEN_ACCOUNT_SIZE) + bytes([account_type]) + b"".join(extensions)
+
+
+def withheld(amount: int) -> bytes:
+    return tlv(EXTENSION_TRANSFER_FEE_AMOUNT, struct.pack("<Q", amount))
+
+
+def test_plain_spl_token_account_has_no_withheld_amount():
+    assert decode_withheld_amount(bytes(TOKEN_ACCOUNT_SIZE)) is None
+    assert decode_withheld_amount(token_account()) is None
+
+
+def test_withheld_amount_is_found_after_other_extensions():
+    data = token_account(tlv(EXTENSION_IMMUTABLE_OWNER, b""), tlv(99, b"\xff" * 13), withheld(2 ** 64 - 1))
+
+    assert decode_withheld_amount(data) == 2 ** 64 - 1
+    assert decode_withheld_amount(token_account(withheld(0))) == 0
+
+
+def test_mint_account_type_is_not_a_token_account():
+    assert decode_withheld_amount(token_account(withheld(5), account_type=1)) is None
+
+
+def test_uninitialized_extension_ends_the_scan():
+    # Zero-filled padding before a TransferFeeAmount-looking value
+    assert decode_withheld_amount(token_account(bytes(4), withheld(5))) is None
+
+
+@pytest.mark.parametrize("data", [
+    token_account(tlv(EXTENSION_TRANSFER_FEE_AMOUNT, b"\x01" * 4)),  # Length too short for a u64
+    token_account(withheld(5))[:-3],  # Value cut off by the end of the data
+    token_account(tlv(99, b"\xff" * 13))[:-5],  # Extension longer than the data
+    token_account(b"\x02"),  # Half a TLV header
+])
+def test_malformed_extensions_are_ignored(data):
+    assert decode_withheld_amount(data) is None
+
+
+def test_harvest_instruction_layout():
+    ix = harvest_withheld_tokens_to_mint(key(1), [key(2), key(3)])
+
+    assert bytes(ix.data) == bytes([TRANSFER_FEE_EXTENSION, HARVEST_WITHHELD_TOKENS_TO_MINT])
+    assert [meta.pubkey for meta in ix.keys] == [key(1), key(2), key(3)]
+    assert all(meta.is_writable and not meta.is_signer for meta in ix.keys)
+
+
+def test_withdraw_instruction_layout_and_source_limit():
+    ix = withdraw_withheld_tokens_from_accounts(key(1), key(2), key(3), [key(4), key(5)])
+
+    assert bytes(ix.data) == bytes([TRANSFER_FEE_EXTENSION, WITHDRAW_WITHHELD_TOKENS_FROM_ACCOUNTS, 2])
+    assert [meta.pubkey for meta in ix.keys] == [key(1), key(2), key(3), key(4), key(5)]
+    assert [meta.is_signer for meta in ix.keys] == [False, False, True, False, False]
+    with pytest.raises(ValueError, match=str(MAX_WITHDRAW_SOURCES)):
+        withdraw_withheld_tokens_from_accounts(key(1), key(2), key(3), [key(4)] * (MAX_WITHDRAW_SOURCES + 1))
+
+
+class HarvestClient:
+    """
+    getProgramAccounts from a fixed list of (pubkey, data); sends are
+    signed and serialized the way solana-py's Client does, then reported
+    confirmed
+    """
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.sent = []  # (transaction, wire size)
+
+    def get_program_accounts(self, program_id, encoding=None, memcmp_opts=None):
+        return {"result": [
+            {"pubkey": str(pubkey), "account": {"data": [base64.b64encode(data).decode(), "base64"]}}
+            for pubkey, data in self.accounts
+        ]}
+
+    def send_transaction(self, transaction, *signers, opts=None, recent_blockhash=None):
+        transaction.recent_blockhash = recent_blockhash
+        transaction.sign(*signers)
+        self.sent.append((transaction, len(transaction.serialize())))
+        return {"result": str(transaction.signature())}
+
+    def get_signature_statuses(self, signatures, search_transaction_history=False):
+        status = {"slot": 1, "confirmations": 1, "err": None, "confirmationStatus": "confirmed"}
+        return {"result": {"value": [status] * len(signatures)}}
+
+
+class FixedBlockhash:
+    def get_blockhash(self):
+        return str(key(99))
+
+    def invalidate(self):
+        pass
+
+
+class SimulatingClient:
+    def simulate_transaction(self, transaction):
+        return {"result": {"value": {"err": None, "unitsConsumed": 30_000}}}
+
+
+def test_scan_keeps_accounts_above_the_minimum_largest_first():
+    client = HarvestClient([
+        (key(10), token_account(withheld(3))),
+        (key(11), token_account()),
+        (key(12), token_account(withheld(900))),
+        (key(13), token_account(withheld(1))),
+    ])
+    harvester = WithheldFeeHarvester(client, Keypair(), min_withheld=2)
+
+    scanned, found = harvester.scan(key(1))
+
+    assert scanned == 4
+    assert [(str(account.address), account.withheld) for account in found] == [
+        (str(key(12)), 900), (str(key(10)), 3)
+    ]
+
+
+def test_max_sources_is_the_largest_batch_that_fits():
+    harvester = WithheldFeeHarvester(HarvestClient([]), Keypair())
+    build = lambda sources: harvest_withheld_tokens_to_mint(key(1), sources)
+
+    capacity = harvester.max_sources("harvest", build)
+    sources = [key(i) for i in range(2, capacity + 3)]
+
+    assert harvester._packer.fits([build(sources[:capacity])])
+    assert not harvester._packer.fits([build(sources[:capacity + 1])])
+    assert harvester._packer.measure([build(sources[:capacity])]) <= PACKET_DATA_SIZE
+
+
+@pytest.mark.parametrize("budgeted", [False, True])
+@pytest.mark.parametrize("kind", ["harvest", "withdraw"])
+def test_full_batch_signs_and_fits_one_packet(kind, budgeted):
+    payer, authority = Keypair(), Keypair()
+    mint, destination = key(1), key(2)
+    client = HarvestClient([])
+    harvester = WithheldFeeHarvester(client, payer)
+    harvester.blockhash = FixedBlockhash()
+    if budgeted:
+        harvester.compute_budget = ComputeBudgetPlanner(
+            SimulatingClient(), PriorityFeeModel(None, min_price=1), FixedBlockhash()
+        )
+    if kind == "harvest":
+        build = lambda sources: harvest_withheld_tokens_to_mint(mint, sources)
+        run = lambda: harvester.harvest(mint)
+    else:
+        build = lambda sources: withdraw_withheld_tokens_from_accounts(mint, destination, authority.public_key, sources)
+        run = lambda: harvester.withdraw(mint, authority, destination)
+    capacity = harvester.max_sources(kind, build)
+    # One account more than a transaction holds: a full batch and a single
+    client.accounts = [
+        (PublicKey((i + 1).to_bytes(32, "big")), token_account(withheld(1_000 - i))) for i in range(capacity + 1)
+    ]
+
+    report = run()
+    harvester.stop()
+
+    assert report.failed == [] and len(report.signatures) == 2
+    assert report.swept == report.total_withheld
+    transaction, size = max(client.sent, key=lambda sent: len(sent[0].instructions[-1].keys))
+    assert len(transaction.instructions[-1].keys) - len(build([]).keys) == capacity
+    assert transaction.fee_payer == payer.public_key
+    assert size <= PACKET_DATA_SIZE
+    # Capacity is measured with room for the budget instructions
+    measured = harvester._packer.measure(transaction.instructions[-1:])
+    assert size == measured if budgeted else size < measured
@@ -0,0 +1,117 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip("solana.publickey")
+
+from fee_ingestion import FeeIngestionPipeline, RollingWindow, TransferEvent, jsonl_source
+from memecoin_launchpad_with_fees import CreatorFeeConfig, FeeDistributionManager
+from milestone_tracker import MAX_TRACKED_VOLUME
+
+
+def line(mint="mintA", amount=100, timestamp=1_000.0, **extra) -> bytes:
+    return json.dumps({"mint": mint, "amount": amount, "timestamp": timestamp, **extra}).encode()
+
+
+def pipeline(**kwargs) -> FeeIngestionPipeline:
+    kwargs.setdefault("on_milestone", lambda mint, reward: None)
+    return FeeIngestionPipeline(FeeDistributionManager(client=None), **kwargs)
+
+
+def test_rolling_window_recycles_buckets_and_expires_on_read():
+    window = RollingWindow(span=60, bucket_seconds=10)
+    window.add(5, 100, 1)
+    window.add(15, 200, 2)
+    window.add(16, 300, 3)
+    assert window.totals(20) == (600, 6, 3)
+
+    # Epoch 6 reuses epoch 0's slot, dropping its totals
+    window.add(65, 50, 5)
+    assert window.totals(65) == (550, 10, 3)
+    # An event older than the bucket now in its slot is outside the window
+    window.add(3, 999, 9)
+    assert window.totals(65) == (550, 10, 3)
+    # Reads skip buckets that fell out of the span, without any write
+    assert window.totals(75) == (50, 5, 1)
+    assert window.totals(500) == (0, 0, 0)
+
+
+def test_malformed_lines_are_counted_and_skipped():
+    ingest = pipeline()
+    lines = [
+        line(),
+        b"not json",
+        b"[1, 2]",
+        json.dumps({"mint": "mintA"}).encode(),
+        line(amount=-1),
+        line(amount=MAX_TRACKED_VOLUME + 1),
+        line(mint=7),
+        line(fee=-5),
+        b'{"mint": "mintA", "amount": 1, "timestamp": NaN}',
+        b'{"mint": "mintA", "amount": 1, "timestamp": Infinity}',
+        line(amount="12", fee="3"),
+    ]
+
+    assert ingest.ingest_lines(lines) == 2
+    assert ingest.stats.malformed == 9
+    assert ingest.aggregates("mintA")["1m"] == {"volume": 112, "fees": 5, "transfers": 2}
+
+
+def test_fees_are_split_like_calculate_fee_distribution():
+    ingest = pipeline()
+    config = ingest.fee_config
+    ingest.ingest([TransferEvent("mintA", 123_457, 1_000.0), TransferEvent("mintA", 10, 1_001.0, fee=7)])
+
+    expected = ingest.manager.calculate_fee_distribution(config.transfer_fee(123_457), config)
+    assert ingest.manager.distributed_fees["mintA"]["creator"] == expected["creator"] + \
+        ingest.manager.calculate_fee_distribution(7, config)["creator"]
+
+
+def test_milestones_fire_once_per_chunk():
+    rewards = []
+    ingest = pipeline(
+        fee_config=CreatorFeeConfig(volume_milestone_rewards={1_000: 7, 2_000: 11, 10_000: 50}),
+        on_milestone=lambda mint, reward: rewards.append((mint, reward)),
+    )
+
+    # Ten 250-unit trades cross two milestones inside one chunk: one summed callback
+    ingest.ingest_lines([line(amount=250) for _ in range(10)])
+    assert rewards == [("mintA", 18)]
+
+    ingest.ingest_lines([line(amount=100) for _ in range(5)])
+    assert rewards == [("mintA", 18)]
+    ingest.ingest_lines([line(amount=7_000), line(mint="mintB", amount=999)])
+    assert rewards == [("mintA", 18), ("mintA", 50)]
+    assert ingest.stats.milestones == 2
+
+
+def test_reader_blocks_when_the_queue_is_full(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b"\n".join(line(timestamp=1_000.0 + i) for i in range(40)) + b"\n")
+
+    ingest = pipeline(max_pending_chunks=1)
+    ingest_lines = ingest.ingest_lines
+
+    def slow_ingest_lines(lines):
+        time.sleep(0.02)  # Aggregator slower than the reader
+        return ingest_lines(lines)
+
+    ingest.ingest_lines = slow_ingest_lines
+    stats = ingest.run(jsonl_source([str(path)], chunk_size=2))
+
+    assert stats.events == 40
+    assert stats.chunks == 20
+    assert stats.backpressure_waits > 0
+    assert stats.backpressure_seconds > 0
+    assert ingest.aggregates("mintA")["1h"]["transfers"] == 40
+
+
+def test_idle_mints_are_evicted_but_keep_lifetime_volume():
+    ingest = pipeline()
+    ingest.ingest([TransferEvent("old", 500, 0.0)])
+    ingest.ingest([TransferEvent("new", 1, 100_000.0)])
+
+    assert ingest.aggregates("old")["24h"]["transfers"] == 0
+    assert "old" not in ingest._mints
+    assert ingest.manager.volume_tracker.state("old")[0] == 500
@@ -0,0 +1,176 @@
+import os
+
+import pytest
+
+pytest.importorskip("solana.publickey")
+
+from solana.publickey import PublicKey
+
+from fee_persistence import (
+    FSYNC_ALWAYS,
+    SNAPSHOT_NAME,
+    WAL_PREFIX,
+    FeeStateStore,
+    RECORD_VOLUME,
+    _record,
+)
+from memecoin_launchpad_with_fees import CreatorFeeConfig, FeeDistributionManager
+
+CONFIG = CreatorFeeConfig()
+SMALL = CreatorFeeConfig(volume_milestone_rewards={500: 1, 5_000: 2})
+
+
+def open_store(directory, **kwargs):
+    manager = FeeDistributionManager(None)
+    return manager, FeeStateStore(str(directory), manager, fsync_policy=FSYNC_ALWAYS, **kwargs)
+
+
+def trade(manager, mint, volume, fee, config=CONFIG):
+    manager.track_volume_milestone(mint, volume, config)
+    totals = manager.distributed_fees.setdefault(mint, dict.fromkeys(("creator", "liquidity", "burn", "treasury"), 0))
+    for name, amount in manager.calculate_fee_distribution(fee, config).items():
+        totals[name] += amount
+
+
+def state(manager):
+    tracker = manager.volume_tracker
+    mints = sorted(set(manager.distributed_fees) | set(tracker.export()[0]))
+    return (
+        {mint: (tracker.state(mint), tracker.milestones_reached(mint)) for mint in mints},
+        {mint: dict(shares) for mint, shares in manager.distributed_fees.items()},
+    )
+
+
+def segments(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith(WAL_PREFIX))
+
+
+def test_wal_replay_restores_volumes_fees_and_schedules(tmp_path):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    trade(manager, "a", 2_000_000, 1_000)
+    trade(manager, "b", 600, 10, SMALL)
+    store.log_mints(["a", "b"])
+    trade(manager, "a", 9_000_000, 3_333)
+    store.log_mints(["a"])
+    manager.fee_accounts = {"treasury": PublicKey(bytes([9]) * 32)}
+    store.log_fee_accounts()
+    store.close()
+
+    restored, reopened = open_store(tmp_path, snapshot_wal_bytes=0)
+
+    assert state(restored) == state(manager)
+    assert {k: str(v) for k, v in restored.fee_accounts.items()} == {"treasury": str(PublicKey(bytes([9]) * 32))}
+    # Two schedules, three volume and three fee records, and the fee accounts
+    assert reopened.recovery.wal_records == 9
+    assert reopened.recovery.torn_bytes == 0
+    # Restored mints keep paying from where they were
+    assert restored.track_volume_milestone("a", 100_000_000, CONFIG) == 200_000
+    assert restored.track_volume_milestone("b", 5_000, SMALL) == 2
+    reopened.close()
+
+
+def test_snapshot_then_wal_recovery(tmp_path):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    for i in range(100):
+        trade(manager, f"mint-{i}", 1_000 * i, i)
+    store.log_mints(f"mint-{i}" for i in range(100))
+    store.snapshot()
+    trade(manager, "mint-1", 5_000_000, 7, SMALL)
+    store.log_mints(["mint-1"])
+    store.close()
+
+    assert os.path.exists(tmp_path / SNAPSHOT_NAME)
+    assert len(segments(tmp_path)) == 1  # Covered segments are deleted
+
+    restored, reopened = open_store(tmp_path, snapshot_wal_bytes=0)
+
+    assert reopened.recovery.snapshot_mints == 100
+    assert state(restored) == state(manager)
+    reopened.close()
+
+
+def test_snapshot_is_taken_when_the_wal_grows(tmp_path):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=4_096)
+    for i in range(200):
+        trade(manager, f"mint-{i}", 10, 1)
+        store.log_mints([f"mint-{i}"])
+    store.close()
+
+    assert os.path.exists(tmp_path / SNAPSHOT_NAME)
+    restored, reopened = open_store(tmp_path, snapshot_wal_bytes=0)
+    assert state(restored) == state(manager)
+    reopened.close()
+
+
+@pytest.mark.parametrize("tail", [
+    lambda record: record[:len(record) // 2],  # Interrupted mid-record
+    lambda record: record[:5],  # Interrupted mid-header
+    lambda record: bytes(len(record)),  # Extended by the filesystem but never written
+])
+def test_torn_tail_is_dropped_and_truncated(tmp_path, tail):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    trade(manager, "a", 1_500_000, 100)
+    store.log_mints(["a"])
+    expected = state(manager)
+    store.close()
+
+    path = tmp_path / segments(tmp_path)[-1]
+    size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(tail(_record(RECORD_VOLUME, b"\x01" * 12 + b"a")))
+
+    restored, reopened = open_store(tmp_path, snapshot_wal_bytes=0)
+
+    assert state(restored) == expected
+    assert reopened.recovery.torn_bytes > 0
+    assert path.stat().st_size == size
+    # Appends after recovery follow the valid data
+    trade(restored, "a", 1, 1)
+    reopened.log_mints(["a"])
+    reopened.close()
+    again, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    assert state(again) == state(restored)
+    store.close()
+
+
+def test_corruption_before_valid_records_fails_recovery(tmp_path):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    for mint in ("a", "b", "c"):
+        trade(manager, mint, 10, 1)
+        store.log_mints([mint])
+    store.close()
+
+    path = tmp_path / segments(tmp_path)[-1]
+    data = bytearray(path.read_bytes())
+    data[12] ^= 0xFF  # Inside the first record's payload
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="corrupt"):
+        open_store(tmp_path, snapshot_wal_bytes=0)
+
+
+def test_corrupt_snapshot_fails_recovery(tmp_path):
+    manager, store = open_store(tmp_path, snapshot_wal_bytes=0)
+    trade(manager, "a", 10, 1)
+    store.log_mints(["a"])
+    store.snapshot()
+    store.close()
+
+    path = tmp_path / SNAPSHOT_NAME
+    data = bytearray(path.read_bytes())
+    data[20] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="corrupt"):
+        open_store(tmp_path, snapshot_wal_bytes=0)
+
+
+def test_invalid_policy_and_closed_store(tmp_path):
+    with pytest.raises(ValueError):
+        FeeStateStore(str(tmp_path), FeeDistributionManager(None), fsync_policy="sometimes")
+
+    manager, store = open_store(tmp_path)
+    store.close()
+    trade(manager, "a", 1, 1)
+    with pytest.raises(RuntimeError, match="closed"):
+        store.log_mints(["a"])
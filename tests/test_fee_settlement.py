@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("solana.publickey")
+
+from fee_settlement import SHARES, FeeSettlementEngine
+from memecoin_launchpad_with_fees import CreatorFeeConfig, FeeDistributionManager
+
+U64_MAX = 2 ** 64 - 1
+
+UNEVEN = CreatorFeeConfig(
+    creator_share_percentage=33.33,
+    liquidity_share_percentage=33.33,
+    burn_share_percentage=0.01,
+    treasury_share_percentage=33.33,
+)
+NO_BURN = CreatorFeeConfig(
+    creator_share_percentage=70.0,
+    liquidity_share_percentage=30.0,
+    burn_share_percentage=0.0,
+    treasury_share_percentage=0.0,
+)
+
+
+def scalar_totals(fees, mint_ids, default, configs):
+    """Per-mint sums of calculate_fee_distribution, the reference implementation"""
+    manager = FeeDistributionManager(None)
+    totals = {}
+    for fee, mint_id in zip(fees, mint_ids):
+        split = manager.calculate_fee_distribution(int(fee), configs.get(mint_id, default))
+        entry = totals.setdefault(mint_id, {**dict.fromkeys(SHARES, 0), "total_fee": 0, "transfers": 0})
+        for name in SHARES:
+            entry[name] += split[name]
+        entry["total_fee"] += int(fee)
+        entry["transfers"] += 1
+    return totals
+
+
+def random_batch(n, mints, seed=7):
+    rng = random.Random(seed)
+    edges = [0, 1, 9_999, 10_000, 10_001, 2 ** 32, 2 ** 40 + 3]
+    fees = [rng.choice(edges) if rng.random() < 0.2 else rng.randrange(0, 10 ** 12) for _ in range(n)]
+    mint_ids = [rng.randrange(mints) for _ in range(n)]
+    return fees, mint_ids
+
+
+def test_default_split_matches_scalar_per_mint():
+    fees, mint_ids = random_batch(5_000, 50)
+    engine = FeeSettlementEngine(UNEVEN)
+
+    totals = engine.settle(np.array(fees, dtype=np.uint64), mint_ids)
+
+    assert totals.as_dict() == scalar_totals(fees, mint_ids, UNEVEN, {})
+
+
+def test_per_mint_configs_match_scalar():
+    fees, mint_ids = random_batch(5_000, 20, seed=11)
+    configs = {3: NO_BURN, 7: UNEVEN, 19: CreatorFeeConfig()}
+    engine = FeeSettlementEngine(CreatorFeeConfig(), configs)
+
+    totals = engine.settle(np.array(fees, dtype=np.int64), mint_ids)
+
+    assert totals.as_dict() == scalar_totals(fees, mint_ids, CreatorFeeConfig(), configs)
+
+
+def test_extreme_fees_split_exactly():
+    fees = [U64_MAX, U64_MAX - 1, 2 ** 63, 10_000 * (2 ** 50) + 9_999]
+    mint_ids = [0, 1, 2, 3]
+    engine = FeeSettlementEngine(UNEVEN)
+
+    totals = engine.settle(np.array(fees, dtype=np.uint64), mint_ids)
+
+    assert totals.as_dict() == scalar_totals(fees, mint_ids, UNEVEN, {})
+    assert (totals.shares.sum(axis=1, dtype=np.uint64) == totals.fees).all()
+
+
+def test_unsorted_input_gives_the_same_totals_as_sorted():
+    fees, mint_ids = random_batch(2_000, 30, seed=3)
+    order = sorted(range(len(fees)), key=mint_ids.__getitem__)
+    engine = FeeSettlementEngine()
+
+    shuffled = engine.settle(np.array(fees, dtype=np.uint64), mint_ids)
+    grouped = engine.settle(np.array([fees[i] for i in order], dtype=np.uint64), [mint_ids[i] for i in order])
+
+    assert shuffled.as_dict() == grouped.as_dict()
+    assert list(shuffled.mint_ids) == sorted(set(mint_ids))
+
+
+def test_batches_combine_to_the_whole():
+    fees, mint_ids = random_batch(3_000, 40, seed=5)
+    engine = FeeSettlementEngine(UNEVEN, {1: NO_BURN})
+    chunks = [
+        (np.array(fees[start:start + 700], dtype=np.uint64), mint_ids[start:start + 700])
+        for start in range(0, len(fees), 700)
+    ]
+
+    assert engine.settle_batches(chunks).as_dict() == engine.settle(np.array(fees, dtype=np.uint64), mint_ids).as_dict()
+
+
+def test_empty_batches():
+    engine = FeeSettlementEngine()
+    assert len(engine.settle(np.zeros(0, dtype=np.uint64), [])) == 0
+    assert len(engine.settle_batches([])) == 0
+
+
+@pytest.mark.parametrize("fees, mint_ids, error", [
+    ([-1, 5], [0, 0], ValueError),
+    ([1.5, 2.0], [0, 0], TypeError),
+    ([1, 2, 3], [0, 0], ValueError),
+])
+def test_invalid_batches_are_rejected(fees, mint_ids, error):
+    with pytest.raises(error):
+        FeeSettlementEngine().settle(np.array(fees), mint_ids)
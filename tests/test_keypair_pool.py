@@ -0,0 +1,102 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip("solana.publickey")
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from spl.token.constants import TOKEN_PROGRAM_ID
+
+from derivation_cache import DerivationCache
+from keypair_pool import KeypairPool
+
+TOKEN_2022_PROGRAM_ID = PublicKey("TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb")
+
+
+def wait_for_depth(pool: KeypairPool, depth: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while len(pool) < depth and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(pool) == depth
+
+
+def test_refills_to_target_depth_after_falling_to_low_water():
+    pool = KeypairPool(Keypair().public_key, target_depth=6, low_water=2, cache=DerivationCache())
+    with pool:
+        wait_for_depth(pool, 6)
+        taken = [pool.take() for _ in range(4)]
+        wait_for_depth(pool, 6)
+
+    assert len({str(entry.keypair.public_key) for entry in taken}) == 4
+    assert pool.stats()["hits"] == 4
+    assert pool.stats()["misses"] == 0
+
+
+def test_empty_pool_derives_inline():
+    pool = KeypairPool(Keypair().public_key, target_depth=2, low_water=0, cache=DerivationCache())
+
+    entry = pool.take()
+    assert pool.stats()["misses"] == 1
+    assert entry.metadata_pda == pool.cache.find_metadata_pda(entry.keypair.public_key)
+
+
+@pytest.mark.parametrize("token_program_id", [TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID], ids=["spl_token", "token_2022"])
+def test_payer_ata_uses_the_pool_token_program(token_program_id):
+    payer = Keypair().public_key
+    cache = DerivationCache()
+    pool = KeypairPool(payer, target_depth=2, low_water=0, cache=cache, token_program_id=token_program_id)
+
+    entry = pool.take()
+    assert entry.payer_ata == cache.get_associated_token_address(payer, entry.keypair.public_key, token_program_id)
+
+
+def test_taken_log_survives_a_restart_and_is_compacted(tmp_path):
+    payer = Keypair().public_key
+    path = str(tmp_path / "pool.json")
+
+    with KeypairPool(payer, target_depth=5, low_water=1, path=path, cache=DerivationCache()) as pool:
+        wait_for_depth(pool, 5)
+
+    # Takes are appended to the log; the pool file is not rewritten
+    restarted = KeypairPool(payer, target_depth=5, low_water=1, path=path, cache=DerivationCache())
+    taken = {str(restarted.take().keypair.public_key) for _ in range(2)}
+    assert set(open(f"{path}.taken").read().split()) == taken
+    assert len(json.load(open(path))["entries"]) == 5
+
+    # Crash without stop(): the next load still skips what was handed out
+    recovered = KeypairPool(payer, target_depth=5, low_water=1, path=path, cache=DerivationCache())
+    assert len(recovered) == 3
+    assert not taken & {str(entry.keypair.public_key) for entry in recovered._entries}
+
+    # Rewriting the pool file compacts the log
+    with recovered:
+        wait_for_depth(recovered, 5)
+    saved = {entry["secret_key"] for entry in json.load(open(path))["entries"]}
+    assert len(saved) == 5
+    assert open(f"{path}.taken").read() == ""
+    assert len(KeypairPool(payer, target_depth=5, low_water=1, path=path, cache=DerivationCache())) == 5
+
+
+def test_load_rejects_another_payer_or_token_program(tmp_path):
+    payer = Keypair().public_key
+    path = str(tmp_path / "pool.json")
+    with KeypairPool(payer, target_depth=2, low_water=0, path=path, cache=DerivationCache()) as pool:
+        wait_for_depth(pool, 2)
+
+    with pytest.raises(ValueError, match="payer"):
+        KeypairPool(Keypair().public_key, target_depth=2, low_water=0, path=path)
+    with pytest.raises(ValueError, match="token program"):
+        KeypairPool(payer, target_depth=2, low_water=0, path=path, token_program_id=TOKEN_2022_PROGRAM_ID)
+
+    # Files written before the token program was recorded are SPL Token pools
+    data = json.load(open(path))
+    del data["token_program"]
+    json.dump(data, open(path, "w"))
+    assert len(KeypairPool(payer, target_depth=2, low_water=0, path=path, cache=DerivationCache())) == 2
+
+
+def test_low_water_must_be_below_target_depth():
+    with pytest.raises(ValueError, match="low_water"):
+        KeypairPool(Keypair().public_key, target_depth=4, low_water=4)
@@ -0,0 +1,137 @@
+import base64
+import io
+import json
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from solana.keypair import Keypair
+from solana.rpc.api import Client
+from solana.system_program import CreateAccountParams, create_account
+from solana.transaction import Transaction
+from spl.token.constants import TOKEN_PROGRAM_ID
+from spl.token.instructions import (
+    AuthorityType,
+    InitializeMintParams,
+    MintToParams,
+    SetAuthorityParams,
+    create_associated_token_account,
+    get_associated_token_address,
+    initialize_mint,
+    mint_to,
+    set_authority,
+)
+
+from account_batcher import MINT_ACCOUNT_SIZE, AccountReadBatcher
+from derivation_cache import DerivationCache
+from fake_rpc_server import FakeRpcServer
+from launch_auditor import LaunchAuditor, read_launch_manifest
+from solana_memecoin_launchpad_production import LaunchInstructionBuilder, ProductionLaunchConfig, TokenMetadata
+
+CONFIG = ProductionLaunchConfig(total_supply=1_000_000, decimals=6)
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer() as server:
+        yield server
+
+
+class Launcher:
+    """Lands a mint on the fake cluster the way a launch does, optionally stopping short"""
+
+    def __init__(self, server: FakeRpcServer):
+        self.server = server
+        self.client = Client(server.url)
+        self.builder = LaunchInstructionBuilder()
+        self.cache = DerivationCache()
+        self.payer = Keypair()
+        server.fund(str(self.payer.public_key), 10 ** 11)
+
+    def launch(self, supply: int = CONFIG.total_supply * 10 ** CONFIG.decimals, renounce: bool = True):
+        payer, mint = self.payer.public_key, Keypair()
+        metadata_pda = self.cache.find_metadata_pda(mint.public_key)
+        ata = get_associated_token_address(payer, mint.public_key)
+
+        self.send([mint], [
+            create_account(CreateAccountParams(
+                from_pubkey=payer, new_account_pubkey=mint.public_key,
+                lamports=1_500_000, space=MINT_ACCOUNT_SIZE, program_id=TOKEN_PROGRAM_ID
+            )),
+            initialize_mint(InitializeMintParams(
+                decimals=CONFIG.decimals, program_id=TOKEN_PROGRAM_ID, mint=mint.public_key, mint_authority=payer
+            )),
+            self.builder._create_metadata_instruction_v3(
+                metadata_pda, mint.public_key, payer, payer, payer,
+                TokenMetadata(name="Moon", symbol="MOON", description="", image_url="", uri="ar://m")
+            ),
+            create_associated_token_account(payer, payer, mint.public_key),
+            mint_to(MintToParams(
+                program_id=TOKEN_PROGRAM_ID, mint=mint.public_key, dest=ata, mint_authority=payer, amount=supply
+            )),
+        ])
+        if renounce:
+            self.send([], [
+                set_authority(SetAuthorityParams(
+                    program_id=TOKEN_PROGRAM_ID, account=mint.public_key,
+                    authority=AuthorityType.MINT_TOKENS, current_authority=payer
+                )),
+                self.builder._update_metadata_to_immutable(metadata_pda, payer),
+            ])
+        return mint.public_key
+
+    def send(self, signers, instructions):
+        transaction = Transaction(recent_blockhash=self.server.dispatch("getLatestBlockhash", [])["value"]["blockhash"])
+        for ix in instructions:
+            transaction.add(ix)
+        transaction.sign(self.payer, *signers)
+        self.server.dispatch("sendTransaction", [base64.b64encode(transaction.serialize()).decode(), {"encoding": "base64"}])
+
+
+def test_audits_mints_in_batched_chunks(server):
+    launcher = Launcher(server)
+    ready = launcher.launch()
+    unrenounced = launcher.launch(renounce=False)
+    short_supply = launcher.launch(supply=5)
+    missing = Keypair().public_key
+
+    batcher = AccountReadBatcher(Client(server.url))
+    output = io.StringIO()
+    launches = [(mint, CONFIG) for mint in (ready, unrenounced, short_supply, missing)]
+    summary = LaunchAuditor(batcher, chunk_size=3).audit_to_jsonl(launches, output)
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [row["mint"] for row in rows] == [str(mint) for mint, _ in launches]
+    assert rows[0]["ready"] is True
+    assert rows[0]["actual_supply"] == 1_000_000 * 10 ** 6
+    assert all(rows[0]["checks"].values())
+
+    assert rows[1]["ready"] is False
+    assert rows[1]["checks"]["mint_authority_renounced"] is False
+    assert rows[1]["checks"]["metadata_immutable"] is False
+    assert rows[1]["checks"]["correct_supply"] is True
+    assert rows[2]["checks"]["correct_supply"] is False
+    assert rows[2]["checks"]["mint_authority_renounced"] is True
+    assert rows[3]["checks"] == {
+        "mint_exists": False,
+        "correct_supply": False,
+        "mint_authority_renounced": False,
+        "metadata_exists": False,
+        "metadata_immutable": False,
+    }
+
+    # Two chunks, one getMultipleAccounts read each
+    assert summary["audited"] == 4
+    assert (summary["ready"], summary["not_ready"]) == (1, 3)
+    assert summary["rpc_requests"] == 2
+    assert server.method_counts["getMultipleAccounts"] == 2
+
+
+def test_read_launch_manifest_skips_blank_lines():
+    mint = Keypair().public_key
+    lines = ["", json.dumps({"mint": str(mint), "config": {"total_supply": 5, "decimals": 0}}), "  "]
+
+    [(parsed, config)] = read_launch_manifest(lines)
+    assert parsed == mint
+    assert (config.total_supply, config.decimals) == (5, 0)
@@ -0,0 +1,195 @@
+import os
+import stat
+import threading
+
+import pytest
+
+pytest.importorskip("solana.transaction")
+
+from solana.keypair import Keypair
+from solana.transaction import Transaction
+
+import launch_pipeline
+from confirmation_tracker import ConfirmationTracker
+from fake_rpc_server import FakeRpcServer, _b58decode, _b58encode
+from launch_pipeline import LaunchJournal, LaunchPipeline, PipelineStep
+
+SLOT_TIME = 0.01
+
+
+class DispatchClient:
+    """The slice of solana.rpc.api.Client recovery uses, answered in-process"""
+
+    def __init__(self, server: FakeRpcServer):
+        self.server = server
+
+    def get_block_height(self):
+        return {"result": self.server.dispatch("getBlockHeight", [])}
+
+    def get_signature_statuses(self, signatures, search_transaction_history=False):
+        return {"result": self.server.dispatch("getSignatureStatuses", [signatures])}
+
+
+class FakeLaunchpad:
+    """Sends an empty transaction to the fake server for every step send"""
+
+    def __init__(self, server: FakeRpcServer):
+        self.server = server
+        self.client = DispatchClient(server)
+        self.confirmations = ConfirmationTracker(self.client, poll_interval=SLOT_TIME, timeout=5.0)
+        self.sent = []  # (signature, block height when sent)
+
+    def _send_transaction_with_retry(self, transaction, signers, on_sent=None):
+        latest = self.server.dispatch("getLatestBlockhash", [])["value"]
+        message = bytes([1, 0, 0, 1]) + os.urandom(32) + _b58decode(latest["blockhash"]) + bytes([0])
+        signature = self.server.dispatch("sendTransaction", [_b58encode(bytes([1]) + os.urandom(64) + message)])
+        self.sent.append((signature, self.server.slot))
+        if on_sent is not None:
+            on_sent(signature, latest["blockhash"], latest["lastValidBlockHeight"])
+        self.confirmations.confirm_all([signature])
+        return signature
+
+
+@pytest.fixture
+def server():
+    with FakeRpcServer(slot_time=SLOT_TIME) as server:
+        yield server
+
+
+@pytest.fixture
+def launchpad(server):
+    launchpad = FakeLaunchpad(server)
+    yield launchpad
+    launchpad.confirmations.stop()
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "launch.journal.jsonl")
+
+
+def sending_step(name, keys, depends_on=(), fail_after=None):
+    def run(ctx):
+        signatures = []
+        for key in keys:
+            signatures.append(ctx.send(key, Transaction(), []))
+            if key == fail_after:
+                raise RuntimeError(f"{name} interrupted")
+        return {"signatures": signatures}
+    return PipelineStep(name, run, depends_on)
+
+
+def test_journal_reload_drops_a_torn_tail(journal_path):
+    with LaunchJournal(journal_path) as journal:
+        journal.append("launch", payer="p", symbol="MOON")
+        journal.append("done", step="create_token", result={"mint": "m"})
+    with open(journal_path, "a") as f:
+        f.write('{"type": "sent", "step": "dis')
+
+    with LaunchJournal(journal_path) as journal:
+        assert [record["type"] for record in journal.records] == ["launch", "done"]
+        journal.append("failed", step="distribute", error="boom")
+
+    assert stat.S_IMODE(os.stat(journal_path).st_mode) == 0o600
+    with LaunchJournal(journal_path) as journal:
+        assert [record["type"] for record in journal.records] == ["launch", "done", "failed"]
+
+
+@pytest.mark.parametrize("steps, message", [
+    ([PipelineStep("a", dict), PipelineStep("a", dict)], "unique"),
+    ([PipelineStep("a", dict, ("missing",))], "unknown step"),
+    ([PipelineStep("a", dict, ("b",)), PipelineStep("b", dict, ("a",))], "cycle"),
+])
+def test_invalid_graphs_are_rejected(journal_path, steps, message):
+    with LaunchJournal(journal_path) as journal:
+        with pytest.raises(ValueError, match=message):
+            LaunchPipeline(None, journal, steps)
+
+
+def test_steps_run_after_their_dependencies_and_concurrently(launchpad, journal_path):
+    order, lock = [], threading.Lock()
+    both_running = threading.Barrier(2, timeout=5)
+
+    def step(name, wait=False):
+        def run(ctx):
+            if wait:
+                both_running.wait()  # Deadlocks unless left and right overlap
+            with lock:
+                order.append(name)
+            return {"name": name}
+        return run
+
+    steps = [
+        PipelineStep("verify", step("verify"), ("left", "right")),
+        PipelineStep("left", step("left", True), ("root",)),
+        PipelineStep("right", step("right", True), ("root",)),
+        PipelineStep("root", step("root")),
+    ]
+    with LaunchJournal(journal_path) as journal:
+        results = LaunchPipeline(launchpad, journal, steps).run()
+
+    assert order[0] == "root" and order[-1] == "verify"
+    assert set(results) == {"root", "left", "right", "verify"}
+
+
+def test_resume_skips_finished_steps_and_landed_sends(launchpad, journal_path):
+    steps = [sending_step("create", ["create"]), sending_step("mint", ["m0", "m1", "m2"], ("create",), fail_after="m1")]
+    with LaunchJournal(journal_path) as journal:
+        with pytest.raises(RuntimeError, match="interrupted"):
+            LaunchPipeline(launchpad, journal, steps).run()
+    first_run = [signature for signature, _ in launchpad.sent]
+
+    steps[1] = sending_step("mint", ["m0", "m1", "m2"], ("create",))
+    with LaunchJournal(journal_path) as journal:
+        results = LaunchPipeline(launchpad, journal, steps).run()
+        types = [record["type"] for record in journal.records]
+
+    # create, m0 and m1 landed in the first run; only m2 is new
+    assert len(launchpad.sent) == 4
+    assert results["create"]["signatures"] == first_run[:1]
+    assert results["mint"]["signatures"][:2] == first_run[1:3]
+    assert types.count("failed") == 1 and types.count("done") == 2
+
+
+def test_unknown_send_is_resent_only_after_its_blockhash_expires(launchpad, server, journal_path, monkeypatch):
+    monkeypatch.setattr(launch_pipeline, "EXPIRY_POLL_INTERVAL", SLOT_TIME)
+    last_valid_block_height = server.slot + 20
+    with LaunchJournal(journal_path) as journal:
+        # Journaled, but the node never saw it (e.g. dropped by the leader)
+        journal.append(
+            "sent", step="mint", key="m0", signature=_b58encode(os.urandom(64)),
+            blockhash="unknown", last_valid_block_height=last_valid_block_height
+        )
+        LaunchPipeline(launchpad, journal, [sending_step("mint", ["m0"])]).run()
+
+    [(_, sent_at)] = launchpad.sent
+    assert sent_at > last_valid_block_height
+
+
+def test_processed_send_is_awaited_not_resent(launchpad, server, journal_path):
+    server.slot_time = 0.2  # Keep the send at processed while recovery looks it up
+    launchpad.confirmations.confirm_all = lambda signatures: {}
+    with LaunchJournal(journal_path) as journal:
+        with pytest.raises(RuntimeError):
+            LaunchPipeline(launchpad, journal, [sending_step("mint", ["m0"], fail_after="m0")]).run()
+    [(signature, _)] = launchpad.sent
+    assert server.dispatch("getSignatureStatuses", [[signature]])["value"][0]["confirmationStatus"] == "processed"
+
+    with LaunchJournal(journal_path) as journal:
+        results = LaunchPipeline(launchpad, journal, [sending_step("mint", ["m0"])]).run()
+
+    assert results["mint"]["signatures"] == [signature]
+    assert len(launchpad.sent) == 1
+
+
+def test_keypairs_are_journaled_and_reused(launchpad, journal_path):
+    def create(ctx):
+        return {"mint": str(ctx.keypair("mint").public_key)}
+
+    with LaunchJournal(journal_path) as journal:
+        pipeline = LaunchPipeline(launchpad, journal, [PipelineStep("create_token", create)])
+        first = pipeline.run()["create_token"]["mint"]
+        fresh = Keypair()
+        again = launch_pipeline.StepContext(pipeline, pipeline.steps[0]).keypair("mint", lambda: fresh)
+
+    assert str(again.public_key) == first != str(fresh.public_key)
@@ -0,0 +1,104 @@
+import io
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+from launch_store import LaunchRecord, LaunchStore
+from solana_memecoin_launchpad_production import ProductionLaunchConfig, TokenMetadata
+
+
+def record(mint: str, symbol: str = "MOON", creator: str = "alice", created_at: float = 100.0, **extra) -> LaunchRecord:
+    return LaunchRecord(
+        mint=mint,
+        symbol=symbol,
+        creator=creator,
+        config=ProductionLaunchConfig(total_supply=1_000_000),
+        metadata=TokenMetadata(name=symbol.title(), symbol=symbol, description="", image_url="", uri="ar://x"),
+        created_at=created_at,
+        **extra
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with LaunchStore(str(tmp_path / "launches.db")) as store:
+        yield store
+
+
+def test_append_round_trips_and_is_idempotent(store):
+    first = record("mint1", token={"transaction": "sig1"})
+    row_id = store.append(first)
+
+    assert store.append(record("mint1", symbol="OTHER")) == row_id
+    assert store.count() == 1
+    assert store.get("mint1") == first  # The first append wins
+    assert store.get("missing") is None
+
+
+@pytest.mark.parametrize("statement", [
+    "UPDATE launches SET symbol = 'X'",
+    "DELETE FROM launches",
+], ids=["update", "delete"])
+def test_rows_are_append_only(store, statement):
+    store.append(record("mint1"))
+
+    with pytest.raises(sqlite3.DatabaseError, match="append-only"):
+        with store._conn:
+            store._conn.execute(statement)
+    assert store.get("mint1").symbol == "MOON"
+
+
+def test_scans_are_ordered_range_queries(store):
+    # Appended out of order; scans return creation order
+    for mint, symbol, creator, created_at in [
+        ("c", "MOON", "bob", 300.0),
+        ("a", "MOON", "alice", 100.0),
+        ("b", "DOGE", "alice", 200.0),
+        ("d", "MOON", "alice", 400.0),
+    ]:
+        store.append(record(mint, symbol, creator, created_at))
+
+    def mints(records):
+        return [r.mint for r in records]
+
+    assert mints(store.scan()) == ["a", "b", "c", "d"]
+    assert mints(store.scan(since=200)) == ["b", "c", "d"]
+    assert mints(store.scan(until=300)) == ["a", "b"]  # until is exclusive
+    assert mints(store.scan(since=200, until=400)) == ["b", "c"]
+    assert mints(store.by_symbol("MOON", since=150)) == ["c", "d"]
+    assert mints(store.by_creator("alice", until=400)) == ["a", "b"]
+    assert mints(store.scan(limit=2)) == ["a", "b"]
+
+    # Naive datetimes are read as UTC
+    since = datetime.fromtimestamp(300, tz=timezone.utc).replace(tzinfo=None)
+    assert mints(store.scan(since=since)) == ["c", "d"]
+
+
+def test_scan_streams_across_batches(store, monkeypatch):
+    monkeypatch.setattr("launch_store.SCAN_BATCH_SIZE", 2)
+    for i in range(5):
+        store.append(record(f"mint{i}", created_at=float(i)))
+
+    assert [r.mint for r in store.scan()] == [f"mint{i}" for i in range(5)]
+
+
+def test_export_jsonl_splices_the_stored_payload(store):
+    launches = [
+        record("a", created_at=100.0, pool={"amm_id": "pool1"}),
+        record("b", symbol="DOGE", created_at=200.0, distribution={"transactions": ["s1", "s2"]}),
+    ]
+    for launch in launches:
+        store.append(launch)
+
+    output = io.StringIO()
+    assert store.export_jsonl(output) == 2
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [launch.to_json() for launch in launches]
+
+    output = io.StringIO()
+    assert store.export_jsonl(output, symbol="DOGE") == 1
+    assert json.loads(output.getvalue())["mint"] == "b"
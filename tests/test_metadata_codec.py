@@ -0,0 +1,161 @@
+import struct
+
+import pytest
+
+pytest.importorskip("solana.publickey")
+
+from solana.publickey import PublicKey
+
+from metadata_codec import (
+    CREATE_METADATA_ACCOUNT_V3,
+    MAX_CREATOR_LIMIT,
+    MAX_NAME_LENGTH,
+    UPDATE_METADATA_ACCOUNT_V2,
+    Creator,
+    create_metadata_v3_size,
+    decode_metadata_account,
+    decode_metadata_accounts,
+    decode_update_metadata_v2,
+    encode_create_metadata_v3,
+    encode_create_metadata_v3_batch,
+    encode_update_metadata_v2,
+)
+
+UPDATE_AUTHORITY = PublicKey(bytes([1]) * 32)
+MINT = PublicKey(bytes([2]) * 32)
+
+
+def metadata_account(instruction_data: bytes, primary_sale_happened: bool = False, tail: bytes = b"") -> bytes:
+    """Account bytes Metaplex writes for a CreateMetadataAccountV3 instruction"""
+    # Instruction: discriminator, data..., collection, uses, is_mutable, collection_details
+    body, is_mutable = instruction_data[1:-4], instruction_data[-2]
+    return (
+        bytes([4]) + bytes(UPDATE_AUTHORITY) + bytes(MINT)
+        + body + bytes([primary_sale_happened, is_mutable]) + tail
+    )
+
+
+def test_encoded_size_matches_the_precomputed_size():
+    creators = [Creator(PublicKey(bytes([3]) * 32), True, 60), Creator(PublicKey(bytes([4]) * 32), False, 40)]
+    data = encode_create_metadata_v3("Moon Doge", "MDOGE", "https://example.com/m.json", 250, creators)
+
+    assert data[0] == CREATE_METADATA_ACCOUNT_V3
+    assert len(data) == create_metadata_v3_size(b"Moon Doge", b"MDOGE", b"https://example.com/m.json", 2)
+
+
+def test_round_trip_without_creators():
+    data = encode_create_metadata_v3("Moon Doge", "MDOGE", "https://example.com/m.json", is_mutable=False)
+
+    decoded = decode_metadata_account(metadata_account(data))
+
+    assert decoded["key"] == 4
+    assert decoded["update_authority"] == str(UPDATE_AUTHORITY)
+    assert decoded["mint"] == str(MINT)
+    assert (decoded["name"], decoded["symbol"], decoded["uri"]) == ("Moon Doge", "MDOGE", "https://example.com/m.json")
+    assert decoded["seller_fee_basis_points"] == 0
+    assert decoded["creators"] is None
+    assert decoded["primary_sale_happened"] is False
+    assert decoded["is_mutable"] is False
+    assert decoded["edition_nonce"] is None
+    assert decoded["token_standard"] is None
+
+
+def test_round_trip_with_creators_and_optional_tail():
+    creators = [Creator(PublicKey(bytes([3]) * 32), True, 60), Creator(PublicKey(bytes([4]) * 32), False, 40)]
+    data = encode_create_metadata_v3("Ünïcödé", "UNI", "ipfs://x", 500, creators)
+
+    # edition_nonce Some(254), token_standard Some(2)
+    decoded = decode_metadata_account(metadata_account(data, True, bytes([1, 254, 1, 2])))
+
+    assert decoded["name"] == "Ünïcödé"
+    assert decoded["seller_fee_basis_points"] == 500
+    assert decoded["creators"] == [
+        {"address": str(creators[0].address), "verified": True, "share": 60},
+        {"address": str(creators[1].address), "verified": False, "share": 40},
+    ]
+    assert decoded["primary_sale_happened"] is True
+    assert decoded["is_mutable"] is True
+    assert decoded["edition_nonce"] == 254
+    assert decoded["token_standard"] == 2
+
+
+def test_decoder_strips_fixed_width_padding():
+    # Metaplex stores names, symbols and uris zero-padded to their maximum length
+    padded = b"Moon".ljust(MAX_NAME_LENGTH, b"\0")
+    data = bytearray(encode_create_metadata_v3("x", "MOON", "u"))
+    data[1:1 + 4 + 1] = struct.pack("<I", len(padded)) + padded
+
+    assert decode_metadata_account(metadata_account(bytes(data)))["name"] == "Moon"
+
+
+def test_batch_encoding_matches_single_encoding():
+    entries = [("Alpha", "A", "https://a"), ("Beta", "BB", "https://b/longer"), ("", "", "")]
+
+    buffer, offsets = encode_create_metadata_v3_batch(entries, is_mutable=False)
+
+    assert offsets[0] == 0 and offsets[-1] == len(buffer)
+    for (name, symbol, uri), start, end in zip(entries, offsets, offsets[1:]):
+        assert bytes(buffer[start:end]) == encode_create_metadata_v3(name, symbol, uri, is_mutable=False)
+
+
+def test_bulk_decode_yields_none_for_missing_or_malformed_accounts():
+    good = metadata_account(encode_create_metadata_v3("Moon", "MOON", "u"))
+    truncated = good[:70]
+
+    decoded = list(decode_metadata_accounts([good, None, truncated, memoryview(good)]))
+
+    assert decoded[0]["symbol"] == "MOON"
+    assert decoded[1] is None
+    assert decoded[2] is None
+    assert decoded[3] == decoded[0]
+
+
+def test_truncated_string_raises():
+    account = metadata_account(encode_create_metadata_v3("Moon", "MOON", "u"))
+    with pytest.raises(ValueError, match="truncated"):
+        decode_metadata_account(account[:65 + 4 + 2])
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"name": "n" * (MAX_NAME_LENGTH + 1)}, "Name"),
+    ({"symbol": "S" * 11}, "Symbol"),
+    ({"uri": "u" * 201}, "URI"),
+    ({"creators": [Creator(PublicKey(bytes([5]) * 32))] * (MAX_CREATOR_LIMIT + 1)}, "creators"),
+])
+def test_field_limits_are_enforced(kwargs, message):
+    fields = {"name": "Moon", "symbol": "MOON", "uri": "u", **kwargs}
+    with pytest.raises(ValueError, match=message):
+        encode_create_metadata_v3(**fields)
+
+
+def test_lock_metadata_encodes_all_four_options():
+    # Discriminator, data: None, update_authority: None, primary_sale_happened: None, is_mutable: Some(false)
+    assert encode_update_metadata_v2(is_mutable=False) == bytes([UPDATE_METADATA_ACCOUNT_V2, 0, 0, 0, 1, 0])
+
+
+@pytest.mark.parametrize("fields", [
+    {},
+    {"is_mutable": False},
+    {"primary_sale_happened": True, "is_mutable": True},
+    {"update_authority": UPDATE_AUTHORITY, "primary_sale_happened": False, "is_mutable": False},
+])
+def test_update_metadata_v2_round_trip(fields):
+    decoded = decode_update_metadata_v2(encode_update_metadata_v2(**fields))
+
+    expected = {"update_authority": None, "primary_sale_happened": None, "is_mutable": None, **fields}
+    if fields.get("update_authority") is not None:
+        expected["update_authority"] = str(fields["update_authority"])
+    assert decoded == expected
+
+
+@pytest.mark.parametrize("data", [
+    bytes([UPDATE_METADATA_ACCOUNT_V2, 0]),  # The old launchpad payload: options missing
+    encode_update_metadata_v2(is_mutable=False)[:-1],
+    encode_update_metadata_v2(update_authority=UPDATE_AUTHORITY)[:20],
+    encode_update_metadata_v2() + b"\x00",
+    bytes([UPDATE_METADATA_ACCOUNT_V2, 1]),
+    bytes([CREATE_METADATA_ACCOUNT_V3, 0, 0, 0, 0]),
+])
+def test_malformed_update_metadata_v2_is_rejected(data):
+    with pytest.raises(ValueError):
+        decode_update_metadata_v2(data)
@@ -0,0 +1,186 @@
+from array import array
+
+import pytest
+
+from milestone_tracker import MAX_TRACKED_VOLUME, MilestoneSchedule, MilestoneTracker
+
+REWARDS = {1_000: 10, 10_000: 50, 100_000: 200}
+
+
+def naive_rewards(trades, rewards):
+    """Reference: walk every threshold on every trade"""
+    total, paid, crossed = 0, set(), []
+    for volume in trades:
+        total += volume
+        hit = [(t, r) for t, r in sorted(rewards.items()) if t <= total and t not in paid]
+        paid.update(t for t, _ in hit)
+        crossed.append(hit)
+    return crossed
+
+
+def test_schedule_orders_thresholds_and_sums_rewards():
+    schedule = MilestoneSchedule({10_000: 50, 1_000: 10, 100_000: 200})
+
+    assert schedule.thresholds == (1_000, 10_000, 100_000)
+    assert schedule.reached(999) == 0
+    assert schedule.reached(10_000) == 2
+    assert schedule.reward_between(0, 3) == 260
+    assert schedule.reward_between(1, 2) == 50
+    assert schedule.key == MilestoneSchedule(dict(reversed(list(REWARDS.items())))).key
+
+
+def test_track_matches_the_naive_walk():
+    trades = [500, 499, 1, 5_000, 94_000, 1, 0, 10 ** 6]
+    tracker = MilestoneTracker(MilestoneSchedule(REWARDS))
+
+    assert [tracker.track("mint", volume) for volume in trades] == naive_rewards(trades, REWARDS)
+    assert tracker.state("mint") == (sum(trades), 3, 0)
+    assert tracker.milestones_reached("mint") == [1_000, 10_000, 100_000]
+
+
+def test_track_reward_sums_every_crossed_milestone():
+    tracker = MilestoneTracker(MilestoneSchedule(REWARDS))
+
+    assert tracker.track_reward("a", 999) is None
+    assert tracker.track_reward("a", 200_000) == 260
+    assert tracker.track_reward("a", 10 ** 9) is None
+
+
+def test_mints_are_tracked_independently():
+    tracker = MilestoneTracker(MilestoneSchedule(REWARDS))
+    tracker.track("a", 50_000)
+    tracker.track("b", 1_500)
+
+    assert len(tracker) == 2 and "a" in tracker and "c" not in tracker
+    assert tracker.milestones_reached("a") == [1_000, 10_000]
+    assert tracker.milestones_reached("b") == [1_000]
+    assert tracker.milestones_reached("c") == []
+    assert tracker.total_volume("c") == 0
+
+
+def test_equal_schedules_share_an_id():
+    tracker = MilestoneTracker()
+    first = tracker.schedule_id(MilestoneSchedule(REWARDS))
+    again = tracker.schedule_id(MilestoneSchedule(dict(REWARDS)))
+    other = tracker.schedule_id(MilestoneSchedule({5: 1}))
+
+    assert first == again == 0
+    assert other == 1
+    assert len(tracker.schedules) == 2
+
+
+def test_switching_schedules_rebases_without_paying_twice():
+    default = MilestoneSchedule(REWARDS)
+    small = MilestoneSchedule({500: 1, 2_000: 7, 20_000: 9})
+    tracker = MilestoneTracker()
+
+    assert tracker.track_reward("a", 1_500, default) == 10
+    # 500 was already passed under the old schedule, so only 2_000 pays
+    assert tracker.track_reward("a", 1_000, small) == 7
+    assert tracker.state("a") == (2_500, 2, 1)
+    assert tracker.milestones_reached("a") == [500, 2_000]
+    # Back again: 1_000 counts as reached, 10_000 pays when crossed
+    assert tracker.track_reward("a", 8_000, default) == 50
+    assert tracker.milestones_reached("a") == [1_000, 10_000]
+
+
+def test_invalid_volumes_are_rejected_without_side_effects():
+    tracker = MilestoneTracker(MilestoneSchedule(REWARDS))
+    tracker.track("a", MAX_TRACKED_VOLUME - 1)
+
+    with pytest.raises(ValueError):
+        tracker.track("a", -1)
+    with pytest.raises(OverflowError):
+        tracker.track("a", 2)
+    with pytest.raises(OverflowError):
+        tracker.track("b", MAX_TRACKED_VOLUME + 1)
+
+    assert tracker.state("a") == (MAX_TRACKED_VOLUME - 1, 3, 0)
+    assert "b" not in tracker
+    assert tracker.track("a", 1) == []
+
+
+def test_missing_schedule_is_an_error():
+    with pytest.raises(ValueError, match="No milestone schedule"):
+        MilestoneTracker().track("a", 1)
+
+
+def test_export_round_trip_keeps_each_mints_schedule():
+    default = MilestoneSchedule(REWARDS)
+    small = MilestoneSchedule({500: 1})
+    tracker = MilestoneTracker(default)
+    tracker.track("a", 20_000)
+    tracker.track("b", 600, small)
+
+    rebuilt = MilestoneTracker.from_export(*tracker.export(), schedule=default)
+
+    for mint in ("a", "b"):
+        assert rebuilt.state(mint) == tracker.state(mint)
+        assert rebuilt.milestones_reached(mint) == tracker.milestones_reached(mint)
+    assert rebuilt.track_reward("a", 80_000) == 200
+    assert rebuilt.track_reward("b", 10 ** 6, small) is None
+
+
+def test_restore_overwrites_or_adds_a_mint():
+    tracker = MilestoneTracker(MilestoneSchedule(REWARDS))
+    tracker.track("a", 5)
+    tracker.restore("a", 50_000, 2)
+    tracker.restore("b", 1_000, 1)
+
+    assert tracker.state("a") == (50_000, 2, 0)
+    assert tracker.track_reward("a", 50_000) == 200
+    assert tracker.track_reward("b", 1) is None
+
+
+def test_hot_path_matches_the_full_path():
+    schedule = MilestoneSchedule(REWARDS)
+    other = MilestoneSchedule({1: 5})
+    tracker = MilestoneTracker(schedule)
+
+    assert tracker.track_reward("a", 10_000) == 60
+    assert tracker.track_reward("a", 5_000, schedule) is None
+    assert tracker.track_reward("a", 85_000, schedule) == 200
+    assert tracker.state("a") == (100_000, 3, 0)
+
+    # A different schedule still rebases instead of taking the hot path
+    assert tracker.track_reward("a", 1, other) is None
+    assert tracker.state("a")[1:] == (1, 1)
+    with pytest.raises(ValueError, match="non-negative"):
+        tracker.track_reward("a", -1, other)
+    with pytest.raises(OverflowError):
+        tracker.track_reward("a", MAX_TRACKED_VOLUME, other)
+    assert tracker.state("a")[0] == 100_001
+
+
+def test_from_export_validates_its_input():
+    schedules = [MilestoneSchedule(REWARDS)]
+    with pytest.raises(ValueError, match="differ in length"):
+        MilestoneTracker.from_export(["a"], array("Q"), array("H"), array("H"), schedules)
+    with pytest.raises(ValueError, match="twice"):
+        MilestoneTracker.from_export([], array("Q"), array("H"), array("H"), schedules * 2)
+
+
+def test_manager_accepts_integral_floats_and_caches_schedules():
+    pytest.importorskip("solana.publickey")
+    from memecoin_launchpad_with_fees import CreatorFeeConfig, FeeDistributionManager
+
+    manager = FeeDistributionManager(None)
+    default = CreatorFeeConfig()
+    custom = CreatorFeeConfig(volume_milestone_rewards={500: 1})
+
+    assert manager.track_volume_milestone("a", 2e6, default) == default.volume_milestone_rewards[1_000_000]
+    manager.track_volume_milestone("a", 1, custom)
+    manager.track_volume_milestone("a", 1, default)
+    assert len(manager.volume_tracker.schedules) == 2
+    assert default.milestone_schedule() is default.milestone_schedule()
+
+    # Reassigning the rewards rebuilds the cached schedule
+    default.volume_milestone_rewards = {10: 7}
+    assert manager.track_volume_milestone("b", 10, default) == 7
+
+    with pytest.raises(ValueError, match="whole number"):
+        manager.track_volume_milestone("a", 1.5, default)
+    with pytest.raises(ValueError, match="whole number"):
+        manager.track_volume_milestone("a", "7", default)
+    with pytest.raises(OverflowError):
+        manager.track_volume_milestone("b", float(2 ** 64), default)
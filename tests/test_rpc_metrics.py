@@ -0,0 +1,163 @@
+import json
+import socket
+import urllib.request
+
+import pytest
+
+from rpc_metrics import (
+    LATENCY_BUCKETS,
+    InstrumentedClient,
+    RpcMetrics,
+    instrument,
+    record_retry,
+    serve_launch_metrics,
+)
+
+
+class ScriptedClient:
+    """Client whose methods answer from a script"""
+
+    def get_slot(self):
+        return {"result": 7}
+
+    def get_balance(self, pubkey):
+        return {"error": {"code": -32602, "message": "Invalid params"}}
+
+    def get_health(self):
+        return {"error": "unhealthy"}
+
+    def send_transaction(self, tx):
+        raise TimeoutError("deadline exceeded")
+
+
+@pytest.mark.parametrize("seconds,bucket", [
+    (0.0005, 0),
+    (0.001, 0),  # Bounds are inclusive, as Prometheus' le
+    (0.0011, 1),
+    (LATENCY_BUCKETS[-1], len(LATENCY_BUCKETS) - 1),
+    (60.0, len(LATENCY_BUCKETS)),
+])
+def test_observe_fills_the_matching_bucket(seconds, bucket):
+    metrics = RpcMetrics()
+    metrics.observe("get_slot", seconds)
+
+    buckets = metrics._methods["get_slot"].buckets
+    assert buckets[bucket] == 1
+    assert sum(buckets) == 1
+
+
+def test_snapshot_estimates_percentiles_from_buckets():
+    metrics = RpcMetrics()
+    for _ in range(90):
+        metrics.observe("get_slot", 0.003)
+    for _ in range(10):
+        metrics.observe("get_slot", 0.3)
+    metrics.observe("get_balance", 60.0)
+
+    slot = metrics.snapshot()["get_slot"]
+    assert slot["count"] == 100
+    assert slot["mean_ms"] == pytest.approx(32.7)
+    assert slot["p50_ms"] == pytest.approx(5.0)
+    assert slot["p95_ms"] == pytest.approx(500.0)
+    assert slot["p99_ms"] == pytest.approx(500.0)
+    # Past the last bound, the last finite bound is reported
+    assert metrics.snapshot()["get_balance"]["p50_ms"] == pytest.approx(LATENCY_BUCKETS[-1] * 1000)
+    assert RpcMetrics().snapshot() == {}
+
+
+def test_render_prometheus_emits_cumulative_histograms_and_counters():
+    metrics = RpcMetrics()
+    metrics.observe("get_slot", 0.002)
+    metrics.observe("get_slot", 0.02)
+    metrics.observe("get_slot", 30.0, "ReadTimeout")
+    metrics.record_retry("get_slot")
+    metrics.record_bytes("get_slot", 100, 250)
+
+    lines = metrics.render_prometheus().splitlines()
+    assert 'solana_rpc_request_duration_seconds_bucket{method="get_slot",le="0.001"} 0' in lines
+    assert 'solana_rpc_request_duration_seconds_bucket{method="get_slot",le="0.0025"} 1' in lines
+    assert 'solana_rpc_request_duration_seconds_bucket{method="get_slot",le="0.025"} 2' in lines
+    assert 'solana_rpc_request_duration_seconds_bucket{method="get_slot",le="10.0"} 2' in lines
+    assert 'solana_rpc_request_duration_seconds_bucket{method="get_slot",le="+Inf"} 3' in lines
+    assert 'solana_rpc_request_duration_seconds_count{method="get_slot"} 3' in lines
+    assert 'solana_rpc_errors_total{method="get_slot",error="ReadTimeout"} 1' in lines
+    assert 'solana_rpc_retries_total{method="get_slot"} 1' in lines
+    assert 'solana_rpc_request_bytes_total{method="get_slot"} 100' in lines
+    assert 'solana_rpc_response_bytes_total{method="get_slot"} 250' in lines
+    assert "# TYPE solana_rpc_request_duration_seconds histogram" in lines
+    assert "# TYPE solana_rpc_errors_total counter" in lines
+
+
+def test_instrumented_client_records_error_classes():
+    metrics = RpcMetrics()
+    client = instrument(ScriptedClient(), metrics)
+
+    assert client.get_slot() == {"result": 7}
+    client.get_balance("key")
+    client.get_health()
+    with pytest.raises(TimeoutError):
+        client.send_transaction(b"")
+    record_retry(client, "send_transaction")
+    record_retry(ScriptedClient(), "send_transaction")  # Uninstrumented: ignored
+
+    snapshot = metrics.snapshot()
+    assert snapshot["get_slot"]["errors"] == {}
+    assert snapshot["get_balance"]["errors"] == {"rpc_-32602": 1}
+    assert snapshot["get_health"]["errors"] == {"rpc_error": 1}
+    assert snapshot["send_transaction"]["errors"] == {"TimeoutError": 1}
+    assert snapshot["send_transaction"]["retries"] == 1
+    assert instrument(client) is client
+    assert isinstance(client, InstrumentedClient)
+
+
+def test_bytes_are_counted_for_solana_clients():
+    pytest.importorskip("solana.rpc.api")
+    from solana.exceptions import SolanaRpcException
+    from solana.rpc.api import Client
+    from fake_rpc_server import FakeRpcServer
+
+    with FakeRpcServer() as server:
+        inner = Client(server.url)
+        metrics = RpcMetrics()
+        client = instrument(inner, metrics)
+        instrument(inner, metrics)  # A second wrapper must not hook the session again
+
+        client.get_slot()
+        client.get_slot()
+        inner.get_slot()  # Uninstrumented calls are not counted
+
+        stats = metrics.snapshot()["get_slot"]
+        assert stats["count"] == 2
+        assert stats["bytes_sent"] > 0
+        assert stats["bytes_received"] > 0
+        assert server.method_counts["getSlot"] == 3
+
+    # Transport errors still surface as solana-py's exception
+    with pytest.raises(SolanaRpcException):
+        client.get_slot()
+
+
+def test_serve_launch_metrics_exposes_the_endpoint():
+    metrics = RpcMetrics()
+    metrics.observe("get_slot", 0.002)
+    assert serve_launch_metrics(0, metrics) is None
+
+    server = serve_launch_metrics(_free_port(), metrics)
+    try:
+        port = server.server_address[1]
+        text = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+        assert 'solana_rpc_request_duration_seconds_count{method="get_slot"} 1' in text
+        snapshot = json.loads(urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics.json").read())
+        assert snapshot["get_slot"]["count"] == 1
+
+        # A busy port is reported, not raised
+        assert serve_launch_metrics(port, metrics) is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,164 @@
+import time
+
+import pytest
+
+pytest.importorskip("solana.rpc.api")
+
+import requests
+from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
+
+from fake_rpc_server import FakeRpcServer
+from rpc_pool import RpcPool, is_failover_error
+
+
+def http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+def wrapped(error: Exception) -> SolanaRpcException:
+    """The exception solana-py's HTTPProvider raises for a transport error"""
+    try:
+        try:
+            raise error
+        except Exception as e:
+            raise SolanaRpcException(e, lambda: None, None, "getSlot") from e
+    except SolanaRpcException as e:
+        return e
+
+
+class ScriptedClient:
+    """Client double that raises a fixed error, or answers"""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = 0
+
+    def get_slot(self):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return {"result": 1}
+
+
+@pytest.mark.parametrize("error,expected", [
+    (requests.exceptions.ConnectionError("refused"), True),
+    (requests.exceptions.ReadTimeout("slow"), True),
+    (TimeoutError(), True),
+    (ConnectionResetError(), True),
+    (http_error(429), True),
+    (http_error(503), True),
+    (http_error(400), False),
+    (wrapped(requests.exceptions.ConnectTimeout("slow")), True),
+    (wrapped(http_error(502)), True),
+    (wrapped(http_error(404)), False),
+    (ValueError("bad params"), False),
+    (KeyError("result"), False),
+], ids=lambda value: type(value).__name__ if isinstance(value, Exception) else str(value))
+def test_is_failover_error(error, expected):
+    assert is_failover_error(error) is expected
+
+
+def test_ewma_ranks_the_faster_endpoint_first():
+    with FakeRpcServer(latency=0.04) as slow, FakeRpcServer() as fast:
+        pool = RpcPool([slow.url, fast.url], hedge=False, client_factory=Client)
+        try:
+            for _ in range(4):
+                pool.get_slot()
+            assert pool.ranked_endpoints() == [fast.url, slow.url]
+            stats = pool.stats()
+            assert stats[slow.url]["latency_ewma_ms"] > stats[fast.url]["latency_ewma_ms"]
+        finally:
+            pool.close()
+
+
+def test_ewma_penalizes_errors():
+    pool = RpcPool(["a", "b"], alpha=0.5, client_factory=lambda url: ScriptedClient())
+    try:
+        pool._record("a", 1.0, failed=False)
+        pool._record("a", 0.0, failed=False)
+        assert pool._stats["a"].latency_ewma == pytest.approx(0.5)
+
+        pool._record("b", 0.1, failed=False)
+        pool._record("b", 0.1, failed=True)
+        assert pool._stats["b"].error_ewma == pytest.approx(0.5)
+        assert pool._stats["b"].score() == pytest.approx(0.1 * (1 + 10 * 0.5))
+        assert pool.ranked_endpoints() == ["a", "b"]
+    finally:
+        pool.close()
+
+
+def test_slow_primary_is_hedged_after_its_p95():
+    with FakeRpcServer(latency=0.5) as slow, FakeRpcServer() as fast:
+        pool = RpcPool([slow.url, fast.url], min_hedge_delay=0.02, client_factory=Client)
+        try:
+            # History says the slow endpoint is fast, so it is tried first
+            for _ in range(5):
+                pool._record(slow.url, 0.001, failed=False)
+            pool._record(fast.url, 0.01, failed=False)
+            assert pool.ranked_endpoints()[0] == slow.url
+
+            started = time.perf_counter()
+            assert pool.get_version()["result"]
+            assert time.perf_counter() - started < 0.4
+            assert pool.stats()[fast.url]["hedges"] == 1
+            assert fast.method_counts["getVersion"] == 1
+            assert slow.request_count == 1  # Still sleeping on the first request
+        finally:
+            pool.close()
+
+
+@pytest.mark.parametrize("broken", [
+    {"error_rate": 1.0},
+    {"rate_limit_rate": 1.0},
+], ids=["http_500", "http_429"])
+def test_fails_over_on_transport_errors(broken):
+    with FakeRpcServer(**broken) as bad, FakeRpcServer() as good:
+        pool = RpcPool([bad.url, good.url], hedge=False, client_factory=Client)
+        try:
+            assert pool.get_slot()["result"] >= 1
+            stats = pool.stats()
+            assert stats[bad.url]["errors"] == 1
+            assert stats[good.url]["errors"] == 0
+            assert stats[bad.url]["error_rate_ewma"] > stats[good.url]["error_rate_ewma"]
+        finally:
+            pool.close()
+
+
+def test_fails_over_when_an_endpoint_is_down():
+    with FakeRpcServer() as good:
+        down = FakeRpcServer()
+        down_url = down.url
+        down._httpd.server_close()  # Never started: connections are refused
+
+        pool = RpcPool([down_url, good.url], hedge=False, client_factory=Client)
+        try:
+            assert pool.get_slot()["result"] >= 1
+            assert pool.stats()[down_url]["errors"] == 1
+        finally:
+            pool.close()
+
+
+def test_other_errors_are_raised_without_failover():
+    clients = {"a": ScriptedClient(ValueError("bad params")), "b": ScriptedClient()}
+    pool = RpcPool(["a", "b"], client_factory=clients.get)
+    try:
+        with pytest.raises(ValueError):
+            pool.get_slot()
+        assert clients["b"].calls == 0
+        assert pool.stats()["a"]["errors"] == 0  # The endpoint answered; it is not unhealthy
+    finally:
+        pool.close()
+
+
+def test_all_endpoints_failing_raises_the_last_error():
+    clients = {"a": ScriptedClient(TimeoutError("a")), "b": ScriptedClient(TimeoutError("b"))}
+    pool = RpcPool(["a", "b"], client_factory=clients.get)
+    try:
+        with pytest.raises(TimeoutError, match="b"):
+            pool.get_slot()
+        assert clients["a"].calls == clients["b"].calls == 1
+    finally:
+        pool.close()
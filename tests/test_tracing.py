@@ -0,0 +1,118 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import tracing
+from tracing import Tracer, chrome_trace_events, propagate, set_trace_attribute, span, traced
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.enable_tracing()
+    yield tracer
+    tracing.disable_tracing()
+
+
+def by_name(tracer: Tracer):
+    return {s.name: s for s in tracer.spans}
+
+
+def test_spans_are_noops_while_disabled():
+    assert not tracing.is_enabled()
+    with span("launch") as current:
+        current.set_attribute("mint", "x")
+    assert tracing.current_span() is None
+
+
+def test_spans_nest_across_propagate_into_worker_threads(tracer):
+    @traced("launch.worker")
+    def work():
+        with span("rpc.send"):
+            return threading.get_ident()
+
+    with span("launch") as root:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker_thread = pool.submit(propagate(work)).result()
+        # Without propagate the worker starts a trace of its own
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(work).result()
+
+    spans = list(tracer.spans)
+    propagated, detached = [s for s in spans if s.name == "launch.worker"]
+    sends = [s for s in spans if s.name == "rpc.send"]
+
+    assert propagated.parent_id == root.span_id
+    assert propagated.trace_id == root.trace_id
+    assert propagated.thread_id == worker_thread != root.thread_id
+    assert sends[0].parent_id == propagated.span_id
+    assert detached.parent_id is None
+    assert detached.trace_id != root.trace_id
+
+
+def test_trace_attributes_reach_spans_that_started_earlier(tracer):
+    with span("launch"):
+        with span("create_mint"):
+            pass
+        with span("metadata"):
+            set_trace_attribute("mint", "Mint111")
+    with span("other_launch"):
+        pass
+
+    spans = by_name(tracer)
+    assert spans["create_mint"].trace_attributes == {"mint": "Mint111"}
+    assert spans["launch"].trace_attributes == {"mint": "Mint111"}
+    assert spans["other_launch"].trace_attributes == {}
+
+
+def test_max_spans_evicts_the_oldest_and_counts_drops():
+    tracer = tracing.enable_tracing(Tracer(max_spans=3))
+    try:
+        for i in range(5):
+            with span(f"s{i}"):
+                pass
+    finally:
+        tracing.disable_tracing()
+
+    assert [s.name for s in tracer.spans] == ["s2", "s3", "s4"]
+    assert tracer.dropped == 2
+    tracer.clear()
+    assert len(tracer.spans) == 0 and tracer.dropped == 0
+
+
+def test_errors_are_recorded_and_reraised(tracer):
+    with pytest.raises(ValueError):
+        with span("launch"):
+            raise ValueError("no funds")
+
+    assert tracer.spans[0].error == "ValueError: no funds"
+    assert tracer.spans[0].end_ns is not None
+
+
+def test_chrome_trace_events_shape(tracer, tmp_path):
+    with span("launch.token", symbol="MOON") as root:
+        set_trace_attribute("mint", object())
+        with span("rpc.send"):
+            pass
+
+    path = tmp_path / "trace.json"
+    assert tracing.write_chrome_trace(str(path)) == 2
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+
+    events = trace["traceEvents"]
+    complete = {e["name"]: e for e in events if e["ph"] == "X"}
+    metadata = [e for e in events if e["ph"] == "M"]
+
+    launch, send = complete["launch.token"], complete["rpc.send"]
+    assert launch["cat"] == "launch" and send["cat"] == "rpc"
+    assert launch["ts"] == 0  # Timestamps are relative to the first span, in microseconds
+    assert launch["ts"] <= send["ts"] and send["ts"] + send["dur"] <= launch["ts"] + launch["dur"]
+    assert launch["args"]["symbol"] == "MOON"
+    assert isinstance(launch["args"]["mint"], str)  # Non-JSON values are stringified
+    assert send["args"]["parent_id"] == root.span_id
+    assert "parent_id" not in launch["args"]
+    assert [e["name"] for e in metadata] == ["thread_name"]
+    assert metadata[0]["tid"] == launch["tid"] == send["tid"]
+    assert chrome_trace_events([]) == []
@@ -0,0 +1,130 @@
+import pytest
+
+pytest.importorskip("solana.transaction")
+
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.transaction import AccountMeta, TransactionInstruction
+
+from transaction_packer import PACKET_DATA_SIZE, TransactionPacker, compact_u16_size
+
+
+def key(n: int) -> PublicKey:
+    return PublicKey(bytes([n]) * 32)
+
+
+PROGRAM = key(200)
+
+
+def instruction(*accounts: PublicKey, data: bytes = b"\x07" * 9, signer: PublicKey = None) -> TransactionInstruction:
+    keys = [AccountMeta(pubkey=account, is_signer=False, is_writable=True) for account in accounts]
+    if signer is not None:
+        keys.append(AccountMeta(pubkey=signer, is_signer=True, is_writable=False))
+    return TransactionInstruction(keys=keys, program_id=PROGRAM, data=data)
+
+
+@pytest.mark.parametrize("value, size", [(0, 1), (0x7F, 1), (0x80, 2), (0x3FFF, 2), (0x4000, 3)])
+def test_compact_u16_size(value, size):
+    assert compact_u16_size(value) == size
+
+
+def test_small_plan_packs_into_one_transaction():
+    payer = key(1)
+    instructions = [instruction(key(10 + i), signer=payer) for i in range(5)]
+
+    packed = TransactionPacker(payer).pack(instructions)
+
+    assert len(packed) == 1
+    assert packed[0].instructions == instructions
+    assert packed[0].signers == [payer]
+    # payer, program and five destinations
+    assert packed[0].num_accounts == 7
+
+
+def test_splits_preserve_order_and_respect_the_size_limit():
+    payer = key(1)
+    instructions = [instruction(key(10 + i), data=bytes(100), signer=payer) for i in range(40)]
+
+    packer = TransactionPacker(payer)
+    packed = packer.pack(instructions)
+
+    assert len(packed) > 1
+    assert [ix for tx in packed for ix in tx.instructions] == instructions
+    for tx in packed:
+        assert tx.size_bytes <= PACKET_DATA_SIZE
+        assert tx.size_bytes == packer.measure(tx.instructions)
+
+
+def test_greedy_packing_fills_each_transaction():
+    payer = key(1)
+    instructions = [instruction(key(10 + i), data=bytes(100), signer=payer) for i in range(40)]
+
+    packer = TransactionPacker(payer)
+    packed = packer.pack(instructions)
+
+    # Moving the next transaction's first instruction back would overflow
+    for tx, following in zip(packed, packed[1:]):
+        assert not packer.fits(tx.instructions + following.instructions[:1])
+
+
+def test_account_limit_forces_a_split():
+    payer = key(1)
+    instructions = [instruction(key(10 + i), data=b"", signer=payer) for i in range(10)]
+
+    packed = TransactionPacker(payer, max_accounts=6).pack(instructions)
+
+    assert all(tx.num_accounts <= 6 for tx in packed)
+    assert sum(len(tx.instructions) for tx in packed) == 10
+
+
+def test_reserved_instructions_count_against_every_transaction():
+    payer = key(1)
+    reserved = [instruction(data=bytes(300))]
+    instructions = [instruction(key(10 + i), data=bytes(100), signer=payer) for i in range(20)]
+
+    plain = TransactionPacker(payer).pack(instructions)
+    budgeted = TransactionPacker(payer, reserved=reserved).pack(instructions)
+
+    assert len(budgeted) > len(plain)
+    assert all(tx.size_bytes <= PACKET_DATA_SIZE for tx in budgeted)
+    # Reserved instructions are not part of the plan itself
+    assert all(ix not in reserved for tx in budgeted for ix in tx.instructions)
+
+
+def test_oversized_instruction_is_rejected():
+    payer = key(1)
+    with pytest.raises(ValueError, match="does not fit"):
+        TransactionPacker(payer).pack([instruction(key(2), data=bytes(PACKET_DATA_SIZE))])
+
+
+def test_measure_matches_the_serialized_transaction():
+    payer, other = Keypair(), Keypair()
+    instructions = [
+        instruction(key(10), signer=payer.public_key),
+        instruction(key(11), key(12), data=bytes(50), signer=other.public_key),
+    ]
+
+    packer = TransactionPacker(payer.public_key)
+    [planned] = packer.pack(instructions)
+    transaction = planned.build()
+    transaction.recent_blockhash = str(key(99))
+    transaction.sign(payer, other)
+
+    assert transaction.fee_payer == payer.public_key
+    assert packer.measure(instructions) == planned.size_bytes == len(transaction.serialize())
+
+
+def test_built_transactions_sign_with_the_packing_payer():
+    payer = Keypair()
+    # The payer signs none of the instructions, so only build() names it fee payer
+    instructions = [instruction(key(10 + i), data=bytes(100)) for i in range(20)]
+
+    packed = TransactionPacker(payer.public_key).pack(instructions)
+
+    assert len(packed) > 1
+    for planned in packed:
+        transaction = planned.build()
+        transaction.recent_blockhash = str(key(99))
+        transaction.sign(payer)
+        assert transaction.compile_message().account_keys[0] == payer.public_key
+        assert len(transaction.serialize()) == planned.size_bytes <= PACKET_DATA_SIZE
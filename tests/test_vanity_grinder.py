@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("solana.keypair")
+
+from vanity_grinder import BASE58_ALPHABET, VanityGrinder, VanityPattern
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"prefix": "0"},
+    {"suffix": "l"},
+    {"prefix": "abc", "suffix": "O"},
+], ids=["empty", "zero", "lowercase_l", "uppercase_o"])
+def test_patterns_outside_base58_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        VanityPattern(**kwargs)
+
+
+def test_ignore_case_accepts_letters_missing_in_one_case():
+    # 'l' and 'O' are not base58, but 'L' and 'o' are
+    pattern = VanityPattern(prefix="l", suffix="O", ignore_case=True)
+    assert pattern.matches("Lxyzo")
+    assert not pattern.matches("Lxyz1")
+
+
+def test_expected_attempts_counts_case_insensitive_choices():
+    assert VanityPattern(prefix="a").expected_attempts() == len(BASE58_ALPHABET)
+    # 'a' and 'A' both match; 'L' has no lowercase twin in base58
+    assert VanityPattern(prefix="a", ignore_case=True).expected_attempts() == len(BASE58_ALPHABET) / 2
+    assert VanityPattern(prefix="L", ignore_case=True).expected_attempts() == len(BASE58_ALPHABET)
+    assert VanityPattern(prefix="ab", suffix="9").expected_attempts() == len(BASE58_ALPHABET) ** 3
+
+
+def test_grinds_a_one_character_suffix():
+    grinder = VanityGrinder(VanityPattern(suffix="z"), processes=1, batch_size=64)
+
+    keypair = grinder.grind(timeout=60, on_progress=lambda attempts, rate: None)
+    assert keypair is not None
+    assert str(keypair.public_key).endswith("z")
+    assert grinder.attempts >= 1
+
+
+def test_cancel_before_grind_returns_none_once():
+    grinder = VanityGrinder(VanityPattern(suffix="z"), processes=1, batch_size=64)
+    grinder.cancel()
+
+    assert grinder.grind(timeout=60) is None
+    assert grinder.attempts == 0
+    # The cancel is consumed; the next search runs
+    assert grinder.grind(timeout=60, on_progress=lambda attempts, rate: None) is not None
+
+
+def test_cancel_during_grind_stops_the_workers():
+    # Ten fixed characters: far beyond what the test could find
+    grinder = VanityGrinder(VanityPattern(prefix="zzzzzzzzzz"), processes=1, batch_size=16)
+    threading.Timer(0.5, grinder.cancel).start()
+
+    started = time.monotonic()
+    assert grinder.grind(progress_interval=0.05, on_progress=lambda attempts, rate: None) is None
+    assert time.monotonic() - started < 10
+    assert grinder.attempts > 0
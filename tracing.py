@@ -0,0 +1,270 @@
+"""
+Launch Tracing
+Context-propagated spans with an optional OpenTelemetry bridge and Chrome trace-event export
+"""
+
+import os
+import json
+import time
+import threading
+import contextvars
+import functools
+from collections import deque
+from typing import Optional, Dict, Any, List, Deque, Callable
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("launch_span", default=None)
+
+_tracer: Optional["Tracer"] = None
+
+
+class Span:
+    """
+    One timed operation
+
+    `trace_attributes` is shared by every span of a trace, so attributes
+    learned mid-launch (the mint address) reach spans that started before
+    it was known.
+    """
+    __slots__ = ("name", "span_id", "parent_id", "trace_id", "start_ns", "end_ns",
+                 "thread_id", "attributes", "trace_attributes", "error", "_otel")
+
+    def __init__(self, name: str, span_id: int, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else span_id
+        self.trace_attributes: Dict[str, Any] = parent.trace_attributes if parent else {}
+        self.attributes = attributes
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._otel = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+        if self._otel is not None:
+            self._otel[1].set_attribute(key, _otel_value(value))
+
+
+class _ActiveSpan:
+    """Context manager that opens a span under the current one"""
+    __slots__ = ("tracer", "name", "attributes", "span", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        self.span = self.tracer._start(self.name, parent, self.attributes)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self.token)
+        if exc is not None:
+            self.span.error = f"{type(exc).__name__}: {exc}"
+        self.tracer._finish(self.span, exc)
+        return False
+
+
+class _NoopSpan:
+    """Returned by span() while tracing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Tracer:
+    """
+    Collects finished spans in memory
+
+    Args:
+        otel: Mirror spans into OpenTelemetry (requires opentelemetry-api)
+        max_spans: Oldest spans are dropped beyond this many
+    """
+
+    def __init__(self, otel: bool = False, max_spans: int = 100_000):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._otel_tracer = None
+        if otel:
+            from opentelemetry import trace as otel_trace
+            self._otel_tracer = otel_trace.get_tracer("ape-fun.launchpad")
+
+    def _start(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+        span = Span(name, span_id, parent, attributes)
+
+        if self._otel_tracer is not None:
+            attrs = {k: _otel_value(v) for k, v in {**span.trace_attributes, **attributes}.items()}
+            manager = self._otel_tracer.start_as_current_span(name, attributes=attrs)
+            span._otel = (manager, manager.__enter__())
+        return span
+
+    def _finish(self, span: Span, exc: Optional[BaseException]):
+        span.end_ns = time.perf_counter_ns()
+        if span._otel is not None:
+            manager, otel_span = span._otel
+            for key, value in span.trace_attributes.items():
+                otel_span.set_attribute(key, _otel_value(value))
+            manager.__exit__(type(exc) if exc else None, exc, exc.__traceback__ if exc else None)
+            span._otel = None
+
+        with self._lock:
+            if len(self.spans) == self.max_spans:
+                self.dropped += 1  # append() evicts the oldest
+            self.spans.append(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+            self.dropped = 0
+
+
+def _otel_value(value: Any) -> Any:
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+def enable_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """Install a process-wide tracer; spans are no-ops until this is called"""
+    global _tracer
+    _tracer = tracer or Tracer()
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attributes):
+    """
+    Open a span for a `with` block
+
+    Returns a shared no-op context manager while tracing is disabled, so
+    instrumented code costs one global lookup when nobody is tracing.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return _ActiveSpan(tracer, name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator that runs a function inside a span named after it"""
+    def decorate(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with _ActiveSpan(tracer, span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_attribute(key: str, value: Any):
+    """Set an attribute on the current span, if any"""
+    current = _current_span.get()
+    if current is not None:
+        current.set_attribute(key, value)
+
+
+def set_trace_attribute(key: str, value: Any):
+    """Attach an attribute to every span of the current trace, past and future"""
+    current = _current_span.get()
+    if current is not None:
+        current.trace_attributes[key] = value
+        if current._otel is not None:
+            current._otel[1].set_attribute(key, _otel_value(value))
+
+
+def propagate(fn: Callable) -> Callable:
+    """Bind fn to the caller's context so spans opened in a worker thread nest correctly"""
+    context = contextvars.copy_context()
+    return functools.partial(context.run, fn)
+
+
+def chrome_trace_events(spans: List[Span]) -> List[Dict[str, Any]]:
+    """Spans as Chrome trace-event "complete" events (viewable in chrome://tracing or Perfetto)"""
+    pid = os.getpid()
+    threads: Dict[int, int] = {}
+    origin = min((s.start_ns for s in spans), default=0)
+    events: List[Dict[str, Any]] = []
+
+    for s in spans:
+        tid = threads.setdefault(s.thread_id, len(threads) + 1)
+        args = {**s.trace_attributes, **s.attributes, "span_id": s.span_id, "trace_id": s.trace_id}
+        if s.parent_id is not None:
+            args["parent_id"] = s.parent_id
+        if s.error is not None:
+            args["error"] = s.error
+        events.append({
+            "name": s.name,
+            "cat": s.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (s.start_ns - origin) / 1_000,
+            "dur": ((s.end_ns or s.start_ns) - s.start_ns) / 1_000,
+            "pid": pid,
+            "tid": tid,
+            "args": {k: _otel_value(v) for k, v in args.items()},
+        })
+
+    for ident, tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                       "args": {"name": f"thread-{ident}"}})
+    return events
+
+
+def write_chrome_trace(path: str, tracer: Optional[Tracer] = None) -> int:
+    """
+    Write the tracer's finished spans as a Chrome trace-event JSON file
+
+    Returns:
+        Number of spans written
+    """
+    tracer = tracer or _tracer
+    if tracer is None:
+        raise RuntimeError("Tracing is not enabled")
+    with tracer._lock:
+        spans = list(tracer.spans)
+
+    with open(path, "w") as f:
+        json.dump({"traceEvents": chrome_trace_events(spans), "displayTimeUnit": "ms"}, f)
+    return len(spans)
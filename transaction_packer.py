@@ -0,0 +1,167 @@
+"""
+Transaction Packer for Memecoin Launchpad
+Bin-packs launch instructions into the fewest transactions that fit on the wire
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+from solana.publickey import PublicKey
+from solana.transaction import Transaction, TransactionInstruction
+
+# Wire limits for legacy transactions
+PACKET_DATA_SIZE = 1232  # IPv6 MTU minus headers
+SIGNATURE_SIZE = 64
+PUBKEY_SIZE = 32
+BLOCKHASH_SIZE = 32
+MESSAGE_HEADER_SIZE = 3
+MAX_TX_ACCOUNTS = 64  # Runtime account lock limit
+MAX_TX_SIGNERS = 12
+
+
+def compact_u16_size(value: int) -> int:
+    """Number of bytes used by a compact-u16 length prefix"""
+    if value < 0x80:
+        return 1
+    if value < 0x4000:
+        return 2
+    return 3
+
+
+@dataclass
+class PackedTransaction:
+    """One planned transaction produced by the packer"""
+    instructions: List[TransactionInstruction] = field(default_factory=list)
+    signers: List[PublicKey] = field(default_factory=list)
+    num_accounts: int = 0
+    size_bytes: int = 0
+    fee_payer: Optional[PublicKey] = None  # The payer the size was measured with
+
+    def build(self) -> Transaction:
+        """Materialize the planned instructions as a Transaction"""
+        transaction = Transaction(fee_payer=self.fee_payer)
+        for ix in self.instructions:
+            transaction.add(ix)
+        return transaction
+
+
+class TransactionPacker:
+    """
+    Packs an ordered instruction plan into as few transactions as possible
+
+    Instruction order is preserved so that dependent instructions (an ATA
+    create followed by a mint_to into it, a mint_to followed by a burn) keep
+    their relative order both within and across transactions.
+    """
+
+    def __init__(
+        self,
+        fee_payer: PublicKey,
+        max_size: int = PACKET_DATA_SIZE,
+        max_accounts: int = MAX_TX_ACCOUNTS,
+        max_signers: int = MAX_TX_SIGNERS,
+        reserved: Sequence[TransactionInstruction] = ()
+    ):
+        self.fee_payer = fee_payer
+        self.max_size = max_size
+        self.max_accounts = max_accounts
+        self.max_signers = max_signers
+        # Instructions prepended at send time (e.g. compute budget); they
+        # count against every transaction's limits but are not planned
+        self.reserved = list(reserved)
+
+    def pack(self, instructions: Sequence[TransactionInstruction]) -> List[PackedTransaction]:
+        """
+        Pack instructions into transactions under the size and account limits
+
+        Args:
+            instructions: Ordered instruction plan
+
+        Returns:
+            Planned transactions with their serialized byte sizes
+        """
+        packed: List[PackedTransaction] = []
+        current: List[TransactionInstruction] = []
+
+        for ix in instructions:
+            if not self._fits([ix]):
+                raise ValueError(
+                    f"Instruction for program {ix.program_id} does not fit in a single "
+                    f"transaction ({self.measure([ix])} bytes > {self.max_size})"
+                )
+
+            if self._fits(current + [ix]):
+                current.append(ix)
+            else:
+                packed.append(self._plan(current))
+                current = [ix]
+
+        if current:
+            packed.append(self._plan(current))
+
+        return packed
+
+    def measure(self, instructions: Sequence[TransactionInstruction]) -> int:
+        """Serialized size in bytes of a signed transaction holding the instructions"""
+        full = self.reserved + list(instructions)
+        accounts, signers = self._collect_accounts(full)
+        return self._serialized_size(full, len(accounts), len(signers))
+
+    def fits(self, instructions: Sequence[TransactionInstruction]) -> bool:
+        """Whether the instructions fit in one transaction under the size and account limits"""
+        return self._fits(instructions)
+
+    def _fits(self, instructions: Sequence[TransactionInstruction]) -> bool:
+        full = self.reserved + list(instructions)
+        accounts, signers = self._collect_accounts(full)
+        if len(accounts) > self.max_accounts or len(signers) > self.max_signers:
+            return False
+        return self._serialized_size(full, len(accounts), len(signers)) <= self.max_size
+
+    def _plan(self, instructions: List[TransactionInstruction]) -> PackedTransaction:
+        full = self.reserved + list(instructions)
+        accounts, signers = self._collect_accounts(full)
+        return PackedTransaction(
+            instructions=list(instructions),
+            signers=[PublicKey(key) for key in signers],
+            num_accounts=len(accounts),
+            size_bytes=self._serialized_size(full, len(accounts), len(signers)),
+            fee_payer=self.fee_payer
+        )
+
+    def _collect_accounts(self, instructions: Sequence[TransactionInstruction]):
+        """Unique account keys and signer keys, fee payer first"""
+        fee_payer = bytes(self.fee_payer)
+        accounts: Dict[bytes, None] = {fee_payer: None}
+        signers: Dict[bytes, None] = {fee_payer: None}
+
+        for ix in instructions:
+            for meta in ix.keys:
+                key = bytes(meta.pubkey)
+                accounts[key] = None
+                if meta.is_signer:
+                    signers[key] = None
+            accounts[bytes(ix.program_id)] = None
+
+        return accounts, signers
+
+    @staticmethod
+    def _serialized_size(
+        instructions: Sequence[TransactionInstruction],
+        num_accounts: int,
+        num_signers: int
+    ) -> int:
+        size = compact_u16_size(num_signers) + num_signers * SIGNATURE_SIZE
+        size += MESSAGE_HEADER_SIZE
+        size += compact_u16_size(num_accounts) + num_accounts * PUBKEY_SIZE
+        size += BLOCKHASH_SIZE
+        size += compact_u16_size(len(instructions))
+
+        for ix in instructions:
+            data_len = len(ix.data)
+            size += 1  # Program id index
+            size += compact_u16_size(len(ix.keys)) + len(ix.keys)
+            size += compact_u16_size(data_len) + data_len
+
+        return size
+
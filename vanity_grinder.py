@@ -0,0 +1,231 @@
+"""
+Vanity Mint Address Grinder
+Searches for keypairs whose base58 address matches a prefix/suffix across all cores
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import multiprocessing
+from dataclasses import dataclass
+from typing import Optional, Callable
+
+from solana.keypair import Keypair
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+DEFAULT_BATCH_SIZE = 2_048  # Keys per worker between cancellation checks
+DEFAULT_PROGRESS_INTERVAL = 2.0  # Seconds between progress reports
+
+
+@dataclass(frozen=True)
+class VanityPattern:
+    """Prefix and/or suffix an address must have"""
+    prefix: str = ""
+    suffix: str = ""
+    ignore_case: bool = False
+
+    def __post_init__(self):
+        if not self.prefix and not self.suffix:
+            raise ValueError("A vanity pattern needs a prefix or a suffix")
+        for char in self.prefix + self.suffix:
+            if self._choices(char) == 0:
+                raise ValueError(f"{char!r} can never appear in a base58 address")
+
+    def matches(self, address: str) -> bool:
+        if self.ignore_case:
+            address = address.lower()
+            return address.startswith(self.prefix.lower()) and address.endswith(self.suffix.lower())
+        return address.startswith(self.prefix) and address.endswith(self.suffix)
+
+    def expected_attempts(self) -> float:
+        """
+        Mean keys to try, treating address characters as uniform over the
+        alphabet (the leading character is skewed, so prefixes are rougher)
+        """
+        attempts = 1.0
+        for char in self.prefix + self.suffix:
+            attempts *= len(BASE58_ALPHABET) / self._choices(char)
+        return attempts
+
+    def _choices(self, char: str) -> int:
+        if self.ignore_case:
+            return sum(1 for c in BASE58_ALPHABET if c.lower() == char.lower())
+        return 1 if char in BASE58_ALPHABET else 0
+
+
+def _grind_worker(pattern: VanityPattern, stop, attempts, results, batch_size: int):
+    """Worker process: generate keys until one matches or the search is stopped"""
+    while not stop.is_set():
+        tried = 0
+        for _ in range(batch_size):
+            keypair = Keypair()
+            tried += 1
+            if pattern.matches(str(keypair.public_key)):
+                results.put(bytes(keypair.secret_key))
+                stop.set()
+                break
+        with attempts.get_lock():
+            attempts.value += tried
+
+
+class VanityGrinder:
+    """
+    Multi-process vanity keypair search
+
+    Worker processes generate keys independently and share an attempt
+    counter; the first match stops every worker. `cancel()` can be called
+    from another thread to abandon a running search, or before grind() to
+    make the next search return None immediately.
+    """
+
+    def __init__(
+        self,
+        pattern: VanityPattern,
+        processes: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.pattern = pattern
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._context = multiprocessing.get_context()
+        self._stop = self._context.Event()
+        self._attempts = self._context.Value("Q", 0)
+        self._started_at: Optional[float] = None
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts.value
+
+    def rate(self) -> float:
+        """Keys per second since the search started"""
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started_at
+        return self.attempts / elapsed if elapsed > 0 else 0.0
+
+    def cancel(self):
+        """Stop the running (or next) search; grind() returns None"""
+        self._stop.set()
+
+    def grind(
+        self,
+        timeout: Optional[float] = None,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        on_progress: Optional[Callable[[int, float], None]] = None
+    ) -> Optional[Keypair]:
+        """
+        Search until a match is found, the timeout passes or cancel() is called
+
+        Args:
+            timeout: Seconds to search before giving up
+            progress_interval: Seconds between progress callbacks
+            on_progress: Called with (attempts, keys/sec); prints a status line by default
+
+        Returns:
+            Matching keypair, or None if cancelled or timed out
+        """
+        on_progress = on_progress or self._print_progress
+        self._attempts.value = 0
+        if self._stop.is_set():
+            self._stop.clear()  # Consume a cancel() issued before this search
+            return None
+        self._started_at = time.monotonic()
+        deadline = self._started_at + timeout if timeout is not None else None
+
+        results = self._context.Queue()
+        workers = [
+            self._context.Process(
+                target=_grind_worker,
+                args=(self.pattern, self._stop, self._attempts, results, self.batch_size),
+                daemon=True
+            )
+            for _ in range(self.processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        secret_key = None
+        try:
+            while secret_key is None:
+                try:
+                    secret_key = results.get(timeout=progress_interval)
+                except queue.Empty:
+                    if self._stop.is_set():
+                        # A worker may have set stop just before its match reached the queue
+                        try:
+                            secret_key = results.get(timeout=1.0)
+                        except queue.Empty:
+                            pass  # Cancelled
+                        break
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    on_progress(self.attempts, self.rate())
+        finally:
+            self._stop.set()
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+            self._stop.clear()  # Ready for the next grind()
+
+        return Keypair.from_secret_key(secret_key) if secret_key is not None else None
+
+    def keypair_source(self, timeout: Optional[float] = None) -> Callable[[], Keypair]:
+        """
+        Mint-keypair source for create_token_with_metadata / create_token_with_fees
+
+        The returned callable grinds a fresh match on every call and raises
+        TimeoutError if none is found in time.
+        """
+        def source() -> Keypair:
+            keypair = self.grind(timeout=timeout)
+            if keypair is None:
+                raise TimeoutError(f"No vanity address found for {self.pattern}")
+            return keypair
+        return source
+
+    def _print_progress(self, attempts: int, rate: float):
+        expected = self.pattern.expected_attempts()
+        remaining = max(expected - attempts, 0) / rate if rate > 0 else float("inf")
+        print(f"⛏️  {attempts:,} keys, {rate:,.0f} keys/s, "
+              f"~{remaining:,.0f}s to expected match ({expected:,.0f} attempts)",
+              file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grind a vanity mint keypair")
+    parser.add_argument("--prefix", default="")
+    parser.add_argument("--suffix", default="")
+    parser.add_argument("--ignore-case", action="store_true")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before giving up")
+    parser.add_argument("--output", "-o", required=True, help="Keypair file (solana CLI JSON format)")
+    args = parser.parse_args(argv)
+
+    pattern = VanityPattern(args.prefix, args.suffix, args.ignore_case)
+    grinder = VanityGrinder(pattern, args.processes)
+    print(f"🎯 Expected attempts: {pattern.expected_attempts():,.0f} on {grinder.processes} processes")
+
+    try:
+        keypair = grinder.grind(timeout=args.timeout)
+    except KeyboardInterrupt:
+        grinder.cancel()
+        keypair = None
+
+    if keypair is None:
+        print(f"❌ No match after {grinder.attempts:,} keys")
+        sys.exit(1)
+
+    fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(list(bytes(keypair.secret_key)), f)
+
+    print(f"✅ {keypair.public_key} after {grinder.attempts:,} keys ({grinder.rate():,.0f} keys/s)")
+    print(f"💾 Keypair written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()